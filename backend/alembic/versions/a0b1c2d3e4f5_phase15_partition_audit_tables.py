@@ -0,0 +1,164 @@
+"""Phase 15 — Monthly RANGE partitioning for audit tables
+
+Convert login_history, export_audit_logs and audit_logs to tables
+partitioned by month on created_at (PK becomes id + created_at).
+Existing rows are copied into monthly partitions; a DEFAULT partition
+catches anything outside the pre-created ranges. Future partitions are
+created at runtime by app.services.partition.maintain_partitions.
+Parents are built with LIKE (as b1c2d3e4f5g6 does for stock_movements), so
+columns, their order, defaults and CHECKs are those of the existing table;
+FKs are re-created by name.
+
+Admin-filter indexes are rebuilt org-first / created_at-last, plus a
+trigram GIN index on audit_logs.description for the ILIKE search.
+
+Revision ID: a0b1c2d3e4f5
+Revises: z6a7b8c9d0e1
+Create Date: 2026-03-22
+"""
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "a0b1c2d3e4f5"
+down_revision = "z6a7b8c9d0e1"
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+TABLES = ["login_history", "export_audit_logs", "audit_logs"]
+
+# LIKE copies columns (same order — INSERT … SELECT * below), NOT NULLs, defaults
+# and CHECKs, but not FKs: these are re-created on the new parent
+_OUTGOING_FKS = {
+    "login_history": [
+        ("fk_login_history_user_id", "user_id", "users", "SET NULL"),
+    ],
+    "export_audit_logs": [
+        ("fk_export_audit_logs_user_id", "user_id", "users", "CASCADE"),
+        ("fk_export_audit_logs_org_id", "org_id", "organizations", "CASCADE"),
+    ],
+    "audit_logs": [
+        ("fk_audit_logs_user_id", "user_id", "users", "SET NULL"),
+    ],
+}
+
+_NEW_INDEXES = {
+    "login_history": [
+        ("ix_login_history_user_created", "(user_id, created_at)"),
+        ("ix_login_history_email", "(email)"),
+        ("ix_login_history_org_created", "(org_id, created_at)"),
+    ],
+    "export_audit_logs": [
+        ("ix_export_audit_logs_org_created", "(org_id, created_at)"),
+        ("ix_export_audit_logs_org_user_created", "(org_id, user_id, created_at)"),
+        ("ix_export_audit_logs_org_resource_created", "(org_id, resource_type, created_at)"),
+    ],
+    "audit_logs": [
+        ("ix_audit_logs_org_created", "(org_id, created_at)"),
+        ("ix_audit_logs_org_user_created", "(org_id, user_id, created_at)"),
+        ("ix_audit_logs_org_resource_created", "(org_id, resource_type, created_at)"),
+        ("ix_audit_logs_org_action_created", "(org_id, action, created_at)"),
+        ("ix_audit_logs_resource", "(resource_type, resource_id)"),
+        ("ix_audit_logs_description_trgm", "USING gin (description gin_trgm_ops)"),
+    ],
+}
+
+# Pre-partitioning indexes (restored on downgrade)
+_OLD_INDEXES = {
+    "login_history": [
+        ("ix_login_history_user_id", "(user_id)"),
+        ("ix_login_history_email", "(email)"),
+        ("ix_login_history_org_created", "(org_id, created_at)"),
+    ],
+    "export_audit_logs": [
+        ("ix_export_audit_logs_org_created", "(org_id, created_at DESC)"),
+        ("ix_export_audit_logs_user", "(user_id)"),
+    ],
+    "audit_logs": [
+        ("ix_audit_logs_org_created", "(org_id, created_at DESC)"),
+        ("ix_audit_logs_user_id", "(user_id)"),
+        ("ix_audit_logs_resource", "(resource_type, resource_id)"),
+        ("ix_audit_logs_action", "(action)"),
+    ],
+}
+
+
+def _add_months(d: date, months: int) -> date:
+    idx = d.year * 12 + (d.month - 1) + months
+    return date(idx // 12, idx % 12 + 1, 1)
+
+
+def _bound(d: date) -> str:
+    return f"{d.isoformat()} 00:00:00+00"
+
+
+def _index_sql(table: str, name: str, spec: str) -> str:
+    return f"CREATE INDEX {name} ON {table} {spec}"
+
+
+def _add_outgoing_fks(table: str) -> None:
+    for name, column, ref_table, on_delete in _OUTGOING_FKS[table]:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {name} "
+            f"FOREIGN KEY ({column}) REFERENCES {ref_table}(id) ON DELETE {on_delete}"
+        )
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    now = datetime.now(timezone.utc)
+    this_month = date(now.year, now.month, 1)
+
+    for table in TABLES:
+        new = f"{table}_partitioned"
+
+        # 1. Partitioned parent with the same columns, defaults and CHECKs
+        op.execute(
+            f"CREATE TABLE {new} "
+            f"(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE (created_at)"
+        )
+        op.execute(f"ALTER TABLE {new} ADD CONSTRAINT pk_{table} PRIMARY KEY (id, created_at)")
+
+        # 2. Monthly partitions covering existing data → now + MONTHS_AHEAD
+        oldest = conn.execute(sa.text(f"SELECT min(created_at) FROM {table}")).scalar()
+        first = date(oldest.year, oldest.month, 1) if oldest else this_month
+        month = min(first, this_month)
+        last = _add_months(this_month, MONTHS_AHEAD)
+        while month <= last:
+            part = f"{table}_y{month.year}m{month.month:02d}"
+            op.execute(
+                f"CREATE TABLE {part} PARTITION OF {new} "
+                f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(_add_months(month, 1))}')"
+            )
+            month = _add_months(month, 1)
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {new} DEFAULT")
+
+        # 3. Copy rows, swap tables (old indexes go with the old table)
+        op.execute(f"INSERT INTO {new} SELECT * FROM {table}")
+        op.execute(f"DROP TABLE {table}")
+        op.execute(f"ALTER TABLE {new} RENAME TO {table}")
+
+        # 4. Outgoing FKs + indexes on the parent (propagate to every partition)
+        _add_outgoing_fks(table)
+        for name, spec in _NEW_INDEXES[table]:
+            op.execute(_index_sql(table, name, spec))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        plain = f"{table}_plain"
+        op.execute(f"CREATE TABLE {plain} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        op.execute(f"INSERT INTO {plain} SELECT * FROM {table}")
+        op.execute(f"DROP TABLE {table} CASCADE")
+        op.execute(f"ALTER TABLE {plain} RENAME TO {table}")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)")
+        _add_outgoing_fks(table)
+        for name, spec in _OLD_INDEXES[table]:
+            op.execute(_index_sql(table, name, spec))
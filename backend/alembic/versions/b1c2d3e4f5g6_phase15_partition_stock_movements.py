@@ -0,0 +1,158 @@
+"""Phase 15 — Monthly RANGE partitioning for stock_movements
+
+Convert stock_movements to a table partitioned by month on created_at
+(PK becomes id + created_at). Existing rows are copied into monthly
+partitions; a DEFAULT partition catches anything outside the pre-created
+ranges. Future partitions: app.services.partition.maintain_partitions.
+
+A partitioned table cannot be the target of a FK on id alone, so the
+incoming FKs (reversed_by_id, *.movement_id) are dropped — the columns
+stay as plain UUID references. Movements are never deleted (reversal
+pattern), so ON DELETE SET NULL never fired in practice.
+From here on the references are kept valid by the services (each is set
+from a movement flushed in the same transaction; movements are never
+deleted) and checked by python -m app.reconcile_stock — see
+app.services.stock_reconcile.MOVEMENT_REFS.
+
+NOTE: copies the whole ledger — schedule a maintenance window on large DBs.
+
+Revision ID: b1c2d3e4f5g6
+Revises: a0b1c2d3e4f5
+Create Date: 2026-03-23
+"""
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "b1c2d3e4f5g6"
+down_revision = "a0b1c2d3e4f5"
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+_OUTGOING_FKS = [
+    ("fk_stock_movements_product_id", "product_id", "products", "RESTRICT"),
+    ("fk_stock_movements_work_order_id", "work_order_id", "work_orders", "RESTRICT"),
+    ("fk_stock_movements_created_by", "created_by", "users", "RESTRICT"),
+    ("fk_stock_movements_bin_id", "bin_id", "bins", "SET NULL"),
+    ("fk_stock_movements_location_id", "location_id", "locations", "SET NULL"),
+    ("fk_stock_movements_to_location_id", "to_location_id", "locations", "SET NULL"),
+    ("fk_stock_movements_cost_center_id", "cost_center_id", "cost_centers", "SET NULL"),
+    ("fk_stock_movements_cost_element_id", "cost_element_id", "cost_elements", "SET NULL"),
+]
+
+_INDEXES = [
+    ("ix_stock_movements_org_id", "(org_id)"),
+    ("ix_stock_movements_product_id", "(product_id)"),
+    ("ix_stock_movements_work_order_id", "(work_order_id)"),
+    ("ix_stock_movements_bin_id", "(bin_id)"),
+    ("ix_stock_movements_location_id", "(location_id)"),
+    ("ix_stock_movements_cost_center_id", "(cost_center_id)"),
+    ("ix_stock_movements_to_location_id", "(to_location_id)"),
+    ("ix_stock_movements_batch_number", "(batch_number) WHERE batch_number IS NOT NULL"),
+    ("ix_movements_product_type", "(product_id, movement_type)"),
+    # Phase 15: time-range reports + per-product FIFO ordering
+    ("ix_movements_org_created", "(org_id, created_at)"),
+    ("ix_movements_org_product_created", "(org_id, product_id, created_at)"),
+]
+
+# (table, column) pairs that referenced stock_movements.id before partitioning
+_INCOMING_REFS = [
+    ("stock_movements", "reversed_by_id"),
+    ("stock_withdrawal_slip_lines", "movement_id"),
+    ("stock_take_lines", "movement_id"),
+    ("transfer_request_lines", "movement_id"),
+    ("delivery_order_lines", "movement_id"),
+]
+
+
+def _add_months(d: date, months: int) -> date:
+    idx = d.year * 12 + (d.month - 1) + months
+    return date(idx // 12, idx % 12 + 1, 1)
+
+
+def _bound(d: date) -> str:
+    return f"{d.isoformat()} 00:00:00+00"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # 1. Drop FKs pointing at stock_movements (names differ across install histories)
+    incoming = conn.execute(sa.text(
+        "SELECT conrelid::regclass::text, conname FROM pg_constraint "
+        "WHERE contype = 'f' AND confrelid = 'stock_movements'::regclass"
+    )).all()
+    for table, conname in incoming:
+        op.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{conname}"')
+
+    # 2. Partitioned parent with the same columns, defaults and CHECKs
+    op.execute(
+        "CREATE TABLE stock_movements_partitioned "
+        "(LIKE stock_movements INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute(
+        "ALTER TABLE stock_movements_partitioned "
+        "ADD CONSTRAINT pk_stock_movements PRIMARY KEY (id, created_at)"
+    )
+
+    # 3. Monthly partitions covering existing data → now + MONTHS_AHEAD
+    now = datetime.now(timezone.utc)
+    this_month = date(now.year, now.month, 1)
+    oldest = conn.execute(sa.text("SELECT min(created_at) FROM stock_movements")).scalar()
+    month = min(date(oldest.year, oldest.month, 1), this_month) if oldest else this_month
+    last = _add_months(this_month, MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE stock_movements_y{month.year}m{month.month:02d} "
+            f"PARTITION OF stock_movements_partitioned "
+            f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(_add_months(month, 1))}')"
+        )
+        month = _add_months(month, 1)
+    op.execute("CREATE TABLE stock_movements_default PARTITION OF stock_movements_partitioned DEFAULT")
+
+    # 4. Copy rows, swap tables
+    op.execute("INSERT INTO stock_movements_partitioned SELECT * FROM stock_movements")
+    op.execute("DROP TABLE stock_movements")
+    op.execute("ALTER TABLE stock_movements_partitioned RENAME TO stock_movements")
+
+    # 5. Outgoing FKs + indexes on the parent (propagate to every partition)
+    for name, column, ref_table, on_delete in _OUTGOING_FKS:
+        op.execute(
+            f"ALTER TABLE stock_movements ADD CONSTRAINT {name} "
+            f"FOREIGN KEY ({column}) REFERENCES {ref_table}(id) ON DELETE {on_delete}"
+        )
+    for name, spec in _INDEXES:
+        op.execute(f"CREATE INDEX {name} ON stock_movements {spec}")
+
+    op.execute("ANALYZE stock_movements")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE TABLE stock_movements_plain "
+        "(LIKE stock_movements INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    op.execute("INSERT INTO stock_movements_plain SELECT * FROM stock_movements")
+    op.execute("DROP TABLE stock_movements CASCADE")
+    op.execute("ALTER TABLE stock_movements_plain RENAME TO stock_movements")
+    op.execute("ALTER TABLE stock_movements ADD CONSTRAINT stock_movements_pkey PRIMARY KEY (id)")
+
+    for name, column, ref_table, on_delete in _OUTGOING_FKS:
+        op.execute(
+            f"ALTER TABLE stock_movements ADD CONSTRAINT {name} "
+            f"FOREIGN KEY ({column}) REFERENCES {ref_table}(id) ON DELETE {on_delete}"
+        )
+    for name, spec in _INDEXES:
+        if name in ("ix_movements_org_created", "ix_movements_org_product_created"):
+            continue
+        op.execute(f"CREATE INDEX {name} ON stock_movements {spec}")
+    for table, column in _INCOMING_REFS:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT fk_{table}_{column} "
+            f"FOREIGN KEY ({column}) REFERENCES stock_movements(id) ON DELETE SET NULL"
+        )
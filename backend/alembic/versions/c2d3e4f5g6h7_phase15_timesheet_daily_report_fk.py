@@ -0,0 +1,48 @@
+"""Phase 15 — timesheets.daily_report_id (keyed replace of daily report auto-records)
+
+Timesheets auto-recorded on daily report approval (BR#52) were found again
+by `note LIKE 'DailyReport#<id>%'`, which cannot use an index. They now carry
+a real FK to daily_work_reports; existing auto-records are backfilled from
+the note (kept for display).
+
+Revision ID: c2d3e4f5g6h7
+Revises: b1c2d3e4f5g6
+Create Date: 2026-03-24
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "c2d3e4f5g6h7"
+down_revision = "b1c2d3e4f5g6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "timesheets",
+        sa.Column(
+            "daily_report_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("daily_work_reports.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+    )
+    op.execute("""
+        UPDATE timesheets t
+        SET daily_report_id = r.id
+        FROM daily_work_reports r
+        WHERE t.note LIKE 'DailyReport#%'
+          AND r.id::text = substring(t.note FROM 13 FOR 36)
+    """)
+    op.create_index(
+        "ix_timesheets_daily_report", "timesheets", ["daily_report_id"],
+        postgresql_where=sa.text("daily_report_id IS NOT NULL"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_timesheets_daily_report", table_name="timesheets")
+    op.drop_column("timesheets", "daily_report_id")
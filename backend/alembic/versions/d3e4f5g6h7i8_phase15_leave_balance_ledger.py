@@ -0,0 +1,138 @@
+"""Phase 15 — leave balance ledger + maintained running balance
+
+leave_balances gains carried_forward / pending / remaining, kept up to date
+by create_leave (pending), approve_leave (pending → used) and HR adjustments,
+each movement recorded in leave_balance_entries. leave_types gains
+carry_forward_max for the year-rollover job.
+
+Backfill recomputes used/pending from the leaves table — previously days were
+counted as used on request and never returned on rejection.
+
+Revision ID: d3e4f5g6h7i8
+Revises: c2d3e4f5g6h7
+Create Date: 2026-03-25
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "d3e4f5g6h7i8"
+down_revision = "c2d3e4f5g6h7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        DO $$ BEGIN
+            CREATE TYPE leave_entry_type_enum AS ENUM ('ACCRUAL', 'CARRY_FORWARD', 'USAGE', 'ADJUSTMENT');
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END $$;
+    """)
+
+    # --- leave_types.carry_forward_max ---
+    op.add_column(
+        "leave_types",
+        sa.Column("carry_forward_max", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_check_constraint("ck_leave_type_carry_positive", "leave_types", "carry_forward_max >= 0")
+
+    # --- leave_balances running balance ---
+    for col in ("carried_forward", "pending", "remaining"):
+        op.add_column(
+            "leave_balances",
+            sa.Column(col, sa.Integer(), nullable=False, server_default="0"),
+        )
+    op.create_check_constraint("ck_leave_balance_carry_positive", "leave_balances", "carried_forward >= 0")
+    op.create_check_constraint("ck_leave_balance_pending_positive", "leave_balances", "pending >= 0")
+    op.create_index("ix_leave_balances_org_year", "leave_balances", ["org_id", "year"])
+
+    op.execute("UPDATE leave_balances SET used = 0, pending = 0, remaining = quota")
+    op.execute("""
+        UPDATE leave_balances b
+        SET used = s.used,
+            pending = s.pending,
+            remaining = b.quota - s.used
+        FROM (
+            SELECT employee_id, leave_type_id, EXTRACT(YEAR FROM start_date)::int AS year,
+                   COALESCE(SUM(days_count) FILTER (WHERE status = 'APPROVED'), 0) AS used,
+                   COALESCE(SUM(days_count) FILTER (WHERE status = 'PENDING'), 0) AS pending
+            FROM leaves
+            WHERE leave_type_id IS NOT NULL
+            GROUP BY 1, 2, 3
+        ) s
+        WHERE s.employee_id = b.employee_id
+          AND s.leave_type_id = b.leave_type_id
+          AND s.year = b.year
+    """)
+
+    # --- leave_balance_entries ---
+    op.create_table(
+        "leave_balance_entries",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "balance_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("leave_balances.id", ondelete="CASCADE"), nullable=False,
+        ),
+        sa.Column(
+            "entry_type",
+            postgresql.ENUM("ACCRUAL", "CARRY_FORWARD", "USAGE", "ADJUSTMENT",
+                            name="leave_entry_type_enum", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("days", sa.Integer(), nullable=False),
+        sa.Column("balance_after", sa.Integer(), nullable=False),
+        sa.Column(
+            "leave_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("leaves.id", ondelete="SET NULL"), nullable=True,
+        ),
+        sa.Column("note", sa.String(255), nullable=True),
+        sa.Column(
+            "created_by", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True,
+        ),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        "ix_leave_balance_entries_balance", "leave_balance_entries", ["balance_id", "created_at"],
+    )
+
+    # Opening ledger: one ACCRUAL per balance, then USAGE per approved leave in date order
+    op.execute("""
+        INSERT INTO leave_balance_entries
+            (id, balance_id, entry_type, days, balance_after, note, org_id, created_at, updated_at)
+        SELECT gen_random_uuid(), b.id, 'ACCRUAL', b.quota, b.quota,
+               'Opening balance ' || b.year, b.org_id, b.created_at, b.created_at
+        FROM leave_balances b
+    """)
+    op.execute("""
+        INSERT INTO leave_balance_entries
+            (id, balance_id, entry_type, days, balance_after, leave_id, created_by, org_id, created_at, updated_at)
+        SELECT gen_random_uuid(), b.id, 'USAGE', -l.days_count,
+               b.quota - SUM(l.days_count) OVER (
+                   PARTITION BY b.id ORDER BY l.start_date, l.created_at, l.id
+               ),
+               l.id, l.approved_by, b.org_id, l.updated_at, l.updated_at
+        FROM leaves l
+        JOIN leave_balances b
+          ON b.employee_id = l.employee_id
+         AND b.leave_type_id = l.leave_type_id
+         AND b.year = EXTRACT(YEAR FROM l.start_date)::int
+        WHERE l.status = 'APPROVED'
+    """)
+
+
+def downgrade():
+    op.drop_index("ix_leave_balance_entries_balance", table_name="leave_balance_entries")
+    op.drop_table("leave_balance_entries")
+    op.drop_index("ix_leave_balances_org_year", table_name="leave_balances")
+    op.drop_constraint("ck_leave_balance_pending_positive", "leave_balances", type_="check")
+    op.drop_constraint("ck_leave_balance_carry_positive", "leave_balances", type_="check")
+    for col in ("remaining", "pending", "carried_forward"):
+        op.drop_column("leave_balances", col)
+    op.drop_constraint("ck_leave_type_carry_positive", "leave_types", type_="check")
+    op.drop_column("leave_types", "carry_forward_max")
+    op.execute("DROP TYPE IF EXISTS leave_entry_type_enum")
@@ -0,0 +1,56 @@
+"""Phase 15 — AR/AP open-item index (outstanding_amount + partial covering index)
+
+customer_invoices / supplier_invoices gain a stored generated
+outstanding_amount (total/net minus received/paid), so every payment,
+approval and cancellation keeps it current without extra writes. A partial
+index over APPROVED, active invoices with a balance left (the open items)
+covers aging buckets, overdue totals and per-party rollups.
+
+Revision ID: e4f5g6h7i8j9
+Revises: d3e4f5g6h7i8
+Create Date: 2026-03-26
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "e4f5g6h7i8j9"
+down_revision = "d3e4f5g6h7i8"
+branch_labels = None
+depends_on = None
+
+_OPEN = "status = 'APPROVED' AND is_active AND outstanding_amount > 0"
+
+
+def upgrade():
+    op.add_column(
+        "customer_invoices",
+        sa.Column(
+            "outstanding_amount", sa.Numeric(12, 2),
+            sa.Computed("total_amount - received_amount", persisted=True),
+        ),
+    )
+    op.add_column(
+        "supplier_invoices",
+        sa.Column(
+            "outstanding_amount", sa.Numeric(12, 2),
+            sa.Computed("net_payment - paid_amount", persisted=True),
+        ),
+    )
+    op.create_index(
+        "ix_ci_open_items", "customer_invoices", ["org_id", "due_date"],
+        postgresql_include=["customer_id", "outstanding_amount"],
+        postgresql_where=sa.text(_OPEN),
+    )
+    op.create_index(
+        "ix_invoice_open_items", "supplier_invoices", ["org_id", "due_date"],
+        postgresql_include=["supplier_id", "outstanding_amount"],
+        postgresql_where=sa.text(_OPEN),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_invoice_open_items", table_name="supplier_invoices")
+    op.drop_index("ix_ci_open_items", table_name="customer_invoices")
+    op.drop_column("supplier_invoices", "outstanding_amount")
+    op.drop_column("customer_invoices", "outstanding_amount")
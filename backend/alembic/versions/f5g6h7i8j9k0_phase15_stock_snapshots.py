@@ -0,0 +1,72 @@
+"""Phase 15 — month-end stock snapshots (stock_snapshots + stock_snapshot_lines)
+
+One header per org × month-end and one line per (product, location, batch)
+with quantity, unit cost and value at the cutoff (first instant of the next
+month). Point-in-time stock reads the nearest snapshot and replays only the
+stock_movements after its cutoff instead of the whole ledger.
+
+Revision ID: f5g6h7i8j9k0
+Revises: e4f5g6h7i8j9
+Create Date: 2026-03-27
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "f5g6h7i8j9k0"
+down_revision = "e4f5g6h7i8j9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "stock_snapshots",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("period_end", sa.Date(), nullable=False),
+        sa.Column("cutoff_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("line_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_quantity", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("total_value", sa.Numeric(16, 2), nullable=False, server_default="0"),
+        sa.Column(
+            "created_by", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True,
+        ),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("org_id", "period_end", name="uq_stock_snapshot_org_period"),
+    )
+    op.create_index("ix_stock_snapshots_org_id", "stock_snapshots", ["org_id"])
+
+    op.create_table(
+        "stock_snapshot_lines",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "snapshot_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("stock_snapshots.id", ondelete="CASCADE"), nullable=False,
+        ),
+        sa.Column(
+            "product_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("products.id", ondelete="RESTRICT"), nullable=False,
+        ),
+        sa.Column(
+            "location_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("locations.id", ondelete="SET NULL"), nullable=True,
+        ),
+        sa.Column("batch_number", sa.String(50), nullable=True),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("unit_cost", sa.Numeric(12, 2), nullable=False),
+        sa.Column("value", sa.Numeric(16, 2), nullable=False),
+    )
+    op.create_index(
+        "ix_stock_snapshot_lines_snapshot_product", "stock_snapshot_lines", ["snapshot_id", "product_id"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_stock_snapshot_lines_snapshot_product", table_name="stock_snapshot_lines")
+    op.drop_table("stock_snapshot_lines")
+    op.drop_index("ix_stock_snapshots_org_id", table_name="stock_snapshots")
+    op.drop_table("stock_snapshots")
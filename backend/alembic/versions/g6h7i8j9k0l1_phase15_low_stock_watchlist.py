@@ -0,0 +1,56 @@
+"""Phase 15 — low-stock watchlist (threshold crossings + batched alerts)
+
+low_stock_watchlist keeps one row per product that has dropped to its
+min_stock. Stock movements flip is_low when on_hand crosses the threshold
+and queue an alert (alert_due); a background worker delivers queued alerts
+in batches, at most one per product per window. Partial indexes cover the
+low-stock count/list and the worker's due-alert scan. Products that are
+already low are backfilled without queueing an alert.
+
+Revision ID: g6h7i8j9k0l1
+Revises: f5g6h7i8j9k0
+Create Date: 2026-03-28
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "g6h7i8j9k0l1"
+down_revision = "f5g6h7i8j9k0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "low_stock_watchlist",
+        sa.Column("product_id", postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey("products.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("is_low", sa.Boolean(), nullable=False, server_default=sa.text("true")),
+        sa.Column("low_since", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("alert_due", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("last_alerted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        "ix_low_stock_watchlist_low", "low_stock_watchlist", ["org_id"],
+        postgresql_where=sa.text("is_low"),
+    )
+    op.create_index(
+        "ix_low_stock_watchlist_alert_due", "low_stock_watchlist", ["org_id"],
+        postgresql_where=sa.text("alert_due"),
+    )
+    op.execute("""
+        INSERT INTO low_stock_watchlist (product_id, org_id, is_low, low_since)
+        SELECT id, org_id, true, now() FROM products
+        WHERE is_active AND min_stock > 0 AND on_hand <= min_stock
+    """)
+
+
+def downgrade():
+    op.drop_index("ix_low_stock_watchlist_alert_due", table_name="low_stock_watchlist")
+    op.drop_index("ix_low_stock_watchlist_low", table_name="low_stock_watchlist")
+    op.drop_table("low_stock_watchlist")
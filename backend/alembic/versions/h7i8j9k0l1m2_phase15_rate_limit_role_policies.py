@@ -0,0 +1,28 @@
+"""Phase 15 — per-role API rate limits in org_security_configs
+
+api_rate_limit_roles holds per-role overrides of api_rate_limit_per_minute
+(e.g. {"viewer": 60}); roles not listed use the org-wide limit.
+
+Revision ID: h7i8j9k0l1m2
+Revises: g6h7i8j9k0l1
+Create Date: 2026-03-29
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "h7i8j9k0l1m2"
+down_revision = "g6h7i8j9k0l1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "org_security_configs",
+        sa.Column("api_rate_limit_roles", sa.JSON(), nullable=False, server_default="{}"),
+    )
+
+
+def downgrade():
+    op.drop_column("org_security_configs", "api_rate_limit_roles")
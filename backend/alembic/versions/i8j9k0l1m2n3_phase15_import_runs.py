@@ -0,0 +1,49 @@
+"""Phase 15 — bulk master-data import runs
+
+import_runs records each uploaded products / employees / customers /
+suppliers / opening-stock file: row counts and the rejected rows that make
+up the downloadable error report.
+
+Revision ID: i8j9k0l1m2n3
+Revises: h7i8j9k0l1m2
+Create Date: 2026-03-30
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "i8j9k0l1m2n3"
+down_revision = "h7i8j9k0l1m2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "import_runs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("entity", sa.String(30), nullable=False),
+        sa.Column("file_name", sa.String(255), nullable=False),
+        sa.Column("dry_run", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("total_rows", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("valid_rows", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("loaded_rows", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("skipped_rows", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("errors", sa.JSON(), nullable=False, server_default="[]"),
+        sa.Column("duration_ms", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_import_runs_org_id", "import_runs", ["org_id"])
+    op.create_index("ix_import_runs_org_created", "import_runs", ["org_id", "created_at"])
+
+
+def downgrade():
+    op.drop_index("ix_import_runs_org_created", table_name="import_runs")
+    op.drop_index("ix_import_runs_org_id", table_name="import_runs")
+    op.drop_table("import_runs")
@@ -0,0 +1,53 @@
+"""Phase 15 — transactional domain-event outbox
+
+domain_events is written in the same transaction as the business change
+(stock movement, goods receipt, shipment, payment, payroll, status change)
+and published to Redis streams by the event relay. domain_event_offset_seq
+numbers events in publish order — the offset consumers replay from.
+
+Revision ID: j9k0l1m2n3o4
+Revises: i8j9k0l1m2n3
+Create Date: 2026-03-31
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "j9k0l1m2n3o4"
+down_revision = "i8j9k0l1m2n3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "domain_events",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), primary_key=True),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_id", postgresql.UUID(as_uuid=True), nullable=False, unique=True),
+        sa.Column("event_type", sa.String(100), nullable=False),
+        sa.Column("aggregate_type", sa.String(50), nullable=False),
+        sa.Column("aggregate_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False, server_default="{}"),
+        sa.Column("actor_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("offset", sa.BigInteger(), nullable=True, unique=True),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("stream_id", sa.String(40), nullable=True),
+    )
+    op.create_index("ix_domain_events_org_id", "domain_events", ["org_id"])
+    op.create_index(
+        "ix_domain_events_unpublished",
+        "domain_events",
+        ["id"],
+        postgresql_where=sa.text("published_at IS NULL"),
+    )
+    op.create_index("ix_domain_events_org_offset", "domain_events", ["org_id", "offset"])
+    op.create_index("ix_domain_events_aggregate", "domain_events", ["aggregate_type", "aggregate_id", "id"])
+    op.execute("CREATE SEQUENCE domain_event_offset_seq")
+
+
+def downgrade():
+    op.execute("DROP SEQUENCE IF EXISTS domain_event_offset_seq")
+    op.drop_table("domain_events")
@@ -0,0 +1,50 @@
+"""Phase 15 — incremental Parquet analytics export
+
+analytics_export_watermarks keeps, per exported table, the updated_at up to
+which rows have been written to Parquet (app.services.analytics_export).
+The updated_at indexes serve each run's "changed since the watermark" scan;
+on stock_movements the index is created on the partitioned parent and so
+on every monthly partition. performance_logs is append-only and exports on
+its existing recorded_at index.
+
+Revision ID: k0l1m2n3o4p5
+Revises: j9k0l1m2n3o4
+Create Date: 2026-04-01
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "k0l1m2n3o4p5"
+down_revision = "j9k0l1m2n3o4"
+branch_labels = None
+depends_on = None
+
+_UPDATED_AT_INDEXES = [
+    ("ix_movements_updated", "stock_movements"),
+    ("ix_timesheets_updated", "timesheets"),
+    ("ix_invoice_updated", "supplier_invoices"),
+    ("ix_payment_updated", "invoice_payments"),
+    ("ix_ci_updated", "customer_invoices"),
+    ("ix_ci_payment_updated", "customer_invoice_payments"),
+]
+
+
+def upgrade():
+    op.create_table(
+        "analytics_export_watermarks",
+        sa.Column("table_name", sa.String(63), primary_key=True),
+        sa.Column("exported_until", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_run_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_run_rows", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("last_run_files", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_run_ms", sa.Integer(), nullable=False, server_default="0"),
+    )
+    for name, table in _UPDATED_AT_INDEXES:
+        op.create_index(name, table, ["updated_at"])
+
+
+def downgrade():
+    for name, table in _UPDATED_AT_INDEXES:
+        op.drop_index(name, table_name=table)
+    op.drop_table("analytics_export_watermarks")
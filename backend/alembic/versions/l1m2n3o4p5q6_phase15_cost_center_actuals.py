@@ -0,0 +1,64 @@
+"""Phase 15 — monthly cost center actuals rollup
+
+cost_center_actuals holds actual labor / material / tool / overhead per org,
+month and cost center for the cost-center summary (app.services.cost_actuals),
+rebuilt per org-month from timesheets, stock movements and tool check-ins.
+rollup_watermarks records how far the incremental refresh has read; the
+first refresh backfills every month. tool_checkouts gets the check-in month
+and updated_at indexes the rebuild and the changed-rows scan use
+(timesheets / stock_movements got theirs in k0l1m2n3o4p5).
+
+Revision ID: l1m2n3o4p5q6
+Revises: k0l1m2n3o4p5
+Create Date: 2026-04-02
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "l1m2n3o4p5q6"
+down_revision = "k0l1m2n3o4p5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "cost_center_actuals",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("period_year", sa.Integer(), nullable=False),
+        sa.Column("period_month", sa.Integer(), nullable=False),
+        sa.Column(
+            "cost_center_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("cost_centers.id", ondelete="CASCADE"), nullable=False,
+        ),
+        sa.Column("labor", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("material", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("tool", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("overhead", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint(
+            "org_id", "period_year", "period_month", "cost_center_id",
+            name="uq_cc_actual_org_period_cc",
+        ),
+        sa.CheckConstraint("period_month >= 1 AND period_month <= 12", name="ck_cc_actual_month_range"),
+    )
+    op.create_index("ix_cost_center_actuals_org_id", "cost_center_actuals", ["org_id"])
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("name", sa.String(63), primary_key=True),
+        sa.Column("processed_until", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_run_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_run_periods", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index("ix_tool_checkouts_org_checkin", "tool_checkouts", ["org_id", "checkin_at"])
+    op.create_index("ix_tool_checkouts_updated", "tool_checkouts", ["updated_at"])
+
+
+def downgrade():
+    op.drop_index("ix_tool_checkouts_updated", table_name="tool_checkouts")
+    op.drop_index("ix_tool_checkouts_org_checkin", table_name="tool_checkouts")
+    op.drop_table("rollup_watermarks")
+    op.drop_table("cost_center_actuals")
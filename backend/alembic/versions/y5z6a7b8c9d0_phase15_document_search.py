@@ -0,0 +1,110 @@
+"""Phase 15 — Global Document Search
+
+Create document_search_index (one row per business document) with a
+prefix btree (varchar_pattern_ops) and a pg_trgm GIN index on search_key,
+then backfill from every searchable document table.
+
+Revision ID: y5z6a7b8c9d0
+Revises: x4y5z6a7b8c9
+Create Date: 2026-03-20
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision = "y5z6a7b8c9d0"
+down_revision = "x4y5z6a7b8c9"
+branch_labels = None
+depends_on = None
+
+
+# ── Idempotent helpers (create_all may have pre-created objects) ──
+def _q(conn, sql):
+    return conn.execute(sa.text(sql)).scalar() is not None
+
+def _table_ok(conn, n):
+    return _q(conn, f"SELECT 1 FROM information_schema.tables WHERE table_schema='public' AND table_name='{n}'")
+
+def _index_ok(conn, n):
+    return _q(conn, f"SELECT 1 FROM pg_indexes WHERE indexname='{n}'")
+
+
+# (doc_type, table, number column, title expression)
+_SOURCES = [
+    ("WO", "work_orders", "wo_number", "customer_name"),
+    ("PR", "purchase_requisitions", "pr_number", "NULL"),
+    ("PO", "purchase_orders", "po_number", "supplier_name"),
+    ("SO", "sales_orders", "so_number", "NULL"),
+    ("DO", "delivery_orders", "do_number", "NULL"),
+    ("SW", "stock_withdrawal_slips", "slip_number", "reference"),
+    ("TF", "transfer_requests", "transfer_number", "reference"),
+    ("ST", "stock_takes", "stocktake_number", "reference"),
+    ("TCS", "tool_checkout_slips", "slip_number", "reference"),
+    ("AP", "supplier_invoices", "invoice_number", "NULL"),
+    ("AR", "customer_invoices", "invoice_number", "NULL"),
+]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # 1. Create document_search_index table
+    if not _table_ok(conn, "document_search_index"):
+        op.create_table(
+            "document_search_index",
+            sa.Column("id", UUID(as_uuid=True), primary_key=True),
+            sa.Column("org_id", UUID(as_uuid=True), nullable=False),
+            sa.Column("doc_type", sa.String(10), nullable=False),
+            sa.Column("doc_id", UUID(as_uuid=True), nullable=False),
+            sa.Column("doc_number", sa.String(50), nullable=False),
+            sa.Column("search_key", sa.String(50), nullable=False),
+            sa.Column("status", sa.String(30), nullable=True),
+            sa.Column("title", sa.String(255), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=False, server_default="true"),
+            sa.Column("doc_updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+            sa.UniqueConstraint("doc_type", "doc_id", name="uq_doc_search_type_id"),
+        )
+
+    # 2. Indexes
+    if not _index_ok(conn, "ix_doc_search_org_updated"):
+        op.create_index(
+            "ix_doc_search_org_updated",
+            "document_search_index",
+            ["org_id", "doc_updated_at"],
+        )
+    if not _index_ok(conn, "ix_doc_search_org_key_prefix"):
+        # LIKE 'PO-2026%' — plain btree can't serve LIKE under non-C collations
+        op.execute(
+            "CREATE INDEX ix_doc_search_org_key_prefix "
+            "ON document_search_index (org_id, search_key varchar_pattern_ops)"
+        )
+    if not _index_ok(conn, "ix_doc_search_key_trgm"):
+        op.execute(
+            "CREATE INDEX ix_doc_search_key_trgm "
+            "ON document_search_index USING gin (search_key gin_trgm_ops)"
+        )
+
+    # 3. Backfill from every searchable document table
+    for doc_type, table, number_col, title_expr in _SOURCES:
+        op.execute(f"""
+            INSERT INTO document_search_index
+                (id, org_id, doc_type, doc_id, doc_number, search_key,
+                 status, title, is_active, doc_updated_at)
+            SELECT gen_random_uuid(), org_id, '{doc_type}', id, {number_col}, UPPER({number_col}),
+                   status::text, LEFT({title_expr}, 255), is_active, updated_at
+            FROM {table}
+            WHERE {number_col} IS NOT NULL
+            ON CONFLICT ON CONSTRAINT uq_doc_search_type_id DO NOTHING
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_doc_search_key_trgm", table_name="document_search_index")
+    op.drop_index("ix_doc_search_org_key_prefix", table_name="document_search_index")
+    op.drop_index("ix_doc_search_org_updated", table_name="document_search_index")
+    op.drop_table("document_search_index")
@@ -0,0 +1,64 @@
+"""Phase 15: Transactional email outbox
+
+Revision ID: z6a7b8c9d0e1
+Revises: y5z6a7b8c9d0
+Create Date: 2026-03-21
+
+1 new table: email_outbox (drained by the email outbox worker)
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "z6a7b8c9d0e1"
+down_revision = "y5z6a7b8c9d0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Enum — use raw SQL to handle asyncpg checkfirst limitation
+    op.execute("""
+        DO $$ BEGIN
+            CREATE TYPE email_status_enum AS ENUM ('PENDING', 'SENDING', 'SENT', 'DEAD');
+        EXCEPTION
+            WHEN duplicate_object THEN NULL;
+        END $$;
+    """)
+    email_status = sa.Enum(
+        "PENDING", "SENDING", "SENT", "DEAD",
+        name="email_status_enum",
+        create_type=False,
+    )
+
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("to_email", sa.String(255), nullable=False),
+        sa.Column("subject", sa.String(500), nullable=False),
+        sa.Column("html_body", sa.Text, nullable=False),
+        sa.Column("status", email_status, nullable=False, server_default="PENDING"),
+        sa.Column("attempts", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text, nullable=True),
+        sa.Column("entity_type", sa.String(50), nullable=True),
+        sa.Column("entity_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_email_outbox_org_id", "email_outbox", ["org_id"])
+    op.create_index("ix_email_outbox_org_status", "email_outbox", ["org_id", "status"])
+    op.create_index(
+        "ix_email_outbox_due",
+        "email_outbox",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("status IN ('PENDING', 'SENDING')"),
+    )
+
+
+def downgrade():
+    op.drop_table("email_outbox")
+    sa.Enum(name="email_status_enum").drop(op.get_bind(), checkfirst=True)
@@ -26,6 +26,9 @@ from app.api.performance import router as performance_router
 from app.api.stocktake import router as stocktake_router
 from app.api.line_auth import line_auth_router
 from app.api.transfer_request import transfer_request_router
+from app.api.search import search_router
+from app.api.data_import import import_router
+from app.api.events import events_router
 
 all_routers = [
     auth_router,
@@ -58,4 +61,7 @@ all_routers = [
     performance_router,
     line_auth_router,
     transfer_request_router,
+    search_router,
+    import_router,
+    events_router,
 ]
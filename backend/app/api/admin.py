@@ -24,7 +24,7 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import DEFAULT_ORG_ID
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.permissions import (
     ALL_PERMISSIONS,
     PERMISSION_DESCRIPTIONS,
@@ -51,6 +51,7 @@ from app.schemas.organization import (
     OrgWorkConfigUpdate,
     VALID_MENU_KEYS,
 )
+from app.schemas.security import OrgSecurityConfigUpdate
 from app.services.organization import (
     get_approval_configs,
     get_dept_menu,
@@ -452,7 +453,7 @@ async def api_audit_log(
     end_date: str | None = Query(default=None, description="ISO date yyyy-mm-dd"),
     limit: int = Query(default=50, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     token: dict = Depends(get_token_payload),
 ):
     """Enhanced audit log — returns AuditLog entries with filters and user enrichment."""
@@ -863,13 +864,13 @@ async def api_get_security_config(
     dependencies=[Depends(require("admin.config.update"))],
 )
 async def api_update_security_config(
-    body: "OrgSecurityConfigUpdate",
+    body: OrgSecurityConfigUpdate,
     request: Request,
     db: AsyncSession = Depends(get_db),
     token: dict = Depends(get_token_payload),
 ):
     """Update org security configuration."""
-    from app.schemas.security import OrgSecurityConfigResponse, OrgSecurityConfigUpdate
+    from app.schemas.security import OrgSecurityConfigResponse
     from app.services.security import update_security_config as svc_update_security
 
     org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
@@ -889,15 +890,13 @@ async def api_update_security_config(
     )
 
     await db.commit()
+    # Other workers reload on the "security" tag bump; this one can drop it now
+    from app.core.rate_limit import limiter
+    limiter.invalidate(str(org_id))
     await db.refresh(config)  # Reload server-side updated_at
     return OrgSecurityConfigResponse.model_validate(config)
 
 
-# Fix type annotation for body parameter
-from app.schemas.security import OrgSecurityConfigUpdate as _OrgSecurityConfigUpdate
-api_update_security_config.__annotations__["body"] = _OrgSecurityConfigUpdate
-
-
 # ============================================================
 # LOGIN HISTORY ROUTES  (Phase 13)
 # ============================================================
@@ -13,7 +13,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import DEFAULT_ORG_ID, get_settings
-from app.core.database import get_db
+from app.core.database import get_auth_db, get_db
 from app.core.security import (
     create_access_token,
     create_refresh_token,
@@ -23,7 +23,7 @@ from app.core.security import (
     verify_password,
 )
 from app.core.permissions import ROLE_PERMISSIONS, require
-from app.core.rate_limit import limiter, get_login_rate_limit, _refresh_rate_limits
+from app.core.rate_limit import limiter
 from app.models import User, RefreshToken
 from app.models.security import LoginStatus
 from app.schemas import (
@@ -121,15 +121,13 @@ def _create_tokens_and_refresh(
 
 
 @router.post("/login", response_model=LoginResponse)
-@limiter.limit(get_login_rate_limit)
+@limiter.limit("login")
 async def login(
     body: LoginRequest,
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_auth_db),
 ):
     """Authenticate user. Handles lockout, 2FA, and password expiry."""
-    # Refresh rate-limit cache from DB (non-blocking, every 5 min)
-    await _refresh_rate_limits()
     ip, user_agent = _get_client_info(request)
 
     # Find user (include inactive for recording purposes)
@@ -244,7 +242,7 @@ async def login(
 async def login_2fa(
     body: TwoFactorLoginRequest,
     request: Request,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_auth_db),
 ):
     """Complete 2FA login with OTP or backup code."""
     payload = verify_temp_token(body.temp_token, "2fa_pending")
@@ -426,7 +424,7 @@ async def revoke_all_other_sessions(
 # ============================================================
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh(body: RefreshRequest, request: Request, db: AsyncSession = Depends(get_db)):
+async def refresh(body: RefreshRequest, request: Request, db: AsyncSession = Depends(get_auth_db)):
     """Exchange refresh token for new access + refresh tokens (rotation)."""
     # Decode refresh token
     payload = decode_token(body.refresh_token)
@@ -623,7 +621,7 @@ async def register(
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
     body: RefreshRequest,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_auth_db),
 ):
     """Revoke refresh token. No access token required — allows cleanup after token expiry."""
     result = await db.execute(
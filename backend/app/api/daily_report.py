@@ -31,6 +31,7 @@ from app.core.security import get_token_payload
 from app.api._helpers import resolve_employee_id, resolve_employee, get_department_employee_ids
 from app.schemas.daily_report import (
     BatchApproveRequest,
+    BatchApproveResponse,
     DailyReportCreate,
     DailyReportListResponse,
     DailyReportResponse,
@@ -42,6 +43,7 @@ from app.services.daily_report import (
     batch_approve_daily_reports,
     create_daily_report,
     get_daily_report,
+    get_daily_reports,
     list_daily_reports,
     reject_daily_report,
     submit_daily_report,
@@ -223,7 +225,7 @@ async def api_approve_daily_report(
 
 @daily_report_router.post(
     "/batch-approve",
-    response_model=list[DailyReportResponse],
+    response_model=BatchApproveResponse,
     dependencies=[Depends(require("hr.dailyreport.approve"))],
 )
 async def api_batch_approve(
@@ -233,15 +235,11 @@ async def api_batch_approve(
 ):
     org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
     approver_id = UUID(token["sub"])
-    await batch_approve_daily_reports(
+    approved, errors = await batch_approve_daily_reports(
         db, body.report_ids, approver_id=approver_id, org_id=org_id
     )
-    # Return updated reports
-    results = []
-    for rid in body.report_ids:
-        r = await get_daily_report(db, rid, org_id=org_id)
-        results.append(r)
-    return results
+    items = await get_daily_reports(db, [r.id for r in approved], org_id=org_id)
+    return BatchApproveResponse(items=items, errors=errors)
 
 
 # ============================================================
@@ -0,0 +1,187 @@
+"""
+SSS Corp ERP — Bulk Import API
+Phase 15: CSV / XLSX master-data import + downloadable error report
+
+One upload endpoint per file type, each behind the permission of the
+single-record create it replaces. ?dry_run=true validates without loading.
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import DEFAULT_ORG_ID
+from app.core.database import get_db
+from app.core.permissions import ROLE_PERMISSIONS, require
+from app.core.security import get_token_payload
+from app.models.data_import import ImportRun
+from app.schemas.data_import import ImportRunResponse
+from app.services.data_import import (
+    IMPORT_ENTITIES,
+    IMPORT_ERROR_PREVIEW,
+    error_report_csv,
+    run_import,
+)
+
+import_router = APIRouter(prefix="/api/admin/imports", tags=["import"])
+
+
+async def _import(
+    entity: str, file: UploadFile, dry_run: bool, request: Request, db: AsyncSession, token: dict,
+) -> ImportRunResponse:
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    user_id = UUID(token["sub"])
+    run = await run_import(
+        db, entity=entity, file=file.file, file_name=file.filename or "upload",
+        org_id=org_id, created_by=user_id, role=token.get("role"), dry_run=dry_run,
+    )
+
+    if run.loaded_rows:
+        from app.services.security import create_audit_log
+        from app.api._helpers import get_client_ip
+        await create_audit_log(
+            db, user_id=user_id, org_id=org_id,
+            action="CREATE", resource_type="data_import",
+            resource_id=str(run.id),
+            description=(f"นำเข้า{IMPORT_ENTITIES[entity]['label']} {run.loaded_rows:,} รายการ "
+                         f"จากไฟล์ {run.file_name}"),
+            changes={"entity": entity, "total_rows": run.total_rows, "loaded_rows": run.loaded_rows,
+                     "skipped_rows": run.skipped_rows, "error_count": run.error_count},
+            ip_address=get_client_ip(request),
+            user_agent=request.headers.get("user-agent"),
+        )
+        await db.commit()
+
+    response = ImportRunResponse.model_validate(run)
+    response.errors = response.errors[:IMPORT_ERROR_PREVIEW]
+    return response
+
+
+@import_router.post(
+    "/products",
+    response_model=ImportRunResponse,
+    dependencies=[Depends(require("inventory.product.create"))],
+)
+async def api_import_products(
+    request: Request,
+    file: UploadFile = File(...),
+    dry_run: bool = Query(default=False),
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Import products (sku, name, model, description, product_type, unit, cost, min_stock)."""
+    return await _import("products", file, dry_run, request, db, token)
+
+
+@import_router.post(
+    "/employees",
+    response_model=ImportRunResponse,
+    dependencies=[Depends(require("hr.employee.create"))],
+)
+async def api_import_employees(
+    request: Request,
+    file: UploadFile = File(...),
+    dry_run: bool = Query(default=False),
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Import employees — department / cost center by code (cost center defaults from the department)."""
+    return await _import("employees", file, dry_run, request, db, token)
+
+
+@import_router.post(
+    "/customers",
+    response_model=ImportRunResponse,
+    dependencies=[Depends(require("customer.customer.create"))],
+)
+async def api_import_customers(
+    request: Request,
+    file: UploadFile = File(...),
+    dry_run: bool = Query(default=False),
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Import customers (code, name, contact_name, email, phone, address, tax_id)."""
+    return await _import("customers", file, dry_run, request, db, token)
+
+
+@import_router.post(
+    "/suppliers",
+    response_model=ImportRunResponse,
+    dependencies=[Depends(require("master.supplier.create"))],
+)
+async def api_import_suppliers(
+    request: Request,
+    file: UploadFile = File(...),
+    dry_run: bool = Query(default=False),
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Import suppliers (code, name, contact_name, email, phone, address, tax_id)."""
+    return await _import("suppliers", file, dry_run, request, db, token)
+
+
+@import_router.post(
+    "/opening-stock",
+    response_model=ImportRunResponse,
+    dependencies=[Depends(require("inventory.movement.create"))],
+)
+async def api_import_opening_stock(
+    request: Request,
+    file: UploadFile = File(...),
+    dry_run: bool = Query(default=False),
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    """
+    Post counted opening balances (sku, quantity, unit_cost, warehouse_code, location_code).
+    RECEIVE where the balance is empty; re-counting an existing balance posts an ADJUST (owner only, BR#7).
+    """
+    return await _import("opening_stock", file, dry_run, request, db, token)
+
+
+async def _get_run(db: AsyncSession, run_id: UUID, token: dict) -> ImportRun:
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    run = (await db.execute(
+        select(ImportRun).where(ImportRun.id == run_id, ImportRun.org_id == org_id)
+    )).scalar_one_or_none()
+    if run is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import run not found")
+    # Same permission as uploading that file type
+    permission = IMPORT_ENTITIES[run.entity]["permission"]
+    if permission not in ROLE_PERMISSIONS.get(token.get("role"), set()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Permission denied: {permission}",
+        )
+    return run
+
+
+@import_router.get("/{run_id}", response_model=ImportRunResponse)
+async def api_get_import_run(
+    run_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Summary of an import run (first rejected rows inline)."""
+    response = ImportRunResponse.model_validate(await _get_run(db, run_id, token))
+    response.errors = response.errors[:IMPORT_ERROR_PREVIEW]
+    return response
+
+
+@import_router.get("/{run_id}/errors")
+async def api_download_import_errors(
+    run_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Rejected rows of an import run as CSV (row, column, value, message)."""
+    run = await _get_run(db, run_id, token)
+    return StreamingResponse(
+        iter([error_report_csv(run)]),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename=import_{run.entity}_{run.id}_errors.csv"},
+    )
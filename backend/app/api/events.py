@@ -0,0 +1,45 @@
+"""
+SSS Corp ERP — Domain Event Replay API
+Phase 15: read the domain event outbox from an offset
+
+Live consumers read the per-org Redis stream (events:{org_id}); this endpoint
+serves the same published events by offset for consumers that start late, fell
+behind the stream's MAXLEN trim, or cannot reach Redis.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import DEFAULT_ORG_ID
+from app.core.database import get_read_db
+from app.core.permissions import require
+from app.core.security import get_token_payload
+from app.schemas.event import DomainEventListResponse
+from app.services.events import list_events
+
+events_router = APIRouter(prefix="/api/admin/events", tags=["events"])
+
+
+@events_router.get(
+    "",
+    response_model=DomainEventListResponse,
+    dependencies=[Depends(require("admin.role.read"))],
+)
+async def api_list_events(
+    after: int = Query(default=0, ge=0, description="last offset already processed"),
+    limit: int = Query(default=500, ge=1, le=5000),
+    aggregate_type: Optional[str] = Query(default=None),
+    event_type: Optional[str] = Query(default=None),
+    db: AsyncSession = Depends(get_read_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Published domain events with offset > after, oldest first."""
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    items = await list_events(
+        db, org_id=org_id, after=after, limit=limit,
+        aggregate_type=aggregate_type, event_type=event_type,
+    )
+    return {"items": items, "next_offset": items[-1].offset if items else after}
@@ -3,10 +3,12 @@ SSS Corp ERP — Finance API Routes
 Phase 3: Reports + export
 Phase 8.5: Finance Dashboard
 Phase 8.6: Dashboard Charts (Inventory + Stock Movement)
+Phase 15: Open-item AR/AP aging as of a date
 
 Endpoints (from CLAUDE.md):
   GET    /api/finance/reports                    finance.report.read
   GET    /api/finance/reports/finance-dashboard  finance.report.read  (Phase 8.5)
+  GET    /api/finance/reports/aging              finance.report.read  (Phase 15)
   GET    /api/finance/reports/dashboard-charts   finance.report.read  (Phase 8.6)
   GET    /api/finance/reports/export             finance.report.export
 """
@@ -20,14 +22,16 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached
 from app.core.config import DEFAULT_ORG_ID
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.permissions import require
 from app.core.security import get_token_payload
 from app.models.inventory import StockMovement
 from app.models.purchasing import PurchaseOrder
 from app.models.sales import SalesOrder, SOStatus
 from app.models.workorder import WorkOrder, WOStatus
+from app.services.partition import date_range_clauses
 
 import csv
 import io
@@ -42,7 +46,7 @@ finance_router = APIRouter(prefix="/api/finance", tags=["finance"])
 async def api_finance_reports(
     period_start: Optional[date] = Query(default=None),
     period_end: Optional[date] = Query(default=None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     token: dict = Depends(get_token_payload),
 ):
     """Generate finance summary report."""
@@ -85,10 +89,10 @@ async def api_finance_reports(
     movement_query = select(
         func.coalesce(func.sum(StockMovement.quantity * StockMovement.unit_cost), 0),
     ).where(StockMovement.is_reversed == False, StockMovement.org_id == org_id)
-    if period_start:
-        movement_query = movement_query.where(func.date(StockMovement.created_at) >= period_start)
-    if period_end:
-        movement_query = movement_query.where(func.date(StockMovement.created_at) <= period_end)
+    # Plain range on created_at (not func.date) — keeps the index usable and prunes partitions
+    movement_query = movement_query.where(
+        *date_range_clauses(StockMovement.created_at, period_start, period_end)
+    )
     movement_result = await db.execute(movement_query)
     inventory_value = float(movement_result.scalar() or 0)
 
@@ -114,24 +118,44 @@ async def api_finance_reports(
     "/reports/finance-dashboard",
     dependencies=[Depends(require("finance.report.read"))],
 )
+@cached(tags=("finance", "purchasing", "sales", "workorder", "inventory", "costing"), ttl=120)
 async def api_finance_dashboard(
     months: int = Query(default=6, ge=1, le=12),
-    db: AsyncSession = Depends(get_db),
+    as_of: Optional[date] = Query(default=None, description="Aging reference date (default today)"),
+    db: AsyncSession = Depends(get_read_db),
     token: dict = Depends(get_token_payload),
 ):
     """Finance Dashboard — comprehensive financial overview (Phase 8.5)."""
     org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
     from app.services.finance import get_finance_dashboard
-    return await get_finance_dashboard(db, org_id=org_id, months=months)
+    return await get_finance_dashboard(db, org_id=org_id, months=months, as_of=as_of)
+
+
+@finance_router.get(
+    "/reports/aging",
+    dependencies=[Depends(require("finance.report.read"))],
+)
+@cached(tags=("finance",), ttl=120)
+async def api_open_item_aging(
+    side: str = Query(default="ar", pattern=r"^(ar|ap)$"),
+    as_of: Optional[date] = Query(default=None, description="Aging reference date (default today)"),
+    db: AsyncSession = Depends(get_read_db),
+    token: dict = Depends(get_token_payload),
+):
+    """AR/AP open-item aging — brackets + per-customer/supplier outstanding (Phase 15)."""
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    from app.services.finance import compute_open_items
+    return await compute_open_items(db, side=side, org_id=org_id, as_of=as_of)
 
 
 @finance_router.get(
     "/reports/dashboard-charts",
     dependencies=[Depends(require("finance.report.read"))],
 )
+@cached(tags=("inventory",), ttl=120)
 async def api_dashboard_charts(
     months: int = Query(default=6, ge=1, le=12),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     token: dict = Depends(get_token_payload),
 ):
     """Dashboard charts — inventory value by type + monthly stock movements (Phase 8.6)."""
@@ -195,9 +219,10 @@ async def api_finance_export(
     "/reports/monthly-summary",
     dependencies=[Depends(require("finance.report.read"))],
 )
+@cached(tags=("sales", "purchasing", "workorder"), ttl=120)
 async def api_monthly_summary(
     months: int = Query(default=6, ge=1, le=12),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     token: dict = Depends(get_token_payload),
 ):
     """Monthly summary for dashboard charts (SO revenue, PO spend, WO closed)."""
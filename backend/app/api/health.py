@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.core.database import get_db
 from app.core.rate_limit import limiter
+from app.core.redis import get_redis_manager
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["health"])
@@ -31,17 +32,14 @@ async def health_check(db: AsyncSession = Depends(get_db)):
         logger.error("Health check — DB failed: %s", e)
         checks["database"] = "error"
 
-    # Redis check
-    try:
-        import redis.asyncio as aioredis
-
-        r = aioredis.from_url(settings.REDIS_URL, socket_connect_timeout=2)
-        await r.ping()
-        await r.aclose()
+    # Redis check (shared pool; an open circuit answers without a network round trip)
+    redis_manager = get_redis_manager()
+    if await redis_manager.ping():
         checks["redis"] = "ok"
-    except Exception as e:
-        logger.warning("Health check — Redis unavailable: %s", e)
+    else:
+        logger.warning("Health check — Redis unavailable: %s", redis_manager.last_error)
         checks["redis"] = "unavailable"
+    checks["redis_circuit"] = redis_manager.state
 
     # Overall status
     if checks["database"] == "ok":
@@ -39,6 +39,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import DEFAULT_ORG_ID
 from app.core.database import get_db
 from app.core.permissions import require
+from app.core.responses import fast_json
 from app.core.security import get_token_payload
 from datetime import date
 
@@ -47,8 +48,11 @@ from app.schemas.hr import (
     EmployeeListResponse,
     EmployeeResponse,
     EmployeeUpdate,
+    LeaveBalanceEntryResponse,
     LeaveBalanceListResponse,
     LeaveBalanceResponse,
+    LeaveBalanceRolloverRequest,
+    LeaveBalanceRolloverResponse,
     LeaveBalanceUpdate,
     LeaveCreate,
     LeaveListResponse,
@@ -90,6 +94,7 @@ from app.services.hr import (
     get_payslips_for_run,
     get_timesheet,
     list_employees,
+    list_leave_balance_entries,
     list_leave_balances,
     list_leaves,
     list_payroll_runs,
@@ -99,6 +104,7 @@ from app.services.hr import (
     release_payslips,
     unlock_timesheet,
     update_employee,
+    rollover_leave_balances,
     update_leave_balance,
     update_profile_self,
     update_shift_roster,
@@ -899,7 +905,8 @@ async def api_list_leave_balances(
         db, employee_id=filter_employee_id, employee_ids=filter_employee_ids,
         year=year, org_id=org_id,
     )
-    return LeaveBalanceListResponse(items=items, total=len(items))
+    # Service rows already match LeaveBalanceResponse — render without re-validation (Phase 15)
+    return fast_json(LeaveBalanceListResponse, {"items": items, "total": len(items)})
 
 
 @hr_router.put(
@@ -915,7 +922,40 @@ async def api_update_leave_balance(
 ):
     org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
     update_data = body.model_dump(exclude_unset=True)
-    return await update_leave_balance(db, balance_id, update_data=update_data, org_id=org_id)
+    return await update_leave_balance(
+        db, balance_id, update_data=update_data, adjusted_by=UUID(token["sub"]), org_id=org_id,
+    )
+
+
+@hr_router.get(
+    "/leave-balance/{balance_id}/entries",
+    response_model=list[LeaveBalanceEntryResponse],
+    dependencies=[Depends(require("hr.employee.update"))],
+)
+async def api_list_leave_balance_entries(
+    balance_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    return await list_leave_balance_entries(db, balance_id, org_id=org_id)
+
+
+@hr_router.post(
+    "/leave-balance/rollover",
+    response_model=LeaveBalanceRolloverResponse,
+    dependencies=[Depends(require("hr.employee.update"))],
+)
+async def api_rollover_leave_balances(
+    body: LeaveBalanceRolloverRequest,
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Phase 15: open next year's balances for all employees, carrying unused days."""
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    return await rollover_leave_balances(
+        db, from_year=body.from_year, org_id=org_id, created_by=UUID(token["sub"]),
+    )
 
 
 # ============================================================
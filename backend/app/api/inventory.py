@@ -14,11 +14,17 @@ Endpoints (from CLAUDE.md):
   GET    /api/inventory/stock-by-location     inventory.product.read
   GET    /api/inventory/low-stock-count       inventory.product.read
 
+  GET    /api/inventory/stock-snapshots       inventory.product.read
+  POST   /api/inventory/stock-snapshots       inventory.product.update
+  GET    /api/inventory/stock-as-of           inventory.product.read
+  GET    /api/inventory/stock-valuation       inventory.product.read
+
   GET    /api/stock/movements                 inventory.movement.read
   POST   /api/stock/movements                 inventory.movement.create
   POST   /api/stock/movements/{id}/reverse    inventory.movement.delete
 """
 
+from datetime import date
 from typing import Optional
 from uuid import UUID
 
@@ -26,9 +32,11 @@ from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cached
 from app.core.config import DEFAULT_ORG_ID
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.permissions import require
+from app.core.responses import fast_json
 from app.core.security import get_token_payload
 from app.schemas.inventory import (
     BatchNumberListResponse,
@@ -40,12 +48,14 @@ from app.schemas.inventory import (
     ProductResponse,
     ProductUpdate,
     StockBatchListResponse,
-    StockBatchResponse,
     StockByLocationListResponse,
     StockByLocationResponse,
     StockMovementCreate,
     StockMovementListResponse,
     StockMovementResponse,
+    StockSnapshotCreate,
+    StockSnapshotListResponse,
+    StockSnapshotResponse,
 )
 from app.services.inventory import (
     create_movement,
@@ -65,6 +75,12 @@ from app.services.inventory import (
     reverse_movement,
     update_product,
 )
+from app.services.stock_snapshot import (
+    get_month_end_valuation,
+    get_stock_as_of,
+    list_stock_snapshots,
+    take_stock_snapshot,
+)
 
 
 # ============================================================
@@ -347,13 +363,14 @@ async def api_low_stock_count(
     "/stock-aging",
     dependencies=[Depends(require("inventory.product.read"))],
 )
+@cached(tags=("inventory",), ttl=300)
 async def api_stock_aging_report(
     warehouse_id: Optional[UUID] = Query(default=None),
     product_type: Optional[str] = Query(
         default=None,
         pattern=r"^(MATERIAL|CONSUMABLE|SPAREPART|FINISHED_GOODS)$",
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     token: dict = Depends(get_token_payload),
 ):
     """Stock Aging Report — FIFO-based inventory age analysis by bracket."""
@@ -475,6 +492,8 @@ async def api_list_movements(
     location_id: Optional[UUID] = Query(default=None),
     work_order_id: Optional[UUID] = Query(default=None),
     batch_number: Optional[str] = Query(default=None, max_length=50),
+    date_from: Optional[date] = Query(default=None),
+    date_to: Optional[date] = Query(default=None),
     db: AsyncSession = Depends(get_db),
     token: dict = Depends(get_token_payload),
 ):
@@ -484,7 +503,7 @@ async def api_list_movements(
         db, limit=limit, offset=offset, product_id=product_id,
         movement_type=movement_type, location_id=location_id,
         work_order_id=work_order_id, org_id=org_id,
-        batch_number=batch_number,
+        batch_number=batch_number, date_from=date_from, date_to=date_to,
     )
 
     # Batch-fetch location names for movements
@@ -645,9 +664,10 @@ async def api_list_stock_by_batch(
         location_id=location_id, batch_number=batch_number,
         limit=limit, offset=offset,
     )
-    return StockBatchListResponse(
-        items=[StockBatchResponse(**item) for item in items],
-        total=total, limit=limit, offset=offset,
+    # Service rows already match StockBatchResponse — render without re-validation (Phase 15)
+    return fast_json(
+        StockBatchListResponse,
+        {"items": items, "total": total, "limit": limit, "offset": offset},
     )
 
 
@@ -685,3 +705,81 @@ async def api_generate_batch_number(
     org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
     batch_num = await generate_batch_number(db, org_id=org_id)
     return GenerateBatchNumberResponse(batch_number=batch_num)
+
+
+# ============================================================
+# STOCK SNAPSHOTS + POINT-IN-TIME STOCK (Phase 15)
+# ============================================================
+
+@product_router.get(
+    "/stock-snapshots",
+    response_model=StockSnapshotListResponse,
+    dependencies=[Depends(require("inventory.product.read"))],
+)
+async def api_list_stock_snapshots(
+    limit: int = Query(default=24, ge=1, le=120),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    """List month-end stock snapshots, newest first."""
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    items, total = await list_stock_snapshots(db, org_id=org_id, limit=limit, offset=offset)
+    return StockSnapshotListResponse(
+        items=[StockSnapshotResponse.model_validate(s) for s in items],
+        total=total, limit=limit, offset=offset,
+    )
+
+
+@product_router.post(
+    "/stock-snapshots",
+    response_model=StockSnapshotResponse,
+    status_code=201,
+    dependencies=[Depends(require("inventory.product.update"))],
+)
+async def api_take_stock_snapshot(
+    body: StockSnapshotCreate,
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    """(Re)take the month-end snapshot for body.month — normally done by the daily job."""
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    return await take_stock_snapshot(
+        db, month=body.month, org_id=org_id, created_by=UUID(token["sub"]),
+    )
+
+
+@product_router.get(
+    "/stock-as-of",
+    dependencies=[Depends(require("inventory.product.read"))],
+)
+@cached(tags=("inventory",), ttl=300)
+async def api_stock_as_of(
+    as_of: date = Query(...),
+    group_by: str = Query(default="product", pattern=r"^(product|location|product_type)$"),
+    product_id: Optional[UUID] = Query(default=None),
+    location_id: Optional[UUID] = Query(default=None),
+    db: AsyncSession = Depends(get_read_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Stock on hand + value at the end of as_of — nearest snapshot + movements since."""
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    return await get_stock_as_of(
+        db, as_of=as_of, org_id=org_id, group_by=group_by,
+        product_id=product_id, location_id=location_id,
+    )
+
+
+@product_router.get(
+    "/stock-valuation",
+    dependencies=[Depends(require("inventory.product.read"))],
+)
+@cached(tags=("inventory",), ttl=300)
+async def api_month_end_valuation(
+    month: date = Query(...),
+    db: AsyncSession = Depends(get_read_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Month-end inventory value by product type (reads the snapshot when there is one)."""
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    return await get_month_end_valuation(db, month=month, org_id=org_id)
@@ -543,6 +543,7 @@ async def api_create_leave_type(
         name=body.name,
         is_paid=body.is_paid,
         default_quota=body.default_quota,
+        carry_forward_max=body.carry_forward_max,
         org_id=org_id,
     )
 
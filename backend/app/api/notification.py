@@ -1,18 +1,23 @@
 """
 SSS Corp ERP — Notification API
 Phase 9: Notification Center — 5 endpoints (JWT-only, no permissions)
+Phase 15: + SSE stream (/stream) fed by Redis pub/sub — replaces badge polling
 
 All endpoints filter by user_id + org_id from JWT token.
 """
 
+import logging
+import time
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.security import get_token_payload
+from app.core.database import AsyncSessionLocal, get_db
+from app.core.redis import RedisPoolExhaustedError, get_pubsub_redis
+from app.core.security import decode_token, get_token_payload
 from app.schemas.notification import (
     NotificationListResponse,
     NotificationResponse,
@@ -24,10 +29,17 @@ from app.services.notification import (
     list_notifications,
     mark_all_as_read,
     mark_as_read,
+    notification_channel,
+    publish_pending_notifications,
 )
 
+logger = logging.getLogger(__name__)
+
 notification_router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 
+STREAM_POLL_SECONDS = 1.0
+STREAM_HEARTBEAT_SECONDS = 25.0
+
 
 # ── List notifications ──
 @notification_router.get(
@@ -85,6 +97,7 @@ async def api_mark_as_read(
     if not notif:
         raise HTTPException(status_code=404, detail="Notification not found")
     await db.commit()
+    await publish_pending_notifications(db)
     return NotificationResponse.model_validate(notif)
 
 
@@ -100,6 +113,7 @@ async def api_mark_all_as_read(
     org_id = UUID(token["org_id"])
     count = await mark_all_as_read(db, user_id, org_id)
     await db.commit()
+    await publish_pending_notifications(db)
     return {"updated": count}
 
 
@@ -118,4 +132,84 @@ async def api_delete_notification(
     if not deleted:
         raise HTTPException(status_code=404, detail="Notification not found")
     await db.commit()
+    await publish_pending_notifications(db)
     return {"deleted": True}
+
+
+# ── Real-time stream (Server-Sent Events) ──
+def _stream_token_payload(
+    request: Request,
+    token: Optional[str] = Query(None, description="Access token (EventSource cannot set headers)"),
+) -> dict:
+    auth = request.headers.get("authorization", "")
+    raw = auth.split(" ", 1)[1] if auth.startswith("Bearer ") else token
+    if not raw:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    payload = decode_token(raw)
+    if payload.get("type") != "access":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
+    return payload
+
+
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@notification_router.get(
+    "/stream",
+)
+async def api_notification_stream(
+    request: Request,
+    token: dict = Depends(_stream_token_payload),
+):
+    """
+    Push new notifications as they are created.
+    Events: `unread_count` (once, on connect) and `notification` (JSON payload).
+    Returns 503 when Redis is unavailable or this worker already holds
+    NOTIFICATION_STREAM_MAX_CONNECTIONS streams — the client should fall back to polling.
+    """
+    user_id = UUID(token["sub"])
+    org_id = UUID(token["org_id"])
+
+    pubsub = get_pubsub_redis().pubsub()
+    try:
+        await pubsub.subscribe(notification_channel(user_id))
+    except RedisPoolExhaustedError:
+        logger.info("Notification stream refused: per-worker stream cap reached")
+        await pubsub.aclose()
+        raise HTTPException(status_code=503, detail="Realtime notifications busy")
+    except Exception:
+        logger.warning("Notification stream unavailable (Redis)", exc_info=True)
+        await pubsub.aclose()
+        raise HTTPException(status_code=503, detail="Realtime notifications unavailable")
+
+    async def event_stream():
+        try:
+            # Short-lived session — don't hold a pooled connection for the whole stream
+            async with AsyncSessionLocal() as db:
+                count = await get_unread_count(db, user_id, org_id)
+            yield _sse("unread_count", f'{{"count": {count}}}')
+
+            last_sent = time.monotonic()
+            while not await request.is_disconnected():
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=STREAM_POLL_SECONDS
+                )
+                if message and message.get("type") == "message":
+                    yield _sse("notification", message["data"])
+                    last_sent = time.monotonic()
+                elif time.monotonic() - last_sent >= STREAM_HEARTBEAT_SECONDS:
+                    yield ": ping\n\n"
+                    last_sent = time.monotonic()
+        finally:
+            try:
+                await pubsub.unsubscribe()
+                await pubsub.aclose()
+            except Exception:
+                logger.debug("Notification stream cleanup failed", exc_info=True)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -9,8 +9,9 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings, DEFAULT_ORG_ID
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.permissions import require
+from app.core.redis import get_redis, get_redis_manager
 from app.core.security import get_token_payload
 from app.schemas.performance import (
     AnalysisResponse,
@@ -48,6 +49,7 @@ def _org_id(token: dict) -> UUID:
 async def api_performance_summary(
     period: str = Query("24h", pattern=r"^(24h|7d|30d)$"),
     db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
     token: dict = Depends(get_token_payload),
 ):
     """Aggregated performance metrics for a given period."""
@@ -55,14 +57,12 @@ async def api_performance_summary(
 
     # Flush Redis buffer first to get fresh data
     try:
-        import redis.asyncio as aioredis
-        redis_client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
-        await perf_svc.flush_redis_buffer(redis_client, db)
-        await redis_client.aclose()
+        await perf_svc.flush_redis_buffer(get_redis(), db)
     except Exception:
         pass
 
-    return await perf_svc.get_summary(db, org_id, period)
+    # Buffer flush writes to the primary; aggregation reads from the replica (lag-guarded)
+    return await perf_svc.get_summary(read_db, org_id, period)
 
 
 @router.get(
@@ -74,7 +74,7 @@ async def api_performance_endpoints(
     period: str = Query("24h", pattern=r"^(24h|7d|30d)$"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     token: dict = Depends(get_token_payload),
 ):
     """Per-endpoint performance breakdown."""
@@ -92,7 +92,7 @@ async def api_performance_endpoints(
 )
 async def api_slow_requests(
     limit: int = Query(50, ge=1, le=200),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     token: dict = Depends(get_token_payload),
 ):
     """Recent slow requests."""
@@ -101,6 +101,46 @@ async def api_slow_requests(
     return {"items": items, "total": total}
 
 
+@router.get(
+    "/db-pools",
+    dependencies=[Depends(require("admin.config.read"))],
+)
+async def api_db_pool_metrics():
+    """Per-workload-class DB slot utilization + queue wait, and raw engine pool status (Phase 15)."""
+    from app.core.database import all_engines
+    from app.core.workload import workload_metrics
+
+    return {
+        "workloads": workload_metrics(),
+        "engines": [
+            {"url": eng.url.render_as_string(hide_password=True), "pool": eng.pool.status()}
+            for eng in all_engines()
+        ],
+    }
+
+
+@router.get(
+    "/redis",
+    dependencies=[Depends(require("admin.config.read"))],
+)
+async def api_redis_metrics():
+    """Shared Redis client — circuit state, pool usage, per-command calls/errors/latency (Phase 15)."""
+    from app.core.cache import cache_metrics
+
+    return {**get_redis_manager().metrics(), "response_cache": cache_metrics()}
+
+
+@router.get(
+    "/rate-limits",
+    dependencies=[Depends(require("admin.config.read"))],
+)
+async def api_rate_limit_metrics():
+    """Rate limiter — cached org policies + allowed/throttled/local-fallback counts per policy (Phase 15)."""
+    from app.core.rate_limit import limiter
+
+    return limiter.metrics()
+
+
 # ============================================================
 # 14.4 — WEB VITALS BEACON
 # ============================================================
@@ -21,6 +21,10 @@ PO Endpoints (existing):
   DELETE /api/purchasing/po/{id}              purchasing.po.delete
   POST   /api/purchasing/po/{id}/approve      purchasing.po.approve
   POST   /api/purchasing/po/{id}/receive      purchasing.po.update
+
+Net Requirements (Phase 15):
+  GET    /api/purchasing/mrp/suggestions      purchasing.pr.read
+  POST   /api/purchasing/mrp/draft-prs        purchasing.pr.create
 """
 
 from typing import Optional
@@ -31,13 +35,16 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import DEFAULT_ORG_ID
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.permissions import require
 from app.core.security import get_token_payload
 from app.api._helpers import resolve_employee, resolve_employee_id
 from app.schemas.purchasing import (
     ConvertToPORequest,
     GoodsReceiptRequest,
+    MRPDraftRequest,
+    MRPDraftResponse,
+    MRPSuggestionListResponse,
     PRApproveRequest,
     PRCreate,
     PRListResponse,
@@ -48,6 +55,7 @@ from app.schemas.purchasing import (
     PurchaseOrderResponse,
     PurchaseOrderUpdate,
 )
+from app.services.mrp import compute_net_requirements, draft_reorder_requisitions
 from app.services.organization import check_approval_bypass
 from app.services.purchasing import (
     approve_purchase_order,
@@ -630,6 +638,78 @@ async def api_receive_goods(
     return _po_to_response(po)
 
 
+# ============================================================
+# NET REQUIREMENTS / REORDER SUGGESTIONS (Phase 15)
+# ============================================================
+
+@purchasing_router.get(
+    "/mrp/suggestions",
+    response_model=MRPSuggestionListResponse,
+    dependencies=[Depends(require("purchasing.pr.read"))],
+)
+async def api_mrp_suggestions(
+    horizon_days: int = Query(default=28, ge=1, le=365),
+    bucket_days: int = Query(default=7, ge=1, le=90),
+    shortages_only: bool = Query(default=True),
+    limit: int = Query(default=50, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_read_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Projected availability per bucket + suggested reorder quantity per product."""
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    items, total = await compute_net_requirements(
+        db, org_id=org_id, horizon_days=horizon_days, bucket_days=bucket_days,
+        shortages_only=shortages_only, limit=limit, offset=offset,
+    )
+    return MRPSuggestionListResponse(items=items, total=total, limit=limit, offset=offset)
+
+
+@purchasing_router.post(
+    "/mrp/draft-prs",
+    response_model=MRPDraftResponse,
+    status_code=201,
+    dependencies=[Depends(require("purchasing.pr.create"))],
+)
+async def api_mrp_draft_prs(
+    body: MRPDraftRequest,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    """Draft PRs (one per need date) for every current shortage."""
+    user_id = UUID(token["sub"])
+    org_id = UUID(token["org_id"]) if "org_id" in token else DEFAULT_ORG_ID
+    suggestions, _ = await compute_net_requirements(
+        db, org_id=org_id, horizon_days=body.horizon_days, bucket_days=body.bucket_days,
+        product_ids=body.product_ids,
+    )
+    prs = await draft_reorder_requisitions(
+        db, org_id=org_id, suggestions=suggestions,
+        cost_center_id=body.cost_center_id, cost_element_id=body.cost_element_id,
+        created_by=user_id, requester_id=await resolve_employee_id(db, user_id),
+    )
+
+    from app.services.security import create_audit_log
+    from app.api._helpers import get_client_ip
+    for pr in prs:
+        await create_audit_log(
+            db, user_id=user_id, org_id=org_id,
+            action="CREATE", resource_type="purchase_requisition",
+            resource_id=str(pr.id),
+            description=f"สร้างใบขอซื้อ {pr.pr_number} (MRP)",
+            ip_address=get_client_ip(request),
+            user_agent=request.headers.get("user-agent"),
+        )
+    await db.commit()
+
+    return MRPDraftResponse(
+        pr_ids=[pr.id for pr in prs],
+        pr_numbers=[pr.pr_number for pr in prs],
+        line_count=sum(len(pr.lines) for pr in prs),
+    )
+
+
 # ============================================================
 # RESPONSE HELPERS
 # ============================================================
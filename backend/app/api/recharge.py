@@ -22,7 +22,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import cached
+from app.core.database import get_db, get_read_db
 from app.core.permissions import require
 from app.core.security import get_token_payload
 from app.schemas.recharge import (
@@ -288,10 +289,11 @@ async def list_entries(
     response_model=CostCenterSummaryResponse,
     dependencies=[Depends(require("finance.report.read"))],
 )
+@cached(tags=("costing", "workorder"), ttl=300)
 async def cost_center_summary(
     year: Optional[int] = Query(None),
     month: Optional[int] = Query(None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     token: dict = Depends(get_token_payload),
 ):
     org_id = UUID(token["org_id"])
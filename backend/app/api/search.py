@@ -0,0 +1,48 @@
+"""
+SSS Corp ERP — Global Search API
+Phase 15: Document number search across all modules (JWT-only)
+
+Results are filtered per document type by the caller's role —
+a type is searchable only if the role holds its read permission.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.security import get_token_payload
+from app.schemas.search import SearchHit, SearchResponse
+from app.services.search import allowed_doc_types, search_documents
+
+search_router = APIRouter(prefix="/api/search", tags=["search"])
+
+
+@search_router.get(
+    "",
+    response_model=SearchResponse,
+)
+async def api_global_search(
+    q: str = Query(..., min_length=1, max_length=50),
+    types: Optional[str] = Query(None, description="Comma-separated doc types, e.g. PO,PR"),
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    token: dict = Depends(get_token_payload),
+):
+    org_id = UUID(token["org_id"])
+
+    doc_types = allowed_doc_types(token.get("role"))
+    if types:
+        requested = {t.strip().upper() for t in types.split(",") if t.strip()}
+        doc_types = [t for t in doc_types if t in requested]
+
+    hits = await search_documents(
+        db, org_id=org_id, query=q, doc_types=doc_types, limit=limit
+    )
+    return SearchResponse(
+        query=q,
+        items=[SearchHit(**h) for h in hits],
+        total=len(hits),
+    )
@@ -35,7 +35,8 @@ from app.core.security import (
 from app.models.organization import Organization, Department
 from app.models.user import RefreshToken, User
 from app.models.master import CostCenter, OTType, LeaveType
-from app.models.hr import Employee, LeaveBalance, PayType
+from app.models.hr import Employee, PayType
+from app.services.hr import open_leave_balance
 
 
 router = APIRouter(prefix="/api/setup", tags=["setup"])
@@ -238,15 +239,15 @@ async def api_setup(
     # 10. Create Leave Balances for Owner
     current_year = date.today().year
     for lt_id, quota in leave_type_ids_with_quota:
-        lb = LeaveBalance(
+        await open_leave_balance(
+            db,
             employee_id=employee.id,
             leave_type_id=lt_id,
             year=current_year,
             quota=quota,
-            used=0,
             org_id=org.id,
+            created_by=user.id,
         )
-        db.add(lb)
 
     # 11. Create tokens
     token_data = {
@@ -0,0 +1,3 @@
+"""
+SSS Corp ERP — Performance benchmarks (run against a scratch database, never production)
+"""
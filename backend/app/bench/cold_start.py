@@ -0,0 +1,126 @@
+"""
+Benchmark — API cold start: `import app.main` in a fresh interpreter, with a regression budget.
+Run: python -m app.bench.cold_start [--repeat 5] [--budget-ms 6000] [--top 15]
+
+Each sample is a new process (`python -c "import app.main"`), so it includes interpreter
+start-up, every router/schema import and router mounting — what a new uvicorn worker pays
+before lifespan. Also reports the slowest imports (-X importtime) and checks that modules
+deferred to first use (LAZY_MODULES) are not pulled in at import time.
+
+Exit status 1 when the median exceeds --budget-ms (default: COLD_START_BUDGET_MS env, else
+6000) or a lazy module is imported eagerly — usable as a CI gate.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Heavy optional dependencies that must stay out of the API import path
+LAZY_MODULES = ("openpyxl", "anthropic", "qrcode", "PIL", "pyotp", "sentry_sdk", "httpx")
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| *(\S+)$")
+
+
+def _env() -> dict:
+    # Sentry is imported only when a DSN is configured — measure the default path
+    return {**os.environ, "SENTRY_DSN": ""}
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=BACKEND_DIR,
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def measure_cold_start(repeat: int) -> list[float]:
+    """Wall-clock ms of `import app.main` in `repeat` fresh interpreters."""
+    _run("-c", "import app.main")  # warm the bytecode / OS file cache
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        _run("-c", "import app.main")
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def eager_heavy_modules() -> list[str]:
+    """LAZY_MODULES that `import app.main` loads anyway."""
+    out = _run(
+        "-c",
+        "import sys, app.main; "
+        f"print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))",
+    ).stdout
+    return out.split()
+
+
+def _slowest(timings: dict[str, float], top: int) -> list[tuple[str, float]]:
+    return sorted(timings.items(), key=lambda kv: kv[1], reverse=True)[:top]
+
+
+def import_profile(top: int) -> tuple[list[tuple[str, float]], list[tuple[str, float]]]:
+    """(top-level packages by cumulative ms, app.* modules by self ms) from -X importtime."""
+    stderr = _run("-X", "importtime", "-c", "import app.main").stderr
+    packages: dict[str, float] = {}
+    app_modules: dict[str, float] = {}
+    for line in stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if not m:
+            continue
+        self_us, cumulative_us, name = m.groups()
+        if name.startswith("app.") or name == "app":
+            app_modules[name] = int(self_us) / 1000
+        elif "." not in name:
+            packages[name] = max(packages.get(name, 0.0), int(cumulative_us) / 1000)
+    return _slowest(packages, top), _slowest(app_modules, top)
+
+
+def run(repeat: int, budget_ms: float, top: int) -> bool:
+    samples = measure_cold_start(repeat)
+    median = statistics.median(samples)
+    print(f"cold start (import app.main): median {median:.0f} ms  "
+          f"min {min(samples):.0f}  max {max(samples):.0f}  ({repeat} runs, budget {budget_ms:.0f} ms)")
+
+    packages, app_modules = import_profile(top)
+    print("\nslowest packages (cumulative ms)")
+    for name, ms in packages:
+        print(f"  {ms:>8.1f}  {name}")
+    print("\nslowest app modules (self ms)")
+    for name, ms in app_modules:
+        print(f"  {ms:>8.1f}  {name}")
+
+    eager = eager_heavy_modules()
+    ok = median <= budget_ms and not eager
+    if eager:
+        print(f"\nFAIL: imported eagerly (should be lazy): {', '.join(eager)}")
+    if median > budget_ms:
+        print(f"\nFAIL: median {median:.0f} ms exceeds budget {budget_ms:.0f} ms")
+    if ok:
+        print("\nOK")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms", type=float, default=float(os.getenv("COLD_START_BUDGET_MS", "6000"))
+    )
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    sys.exit(0 if run(args.repeat, args.budget_ms, args.top) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,445 @@
+"""
+Benchmark — critical API flows: p50/p95/p99 latency and SQL query count per flow, with budgets.
+Run: python -m app.bench.endpoints [--flows login me ...] [--requests 100] [--write-requests 20]
+                                   [--concurrency 8] [--tolerance 0.25] [--update-baseline]
+
+Drives app.main in-process (httpx ASGITransport: full middleware stack, lifespan included)
+against the configured DATABASE_URL / REDIS_URL. Load `python -m app.seed` (and optionally
+`python -m app.seed_synthetic --scale M`) into a scratch database first — write flows create
+real documents (PR → PO → GR, withdrawal slips, stock takes, payroll runs). Never production.
+
+Per flow:
+  setup    untimed prerequisite documents, one set per measured request (write flows)
+  probe    one sequential request with a cursor-execute counter on every engine → queries
+  load     the remaining requests at --concurrency → p50 / p95 / p99 (ms), errors
+
+Regression (exit 1): any non-2xx response, p95 above the flow's budget (FLOW_BUDGETS_MS,
+override with --budget flow=ms), or — against the baseline JSON — p95 above baseline × (1 +
+tolerance) or more queries than the baseline. --update-baseline rewrites the baseline file.
+Baselines are machine- and data-specific: record them on the box the comparison runs on.
+
+Rate limiting is disabled for the run (the limiter would throttle the load phase after a few
+requests); the response cache stays on, so cached reports measure the hit path after the probe.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from sqlalchemy import event
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_BASELINE = BACKEND_DIR / "bench_baselines" / "endpoints.json"
+
+OWNER = {"email": "owner@sss-corp.com", "password": "owner123"}
+
+# p95 budgets (ms) at the default concurrency on a developer machine
+FLOW_BUDGETS_MS: dict[str, float] = {
+    "login": 500,
+    "me": 50,
+    "product_list": 150,
+    "product_search": 250,
+    "create_movement": 300,
+    "goods_receipt": 600,
+    "withdrawal_issue": 500,
+    "stocktake_approve": 2000,
+    "payroll_execute": 2500,
+    "finance_dashboard": 500,
+    "stock_aging": 1000,
+    "export_products": 2000,
+    "export_stock_aging": 2500,
+    "export_finance": 2500,
+}
+
+
+# ============================================================
+# QUERY COUNTER
+# ============================================================
+
+class QueryCounter:
+    """Counts cursor executions on the given engines while attached."""
+
+    def __init__(self, engines: list):
+        self.engines = [e.sync_engine for e in engines]
+        self.count = 0
+
+    def _on_execute(self, *_args) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "QueryCounter":
+        self.count = 0
+        for engine in self.engines:
+            event.listen(engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        for engine in self.engines:
+            event.remove(engine, "before_cursor_execute", self._on_execute)
+
+
+# ============================================================
+# FLOWS
+# ============================================================
+
+@dataclass
+class Call:
+    method: str
+    path: str
+    params: dict | None = None
+    json: dict | None = None
+
+
+@dataclass
+class Flow:
+    name: str
+    writes: bool
+    prepare: Callable[["Bench", int], Awaitable[list[Call]]]
+
+
+@dataclass
+class Bench:
+    client: object  # httpx.AsyncClient bound to the app
+    headers: dict = field(default_factory=dict)
+    cost_element_id: str | None = None
+    search: str = "bolt"
+
+    async def call(self, method: str, path: str, **kwargs) -> dict:
+        r = await self.client.request(method, path, headers=self.headers, **kwargs)
+        if r.status_code >= 300:
+            raise RuntimeError(f"setup {method} {path} → {r.status_code}: {r.text[:300]}")
+        return r.json()
+
+
+def _get(path: str, **params) -> Callable[[Bench, int], Awaitable[list[Call]]]:
+    async def prepare(bench: Bench, n: int) -> list[Call]:
+        resolved = {k: v(bench) if callable(v) else v for k, v in params.items()}
+        return [Call("GET", path, params=resolved or None) for _ in range(n)]
+    return prepare
+
+
+async def _login(bench: Bench, n: int) -> list[Call]:
+    return [Call("POST", "/api/auth/login", json=OWNER) for _ in range(n)]
+
+
+async def _create_movement(bench: Bench, n: int) -> list[Call]:
+    from app.seed import LOC_STORAGE_ID, PROD_BOLT_ID
+
+    body = {
+        "product_id": str(PROD_BOLT_ID),
+        "movement_type": "RECEIVE",
+        "quantity": 1,
+        "unit_cost": "5.00",
+        "location_id": str(LOC_STORAGE_ID),
+        "reference": "BENCH",
+    }
+    return [Call("POST", "/api/stock/movements", json=body) for _ in range(n)]
+
+
+async def _goods_receipt(bench: Bench, n: int) -> list[Call]:
+    from app.seed import CC_PROD_ID, LOC_RECEIVING_ID, PROD_BOLT_ID, SUP_STEEL_ID
+
+    calls = []
+    for _ in range(n):
+        pr = await bench.call("POST", "/api/purchasing/pr", json={
+            "pr_type": "STANDARD",
+            "cost_center_id": str(CC_PROD_ID),
+            "required_date": str(date.today() + timedelta(days=30)),
+            "note": "BENCH",
+            "lines": [{
+                "item_type": "GOODS",
+                "product_id": str(PROD_BOLT_ID),
+                "description": "Bolt M10",
+                "quantity": 10,
+                "estimated_unit_cost": 5,
+                "cost_element_id": bench.cost_element_id,
+            }],
+        })
+        await bench.call("POST", f"/api/purchasing/pr/{pr['id']}/submit")
+        await bench.call("POST", f"/api/purchasing/pr/{pr['id']}/approve", json={"action": "approve"})
+        po = await bench.call("POST", f"/api/purchasing/pr/{pr['id']}/convert-to-po", json={
+            "supplier_id": str(SUP_STEEL_ID),
+            "supplier_name": "Thai Steel Supply Co., Ltd.",
+            "lines": [{"pr_line_id": line["id"], "unit_cost": "4.50"} for line in pr["lines"]],
+        })
+        if po["status"] != "APPROVED":
+            po = await bench.call("POST", f"/api/purchasing/po/{po['id']}/approve")
+        calls.append(Call("POST", f"/api/purchasing/po/{po['id']}/receive", json={
+            "delivery_note_number": "BENCH",
+            "lines": [
+                {"line_id": line["id"], "received_qty": line["quantity"],
+                 "location_id": str(LOC_RECEIVING_ID)}
+                for line in po["lines"]
+            ],
+        }))
+    return calls
+
+
+async def _withdrawal_issue(bench: Bench, n: int) -> list[Call]:
+    from app.seed import CC_PROD_ID, LOC_STORAGE_ID, PROD_BOLT_ID
+
+    await bench.call("POST", "/api/stock/movements", json={
+        "product_id": str(PROD_BOLT_ID), "movement_type": "RECEIVE", "quantity": n * 2,
+        "unit_cost": "5.00", "location_id": str(LOC_STORAGE_ID), "reference": "BENCH",
+    })
+    calls = []
+    for _ in range(n):
+        slip = await bench.call("POST", "/api/inventory/withdrawal-slips", json={
+            "withdrawal_type": "CC_ISSUE",
+            "cost_center_id": str(CC_PROD_ID),
+            "cost_element_id": bench.cost_element_id,
+            "reference": "BENCH",
+            "lines": [{"product_id": str(PROD_BOLT_ID), "quantity": 2, "location_id": str(LOC_STORAGE_ID)}],
+        })
+        await bench.call("POST", f"/api/inventory/withdrawal-slips/{slip['id']}/submit")
+        calls.append(Call("POST", f"/api/inventory/withdrawal-slips/{slip['id']}/issue", json={
+            "lines": [{"line_id": line["id"], "issued_qty": line["quantity"]} for line in slip["lines"]],
+        }))
+    return calls
+
+
+async def _stocktake_approve(bench: Bench, n: int) -> list[Call]:
+    from app.seed import LOC_SHIPPING_ID, WH_MAIN_ID
+
+    calls = []
+    for _ in range(n):
+        st = await bench.call("POST", "/api/inventory/stock-take", json={
+            "warehouse_id": str(WH_MAIN_ID), "location_id": str(LOC_SHIPPING_ID), "reference": "BENCH",
+        })
+        if not st["lines"]:
+            raise RuntimeError("stocktake_approve needs stock at the SHIPPING location")
+        await bench.call("PUT", f"/api/inventory/stock-take/{st['id']}", json={
+            "lines": [{"line_id": line["id"], "counted_qty": line["system_qty"]} for line in st["lines"]],
+        })
+        await bench.call("POST", f"/api/inventory/stock-take/{st['id']}/submit")
+        calls.append(Call("POST", f"/api/inventory/stock-take/{st['id']}/approve", json={"action": "approve"}))
+    return calls
+
+
+async def _payroll_execute(bench: Bench, n: int) -> list[Call]:
+    period_end = date.today().replace(day=1) - timedelta(days=1)
+    calls = []
+    for _ in range(n):
+        run = await bench.call("POST", "/api/hr/payroll", json={
+            "period_start": str(period_end.replace(day=1)), "period_end": str(period_end), "note": "BENCH",
+        })
+        calls.append(Call("POST", "/api/hr/payroll/run", params={"payroll_id": run["id"]}))
+    return calls
+
+
+async def _cost_element(bench: Bench) -> str:
+    """First cost element of the org — the base seed has none, so create one if needed."""
+    elements = await bench.call("GET", "/api/master/cost-elements")
+    items = elements.get("items", elements) if isinstance(elements, dict) else elements
+    if items:
+        return items[0]["id"]
+    created = await bench.call("POST", "/api/master/cost-elements", json={"code": "BENCH", "name": "Benchmark"})
+    return created["id"]
+
+
+def _year_to_date() -> dict:
+    today = date.today()
+    return {"period_start": str(today.replace(month=1, day=1)), "period_end": str(today)}
+
+
+FLOWS: dict[str, Flow] = {f.name: f for f in [
+    Flow("login", True, _login),
+    Flow("me", False, _get("/api/auth/me")),
+    Flow("product_list", False, _get("/api/inventory/products", limit=20)),
+    Flow("product_search", False, _get("/api/inventory/products", limit=20, search=lambda b: b.search)),
+    Flow("create_movement", True, _create_movement),
+    Flow("goods_receipt", True, _goods_receipt),
+    Flow("withdrawal_issue", True, _withdrawal_issue),
+    Flow("stocktake_approve", True, _stocktake_approve),
+    Flow("payroll_execute", True, _payroll_execute),
+    Flow("finance_dashboard", False, _get("/api/finance/reports/finance-dashboard", months=6)),
+    Flow("stock_aging", False, _get("/api/inventory/stock-aging")),
+    Flow("export_products", False, _get("/api/inventory/products/export")),
+    Flow("export_stock_aging", False, _get("/api/inventory/stock-aging/export")),
+    Flow("export_finance", False, _get("/api/finance/reports/export", **_year_to_date())),
+]}
+
+
+# ============================================================
+# RUNNER
+# ============================================================
+
+def percentile(sorted_ms: list[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_ms:
+        return 0.0
+    rank = max(1, -(-len(sorted_ms) * p // 100))  # ceil(n * p / 100)
+    return sorted_ms[int(rank) - 1]
+
+
+async def _send(bench: Bench, call: Call) -> tuple[float, int]:
+    t0 = time.perf_counter()
+    r = await bench.client.request(call.method, call.path, params=call.params, json=call.json,
+                                   headers=bench.headers)
+    await r.aread()
+    return (time.perf_counter() - t0) * 1000, r.status_code
+
+
+async def run_flow(bench: Bench, flow: Flow, n: int, concurrency: int, engines: list) -> dict:
+    calls = await flow.prepare(bench, n + 1)
+
+    with QueryCounter(engines) as counter:
+        probe_ms, probe_status = await _send(bench, calls[0])
+    queries = counter.count
+
+    results: list[tuple[float, int]] = []
+    pending = iter(calls[1:])
+
+    async def worker() -> None:
+        for call in pending:
+            results.append(await _send(bench, call))
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - t0
+
+    samples = sorted(ms for ms, _ in results)
+    failed = [code for _, code in results if code >= 300] + ([probe_status] if probe_status >= 300 else [])
+    return {
+        "requests": len(results),
+        "concurrency": concurrency,
+        "p50_ms": round(percentile(samples, 50), 1),
+        "p95_ms": round(percentile(samples, 95), 1),
+        "p99_ms": round(percentile(samples, 99), 1),
+        "probe_ms": round(probe_ms, 1),
+        "rps": round(len(results) / wall, 1) if wall else 0.0,
+        "queries": queries,
+        "errors": len(failed),
+        "error_statuses": sorted(set(failed)),
+    }
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], budgets: dict[str, float],
+            tolerance: float) -> list[str]:
+    """Human-readable regressions; empty when every flow is within budget and baseline."""
+    problems = []
+    for name, r in results.items():
+        if r["errors"]:
+            statuses = ", ".join(map(str, r.get("error_statuses", [])))
+            problems.append(f"{name}: {r['errors']} non-2xx responses ({statuses})")
+        budget = budgets.get(name)
+        if budget is not None and r["p95_ms"] > budget:
+            problems.append(f"{name}: p95 {r['p95_ms']:.0f} ms > budget {budget:.0f} ms")
+        base = baseline.get(name)
+        if not base:
+            continue
+        limit = base["p95_ms"] * (1 + tolerance)
+        if r["p95_ms"] > limit:
+            problems.append(
+                f"{name}: p95 {r['p95_ms']:.0f} ms > baseline {base['p95_ms']:.0f} ms "
+                f"+{tolerance:.0%} ({limit:.0f} ms)"
+            )
+        if r["queries"] > base["queries"]:
+            problems.append(f"{name}: {r['queries']} queries > baseline {base['queries']}")
+    return problems
+
+
+def _print_table(results: dict[str, dict], baseline: dict[str, dict]) -> None:
+    print(f"\n{'flow':<20}{'n':>5}{'p50':>9}{'p95':>9}{'p99':>9}{'rps':>8}{'queries':>9}"
+          f"{'base p95':>10}{'err':>5}")
+    for name, r in results.items():
+        base = baseline.get(name, {}).get("p95_ms")
+        print(f"{name:<20}{r['requests']:>5}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}"
+              f"{r['rps']:>8.1f}{r['queries']:>9}{'-' if base is None else f'{base:.1f}':>10}{r['errors']:>5}")
+
+
+def _load_baseline(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["flows"]
+
+
+def _save_baseline(path: Path, results: dict[str, dict], merged: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = {
+        "recorded_at": date.today().isoformat(),
+        "machine": {"python": platform.python_version(), "cpus": os.cpu_count(), "platform": sys.platform},
+        "flows": {**merged, **results},
+    }
+    path.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n")
+
+
+async def run(
+    flow_names: list[str], requests: int, write_requests: int, concurrency: int, search: str
+) -> dict[str, dict]:
+    import httpx
+
+    from app.core.database import all_engines
+    from app.core.rate_limit import limiter
+    from app.main import app
+
+    limiter.enabled = False
+    results: dict[str, dict] = {}
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)  # 500s count as errors
+    async with app.router.lifespan_context(app), httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=120
+    ) as client:
+        bench = Bench(client=client, search=search)
+        login = await bench.call("POST", "/api/auth/login", json=OWNER)
+        if "access_token" not in login:
+            raise RuntimeError("owner login needs 2FA — disable it on the scratch database")
+        bench.headers = {"Authorization": f"Bearer {login['access_token']}", "User-Agent": "bench-endpoints"}
+        bench.cost_element_id = await _cost_element(bench)
+
+        for name in flow_names:
+            flow = FLOWS[name]
+            n = write_requests if flow.writes else requests
+            t0 = time.perf_counter()
+            results[name] = await run_flow(bench, flow, n, concurrency, all_engines())
+            print(f"  {name:<20} done in {time.perf_counter() - t0:.1f}s", flush=True)
+    return results
+
+
+def _budget(value: str) -> tuple[str, float]:
+    name, _, ms = value.partition("=")
+    if name not in FLOWS or not ms:
+        raise argparse.ArgumentTypeError(f"expected <flow>=<ms> with flow in {', '.join(FLOWS)}")
+    return name, float(ms)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--flows", nargs="+", choices=list(FLOWS), default=list(FLOWS))
+    parser.add_argument("--requests", type=int, default=100, help="measured requests per read flow")
+    parser.add_argument("--write-requests", type=int, default=20, help="measured requests per write flow")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--search", default="bolt", help="product_search term")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95 growth over baseline")
+    parser.add_argument("--budget", type=_budget, action="append", default=[], metavar="FLOW=MS")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    baseline = _load_baseline(args.baseline)
+    results = asyncio.run(run(
+        args.flows, args.requests, args.write_requests, args.concurrency, args.search
+    ))
+    _print_table(results, baseline)
+
+    if args.update_baseline:
+        _save_baseline(args.baseline, results, baseline)
+        print(f"\nbaseline written: {args.baseline}")
+        return
+
+    problems = compare(results, baseline, {**FLOW_BUDGETS_MS, **dict(args.budget)}, args.tolerance)
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if not problems:
+        print("\nOK")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
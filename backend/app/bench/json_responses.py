@@ -0,0 +1,106 @@
+"""
+Benchmark — list response serialization: stock JSONResponse vs orjson vs fast_json + compression.
+Run: python -m app.bench.json_responses [--sizes 100 500 5000] [--repeat 20]
+
+Pure CPU, no database: synthetic StockBatchListResponse pages (UUID/Decimal/datetime-heavy).
+  baseline     FastAPI response_model validate + dump, rendered by starlette JSONResponse
+  orjson       same validation, rendered by FastJSONResponse (app default_response_class)
+  fast_json    service dicts rendered directly (no re-validation)
+  gzip / br    compression cost + size of the fast_json body
+"""
+
+import argparse
+import asyncio
+import gzip
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.responses import FastJSONResponse, fast_json
+from app.schemas.inventory import StockBatchListResponse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _rows(n: int) -> list[dict]:
+    org_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "product_id": uuid.uuid4(),
+            "product_sku": f"MAT-{i:06d}",
+            "product_name": f"วัตถุดิบทดสอบ {i}",
+            "product_unit": "PCS",
+            "location_id": uuid.uuid4(),
+            "location_name": "STORAGE",
+            "warehouse_id": uuid.uuid4(),
+            "warehouse_name": "WH-MAIN",
+            "batch_number": f"B2026-{i:06d}",
+            "on_hand": i % 500,
+            "unit_cost": Decimal("125.50") + i,
+            "received_date": now - timedelta(days=i % 365),
+            "org_id": org_id,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(n)
+    ]
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def run(sizes: list[int], repeat: int) -> None:
+    field = create_model_field("response", StockBatchListResponse, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def _validated(payload):
+        return loop.run_until_complete(serialize_response(field=field, response_content=payload))
+
+    print(f"median of {repeat} runs (ms); sizes in KB")
+    print(f"{'rows':>6}{'baseline':>10}{'orjson':>10}{'fast_json':>11}{'speedup':>9}"
+          f"{'raw KB':>9}{'gzip':>8}{'gz KB':>8}{'br':>8}{'br KB':>8}")
+    for n in sizes:
+        payload = {"items": _rows(n), "total": n, "limit": n, "offset": 0}
+        baseline = _median_ms(lambda: JSONResponse(_validated(payload)), repeat)
+        with_orjson = _median_ms(lambda: FastJSONResponse(_validated(payload)), repeat)
+        fast = _median_ms(lambda: fast_json(StockBatchListResponse, payload), repeat)
+
+        body = fast_json(StockBatchListResponse, payload).body
+        gz_ms = _median_ms(lambda: gzip.compress(body, compresslevel=6), repeat)
+        gz_kb = len(gzip.compress(body, compresslevel=6)) / 1024
+        br_ms = br_kb = float("nan")
+        if brotli is not None:
+            br_ms = _median_ms(lambda: brotli.compress(body, quality=4), repeat)
+            br_kb = len(brotli.compress(body, quality=4)) / 1024
+        print(f"{n:>6}{baseline:>10.2f}{with_orjson:>10.2f}{fast:>11.2f}{baseline / fast:>8.1f}x"
+              f"{len(body) / 1024:>9.1f}{gz_ms:>8.2f}{gz_kb:>8.1f}{br_ms:>8.2f}{br_kb:>8.1f}")
+    loop.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 5000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark — stock_movements: plain table + func.date() vs monthly partitions + range predicates.
+Run: python -m app.bench.stock_movements [--rows 50000000] [--months 36] [--repeat 5] [--keep]
+
+Builds two copies of a synthetic movement ledger in a scratch schema (bench_sm):
+  - sm_plain : heap table, PK (id), the pre-Phase-15 index set
+  - sm_part  : RANGE (created_at) monthly partitions, PK (id, created_at), Phase 15 index set
+then times the report queries the app actually issues and prints the median per query.
+The scratch schema is dropped at the end unless --keep is given.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.services.partition import add_months
+
+SCHEMA = "bench_sm"
+ORGS = 4
+PRODUCTS = 2000
+
+_COLUMNS = """
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    org_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    movement_type VARCHAR(20) NOT NULL,
+    quantity INTEGER NOT NULL,
+    unit_cost NUMERIC(12, 2) NOT NULL,
+    is_reversed BOOLEAN NOT NULL DEFAULT false,
+    created_at TIMESTAMPTZ NOT NULL
+"""
+
+_TYPES = "(ARRAY['RECEIVE','ISSUE','CONSUME','RETURN','TRANSFER','ADJUST'])"
+
+
+def _queries(start: date, end: date) -> dict[str, str]:
+    month_ago = end - timedelta(days=30)
+    return {
+        "finance_report_func_date": (
+            "SELECT coalesce(sum(quantity * unit_cost), 0) FROM {t} "
+            "WHERE NOT is_reversed AND org_id = 1 "
+            f"AND date(created_at) >= '{start}' AND date(created_at) <= '{end}'"
+        ),
+        "finance_report_range": (
+            "SELECT coalesce(sum(quantity * unit_cost), 0) FROM {t} "
+            "WHERE NOT is_reversed AND org_id = 1 "
+            f"AND created_at >= '{start}' AND created_at < '{end + timedelta(days=1)}'"
+        ),
+        "dashboard_monthly": (
+            "SELECT date_trunc('month', created_at) AS m, movement_type, sum(quantity) FROM {t} "
+            f"WHERE org_id = 1 AND created_at >= '{add_months(end, -5)}' "
+            "GROUP BY m, movement_type"
+        ),
+        "movement_list_page": (
+            "SELECT * FROM {t} WHERE org_id = 1 "
+            f"AND created_at >= '{month_ago}' AND created_at < '{end + timedelta(days=1)}' "
+            "ORDER BY created_at DESC LIMIT 20"
+        ),
+        "product_history": (
+            "SELECT * FROM {t} WHERE org_id = 1 AND product_id = 42 "
+            f"AND created_at >= '{add_months(end, -3)}' ORDER BY created_at DESC LIMIT 50"
+        ),
+    }
+
+
+async def _build(conn, rows: int, months: int) -> tuple[date, date]:
+    today = date.today()
+    first = add_months(date(today.year, today.month, 1), -(months - 1))
+    span_days = (today - first).days + 1
+
+    await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    await conn.execute(text(f"CREATE TABLE {SCHEMA}.sm_plain ({_COLUMNS}, PRIMARY KEY (id))"))
+    await conn.execute(text(
+        f"CREATE TABLE {SCHEMA}.sm_part ({_COLUMNS}, PRIMARY KEY (id, created_at)) "
+        f"PARTITION BY RANGE (created_at)"
+    ))
+    for i in range(months + 1):
+        lo = add_months(first, i)
+        await conn.execute(text(
+            f"CREATE TABLE {SCHEMA}.sm_part_y{lo.year}m{lo.month:02d} PARTITION OF {SCHEMA}.sm_part "
+            f"FOR VALUES FROM ('{lo}') TO ('{add_months(lo, 1)}')"
+        ))
+
+    t0 = time.perf_counter()
+    await conn.execute(text(
+        f"INSERT INTO {SCHEMA}.sm_plain "
+        f"(org_id, product_id, movement_type, quantity, unit_cost, is_reversed, created_at) "
+        f"SELECT 1 + (g % {ORGS}), 1 + (random() * {PRODUCTS - 1})::int, "
+        f"{_TYPES}[1 + (g % 6)], 1 + (random() * 100)::int, "
+        f"round((random() * 1000)::numeric, 2), random() < 0.01, "
+        f"'{first}'::timestamptz + random() * interval '{span_days} days' "
+        f"FROM generate_series(1, :rows) g"
+    ), {"rows": rows})
+    await conn.execute(text(f"INSERT INTO {SCHEMA}.sm_part SELECT * FROM {SCHEMA}.sm_plain"))
+    print(f"loaded {rows:,} rows x2 in {time.perf_counter() - t0:.1f}s")
+
+    # Pre-Phase-15 indexes on the plain table, Phase 15 set on the partitioned one
+    await conn.execute(text(f"CREATE INDEX ON {SCHEMA}.sm_plain (org_id)"))
+    await conn.execute(text(f"CREATE INDEX ON {SCHEMA}.sm_plain (product_id, movement_type)"))
+    await conn.execute(text(f"CREATE INDEX ON {SCHEMA}.sm_part (org_id, created_at)"))
+    await conn.execute(text(f"CREATE INDEX ON {SCHEMA}.sm_part (org_id, product_id, created_at)"))
+    await conn.execute(text(f"CREATE INDEX ON {SCHEMA}.sm_part (product_id, movement_type)"))
+    await conn.execute(text(f"ANALYZE {SCHEMA}.sm_plain"))
+    await conn.execute(text(f"ANALYZE {SCHEMA}.sm_part"))
+    return add_months(date(today.year, today.month, 1), -2), today
+
+
+async def _time(conn, sql: str, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        await conn.execute(text(sql))
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+async def run(rows: int, months: int, repeat: int, keep: bool) -> None:
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        start, end = await _build(conn, rows, months)
+        print(f"\nreport window {start} → {end}, median of {repeat} runs (ms)")
+        print(f"{'query':<28}{'sm_plain':>12}{'sm_part':>12}")
+        for name, sql in _queries(start, end).items():
+            plain = await _time(conn, sql.format(t=f"{SCHEMA}.sm_plain"), repeat)
+            part = await _time(conn, sql.format(t=f"{SCHEMA}.sm_part"), repeat)
+            print(f"{name:<28}{plain:>12.1f}{part:>12.1f}")
+        if not keep:
+            await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50_000_000)
+    parser.add_argument("--months", type=int, default=36)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="keep the bench_sm schema")
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.months, args.repeat, args.keep))
+
+
+if __name__ == "__main__":
+    main()
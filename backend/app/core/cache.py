@@ -0,0 +1,326 @@
+"""
+SSS Corp ERP — Tag-based Response Cache
+Phase 15: Redis cache for expensive read-only GET endpoints (dashboards, reports)
+
+Key:    cache:resp:{org}:{route}:{role}:{sha1(normalized query params + today)}
+        role = permission scope — viewers with different roles never share an entry
+Entry:  {"at": epoch, "tags": {tag_key: version}, "data": <jsonable response>}
+        stored with Redis TTL = ttl + stale_ttl
+Tags:   cache:tag:{org}:{tag} version counters (plus cache:tag:*:{tag} for writes whose
+        org is unknown). A write INCRs the versions; an entry whose recorded versions
+        differ is a miss and is never served.
+
+Fresh (age < ttl)                → served
+Stale (age < ttl + stale_ttl)    → served, one background refresh (own read session)
+Miss                             → single-flight: one computation per key — in-process
+                                   future + Redis NX lock across workers; the rest wait
+
+Invalidation is automatic: an after_flush hook maps touched tables → tags (TABLE_TAGS)
+and bumps the versions after commit (same unit-of-work pattern as the search index).
+Redis down → the endpoint simply runs uncached.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+from datetime import date
+from itertools import chain
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.redis import get_redis, get_redis_manager
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+# ============================================================
+# REGISTRY — table → cache tags
+# ============================================================
+
+_TAG_TABLES: dict[str, tuple[str, ...]] = {
+    "inventory": (
+        "products", "stock_movements", "stock_by_location", "stock_by_bin", "stock_batches",
+        "warehouses", "locations", "bins", "stock_takes", "stock_withdrawal_slips",
+        "transfer_requests", "stock_snapshots",
+    ),
+    "purchasing": ("purchase_requisitions", "purchase_orders", "purchase_order_lines"),
+    "sales": ("sales_orders", "sales_order_lines", "delivery_orders"),
+    "workorder": ("work_orders",),
+    "finance": (
+        "supplier_invoices", "invoice_payments", "customer_invoices",
+        "customer_invoice_payments", "customers", "suppliers",
+    ),
+    "costing": (
+        "cost_centers", "cost_elements", "fixed_recharge_budgets", "fixed_recharge_entries",
+        "employees", "departments", "timesheets", "payroll_runs", "cost_center_actuals",
+    ),
+    # No cached endpoints — the rate limiter reads this version to reload org policies
+    "security": ("org_security_configs",),
+}
+
+TABLE_TAGS: dict[str, tuple[str, ...]] = {}
+for _tag, _tables in _TAG_TABLES.items():
+    for _table in _tables:
+        TABLE_TAGS[_table] = TABLE_TAGS.get(_table, ()) + (_tag,)
+
+_ALL_ORGS = "*"
+_PENDING_KEY = "cache_tags_pending"
+
+stats = {"hit": 0, "stale": 0, "miss": 0, "coalesced": 0, "refresh": 0, "bypass": 0}
+
+_inflight: dict[str, asyncio.Future] = {}
+_background: set[asyncio.Task] = set()
+
+
+def _tag_key(org: str, tag: str) -> str:
+    return f"cache:tag:{org}:{tag}"
+
+
+# ============================================================
+# INVALIDATION
+# ============================================================
+
+def stage_invalidation(db: AsyncSession, org_id, *tags: str) -> None:
+    """Queue tag bumps for writes the unit of work can't see (raw SQL); sent after commit."""
+    org = str(org_id) if org_id else _ALL_ORGS
+    db.info.setdefault(_PENDING_KEY, set()).update((org, t) for t in tags)
+
+
+async def invalidate_tags(pairs) -> None:
+    """INCR the version of each (org, tag). Never raises — entries expire by TTL anyway."""
+    try:
+        async with get_redis_manager().pipeline() as pipe:
+            for org, tag in pairs:
+                pipe.incr(_tag_key(org, tag))
+    except Exception:
+        logger.warning("Cache invalidation failed for %s", sorted(pairs), exc_info=True)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tags(session: Session, flush_context) -> None:
+    pending = None
+    for obj in chain(session.new, session.dirty, session.deleted):
+        tags = TABLE_TAGS.get(getattr(obj, "__tablename__", None))
+        if not tags:
+            continue
+        org_id = getattr(obj, "org_id", None)
+        org = str(org_id) if org_id else _ALL_ORGS
+        if pending is None:
+            pending = session.info.setdefault(_PENDING_KEY, set())
+        pending.update((org, t) for t in tags)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_tags(orm_execute_state) -> None:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    tags = TABLE_TAGS.get(getattr(table, "name", None))
+    if tags:
+        orm_execute_state.session.info.setdefault(_PENDING_KEY, set()).update(
+            (_ALL_ORGS, t) for t in tags
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # sync context (scripts) — entries age out by TTL
+    task = loop.create_task(invalidate_tags(pending))
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_tags_on_rollback(session: Session, previous_transaction) -> None:
+    # A savepoint rollback keeps the outer transaction's writes — keep their tags too
+    if not previous_transaction.nested:
+        session.info.pop(_PENDING_KEY, None)
+
+
+# ============================================================
+# READ PATH
+# ============================================================
+
+async def _load(key: str, tag_keys: list[str]) -> tuple[dict | None, dict[str, str]]:
+    async with get_redis_manager().pipeline() as pipe:
+        pipe.get(key)
+        pipe.mget(tag_keys)
+    raw, versions = pipe.results
+    current = {k: v or "0" for k, v in zip(tag_keys, versions)}
+    entry = json.loads(raw) if raw else None
+    if entry is not None and entry.get("tags") != current:
+        entry = None  # invalidated since it was computed
+    return entry, current
+
+
+async def _store(key: str, data, versions: dict[str, str], ttl: int, stale_ttl: int) -> None:
+    entry = {"at": time.time(), "tags": versions, "data": data}
+    try:
+        await get_redis().set(key, json.dumps(entry), ex=ttl + stale_ttl)
+    except Exception:
+        logger.debug("Cache store failed for %s", key, exc_info=True)
+
+
+async def _compute_locked(key: str, versions: dict, ttl: int, stale_ttl: int, compute, *, wait: bool):
+    """
+    Run `compute` under the cross-process lock. If another worker holds it:
+    wait=True polls for its result (then computes anyway on timeout); wait=False returns None.
+    """
+    lock_key = f"cache:lock:{key}"
+    lock_ms = settings.RESPONSE_CACHE_LOCK_MS
+    try:
+        acquired = await get_redis().set(lock_key, "1", nx=True, px=lock_ms)
+    except Exception:
+        acquired = True  # Redis trouble — just compute
+    if not acquired:
+        if not wait:
+            return None
+        deadline = time.monotonic() + lock_ms / 1000
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            try:
+                entry, _ = await _load(key, list(versions))
+            except Exception:
+                break
+            if entry is not None:
+                stats["coalesced"] += 1
+                return entry["data"]
+    try:
+        data = jsonable_encoder(await compute())
+        await _store(key, data, versions, ttl, stale_ttl)
+        return data
+    finally:
+        if acquired:
+            try:
+                await get_redis().delete(lock_key)
+            except Exception:
+                pass
+
+
+async def _single_flight(key: str, coro_factory):
+    """One in-process computation per key; concurrent callers share its result."""
+    existing = _inflight.get(key)
+    if existing is not None:
+        stats["coalesced"] += 1
+        return await asyncio.shield(existing)
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await coro_factory()
+        future.set_result(result)
+        return result
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved when nobody else was waiting
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+
+def _cache_key(route: str, org: str, scope: str, params: dict) -> str:
+    material = json.dumps(
+        {"p": jsonable_encoder(params), "d": date.today().isoformat()}, sort_keys=True
+    )
+    digest = hashlib.sha1(material.encode()).hexdigest()
+    return f"cache:resp:{org}:{route}:{scope}:{digest}"
+
+
+def cached(*, tags: tuple[str, ...], ttl: int = 60, stale_ttl: int = 300):
+    """
+    Cache a read-only GET route. Apply below the router decorator:
+
+        @router.get("/reports/x")
+        @cached(tags=("inventory",), ttl=60)
+        async def api_x(..., db: AsyncSession = Depends(get_read_db), token=Depends(...)):
+    """
+
+    def decorator(fn):
+        route = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+        db_param = next(
+            (
+                p.name for p in inspect.signature(fn).parameters.values()
+                if p.annotation in (AsyncSession, "AsyncSession")
+            ),
+            None,
+        )
+        skip = {db_param, "token", "request"}
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            token = kwargs.get("token") or {}
+            if not settings.RESPONSE_CACHE_ENABLED or args or "org_id" not in token:
+                stats["bypass"] += 1
+                return await fn(*args, **kwargs)
+
+            org = token["org_id"]
+            params = {k: v for k, v in kwargs.items() if k not in skip}
+            key = _cache_key(route, org, token.get("role") or "-", params)
+            tag_keys = [_tag_key(o, t) for t in tags for o in (org, _ALL_ORGS)]
+
+            try:
+                entry, versions = await _load(key, tag_keys)
+            except Exception:
+                stats["bypass"] += 1
+                return await fn(*args, **kwargs)
+
+            if entry is not None:
+                age = time.time() - entry["at"]
+                if age < ttl:
+                    stats["hit"] += 1
+                    return entry["data"]
+                stats["stale"] += 1
+                if key not in _inflight and db_param:
+                    task = asyncio.create_task(
+                        _single_flight(key, lambda: _refresh(key, versions, kwargs))
+                    )
+                    _background.add(task)
+                    task.add_done_callback(_background.discard)
+                return entry["data"]
+
+            stats["miss"] += 1
+            return await _single_flight(
+                key,
+                lambda: _compute_locked(
+                    key, versions, ttl, stale_ttl, lambda: fn(**kwargs), wait=True
+                ),
+            )
+
+        async def _refresh(key: str, versions: dict, kwargs: dict):
+            from app.core.database import read_session
+
+            stats["refresh"] += 1
+
+            async def _compute():
+                async with read_session() as db:
+                    return await fn(**{**kwargs, db_param: db})
+
+            try:
+                return await _compute_locked(key, versions, ttl, stale_ttl, _compute, wait=False)
+            except Exception:
+                logger.warning("Background cache refresh failed for %s", key, exc_info=True)
+
+        return wrapper
+
+    return decorator
+
+
+def cache_metrics() -> dict:
+    return dict(stats)
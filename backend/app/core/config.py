@@ -11,9 +11,47 @@ DEFAULT_ORG_ID = UUID("00000000-0000-0000-0000-000000000001")
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "postgresql+asyncpg://postgres:postgres@db:5432/sss_corp_erp"
+    # Read replica for reports/dashboards (Phase 15) — empty = all reads on the primary
+    DATABASE_REPLICA_URL: str = ""
+    REPLICA_POOL_SIZE: int = 10
+    REPLICA_MAX_OVERFLOW: int = 10
+    REPLICA_MAX_LAG_SECONDS: float = 10.0
+    REPLICA_LAG_CHECK_SECONDS: float = 5.0
+    # Workload classes (Phase 15) — concurrent sessions per class (sum ≈ pool_size + max_overflow),
+    # queue wait before 503, and SET LOCAL timeouts applied to every transaction of the class
+    DB_TRANSACTIONAL_MAX_SESSIONS: int = 16
+    DB_TRANSACTIONAL_QUEUE_WAIT_MS: int = 3000
+    DB_TRANSACTIONAL_STATEMENT_TIMEOUT_MS: int = 15000
+    DB_TRANSACTIONAL_LOCK_TIMEOUT_MS: int = 5000
+    DB_REPORTING_MAX_SESSIONS: int = 6
+    DB_REPORTING_QUEUE_WAIT_MS: int = 2000
+    DB_REPORTING_STATEMENT_TIMEOUT_MS: int = 60000
+    DB_REPORTING_LOCK_TIMEOUT_MS: int = 2000
+    DB_BACKGROUND_MAX_SESSIONS: int = 4
+    DB_BACKGROUND_QUEUE_WAIT_MS: int = 30000
+    DB_BACKGROUND_STATEMENT_TIMEOUT_MS: int = 300000
+    DB_BACKGROUND_LOCK_TIMEOUT_MS: int = 10000
+    DB_AUTH_MAX_SESSIONS: int = 4
+    DB_AUTH_QUEUE_WAIT_MS: int = 2000
+    DB_AUTH_STATEMENT_TIMEOUT_MS: int = 5000
+    DB_AUTH_LOCK_TIMEOUT_MS: int = 2000
 
     # Redis
     REDIS_URL: str = "redis://redis:6379/0"
+    # Shared command client (Phase 15) — per worker; past it commands fail fast (no breaker trip)
+    REDIS_MAX_CONNECTIONS: int = 200
+    # Notification SSE streams per worker — each holds one connection of a separate
+    # pub/sub pool; over the cap the stream answers 503 and the client polls instead
+    NOTIFICATION_STREAM_MAX_CONNECTIONS: int = 200
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 2.0
+    REDIS_BREAKER_FAILURES: int = 3
+    REDIS_BREAKER_COOLDOWN_SECONDS: float = 10.0
+    # Response cache for dashboards/reports (Phase 15, app.core.cache)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_LOCK_MS: int = 10000  # single-flight lock; also the max wait for another worker
+    # Fast JSON path + compression (Phase 15, app.core.responses / app.middleware.compression)
+    RESPONSE_FAST_PATH_VERIFY: bool = False  # validate fast_json payloads against the schema
+    RESPONSE_COMPRESSION_MIN_BYTES: int = 1024
 
     # JWT
     JWT_SECRET_KEY: str = "change-this-to-a-random-secret"
@@ -41,11 +79,28 @@ class Settings(BaseSettings):
     PERF_SLOW_QUERY_MS: int = 100
     PERF_RETENTION_DAYS: int = 30
 
+    # Partitioned audit tables (Phase 15) — retention in months, 0 = keep forever
+    PARTITION_MONTHS_AHEAD: int = 3
+    AUDIT_LOG_RETENTION_MONTHS: int = 0
+    LOGIN_HISTORY_RETENTION_MONTHS: int = 0
+    EXPORT_AUDIT_RETENTION_MONTHS: int = 0
+
+    # Batched writer for login history / export audit (Phase 15, off by default)
+    AUDIT_ASYNC_WRITES: bool = False
+    AUDIT_WRITER_BATCH_SIZE: int = 200
+    AUDIT_WRITER_FLUSH_MS: int = 500
+    AUDIT_WRITER_MAX_QUEUE: int = 10000
+
     # LINE Login (optional — disabled when empty)
     LINE_CHANNEL_ID: str = ""
     LINE_CHANNEL_SECRET: str = ""
     LINE_CALLBACK_URL: str = ""  # e.g. https://erp.sss-corp.com/auth/line/callback
 
+    # Rate limiting (Phase 15 — policies per org in OrgSecurityConfig)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_POLICY_TTL_SECONDS: int = 300  # reload even without a config change (Redis down)
+    RATE_LIMIT_LOCAL_MAX_KEYS: int = 50_000  # in-process fallback buckets per worker
+
     # Email (Phase 4.6 — disabled by default)
     SMTP_HOST: str = ""
     SMTP_PORT: int = 587
@@ -53,8 +108,40 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""
     EMAIL_FROM: str = "noreply@sss-corp.com"
     EMAIL_ENABLED: bool = False
+    # Email outbox worker (Phase 15)
+    EMAIL_WORKER_ENABLED: bool = True  # set False on replicas that should only enqueue
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_POLL_SECONDS: int = 5
+    EMAIL_MAX_ATTEMPTS: int = 6
+    EMAIL_RETRY_BASE_SECONDS: int = 30
+    EMAIL_SENDING_TIMEOUT_SECONDS: int = 600  # reclaim rows stuck in SENDING (worker crash)
+    EMAIL_SMTP_IDLE_SECONDS: int = 60  # close the SMTP session after this long without mail
     FRONTEND_URL: str = "http://localhost:5173"
 
+    # Low-stock watchlist alerts (Phase 15)
+    LOW_STOCK_ALERT_WORKER_ENABLED: bool = True  # set False on replicas that should not deliver
+    LOW_STOCK_ALERT_BATCH_SIZE: int = 200
+    LOW_STOCK_ALERT_POLL_SECONDS: int = 60
+    LOW_STOCK_ALERT_WINDOW_HOURS: int = 24  # at most one alert per product per window
+
+    # Domain event outbox relay (Phase 15, app.services.events)
+    EVENT_RELAY_ENABLED: bool = True  # set False on replicas that should only record events
+    EVENT_RELAY_BATCH_SIZE: int = 500
+    EVENT_RELAY_POLL_SECONDS: float = 1.0
+    EVENT_STREAM_MAXLEN: int = 100_000  # per-org stream, approximate trim
+    EVENT_RETENTION_DAYS: int = 30  # published events kept for offset replay, 0 = keep forever
+
+    # Parquet analytics export (Phase 15, app.services.analytics_export)
+    ANALYTICS_EXPORT_DIR: str = ""  # default --out of python -m app.export_analytics (daily job)
+    ANALYTICS_EXPORT_BATCH_ROWS: int = 20_000  # cursor fetch size = Parquet row group
+    ANALYTICS_EXPORT_COMPRESSION: str = "zstd"
+    ANALYTICS_EXPORT_LAG_SECONDS: int = 300  # leave rows this recent to the next run
+
+    # Cost center actuals rollup (Phase 15, app.services.cost_actuals)
+    COST_ACTUALS_REFRESH_ENABLED: bool = True  # set False on replicas that should not refresh
+    COST_ACTUALS_REFRESH_SECONDS: int = 300
+    COST_ACTUALS_LAG_SECONDS: int = 60  # leave rows this recent to the next refresh
+
     @property
     def cors_origins_list(self) -> list[str]:
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
@@ -1,8 +1,16 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 from app.core.config import get_settings
+from app.core.workload import WorkloadClass, get_gate
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -22,9 +30,153 @@ class Base(DeclarativeBase):
     pass
 
 
+@asynccontextmanager
+async def workload_session(workload: WorkloadClass, factory=None):
+    """
+    Session gated by its workload class (Phase 15): waits at most the class queue budget
+    for a slot (PoolSaturatedError → 503), then applies the class timeouts per transaction.
+    """
+    gate = get_gate(workload)
+    async with gate.slot():
+        async with (factory or AsyncSessionLocal)() as session:
+            session.info["workload"] = gate
+            yield session
+
+
 async def get_db() -> AsyncSession:
-    async with AsyncSessionLocal() as session:
+    async with workload_session(WorkloadClass.TRANSACTIONAL) as session:
         try:
             yield session
         finally:
             await session.close()
+
+
+async def get_auth_db() -> AsyncSession:
+    """Login / token refresh — own slots so a busy ERP never locks users out."""
+    async with workload_session(WorkloadClass.AUTH) as session:
+        yield session
+
+
+def background_session():
+    """Workers and maintenance loops: long timeouts, small share of the pool."""
+    return workload_session(WorkloadClass.BACKGROUND)
+
+
+# ============================================================
+# READ REPLICA ROUTING (Phase 15)
+# ============================================================
+# Heavy report/dashboard reads go through get_read_db → replica (DATABASE_REPLICA_URL).
+# Falls back to the primary when no replica is configured, the replica is unreachable,
+# or its replay lag exceeds REPLICA_MAX_LAG_SECONDS. Either way the session runs
+# READ ONLY transactions, so a write slipped into a report path fails loudly on both.
+# Single-instance stand-in: point DATABASE_REPLICA_URL at the primary (lag reads as 0).
+
+read_engine = (
+    create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        echo=settings.ENVIRONMENT == "development",
+        pool_size=settings.REPLICA_POOL_SIZE,
+        max_overflow=settings.REPLICA_MAX_OVERFLOW,
+    )
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+
+ReadSessionLocal = (
+    async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+
+# Seconds of replay lag; 0 on a primary, or on a replica that has replayed all it received
+# (an idle primary would otherwise make pg_last_xact_replay_timestamp look stale)
+_REPLICA_LAG_SQL = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+class ReplicaRouter:
+    """Picks the session factory for read-only work; caches the lag probe per check interval."""
+
+    def __init__(self, replica_factory, primary_factory, *, max_lag: float, check_interval: float):
+        self.replica_factory = replica_factory
+        self.primary_factory = primary_factory
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.last_lag: float | None = None
+        self._healthy = False
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _measure_lag(self) -> float | None:
+        async with self.replica_factory() as session:
+            return (await session.execute(_REPLICA_LAG_SQL)).scalar()
+
+    async def replica_ok(self) -> bool:
+        if self.replica_factory is None:
+            return False
+        if time.monotonic() - self._checked_at < self.check_interval:
+            return self._healthy
+        async with self._lock:
+            if time.monotonic() - self._checked_at < self.check_interval:
+                return self._healthy
+            try:
+                lag = await self._measure_lag()
+                self.last_lag = float(lag) if lag is not None else None
+                self._healthy = self.last_lag is not None and self.last_lag <= self.max_lag
+                if not self._healthy:
+                    logger.warning("Replica lag %s s > %s s — reads fall back to primary",
+                                   self.last_lag, self.max_lag)
+            except Exception:
+                self._healthy = False
+                logger.warning("Replica probe failed — reads fall back to primary", exc_info=True)
+            self._checked_at = time.monotonic()
+            return self._healthy
+
+    async def factory(self):
+        return self.replica_factory if await self.replica_ok() else self.primary_factory
+
+
+replica_router = ReplicaRouter(
+    ReadSessionLocal,
+    AsyncSessionLocal,
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    check_interval=settings.REPLICA_LAG_CHECK_SECONDS,
+)
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_session_limits(session: Session, transaction, connection) -> None:
+    if session.info.get("read_only"):
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+    gate = session.info.get("workload")
+    if gate is not None:
+        # SET LOCAL: scoped to this transaction, never leaks back into the pool
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(gate.statement_timeout_ms)}")
+        connection.exec_driver_sql(f"SET LOCAL lock_timeout = {int(gate.lock_timeout_ms)}")
+
+
+@asynccontextmanager
+async def read_session():
+    """
+    Read-only session on the replica (or primary fallback).
+    For services/background jobs that run outside a request; endpoints use get_read_db.
+    """
+    factory = await replica_router.factory()
+    async with workload_session(WorkloadClass.REPORTING, factory) as session:
+        session.info["read_only"] = True
+        session.info["replica"] = factory is not AsyncSessionLocal
+        yield session
+
+
+async def get_read_db() -> AsyncSession:
+    """Dependency for report/dashboard endpoints that never write."""
+    async with read_session() as session:
+        yield session
+
+
+def all_engines() -> list:
+    return [engine] if read_engine is None else [engine, read_engine]
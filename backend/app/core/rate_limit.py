@@ -1,129 +1,245 @@
 """
 SSS Corp ERP — Rate Limiter
 Phase 13.6: Per-user rate limiting with Redis backend
+Phase 15: per-org / per-role policies, one atomic Redis round trip per check
 
-Dynamic rate limits are read from OrgSecurityConfig:
-  - api_rate_limit_login: per-minute limit on /login (default 5)
+Policies come from each org's OrgSecurityConfig:
   - api_rate_limit_per_minute: general API limit (default 120)
-
-Key function: user_id from JWT (authenticated) → IP address (unauthenticated)
-Default limits: applied globally via SlowAPIMiddleware
+  - api_rate_limit_roles: per-role overrides of the API limit, e.g. {"viewer": 60}
+  - api_rate_limit_login: per-minute limit on /login, per IP (default 5) — the org is
+    unknown before login, so the DEFAULT_ORG_ID policy applies
+
+Check:  one EVALSHA of a GCRA (token bucket, burst = limit) script keyed
+        rl:{org}:{policy}:{subject}. The same script returns the org's "security"
+        cache-tag version (app.core.cache) — update_security_config bumps it on commit,
+        so every worker reloads that org's policy on its next request, no polling.
+Subject: user id from the access token (decoded once per request, shared with
+        get_token_payload) → client IP for anonymous requests.
+Redis down → the same algorithm runs in-process (per-worker quota) until it is back.
+Counters: allowed / throttled / local per policy — GET /api/admin/performance/rate-limits
 """
 
+import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
 
-from fastapi import Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from starlette.routing import Match
 
-from app.core.config import get_settings
+from app.core.config import DEFAULT_ORG_ID, get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-
-# ============================================================
-# DYNAMIC RATE LIMIT CACHE
-# ============================================================
-# Cached org security config values — refreshed every 5 minutes
-# to avoid hitting DB on every request.
-# Must be defined BEFORE limiter (used in default_limits).
-
-_rate_limit_cache: dict = {
-    "login": 5,         # default from OrgSecurityConfig
-    "api": 120,         # default from OrgSecurityConfig
-    "last_refresh": 0,  # epoch timestamp
-}
-
-
-def get_login_rate_limit() -> str:
-    """Dynamic rate limit string for login endpoint.
-    slowapi supports callables for limit values."""
-    return f"{_rate_limit_cache['login']}/minute"
+PERIOD_SECONDS = 60
+DEFAULT_LIMITS = {"api": 120, "login": 5}
+
+_POLICY_ATTR = "_rate_limit_policy"
+
+# GCRA: KEYS[1] = bucket (theoretical arrival time, ms), KEYS[2..3] = policy version keys
+# ARGV[1] = limit per period, ARGV[2] = period (ms)
+# Returns {allowed, retry_after_ms | remaining, policy_version}
+_GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local period = tonumber(ARGV[2])
+local interval = period / tonumber(ARGV[1])
+local tat = tonumber(redis.call('GET', KEYS[1]) or 0)
+if tat < now then tat = now end
+local v = redis.call('MGET', KEYS[2], KEYS[3])
+local version = (v[1] or '0') .. ':' .. (v[2] or '0')
+local new_tat = tat + interval
+if new_tat - now > period then
+    return {0, math.ceil(new_tat - period - now), version}
+end
+redis.call('SET', KEYS[1], string.format('%.3f', new_tat), 'PX', math.ceil(new_tat - now))
+return {1, math.floor((period - (new_tat - now)) / interval), version}
+"""
 
 
-def get_api_rate_limit() -> str:
-    """Dynamic rate limit string for general API endpoints."""
-    return f"{_rate_limit_cache['api']}/minute"
+@dataclass
+class OrgRatePolicy:
+    api: int = DEFAULT_LIMITS["api"]
+    login: int = DEFAULT_LIMITS["login"]
+    roles: dict[str, int] = field(default_factory=dict)
+    version: str | None = None  # security tag version it was loaded at (None = unknown)
+    loaded_at: float = 0.0
+
+    def limit_for(self, policy: str, role: str | None) -> tuple[str, int]:
+        """(counter label, requests per PERIOD_SECONDS) for a policy + caller role."""
+        if policy == "api" and role in self.roles:
+            return f"api:{role}", self.roles[role]
+        return policy, getattr(self, policy, DEFAULT_LIMITS.get(policy, DEFAULT_LIMITS["api"]))
+
+
+class LocalGCRA:
+    """Same algorithm as _GCRA_LUA, in-process — used while Redis is unavailable."""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._tat: dict[str, float] = {}
+
+    def hit(self, key: str, limit: int, period: float, now: float | None = None) -> tuple[bool, float]:
+        now = time.monotonic() if now is None else now
+        interval = period / limit
+        tat = max(self._tat.get(key, now), now)
+        new_tat = tat + interval
+        if new_tat - now > period:
+            return False, new_tat - period - now
+        if len(self._tat) >= self.max_keys and key not in self._tat:
+            self._tat = {k: v for k, v in self._tat.items() if v > now}
+        self._tat[key] = new_tat
+        return True, 0.0
+
+
+class RateLimiter:
+    def __init__(self):
+        self.enabled = settings.RATE_LIMIT_ENABLED
+        self.stats: dict[str, dict[str, int]] = {}
+        self.local = LocalGCRA(settings.RATE_LIMIT_LOCAL_MAX_KEYS)
+        self._policies: dict[str, OrgRatePolicy] = {}
+        self._loading: dict[str, asyncio.Task] = {}
+        self._marked_routes: list | None = None
+        self._script = None
+
+    # --- route marking ---
+
+    def limit(self, policy: str):
+        """Use a named policy (e.g. "login") for this endpoint instead of "api"."""
+        def decorator(fn):
+            setattr(fn, _POLICY_ATTR, policy)
+            return fn
+        return decorator
+
+    def exempt(self, fn):
+        setattr(fn, _POLICY_ATTR, None)
+        return fn
+
+    def route_policy(self, scope) -> str | None:
+        """Policy for the request — only the few marked routes are matched, the rest are "api"."""
+        if self._marked_routes is None:
+            self._marked_routes = [
+                (route, getattr(route.endpoint, _POLICY_ATTR))
+                for route in scope["app"].routes
+                if hasattr(getattr(route, "endpoint", None), _POLICY_ATTR)
+            ]
+        for route, policy in self._marked_routes:
+            if route.matches(scope)[0] == Match.FULL:
+                return policy
+        return "api"
+
+    # --- policies ---
+
+    async def _load_policy(self, org: str) -> OrgRatePolicy:
+        from uuid import UUID
 
+        from sqlalchemy import select
 
-async def _refresh_rate_limits() -> None:
-    """Refresh rate limit values from DB (non-blocking, fire-and-forget)."""
-    import time
-    now = time.time()
-    # Only refresh every 5 minutes
-    if now - _rate_limit_cache["last_refresh"] < 300:
-        return
-    try:
-        from app.core.database import AsyncSessionLocal
-        from app.core.config import DEFAULT_ORG_ID
+        from app.core.database import workload_session
+        from app.core.workload import WorkloadClass
         from app.models.security import OrgSecurityConfig
-        from sqlalchemy import select
 
-        async with AsyncSessionLocal() as db:
-            result = await db.execute(
-                select(OrgSecurityConfig).where(OrgSecurityConfig.org_id == DEFAULT_ORG_ID)
-            )
-            config = result.scalar_one_or_none()
-            if config:
-                _rate_limit_cache["login"] = config.api_rate_limit_login
-                _rate_limit_cache["api"] = config.api_rate_limit_per_minute
-                _rate_limit_cache["last_refresh"] = now
-                logger.debug(
-                    "Rate limits refreshed: login=%d/min, api=%d/min",
-                    config.api_rate_limit_login,
-                    config.api_rate_limit_per_minute,
-                )
-    except Exception:
-        logger.debug("Could not refresh rate limits from DB, using cached values")
-
-
-# ============================================================
-# KEY FUNCTION — Per-User or Per-IP
-# ============================================================
-
-def get_user_or_ip_key(request: Request) -> str:
-    """Extract user_id from JWT for rate limiting, fall back to IP.
-
-    This is lightweight — just JWT decode (no DB call).
-    Authenticated users get per-user quota; unauthenticated get per-IP.
-    """
-    auth = request.headers.get("authorization", "")
-    if auth.startswith("Bearer "):
+        policy = OrgRatePolicy(loaded_at=time.monotonic())
+        try:
+            async with workload_session(WorkloadClass.AUTH) as db:
+                config = (await db.execute(
+                    select(OrgSecurityConfig).where(OrgSecurityConfig.org_id == UUID(org))
+                )).scalar_one_or_none()
+            if config is not None:
+                policy.api = config.api_rate_limit_per_minute
+                policy.login = config.api_rate_limit_login
+                policy.roles = dict(config.api_rate_limit_roles or {})
+        except Exception:
+            logger.warning("Could not load rate-limit policy for org %s, using defaults", org, exc_info=True)
+            policy.loaded_at -= settings.RATE_LIMIT_POLICY_TTL_SECONDS - 30  # retry in ~30s
+        return policy
+
+    async def policy_for(self, org: str) -> OrgRatePolicy:
+        policy = self._policies.get(org)
+        if policy is not None and time.monotonic() - policy.loaded_at < settings.RATE_LIMIT_POLICY_TTL_SECONDS:
+            return policy
+        # Single-flight per org: concurrent first requests share one DB read
+        task = self._loading.get(org)
+        if task is None:
+            task = self._loading[org] = asyncio.ensure_future(self._load_policy(org))
+            task.add_done_callback(lambda _t, o=org: self._loading.pop(o, None))
+        fresh = await asyncio.shield(task)
+        if policy is not None and fresh.version is None:
+            fresh.version = policy.version
+        self._policies[org] = fresh
+        return fresh
+
+    def invalidate(self, org: str | None = None) -> None:
+        """Drop cached policies (this worker). Other workers notice via the tag version."""
+        if org is None:
+            self._policies.clear()
+        else:
+            self._policies.pop(org, None)
+
+    # --- check ---
+
+    async def _hit_redis(self, key: str, limit: int, org: str) -> tuple[bool, float, str]:
+        from app.core.cache import _ALL_ORGS, _tag_key
+        from app.core.redis import get_redis
+
+        if self._script is None:
+            self._script = get_redis().register_script(_GCRA_LUA)
+        allowed, value, version = await self._script(
+            keys=[key, _tag_key(org, "security"), _tag_key(_ALL_ORGS, "security")],
+            args=[limit, PERIOD_SECONDS * 1000],
+            client=get_redis(),
+        )
+        return bool(allowed), (0.0 if allowed else int(value) / 1000), version
+
+    def _count(self, label: str, outcome: str) -> None:
+        s = self.stats.get(label)
+        if s is None:
+            s = self.stats[label] = {"allowed": 0, "throttled": 0, "local": 0}
+        s[outcome] += 1
+
+    async def hit(self, *, org: str, policy_name: str, subject: str, role: str | None) -> tuple[bool, float, int]:
+        """Count one request. Returns (allowed, retry_after_seconds, limit)."""
+        policy = await self.policy_for(org)
+        label, limit = policy.limit_for(policy_name, role)
+        key = f"rl:{org}:{policy_name}:{subject}"
         try:
-            from jose import jwt as jose_jwt
-
-            token = auth[7:]
-            payload = jose_jwt.decode(
-                token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM],
-            )
-            user_id = payload.get("sub")
-            if user_id:
-                return f"user:{user_id}"
+            allowed, retry_after, version = await self._hit_redis(key, limit, org)
         except Exception:
-            # Expired/invalid token — fall back to IP
-            pass
-    return get_remote_address(request)
-
-
-# ============================================================
-# LIMITER SETUP
-# ============================================================
-
-# Use Redis backend for rate limiting (production-ready).
-# Falls back to in-memory if Redis is unavailable.
-_storage_uri = None
-try:
-    if settings.REDIS_URL:
-        _storage_uri = settings.REDIS_URL
-        logger.info("Rate limiter using Redis: %s", settings.REDIS_URL)
-except Exception:
-    logger.warning("Redis URL not configured, using in-memory rate limiter")
-
-limiter = Limiter(
-    key_func=get_user_or_ip_key,
-    storage_uri=_storage_uri,
-    default_limits=[get_api_rate_limit],
-)
+            allowed, retry_after = self.local.hit(key, limit, PERIOD_SECONDS)
+            self._count(label, "local")
+        else:
+            if policy.version is None:
+                policy.version = version
+            elif version != policy.version:
+                self.invalidate(org)  # config changed somewhere — reload on the next request
+        self._count(label, "allowed" if allowed else "throttled")
+        return allowed, retry_after, limit
+
+    def metrics(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "policies": {
+                org: {"api": p.api, "login": p.login, "roles": p.roles}
+                for org, p in self._policies.items()
+            },
+            "counters": {label: dict(s) for label, s in sorted(self.stats.items())},
+            "local_keys": len(self.local._tat),
+        }
+
+
+def request_identity(request, policy: str = "api") -> tuple[str, str | None, str]:
+    """
+    (org, role, subject) — user from the access token, client IP when anonymous.
+    Login is pre-auth: always per IP under the DEFAULT_ORG_ID policy.
+    """
+    from app.core.security import get_token_payload_from_request
+
+    if policy != "login":
+        payload = get_token_payload_from_request(request)
+        if payload and payload.get("type") == "access" and payload.get("sub"):
+            return str(payload.get("org_id") or DEFAULT_ORG_ID), payload.get("role"), f"user:{payload['sub']}"
+    client = request.client.host if request.client else "unknown"
+    return str(DEFAULT_ORG_ID), None, f"ip:{client}"
+
+
+limiter = RateLimiter()
@@ -0,0 +1,243 @@
+"""
+SSS Corp ERP — Shared Redis Client
+One lazily-created command pool per process, plus a separate pub/sub pool for the
+notification SSE streams (both closed in main.lifespan shutdown).
+
+Callers must treat Redis as optional: every use is wrapped in try/except and
+falls back to Postgres (or simply skips the side-effect) when Redis is down.
+
+Phase 15: RedisManager adds
+  - a circuit breaker — after REDIS_BREAKER_FAILURES consecutive connection errors,
+    commands fail immediately (RedisUnavailableError, a redis ConnectionError) for
+    REDIS_BREAKER_COOLDOWN_SECONDS instead of each waiting out the socket timeout;
+    the first command after the cooldown is the half-open probe
+  - per-command call / error / latency counters (GET /api/admin/performance/redis)
+  - pipeline() helper — one round trip, same breaker + counters
+  - bounded pools — past max_connections a command fails at once with
+    RedisPoolExhaustedError, which is local back-pressure and does not count
+    towards the breaker (Redis itself is fine)
+"""
+
+import logging
+import time
+from contextlib import asynccontextmanager
+
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class RedisUnavailableError(RedisConnectionError):
+    """Raised without touching the network while the circuit breaker is open."""
+
+
+class RedisPoolExhaustedError(RedisConnectionError):
+    """Every connection of a process pool is in use — raised before any network I/O."""
+
+
+class _BoundedPool(aioredis.ConnectionPool):
+    """ConnectionPool whose "Too many connections" is a RedisPoolExhaustedError."""
+
+    def get_available_connection(self):
+        if not self._available_connections and len(self._in_use_connections) >= self.max_connections:
+            raise RedisPoolExhaustedError(f"All {self.max_connections} pooled Redis connections in use")
+        return super().get_available_connection()
+
+
+class _CommandStats:
+    __slots__ = ("calls", "errors", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class RedisManager:
+    """Breaker state + counters shared by every command sent through the process client."""
+
+    def __init__(self, *, failure_threshold: int, cooldown_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        self.last_error: str | None = None
+        self.pool_exhausted = 0
+        self.stats: dict[str, _CommandStats] = {}
+
+    # --- circuit breaker ---
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown_seconds:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        if self.state == "open":
+            raise RedisUnavailableError("Redis circuit open")
+
+    def record(self, command: str, elapsed_ms: float, error: BaseException | None = None) -> None:
+        s = self.stats.get(command)
+        if s is None:
+            s = self.stats[command] = _CommandStats()
+        s.calls += 1
+        s.total_ms += elapsed_ms
+        s.max_ms = max(s.max_ms, elapsed_ms)
+        if error is None:
+            if self.opened_at is not None:
+                logger.info("Redis circuit closed")
+            self.consecutive_failures = 0
+            self.opened_at = None
+            return
+        s.errors += 1
+        if isinstance(error, RedisPoolExhaustedError):
+            self.pool_exhausted += 1  # this process is saturated, Redis is not down
+            return
+        self.last_error = f"{type(error).__name__}: {error}"
+        # Only transport failures trip the breaker (not WRONGTYPE etc.)
+        if isinstance(error, (RedisConnectionError, RedisTimeoutError, OSError)):
+            self.consecutive_failures += 1
+            if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning("Redis circuit open for %ss: %s", self.cooldown_seconds, self.last_error)
+                self.opened_at = time.monotonic()
+
+    async def timed(self, command: str, coro_fn):
+        self.before_call()
+        start = time.perf_counter()
+        try:
+            result = await coro_fn()
+        except Exception as e:
+            self.record(command, (time.perf_counter() - start) * 1000, e)
+            raise
+        self.record(command, (time.perf_counter() - start) * 1000)
+        return result
+
+    # --- helpers ---
+
+    @asynccontextmanager
+    async def pipeline(self, client: aioredis.Redis | None = None, *, transaction: bool = False):
+        """
+        Queue commands on the yielded pipeline; they are sent in one round trip on exit.
+        Results: `pipe.results` after the block.
+        """
+        pipe = (client or get_redis()).pipeline(transaction=transaction)
+        yield pipe
+        pipe.results = await self.timed("PIPELINE", pipe.execute)
+
+    async def ping(self) -> bool:
+        try:
+            return bool(await get_redis().ping())
+        except Exception:
+            return False
+
+    def health(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+            "pool_exhausted": self.pool_exhausted,
+            "pool": _pool_health(_client),
+            "pubsub_pool": _pool_health(_pubsub_client),
+        }
+
+    def metrics(self) -> dict:
+        return {
+            **self.health(),
+            "commands": {name: s.as_dict() for name, s in sorted(self.stats.items())},
+        }
+
+
+class InstrumentedRedis(aioredis.Redis):
+    """redis.asyncio.Redis whose every command goes through the manager's breaker + counters."""
+
+    async def execute_command(self, *args, **options):
+        return await manager.timed(
+            str(args[0]).upper(),
+            lambda: super(InstrumentedRedis, self).execute_command(*args, **options),
+        )
+
+
+manager = RedisManager(
+    failure_threshold=settings.REDIS_BREAKER_FAILURES,
+    cooldown_seconds=settings.REDIS_BREAKER_COOLDOWN_SECONDS,
+)
+
+_client: InstrumentedRedis | None = None
+_pubsub_client: aioredis.Redis | None = None
+
+
+def _make_client(cls: type[aioredis.Redis], max_connections: int) -> aioredis.Redis:
+    pool = _BoundedPool.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        socket_connect_timeout=2,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        health_check_interval=30,
+        max_connections=max_connections,
+    )
+    client = cls(connection_pool=pool)
+    client.auto_close_connection_pool = True  # aclose() closes the pool, as from_url()
+    return client
+
+
+def _pool_health(client: aioredis.Redis | None) -> dict | None:
+    if client is None:
+        return None
+    pool = client.connection_pool
+    return {
+        "max_connections": pool.max_connections,
+        "in_use": len(pool._in_use_connections),
+        "idle": len(pool._available_connections),
+    }
+
+
+def get_redis() -> aioredis.Redis:
+    """Return the process-wide Redis client (str responses)."""
+    global _client
+    if _client is None:
+        _client = _make_client(InstrumentedRedis, settings.REDIS_MAX_CONNECTIONS)
+    return _client
+
+
+def get_pubsub_redis() -> aioredis.Redis:
+    """
+    Client for long-lived subscriptions (notification SSE streams) — its own pool
+    of NOTIFICATION_STREAM_MAX_CONNECTIONS, so open streams never take connections
+    from the command pool. Past the cap, subscribe() raises RedisPoolExhaustedError.
+    """
+    global _pubsub_client
+    if _pubsub_client is None:
+        _pubsub_client = _make_client(aioredis.Redis, settings.NOTIFICATION_STREAM_MAX_CONNECTIONS)
+    return _pubsub_client
+
+
+def get_redis_manager() -> RedisManager:
+    return manager
+
+
+async def close_redis() -> None:
+    global _client, _pubsub_client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    if _pubsub_client is not None:
+        await _pubsub_client.aclose()
+        _pubsub_client = None
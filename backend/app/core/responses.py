@@ -0,0 +1,54 @@
+"""
+SSS Corp ERP — Fast JSON Response Path
+Phase 15: orjson rendering for every endpoint + opt-in validation bypass for large lists
+
+FastJSONResponse is the app's default_response_class: FastAPI still validates against
+response_model, but rendering uses orjson instead of json.dumps.
+
+fast_json(Model, payload) goes further for list endpoints whose service already builds
+dicts in the exact response_model shape (all fields present, right types): the payload
+is rendered directly, skipping the response_model validate + dump round trip. Output
+matches Pydantic's JSON mode (UUID/datetime/date native, Decimal → string, UTC → "Z").
+Set RESPONSE_FAST_PATH_VERIFY=True (dev/tests) to validate every fast_json payload.
+"""
+
+from decimal import Decimal
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return str(obj)  # same as Pydantic JSON mode for Decimal fields
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content) -> bytes:
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def fast_json(model: type[BaseModel], content: dict, *, status_code: int = 200) -> FastJSONResponse:
+    """
+    Render a service-built payload without response_model re-validation.
+    Keep `response_model=Model` on the route for the OpenAPI schema.
+    """
+    if settings.RESPONSE_FAST_PATH_VERIFY:
+        model.model_validate(content)
+    return FastJSONResponse(content, status_code=status_code)
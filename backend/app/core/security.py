@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -41,7 +42,9 @@ def create_refresh_token(data: dict[str, Any]) -> str:
     expire = datetime.now(timezone.utc) + timedelta(
         days=settings.REFRESH_TOKEN_EXPIRE_DAYS
     )
-    to_encode = {**data, "exp": expire, "type": "refresh"}
+    # jti: refresh tokens are stored under a unique index — two logins by the same
+    # user within one second would otherwise encode identical tokens
+    to_encode = {**data, "exp": expire, "type": "refresh", "jti": uuid.uuid4().hex}
     return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
@@ -61,10 +64,17 @@ def decode_token(token: str) -> dict[str, Any]:
 
 # --- Dependencies ---
 
+_TOKEN_PAYLOAD_STATE = "token_payload"  # request state key — JWT decoded once per request
+
+
 def get_token_payload(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
 ) -> dict[str, Any]:
-    payload = decode_token(credentials.credentials)
+    # Already decoded by the rate limiter / middleware for this request?
+    payload = request.scope.get("state", {}).get(_TOKEN_PAYLOAD_STATE)
+    if payload is None:
+        payload = decode_token(credentials.credentials)
     if payload.get("type") != "access":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -74,15 +84,23 @@ def get_token_payload(
 
 
 def get_token_payload_from_request(request: Request) -> dict | None:
-    """Extract JWT payload from request Authorization header. Non-raising."""
+    """
+    Extract JWT payload from request Authorization header. Non-raising.
+    The result (None too) is kept in the request state, so the rate limiter,
+    get_token_payload and the performance middleware share one decode.
+    """
+    state = request.scope.setdefault("state", {})
+    if _TOKEN_PAYLOAD_STATE in state:
+        return state[_TOKEN_PAYLOAD_STATE]
+    payload = None
     try:
         auth = request.headers.get("authorization", "")
-        if not auth.startswith("Bearer "):
-            return None
-        token = auth.split(" ", 1)[1]
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
-        return payload
+        if auth.startswith("Bearer "):
+            token = auth.split(" ", 1)[1]
+            payload = jwt.decode(
+                token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+            )
     except Exception:
-        return None
+        payload = None
+    state[_TOKEN_PAYLOAD_STATE] = payload
+    return payload
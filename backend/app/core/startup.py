@@ -0,0 +1,49 @@
+"""
+SSS Corp ERP — Cold-start profiling
+Phase 15: Startup phase timings
+
+Phases (ms, logged once as "Startup timing" when lifespan is ready):
+  imports         app.main module imports (app.api pulls every router/schema module)
+  routers         app.include_router() for all_routers
+  db_warmup       first connection per engine (SELECT 1)
+  role_overrides  load_role_overrides() from DB
+  redis           first PING (pool warm-up, breaker state)
+  total           app.main import start → ready to serve
+
+Benchmark / regression guard: python -m app.bench.cold_start --budget-ms N
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Ordered phase → elapsed ms, measured relative to `origin` (perf_counter)."""
+
+    def __init__(self, origin: float | None = None):
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.phases: dict[str, float] = {}
+
+    def record(self, name: str, started: float) -> None:
+        self.phases[name] = (time.perf_counter() - started) * 1000
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started)
+
+    def report(self) -> dict[str, float]:
+        total = (time.perf_counter() - self.origin) * 1000
+        return {name: round(ms, 1) for name, ms in {**self.phases, "total": total}.items()}
+
+    def log(self) -> dict[str, float]:
+        report = self.report()
+        logger.info("Startup timing (ms): %s", " ".join(f"{k}={v:.0f}" for k, v in report.items()))
+        return report
+
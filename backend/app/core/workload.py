@@ -0,0 +1,126 @@
+"""
+SSS Corp ERP — Database workload classes
+Phase 15: Isolate transactional, reporting, background and auth traffic
+
+Each class gets its own concurrency gate (a bounded share of the connection pool),
+its own statement_timeout / lock_timeout (SET LOCAL at transaction begin, see
+app.core.database) and a bounded queue wait. When a class stays saturated longer
+than its wait budget the request fails fast with 503 + Retry-After instead of
+queueing behind a runaway report.
+"""
+
+import asyncio
+import enum
+import math
+import time
+from contextlib import asynccontextmanager
+
+from app.core.config import get_settings
+
+
+class WorkloadClass(str, enum.Enum):
+    TRANSACTIONAL = "transactional"
+    REPORTING = "reporting"
+    BACKGROUND = "background"
+    AUTH = "auth"
+
+
+class PoolSaturatedError(Exception):
+    """Raised when a workload class has no free slot within its wait budget."""
+
+    def __init__(self, workload: str, retry_after: int):
+        self.workload = workload
+        self.retry_after = retry_after
+        super().__init__(f"Database workload '{workload}' saturated")
+
+
+class WorkloadGate:
+    """Concurrency limit + queue-wait bound + per-class counters for one workload class."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        limit: int,
+        wait_ms: int,
+        statement_timeout_ms: int,
+        lock_timeout_ms: int,
+    ):
+        self.name = name
+        self.limit = limit
+        self.wait_ms = wait_ms
+        self.statement_timeout_ms = statement_timeout_ms
+        self.lock_timeout_ms = lock_timeout_ms
+        self._sem = asyncio.Semaphore(limit)
+        self.in_use = 0
+        self.waiting = 0
+        self.peak_in_use = 0
+        self.acquired = 0
+        self.rejected = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    @property
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.wait_ms / 1000))
+
+    @asynccontextmanager
+    async def slot(self):
+        start = time.perf_counter()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._sem.acquire(), timeout=self.wait_ms / 1000)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise PoolSaturatedError(self.name, self.retry_after) from None
+        finally:
+            self.waiting -= 1
+
+        waited = (time.perf_counter() - start) * 1000
+        self.acquired += 1
+        self.wait_ms_total += waited
+        self.wait_ms_max = max(self.wait_ms_max, waited)
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        try:
+            yield self
+        finally:
+            self.in_use -= 1
+            self._sem.release()
+
+    def snapshot(self) -> dict:
+        return {
+            "workload": self.name,
+            "limit": self.limit,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "utilization": round(self.in_use / self.limit, 3) if self.limit else 0.0,
+            "peak_in_use": self.peak_in_use,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.wait_ms_total / self.acquired, 2) if self.acquired else 0.0,
+            "max_wait_ms": round(self.wait_ms_max, 2),
+            "statement_timeout_ms": self.statement_timeout_ms,
+            "lock_timeout_ms": self.lock_timeout_ms,
+        }
+
+
+_gates: dict[WorkloadClass, WorkloadGate] = {}
+
+
+def get_gate(workload: WorkloadClass) -> WorkloadGate:
+    if workload not in _gates:
+        settings = get_settings()
+        prefix = f"DB_{workload.name}_"
+        _gates[workload] = WorkloadGate(
+            workload.value,
+            limit=getattr(settings, prefix + "MAX_SESSIONS"),
+            wait_ms=getattr(settings, prefix + "QUEUE_WAIT_MS"),
+            statement_timeout_ms=getattr(settings, prefix + "STATEMENT_TIMEOUT_MS"),
+            lock_timeout_ms=getattr(settings, prefix + "LOCK_TIMEOUT_MS"),
+        )
+    return _gates[workload]
+
+
+def workload_metrics() -> list[dict]:
+    return [get_gate(w).snapshot() for w in WorkloadClass]
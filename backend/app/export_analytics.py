@@ -0,0 +1,57 @@
+"""
+Incremental Parquet export of the operational ledgers — schedule daily (cron / job).
+Run: python -m app.export_analytics [--out DIR] [--tables T ...] [--full] [--batch-rows N]
+
+Exports rows changed since each table's watermark to
+DIR/{table}/month=YYYY-MM/part-{run}.parquet (services.analytics_export) and
+advances the watermark. DIR defaults to ANALYTICS_EXPORT_DIR. --full exports
+every row again and needs an empty DIR/{table}.
+Exit status: 0 = all tables exported, 1 = a table failed.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.core.config import get_settings
+from app.services.analytics_export import EXPORT_TABLES, export_table
+
+
+async def run(tables: list[str], *, out_dir: str, full: bool, batch_rows: int | None) -> int:
+    from app.core.database import background_session
+
+    failed = 0
+    for table_name in tables:
+        try:
+            async with background_session() as control:
+                result = await export_table(
+                    control, table_name, out_dir=out_dir, full=full, batch_rows=batch_rows,
+                )
+        except Exception as exc:
+            print(f"[EXPORT] {table_name}: FAILED — {exc}")
+            failed += 1
+            continue
+        if result is None:
+            print(f"[EXPORT] {table_name}: skipped, another export of it is running")
+            continue
+        print(f"[EXPORT] {table_name}: {result['rows']:,} rows → {len(result['files'])} files "
+              f"in {result['duration_ms'] / 1000:.1f}s (changed up to {result['until']:%Y-%m-%d %H:%M:%S%z})")
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", default=get_settings().ANALYTICS_EXPORT_DIR,
+                        help="output directory (default ANALYTICS_EXPORT_DIR)")
+    parser.add_argument("--tables", nargs="+", choices=list(EXPORT_TABLES), default=list(EXPORT_TABLES))
+    parser.add_argument("--full", action="store_true", help="ignore the watermarks, export every row")
+    parser.add_argument("--batch-rows", type=int, help="rows per fetch / row group "
+                                                       "(default ANALYTICS_EXPORT_BATCH_ROWS)")
+    args = parser.parse_args()
+    if not args.out:
+        parser.error("--out is required when ANALYTICS_EXPORT_DIR is not set")
+    sys.exit(asyncio.run(run(args.tables, out_dir=args.out, full=args.full, batch_rows=args.batch_rows)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Bulk master-data import — same pipeline as POST /api/admin/imports/*.
+Run: python -m app.import_master ENTITY FILE --as-user EMAIL [--org UUID] [--dry-run]
+     [--errors OUT.csv]
+
+ENTITY: products | employees | customers | suppliers | opening_stock (FILE: .csv or .xlsx)
+Rows are validated and loaded in chunks (services.data_import), each loaded chunk
+committed; rows whose key already exists are skipped, so the file can be re-run
+after fixing the rejected rows listed in --errors (default FILE.errors.csv).
+Exit status: 0 = no rejected rows, 1 = some rows rejected.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.core.config import DEFAULT_ORG_ID
+from app.services.data_import import IMPORT_ENTITIES, error_report_csv, run_import
+
+
+async def run(entity: str, path: str, *, org_id: UUID, as_user: str, dry_run: bool,
+              errors_path: str) -> int:
+    from fastapi import HTTPException
+
+    from app.core.database import background_session
+    from app.models.user import User
+
+    async with background_session() as db:
+        user = (await db.execute(
+            select(User).where(User.email == as_user, User.org_id == org_id, User.is_active == True)
+        )).scalar_one_or_none()
+        if user is None:
+            print(f"[IMPORT] --as-user {as_user} not found in org {org_id}")
+            return 1
+        with open(path, "rb") as f:
+            try:
+                result = await run_import(
+                    db, entity=entity, file=f, file_name=os.path.basename(path),
+                    org_id=org_id, created_by=user.id, role=user.role, dry_run=dry_run,
+                )
+            except HTTPException as exc:
+                print(f"[IMPORT] {exc.detail}")
+                return 1
+
+    mode = " (dry run)" if dry_run else ""
+    print(f"[IMPORT] {entity}{mode}: {result.total_rows:,} rows — {result.loaded_rows:,} loaded, "
+          f"{result.skipped_rows:,} skipped, {result.error_count:,} rejected "
+          f"in {result.duration_ms / 1000:.1f}s (run {result.id})")
+    if not result.error_count:
+        return 0
+    with open(errors_path, "w", encoding="utf-8-sig", newline="") as out:
+        out.write(error_report_csv(result))
+    print(f"[IMPORT] rejected rows → {errors_path}")
+    return 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("entity", choices=sorted(IMPORT_ENTITIES))
+    parser.add_argument("file", help=".csv (UTF-8) or .xlsx, header in the first row")
+    parser.add_argument("--as-user", required=True, help="email of the user the import runs as")
+    parser.add_argument("--org", type=UUID, default=DEFAULT_ORG_ID)
+    parser.add_argument("--dry-run", action="store_true", help="validate only, load nothing")
+    parser.add_argument("--errors", help="where to write rejected rows (default FILE.errors.csv)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(
+        args.entity, args.file, org_id=args.org, as_user=args.as_user, dry_run=args.dry_run,
+        errors_path=args.errors or os.path.splitext(args.file)[0] + ".errors.csv",
+    )))
+
+
+if __name__ == "__main__":
+    main()
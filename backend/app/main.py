@@ -2,28 +2,37 @@
 SSS Corp ERP — Main Application
 """
 
-import logging
 import time
+
+_import_started = time.perf_counter()
+
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
-import sentry_sdk
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
 
 from app.core.config import get_settings
 from app.core.rate_limit import limiter
-from app.core.database import engine, Base
+from app.core.database import all_engines
+from app.core.responses import FastJSONResponse
+from app.core.startup import StartupTimer
+from app.core.workload import PoolSaturatedError
+from app.middleware.rate_limit import RateLimitMiddleware
 from app.api import all_routers
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# --- Sentry (error monitoring) ---
+startup_timer = StartupTimer(origin=_import_started)
+startup_timer.record("imports", _import_started)
+
+# --- Sentry (error monitoring) — imported only when configured (~250ms cold) ---
 if settings.SENTRY_DSN:
+    import sentry_sdk
+
     sentry_sdk.init(
         dsn=settings.SENTRY_DSN,
         environment=settings.ENVIRONMENT,
@@ -50,28 +59,45 @@ async def lifespan(app: FastAPI):
     #     async with engine.begin() as conn:
     #         await conn.run_sync(Base.metadata.create_all)
 
+    # --- DB warm-up (Phase 15) — open the first pooled connection per engine ---
+    with startup_timer.phase("db_warmup"):
+        from sqlalchemy import text
+
+        for _engine in all_engines():
+            try:
+                async with _engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            except Exception as e:
+                logger.warning("DB warm-up failed for %s: %s", _engine.url.host, e)
+
     # Load persisted role permission overrides from DB
-    try:
-        from app.core.database import AsyncSessionLocal
-        from app.core.config import DEFAULT_ORG_ID
-        from app.core.permissions import load_role_overrides
+    with startup_timer.phase("role_overrides"):
+        try:
+            from app.core.database import AsyncSessionLocal
+            from app.core.config import DEFAULT_ORG_ID
+            from app.core.permissions import load_role_overrides
 
-        async with AsyncSessionLocal() as db:
-            await load_role_overrides(db, DEFAULT_ORG_ID)
-            logger.info("Role permission overrides loaded from DB")
-    except Exception as e:
-        logger.warning("Could not load role overrides: %s (using defaults)", e)
+            async with AsyncSessionLocal() as db:
+                await load_role_overrides(db, DEFAULT_ORG_ID)
+                logger.info("Role permission overrides loaded from DB")
+        except Exception as e:
+            logger.warning("Could not load role overrides: %s (using defaults)", e)
+
+    # --- Shared Redis (Phase 15) — warm the pool, seed breaker state ---
+    with startup_timer.phase("redis"):
+        from app.core.redis import get_redis_manager
+
+        if not await get_redis_manager().ping():
+            logger.warning("Redis unavailable at startup — caches/realtime degrade to Postgres")
 
     # --- DB Query Profiler (Phase 14) ---
     try:
         from sqlalchemy import event
         from app.middleware.performance import _request_query_stats
 
-        @event.listens_for(engine.sync_engine, "before_cursor_execute")
         def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
             conn.info["query_start_time"] = time.perf_counter()
 
-        @event.listens_for(engine.sync_engine, "after_cursor_execute")
         def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
             start = conn.info.pop("query_start_time", None)
             if start is None:
@@ -85,13 +111,114 @@ async def lifespan(app: FastAPI):
             if elapsed_ms > settings.PERF_SLOW_QUERY_MS:
                 logger.warning("Slow query (%.1fms): %s", elapsed_ms, statement[:200])
 
+        for _engine in all_engines():
+            event.listen(_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(_engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
         logger.info("DB query profiler enabled (slow threshold: %dms)", settings.PERF_SLOW_QUERY_MS)
     except Exception as e:
         logger.warning("Could not set up DB query profiler: %s", e)
 
+    # --- Monthly partitions for audit tables + month-end stock snapshots (Phase 15) ---
+    async def _partition_maintenance_loop():
+        from app.core.database import background_session
+        from app.services.partition import maintain_partitions
+        from app.services.events import prune_domain_events
+        from app.services.stock_snapshot import ensure_month_end_snapshots
+
+        while True:
+            try:
+                async with background_session() as db:
+                    await maintain_partitions(db)
+            except Exception as e:
+                logger.warning("Partition maintenance failed: %s", e)
+            try:
+                async with background_session() as db:
+                    await ensure_month_end_snapshots(db)
+            except Exception as e:
+                logger.warning("Month-end stock snapshot failed: %s", e)
+            try:
+                async with background_session() as db:
+                    await prune_domain_events(db)
+            except Exception as e:
+                logger.warning("Domain event pruning failed: %s", e)
+            await asyncio.sleep(24 * 3600)
+
+    partition_task = asyncio.create_task(_partition_maintenance_loop())
+
+    # --- Batched audit writer (Phase 15, optional) ---
+    if settings.AUDIT_ASYNC_WRITES:
+        from app.services.audit_writer import start_audit_writer
+
+        start_audit_writer()
+        logger.info("Batched audit writer enabled (batch=%d, flush=%dms)",
+                    settings.AUDIT_WRITER_BATCH_SIZE, settings.AUDIT_WRITER_FLUSH_MS)
+
+    # --- Email outbox worker (Phase 15) ---
+    email_stop = asyncio.Event()
+    email_worker = None
+    from app.services.email import email_enabled
+
+    if email_enabled() and settings.EMAIL_WORKER_ENABLED:
+        from app.services.email import run_email_outbox_worker
+
+        email_worker = asyncio.create_task(run_email_outbox_worker(email_stop))
+
+    # --- Low-stock alert worker (Phase 15) ---
+    low_stock_stop = asyncio.Event()
+    low_stock_worker = None
+    if settings.LOW_STOCK_ALERT_WORKER_ENABLED:
+        from app.services.low_stock import run_low_stock_alert_worker
+
+        low_stock_worker = asyncio.create_task(run_low_stock_alert_worker(low_stock_stop))
+
+    # --- Domain event relay (Phase 15) ---
+    event_relay_stop = asyncio.Event()
+    event_relay = None
+    if settings.EVENT_RELAY_ENABLED:
+        from app.services.events import run_event_relay
+
+        event_relay = asyncio.create_task(run_event_relay(event_relay_stop))
+
+    # --- Cost center actuals refresher (Phase 15) ---
+    cost_actuals_stop = asyncio.Event()
+    cost_actuals_refresher = None
+    if settings.COST_ACTUALS_REFRESH_ENABLED:
+        from app.services.cost_actuals import run_cost_actuals_refresher
+
+        cost_actuals_refresher = asyncio.create_task(run_cost_actuals_refresher(cost_actuals_stop))
+
+    app.state.startup_timings = startup_timer.log()
+
     yield
     # Shutdown
-    await engine.dispose()
+    partition_task.cancel()
+    try:
+        await partition_task
+    except asyncio.CancelledError:
+        pass
+    if email_worker is not None:
+        email_stop.set()
+        await email_worker
+    if low_stock_worker is not None:
+        low_stock_stop.set()
+        await low_stock_worker
+    if event_relay is not None:
+        event_relay_stop.set()
+        await event_relay
+    if cost_actuals_refresher is not None:
+        cost_actuals_stop.set()
+        await cost_actuals_refresher
+
+    from app.services.audit_writer import stop_audit_writer
+
+    await stop_audit_writer()
+
+    from app.core.redis import close_redis
+
+    await close_redis()
+    for _engine in all_engines():
+        await _engine.dispose()
 
 
 app = FastAPI(
@@ -99,11 +226,16 @@ app = FastAPI(
     version=settings.APP_VERSION,
     docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
+    default_response_class=FastJSONResponse,
     lifespan=lifespan,
 )
 
 # --- Middleware ---
 
+# Rate Limiting (Phase 15: per-org/per-role policies, one Redis round trip) — added
+# before CORS so it sits inside it and 429 responses carry the CORS headers
+app.add_middleware(RateLimitMiddleware, limiter=limiter)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -113,30 +245,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Rate Limiting (Phase 13.6: per-user via JWT, default_limits applied globally)
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-app.add_middleware(SlowAPIMiddleware)
+# DB workload class saturated (Phase 15) — fail fast instead of queueing on the pool
+@app.exception_handler(PoolSaturatedError)
+async def _pool_saturated_handler(request: Request, exc: PoolSaturatedError):
+    logger.warning("DB workload '%s' saturated: %s %s", exc.workload, request.method, request.url.path)
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server busy, please retry", "workload": exc.workload},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
 # Performance Monitoring Middleware (Phase 14)
 try:
-    import redis.asyncio as aioredis
+    from app.core.redis import get_redis
     from app.middleware.performance import PerformanceMiddleware
 
-    _perf_redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
     app.add_middleware(
         PerformanceMiddleware,
-        redis_client=_perf_redis,
+        redis_client=get_redis(),
         slow_threshold_ms=settings.PERF_SLOW_REQUEST_MS,
     )
     logger.info("Performance middleware enabled (slow threshold: %dms)", settings.PERF_SLOW_REQUEST_MS)
 except Exception as e:
     logger.warning("Could not set up performance middleware: %s", e)
 
+# Response compression (Phase 15) — outermost, so it sees the final body
+from app.middleware.compression import CompressionMiddleware
+
+app.add_middleware(CompressionMiddleware, minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES)
+
 
 # --- Register Routers ---
-for router in all_routers:
-    app.include_router(router)
+with startup_timer.phase("routers"):
+    for router in all_routers:
+        app.include_router(router)
 
 
 # --- Root ---
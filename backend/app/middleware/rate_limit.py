@@ -0,0 +1,43 @@
+"""
+SSS Corp ERP — Rate Limit Middleware
+Phase 15: enforces app.core.rate_limit policies before routing
+
+Pure ASGI, mounted inside CORS so a 429 still carries the CORS headers the
+browser needs to read it. Throttled requests get 429 + Retry-After.
+"""
+
+import math
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from app.core.rate_limit import PERIOD_SECONDS, RateLimiter, request_identity
+
+
+class RateLimitMiddleware:
+    def __init__(self, app, limiter: RateLimiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.limiter.enabled or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+        policy = self.limiter.route_policy(scope)
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        org, role, subject = request_identity(Request(scope), policy)
+        allowed, retry_after, limit = await self.limiter.hit(
+            org=org, policy_name=policy, subject=subject, role=role,
+        )
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+        response = JSONResponse(
+            status_code=429,
+            content={"detail": f"Rate limit exceeded: {limit} per {PERIOD_SECONDS} seconds"},
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        await response(scope, receive, send)
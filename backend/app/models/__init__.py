@@ -31,6 +31,12 @@ from app.models.notification import Notification, NotificationType
 from app.models.security import LoginHistory, LoginStatus, OrgSecurityConfig, ExportAuditLog, AuditLog, AuditAction
 from app.models.performance import PerformanceLog, PerformanceAnalysis, WebVitalLog, AnalysisSeverity
 from app.models.stocktake import StockTake, StockTakeLine, StockTakeStatus
+from app.models.search import DocumentSearchIndex
+from app.models.email import EmailOutbox, EmailStatus
+from app.models.data_import import ImportRun
+from app.models.event import DomainEvent
+from app.models.analytics_export import AnalyticsExportWatermark
+from app.models.cost_actuals import CostCenterActual, RollupWatermark
 
 __all__ = [
     "User",
@@ -138,4 +144,12 @@ __all__ = [
     "StockTake",
     "StockTakeLine",
     "StockTakeStatus",
+    "DocumentSearchIndex",
+    "EmailOutbox",
+    "EmailStatus",
+    "ImportRun",
+    "DomainEvent",
+    "AnalyticsExportWatermark",
+    "CostCenterActual",
+    "RollupWatermark",
 ]
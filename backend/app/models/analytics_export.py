@@ -0,0 +1,32 @@
+"""
+SSS Corp ERP — Analytics Export Models
+Phase 15: one watermark row per exported table (app.services.analytics_export) —
+rows changed after it have not been written to Parquet yet.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class AnalyticsExportWatermark(Base):
+    """
+    Export progress of one table, across all orgs. Advanced only after a run's
+    files are in place, so a failed run is simply repeated by the next one.
+    """
+    __tablename__ = "analytics_export_watermarks"
+
+    table_name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    exported_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    last_run_rows: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    last_run_files: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_run_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<AnalyticsExportWatermark {self.table_name} until={self.exported_until}>"
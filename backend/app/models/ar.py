@@ -19,6 +19,7 @@ import uuid
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
+    Computed,
     Date,
     DateTime,
     Enum,
@@ -27,6 +28,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -100,6 +102,10 @@ class CustomerInvoice(Base, TimestampMixin, OrgMixin):
     received_amount: Mapped[object] = mapped_column(
         Numeric(12, 2), nullable=False, default=0
     )
+    # Phase 15: open-item balance, kept in step with every payment by Postgres
+    outstanding_amount: Mapped[object] = mapped_column(
+        Numeric(12, 2), Computed("total_amount - received_amount", persisted=True)
+    )
 
     # Status
     status: Mapped[CustomerInvoiceStatus] = mapped_column(
@@ -173,6 +179,13 @@ class CustomerInvoice(Base, TimestampMixin, OrgMixin):
         Index("ix_ci_customer_id", "customer_id"),
         Index("ix_ci_due_date", "due_date"),
         Index("ix_ci_company", "company_id"),
+        Index("ix_ci_updated", "updated_at"),  # analytics export watermark
+        # Phase 15: open-item index — only APPROVED invoices with a balance left
+        Index(
+            "ix_ci_open_items", "org_id", "due_date",
+            postgresql_include=["customer_id", "outstanding_amount"],
+            postgresql_where=text("status = 'APPROVED' AND is_active AND outstanding_amount > 0"),
+        ),
     )
 
 
@@ -224,4 +237,5 @@ class CustomerInvoicePayment(Base, TimestampMixin, OrgMixin):
             name="ck_ci_payment_amount_positive",
         ),
         Index("ix_ci_payment_invoice_id", "invoice_id"),
+        Index("ix_ci_payment_updated", "updated_at"),  # analytics export watermark
     )
@@ -0,0 +1,84 @@
+"""
+SSS Corp ERP — Cost Center Actuals Rollup Models
+Phase 15: monthly actual labor / material / tool / overhead per cost center
+(app.services.cost_actuals), read by the cost-center summary and finance dashboard.
+"""
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Integer, Numeric, String, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.user import OrgMixin
+
+
+# ============================================================
+# COST CENTER ACTUAL (one row per org × month × cost center)
+# ============================================================
+
+class CostCenterActual(Base, OrgMixin):
+    """
+    Job-costing actuals of one cost center for one month — derived data, rebuilt
+    per org-month from timesheets, stock movements and tool check-ins.
+    overhead = labor × the cost center's overhead_rate % (BR#17).
+    """
+    __tablename__ = "cost_center_actuals"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    period_year: Mapped[int] = mapped_column(Integer, nullable=False)
+    period_month: Mapped[int] = mapped_column(Integer, nullable=False)
+    cost_center_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("cost_centers.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    labor: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=Decimal("0.00"))
+    material: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=Decimal("0.00"))
+    tool: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=Decimal("0.00"))
+    overhead: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=Decimal("0.00"))
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        # Summary lookup: org (+ year (+ month)) prefix of the key
+        UniqueConstraint(
+            "org_id", "period_year", "period_month", "cost_center_id",
+            name="uq_cc_actual_org_period_cc",
+        ),
+        CheckConstraint(
+            "period_month >= 1 AND period_month <= 12",
+            name="ck_cc_actual_month_range",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<CostCenterActual {self.period_year}/{self.period_month:02d} cc={self.cost_center_id}>"
+
+
+# ============================================================
+# ROLLUP WATERMARK
+# ============================================================
+
+class RollupWatermark(Base):
+    """
+    Progress of an incremental rollup: source rows with updated_at up to
+    processed_until have been folded in. One row per rollup ("cost_center_actuals").
+    """
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    processed_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    last_run_periods: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<RollupWatermark {self.name} until={self.processed_until}>"
@@ -0,0 +1,48 @@
+"""
+SSS Corp ERP — Bulk Import Models
+Phase 15: one row per master-data import run (app.services.data_import) —
+counts plus the rejected rows, served back as the downloadable error report.
+"""
+
+import uuid
+
+from sqlalchemy import JSON, Boolean, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.user import TimestampMixin, OrgMixin
+
+
+class ImportRun(Base, TimestampMixin, OrgMixin):
+    """
+    Result of one uploaded file. errors holds up to IMPORT_MAX_ERRORS rejected rows
+    as {row, column, value, message}; error_count keeps counting past the cap.
+    """
+    __tablename__ = "import_runs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    entity: Mapped[str] = mapped_column(String(30), nullable=False)
+    file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    dry_run: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    total_rows: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    valid_rows: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    loaded_rows: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    skipped_rows: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    errors: Mapped[list] = mapped_column(JSON, default=list, nullable=False)
+    duration_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    created_by: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="RESTRICT"),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("ix_import_runs_org_created", "org_id", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ImportRun {self.entity} {self.loaded_rows}/{self.total_rows}>"
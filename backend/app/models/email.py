@@ -0,0 +1,92 @@
+"""
+SSS Corp ERP — Email Outbox Models
+Phase 15: Transactional email outbox — written in the same transaction as the
+business change, delivered asynchronously by the outbox worker (app.services.email).
+"""
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.user import TimestampMixin, OrgMixin
+
+
+# ============================================================
+# Enums
+# ============================================================
+
+class EmailStatus(str, enum.Enum):
+    PENDING = "PENDING"     # รอส่ง (รวมถึงรอ retry)
+    SENDING = "SENDING"     # worker จองไว้แล้ว กำลังส่ง
+    SENT = "SENT"           # ส่งสำเร็จ
+    DEAD = "DEAD"           # ส่งไม่สำเร็จถาวร / เกินจำนวนครั้ง (dead-letter)
+
+
+# ============================================================
+# EMAIL OUTBOX MODEL
+# ============================================================
+
+class EmailOutbox(Base, TimestampMixin, OrgMixin):
+    """
+    One row per outgoing email.
+    Worker claims due rows with FOR UPDATE SKIP LOCKED, so several app
+    processes can drain the same outbox without double-sending.
+    """
+    __tablename__ = "email_outbox"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    to_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    subject: Mapped[str] = mapped_column(String(500), nullable=False)
+    html_body: Mapped[str] = mapped_column(Text, nullable=False)
+
+    status: Mapped[EmailStatus] = mapped_column(
+        Enum(EmailStatus, name="email_status_enum"),
+        default=EmailStatus.PENDING,
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    locked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Source document (for tracing — "PR", "PO", ...)
+    entity_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    entity_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+
+    __table_args__ = (
+        # Worker poll: due PENDING rows only — stays tiny as SENT rows accumulate
+        Index(
+            "ix_email_outbox_due",
+            "next_attempt_at",
+            postgresql_where=text("status IN ('PENDING', 'SENDING')"),
+        ),
+        Index("ix_email_outbox_org_status", "org_id", "status"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<EmailOutbox {self.to_email} {self.status}>"
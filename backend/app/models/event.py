@@ -0,0 +1,62 @@
+"""
+SSS Corp ERP — Domain Event Outbox Models
+Phase 15: Domain events (goods received, stock moved, invoice paid, payroll executed,
+document status changes) — written in the same transaction as the business change,
+published to Redis streams by the event relay (app.services.events).
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Identity, Index, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.user import OrgMixin
+
+
+# ============================================================
+# DOMAIN EVENT MODEL
+# ============================================================
+
+class DomainEvent(Base, OrgMixin):
+    """
+    One row per domain event. Append-only apart from the relay's publish stamp.
+
+    id orders events as written (per aggregate this is commit order — writers of
+    one aggregate serialize on its row lock). `offset` is assigned by the relay
+    at publish time, in publish order, and is what consumers replay from.
+    """
+    __tablename__ = "domain_events"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
+    event_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), default=uuid.uuid4, nullable=False, unique=True
+    )
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)  # "po.goods_received"
+    aggregate_type: Mapped[str] = mapped_column(String(50), nullable=False)  # "PO", "Product", ...
+    aggregate_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    actor_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    occurred_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    # Set by the relay once the event is on the stream
+    offset: Mapped[int | None] = mapped_column(BigInteger, nullable=True, unique=True)
+    published_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    stream_id: Mapped[str | None] = mapped_column(String(40), nullable=True)
+
+    __table_args__ = (
+        # Relay poll: unpublished rows only — stays tiny as published rows accumulate
+        Index("ix_domain_events_unpublished", "id", postgresql_where=text("published_at IS NULL")),
+        # Replay: GET /api/admin/events?after=<offset>
+        Index("ix_domain_events_org_offset", "org_id", "offset"),
+        Index("ix_domain_events_aggregate", "aggregate_type", "aggregate_id", "id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<DomainEvent {self.id} {self.event_type} {self.aggregate_type}:{self.aggregate_id}>"
@@ -5,6 +5,7 @@ Phase 4.1: Employee + department_id, supervisor_id, pay_type, daily_rate, monthl
 Phase 4.3: LeaveBalance + Leave upgrade (leave_type_id, days_count)
 Phase 4.9: ShiftRoster + Employee.work_schedule_id (Shift Management)
 Go-Live G7: PayrollSlip — individual payslips per employee per payroll run
+Phase 15: LeaveBalanceEntry ledger + running balance on LeaveBalance
 
 Business Rules:
   BR#15 — ManHour Cost = Σ((Regular + OT × Factor) × Rate)
@@ -36,6 +37,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -62,6 +64,13 @@ class LeaveStatus(str, enum.Enum):
     REJECTED = "REJECTED"
 
 
+class LeaveEntryType(str, enum.Enum):
+    ACCRUAL = "ACCRUAL"                 # Yearly quota granted
+    CARRY_FORWARD = "CARRY_FORWARD"     # Unused days brought in from previous year
+    USAGE = "USAGE"                     # Approved leave
+    ADJUSTMENT = "ADJUSTMENT"           # HR quota edit
+
+
 class PayrollStatus(str, enum.Enum):
     DRAFT = "DRAFT"
     EXECUTED = "EXECUTED"
@@ -228,6 +237,12 @@ class Timesheet(Base, TimestampMixin, OrgMixin):
         default=TimesheetStatus.DRAFT,
     )
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Phase 15: set when auto-recorded from an approved daily report (BR#52)
+    daily_report_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("daily_work_reports.id", ondelete="SET NULL"),
+        nullable=True,
+    )
     created_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="RESTRICT"),
@@ -252,6 +267,11 @@ class Timesheet(Base, TimestampMixin, OrgMixin):
         CheckConstraint("ot_hours >= 0", name="ck_timesheet_ot_hours_positive"),
         Index("ix_timesheets_employee_date", "employee_id", "work_date"),
         Index("ix_timesheets_wo", "work_order_id"),
+        Index("ix_timesheets_updated", "updated_at"),  # analytics export watermark
+        Index(
+            "ix_timesheets_daily_report", "daily_report_id",
+            postgresql_where=text("daily_report_id IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -321,6 +341,10 @@ class LeaveBalance(Base, TimestampMixin, OrgMixin):
     """
     Per-employee per-leave-type per-year quota tracking.
     BR#36: Cannot take leave exceeding quota.
+
+    Phase 15: running balance maintained incrementally from LeaveBalanceEntry —
+      remaining = quota + carried_forward - used
+      pending   = days of leaves still waiting for approval (reserved, not used)
     """
     __tablename__ = "leave_balances"
 
@@ -340,16 +364,64 @@ class LeaveBalance(Base, TimestampMixin, OrgMixin):
     year: Mapped[int] = mapped_column(Integer, nullable=False)
     quota: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     used: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    carried_forward: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    pending: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    remaining: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     __table_args__ = (
         UniqueConstraint("employee_id", "leave_type_id", "year", name="uq_leave_balance_emp_type_year"),
         CheckConstraint("quota >= 0", name="ck_leave_balance_quota_positive"),
         CheckConstraint("used >= 0", name="ck_leave_balance_used_positive"),
+        CheckConstraint("carried_forward >= 0", name="ck_leave_balance_carry_positive"),
+        CheckConstraint("pending >= 0", name="ck_leave_balance_pending_positive"),
         Index("ix_leave_balances_employee", "employee_id"),
+        Index("ix_leave_balances_org_year", "org_id", "year"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<LeaveBalance emp={self.employee_id} year={self.year} remaining={self.remaining}/{self.quota}>"
+
+
+class LeaveBalanceEntry(Base, TimestampMixin, OrgMixin):
+    """
+    Leave balance ledger (Phase 15) — append-only movements behind LeaveBalance.
+    days is signed (+accrual/carry, -usage, ±adjustment); balance_after is the
+    LeaveBalance.remaining right after the entry was booked.
+    """
+    __tablename__ = "leave_balance_entries"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    balance_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("leave_balances.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    entry_type: Mapped[LeaveEntryType] = mapped_column(
+        Enum(LeaveEntryType, name="leave_entry_type_enum"),
+        nullable=False,
+    )
+    days: Mapped[int] = mapped_column(Integer, nullable=False)
+    balance_after: Mapped[int] = mapped_column(Integer, nullable=False)
+    leave_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("leaves.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    note: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    created_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    __table_args__ = (
+        Index("ix_leave_balance_entries_balance", "balance_id", "created_at"),
     )
 
     def __repr__(self) -> str:
-        return f"<LeaveBalance emp={self.employee_id} year={self.year} used={self.used}/{self.quota}>"
+        return f"<LeaveBalanceEntry {self.entry_type.value} {self.days:+d} → {self.balance_after}>"
 
 
 # ============================================================
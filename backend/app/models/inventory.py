@@ -5,12 +5,14 @@ Phase 1: Product + StockMovement + StockBalance
 
 import enum
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     CheckConstraint,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
@@ -21,6 +23,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -120,11 +123,23 @@ class Product(Base, TimestampMixin, OrgMixin):
 # ============================================================
 
 class StockMovement(Base, TimestampMixin, OrgMixin):
+    """
+    Append-only stock ledger. RANGE-partitioned by month on created_at (Phase 15) —
+    always filter created_at with plain range predicates (>=, <) so Postgres can
+    prune partitions; never wrap it in date()/date_trunc() inside WHERE.
+    """
     __tablename__ = "stock_movements"
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
+    # Partition key — must be part of the primary key on a partitioned table
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
+    )
     product_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("products.id", ondelete="RESTRICT"),
@@ -156,8 +171,7 @@ class StockMovement(Base, TimestampMixin, OrgMixin):
     )
     reversed_by_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("stock_movements.id", ondelete="SET NULL"),
-        nullable=True,
+        nullable=True,  # → stock_movements.id (no FK: partitioned — see stock_reconcile.MOVEMENT_REFS)
     )
     is_reversed: Mapped[bool] = mapped_column(
         Boolean, default=False, nullable=False
@@ -169,6 +183,10 @@ class StockMovement(Base, TimestampMixin, OrgMixin):
     __table_args__ = (
         CheckConstraint("quantity != 0", name="ck_movement_qty_nonzero"),
         Index("ix_movements_product_type", "product_id", "movement_type"),
+        Index("ix_movements_org_created", "org_id", "created_at"),
+        Index("ix_movements_org_product_created", "org_id", "product_id", "created_at"),
+        Index("ix_movements_updated", "updated_at"),  # analytics export watermark
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     # Bin link (nullable — 3rd level warehouse hierarchy, backward compatible)
@@ -423,8 +441,7 @@ class StockWithdrawalSlipLine(Base, TimestampMixin):
     )
     movement_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("stock_movements.id", ondelete="SET NULL"),
-        nullable=True,
+        nullable=True,  # → stock_movements.id (no FK: partitioned — see stock_reconcile.MOVEMENT_REFS)
     )
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
 
@@ -557,8 +574,7 @@ class TransferRequestLine(Base, TimestampMixin):
     transferred_qty: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     movement_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("stock_movements.id", ondelete="SET NULL"),
-        nullable=True,
+        nullable=True,  # → stock_movements.id (no FK: partitioned — see stock_reconcile.MOVEMENT_REFS)
     )
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
 
@@ -573,3 +589,103 @@ class TransferRequestLine(Base, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<TFLine #{self.line_number} product={self.product_id} qty={self.quantity}>"
+
+
+# ============================================================
+# STOCK SNAPSHOT (month-end quantity + value per product/location/batch, Phase 15)
+# ============================================================
+
+class StockSnapshot(Base, TimestampMixin, OrgMixin):
+    """
+    Month-end stock state. Lines hold on-hand at cutoff_at (first instant of the
+    next month, UTC) so as-of queries only replay movements after the nearest one.
+    """
+    __tablename__ = "stock_snapshots"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    period_end: Mapped[date] = mapped_column(Date, nullable=False)
+    cutoff_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    line_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_quantity: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_value: Mapped[Decimal] = mapped_column(
+        Numeric(16, 2), nullable=False, default=Decimal("0")
+    )
+    created_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    __table_args__ = (
+        UniqueConstraint("org_id", "period_end", name="uq_stock_snapshot_org_period"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<StockSnapshot {self.period_end} lines={self.line_count}>"
+
+
+class StockSnapshotLine(Base):
+    """One (product, location, batch) row of a snapshot. NULL location/batch = unlocated/unbatched stock."""
+    __tablename__ = "stock_snapshot_lines"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    snapshot_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("stock_snapshots.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="RESTRICT"),
+        nullable=False,
+    )
+    location_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("locations.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    batch_number: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    unit_cost: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    value: Mapped[Decimal] = mapped_column(Numeric(16, 2), nullable=False)
+
+    __table_args__ = (
+        Index("ix_stock_snapshot_lines_snapshot_product", "snapshot_id", "product_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<StockSnapshotLine product={self.product_id} qty={self.quantity}>"
+
+
+class LowStockWatch(Base, TimestampMixin):
+    """
+    Reorder watchlist — one row per product that has ever dropped to min_stock.
+    Flipped by the movement that crosses the threshold (either direction); alerts
+    are queued via alert_due and sent in batches by the low-stock worker.
+    """
+    __tablename__ = "low_stock_watchlist"
+
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), nullable=False
+    )
+    is_low: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    low_since: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    alert_due: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    last_alerted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_low_stock_watchlist_low", "org_id", postgresql_where=text("is_low")),
+        Index("ix_low_stock_watchlist_alert_due", "org_id", postgresql_where=text("alert_due")),
+    )
+
+    def __repr__(self) -> str:
+        return f"<LowStockWatch product={self.product_id} low={self.is_low}>"
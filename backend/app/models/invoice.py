@@ -19,6 +19,7 @@ import uuid
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
+    Computed,
     Date,
     DateTime,
     Enum,
@@ -27,6 +28,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -110,6 +112,10 @@ class SupplierInvoice(Base, TimestampMixin, OrgMixin):
     paid_amount: Mapped[object] = mapped_column(
         Numeric(12, 2), nullable=False, default=0
     )
+    # Phase 15: open-item balance, kept in step with every payment by Postgres
+    outstanding_amount: Mapped[object] = mapped_column(
+        Numeric(12, 2), Computed("net_payment - paid_amount", persisted=True)
+    )
 
     # Status
     status: Mapped[InvoiceStatus] = mapped_column(
@@ -190,6 +196,13 @@ class SupplierInvoice(Base, TimestampMixin, OrgMixin):
         Index("ix_invoice_supplier_id", "supplier_id"),
         Index("ix_invoice_due_date", "due_date"),
         Index("ix_invoice_company", "company_id"),
+        Index("ix_invoice_updated", "updated_at"),  # analytics export watermark
+        # Phase 15: open-item index — only APPROVED invoices with a balance left
+        Index(
+            "ix_invoice_open_items", "org_id", "due_date",
+            postgresql_include=["supplier_id", "outstanding_amount"],
+            postgresql_where=text("status = 'APPROVED' AND is_active AND outstanding_amount > 0"),
+        ),
     )
 
 
@@ -248,4 +261,5 @@ class InvoicePayment(Base, TimestampMixin, OrgMixin):
             name="ck_payment_wht_non_negative",
         ),
         Index("ix_payment_invoice_id", "invoice_id"),
+        Index("ix_payment_updated", "updated_at"),  # analytics export watermark
     )
@@ -177,11 +177,16 @@ class LeaveType(Base, TimestampMixin, OrgMixin):
     default_quota: Mapped[int | None] = mapped_column(
         Integer, nullable=True
     )
+    # Phase 15: max unused days carried into next year on rollover (0 = none)
+    carry_forward_max: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     __table_args__ = (
         UniqueConstraint("org_id", "code", name="uq_leave_type_org_code"),
         CheckConstraint("default_quota IS NULL OR default_quota >= 0", name="ck_leave_type_quota_positive"),
+        CheckConstraint("carry_forward_max >= 0", name="ck_leave_type_carry_positive"),
     )
 
     def __repr__(self) -> str:
@@ -252,8 +252,7 @@ class DeliveryOrderLine(Base, TimestampMixin):
     )
     movement_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("stock_movements.id", ondelete="SET NULL"),
-        nullable=True,
+        nullable=True,  # → stock_movements.id (no FK: partitioned — see stock_reconcile.MOVEMENT_REFS)
     )
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
 
@@ -0,0 +1,69 @@
+"""
+SSS Corp ERP — Global Document Search Index
+Phase 15: One row per business document (WO, PR, PO, SO, DO, SW, TF, ST, TCS, AP/AR invoices)
+
+Kept in sync by the after_flush hook in app.services.search — never written directly by API code.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Index,
+    String,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.user import TimestampMixin
+
+
+# ============================================================
+# DOCUMENT SEARCH INDEX
+# ============================================================
+
+class DocumentSearchIndex(Base, TimestampMixin):
+    """
+    Denormalized lookup table for the global document-number search.
+    Queried by (org_id, search_key prefix) and trigram substring match.
+    """
+    __tablename__ = "document_search_index"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), nullable=False
+    )
+    doc_type: Mapped[str] = mapped_column(
+        String(10), nullable=False  # "WO", "PR", "PO", "SO", "DO", "SW", "TF", "ST", "TCS", "AP", "AR"
+    )
+    doc_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), nullable=False
+    )
+    doc_number: Mapped[str] = mapped_column(String(50), nullable=False)
+    # Upper-cased doc_number — what the search actually matches against
+    search_key: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[str | None] = mapped_column(String(30), nullable=True)
+    title: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    is_active: Mapped[bool] = mapped_column(
+        Boolean, default=True, nullable=False, server_default="true"
+    )
+    doc_updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint("doc_type", "doc_id", name="uq_doc_search_type_id"),
+        # Prefix search: WHERE org_id = ? AND search_key LIKE 'PO-2026%'
+        # (varchar_pattern_ops + trigram GIN index are created in the migration only)
+        Index("ix_doc_search_org_updated", "org_id", "doc_updated_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<DocumentSearchIndex {self.doc_type} {self.doc_number}>"
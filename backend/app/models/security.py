@@ -1,6 +1,8 @@
 """
 SSS Corp ERP — Security Models
 Phase 13: Login History + OrgSecurityConfig + Audit Trail
+Phase 15: login_history / export_audit_logs / audit_logs are RANGE-partitioned by
+          month on created_at (PK = id + created_at; partitions managed by app.services.partition)
 """
 
 import enum
@@ -52,6 +54,13 @@ class LoginHistory(Base, TimestampMixin):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
+    # Partition key — must be part of the primary key on a partitioned table
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
+    )
     user_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
@@ -68,9 +77,10 @@ class LoginHistory(Base, TimestampMixin):
     failure_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     __table_args__ = (
-        Index("ix_login_history_user_id", "user_id"),
+        Index("ix_login_history_user_created", "user_id", "created_at"),
         Index("ix_login_history_email", "email"),
         Index("ix_login_history_org_created", "org_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
@@ -132,6 +142,10 @@ class OrgSecurityConfig(Base, TimestampMixin):
     api_rate_limit_login: Mapped[int] = mapped_column(
         Integer, default=5, nullable=False, server_default="5"
     )
+    # Phase 15: per-role API limit overrides, e.g. {"viewer": 60, "owner": 300}
+    api_rate_limit_roles: Mapped[dict] = mapped_column(
+        JSON, default=dict, nullable=False, server_default="{}"
+    )
 
     __table_args__ = (
         CheckConstraint(
@@ -175,6 +189,13 @@ class ExportAuditLog(Base, TimestampMixin):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
+    # Partition key — must be part of the primary key on a partitioned table
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
+    )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
@@ -193,7 +214,9 @@ class ExportAuditLog(Base, TimestampMixin):
 
     __table_args__ = (
         Index("ix_export_audit_logs_org_created", "org_id", "created_at"),
-        Index("ix_export_audit_logs_user", "user_id"),
+        Index("ix_export_audit_logs_org_user_created", "org_id", "user_id", "created_at"),
+        Index("ix_export_audit_logs_org_resource_created", "org_id", "resource_type", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
@@ -211,6 +234,13 @@ class AuditLog(Base, TimestampMixin):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
+    # Partition key — must be part of the primary key on a partitioned table
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
+    )
     user_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
@@ -226,10 +256,15 @@ class AuditLog(Base, TimestampMixin):
     user_agent: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
     __table_args__ = (
+        # Admin audit view filters — every index leads with org_id and ends with
+        # created_at so "filter + ORDER BY created_at DESC LIMIT n" is an index scan
         Index("ix_audit_logs_org_created", "org_id", "created_at"),
-        Index("ix_audit_logs_user_id", "user_id"),
+        Index("ix_audit_logs_org_user_created", "org_id", "user_id", "created_at"),
+        Index("ix_audit_logs_org_resource_created", "org_id", "resource_type", "created_at"),
+        Index("ix_audit_logs_org_action_created", "org_id", "action", "created_at"),
         Index("ix_audit_logs_resource", "resource_type", "resource_id"),
-        Index("ix_audit_logs_action", "action"),
+        # description ILIKE '%...%' (trigram GIN created in migration)
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
@@ -137,6 +137,9 @@ class ToolCheckout(Base, TimestampMixin, OrgMixin):
         CheckConstraint("charge_amount >= 0", name="ck_checkout_charge_positive"),
         Index("ix_tool_checkouts_tool", "tool_id"),
         Index("ix_tool_checkouts_wo", "work_order_id"),
+        # Cost center actuals: charges per check-in month + changed-rows scan
+        Index("ix_tool_checkouts_org_checkin", "org_id", "checkin_at"),
+        Index("ix_tool_checkouts_updated", "updated_at"),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,88 @@
+"""
+Net requirements (MRP) run — project stock over the horizon and report / draft reorders.
+Run: python -m app.plan_reorders [--org UUID] [--horizon-days 28] [--bucket-days 7]
+     [--draft --as-user EMAIL --cost-center UUID --cost-element UUID]
+
+Read-only unless --draft. One projection statement covers every stocked product
+(services.mrp); with --draft the shortages become DRAFT PRs created by --as-user,
+one per need date. Drafted lines count as open-PR supply, so a nightly cron run
+does not re-draft what is still waiting for approval.
+Exit status: 0 = no shortages (or all drafted), 1 = shortages reported only.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.core.config import DEFAULT_ORG_ID
+from app.services.mrp import compute_net_requirements, draft_reorder_requisitions
+
+
+async def run(org_id: UUID, *, horizon_days: int, bucket_days: int, draft: bool,
+              as_user: str | None, cost_center: UUID | None, cost_element: UUID | None,
+              show: int) -> int:
+    from app.core.database import background_session
+    from app.models.hr import Employee
+    from app.models.user import User
+
+    async with background_session() as db:
+        t0 = time.perf_counter()
+        items, total = await compute_net_requirements(
+            db, org_id=org_id, horizon_days=horizon_days, bucket_days=bucket_days,
+        )
+        print(f"[MRP] {total:,} products short within {horizon_days}d "
+              f"({bucket_days}d buckets) — {time.perf_counter() - t0:.2f}s")
+        for s in items[:show]:
+            print(f"  {s['sku']:<16} on_hand={s['on_hand']} min={s['min_stock']} "
+                  f"low={s['min_projected']} need={s['need_date']} order={s['suggested_qty']}")
+        if len(items) > show:
+            print(f"  … {len(items) - show} more")
+        if not items:
+            return 0
+        if not draft:
+            return 1
+
+        user = (await db.execute(
+            select(User).where(User.email == as_user, User.org_id == org_id, User.is_active == True)
+        )).scalar_one_or_none()
+        if user is None:
+            print(f"[MRP] --as-user {as_user} not found in org {org_id}")
+            return 1
+        requester_id = (await db.execute(
+            select(Employee.id).where(Employee.user_id == user.id, Employee.is_active == True)
+        )).scalar_one_or_none()
+        prs = await draft_reorder_requisitions(
+            db, org_id=org_id, suggestions=items,
+            cost_center_id=cost_center, cost_element_id=cost_element,
+            created_by=user.id, requester_id=requester_id,
+        )
+        print(f"[MRP] drafted {len(prs)} PR(s): " + ", ".join(pr.pr_number for pr in prs))
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--org", type=UUID, default=DEFAULT_ORG_ID)
+    parser.add_argument("--horizon-days", type=int, default=28)
+    parser.add_argument("--bucket-days", type=int, default=7)
+    parser.add_argument("--draft", action="store_true", help="create DRAFT PRs for the shortages")
+    parser.add_argument("--as-user", help="email of the user the PRs are created by")
+    parser.add_argument("--cost-center", type=UUID, help="cost center for drafted PRs")
+    parser.add_argument("--cost-element", type=UUID, help="cost element for drafted PR lines")
+    parser.add_argument("--show", type=int, default=50, help="shortages to print")
+    args = parser.parse_args()
+    if args.draft and not (args.as_user and args.cost_center and args.cost_element):
+        parser.error("--draft needs --as-user, --cost-center and --cost-element")
+    sys.exit(asyncio.run(run(
+        args.org, horizon_days=args.horizon_days, bucket_days=args.bucket_days,
+        draft=args.draft, as_user=args.as_user, cost_center=args.cost_center,
+        cost_element=args.cost_element, show=args.show,
+    )))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Rebuild the monthly cost center actuals rollup for a range of months.
+Run: python -m app.rebuild_cost_actuals FROM [TO] [--org UUID]
+
+FROM / TO: YYYY-MM (TO defaults to FROM). Each month is recomputed from
+timesheets, stock movements and tool check-ins (services.cost_actuals) and
+committed on its own. Use after changing hourly rates, OT factors, overhead
+rates or a work order's cost center — the incremental refresh only sees
+changed source rows.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import date, datetime
+from uuid import UUID
+
+from app.core.config import DEFAULT_ORG_ID
+from app.services.cost_actuals import month_range, rebuild_period
+
+
+def _month(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM, got {value!r}")
+
+
+async def run(first: date, last: date, *, org_id: UUID) -> int:
+    from app.core.database import background_session
+
+    periods = month_range(first, last)
+    if not periods:
+        print("[COST ACTUALS] TO is before FROM — nothing to rebuild")
+        return 1
+    started = time.monotonic()
+    for period in periods:
+        async with background_session() as db:
+            written = await rebuild_period(db, org_id=org_id, year=period.year, month=period.month)
+        print(f"[COST ACTUALS] {period:%Y-%m}: {written} cost centers")
+    print(f"[COST ACTUALS] {len(periods)} month(s) rebuilt in {time.monotonic() - started:.1f}s")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("first", type=_month, metavar="FROM")
+    parser.add_argument("last", type=_month, nargs="?", metavar="TO")
+    parser.add_argument("--org", type=UUID, default=DEFAULT_ORG_ID)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.first, args.last or args.first, org_id=args.org)))
+
+
+if __name__ == "__main__":
+    main()
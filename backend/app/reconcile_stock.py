@@ -0,0 +1,97 @@
+"""
+Stock ledger reconciliation — compare on-hand balances with stock_movements, optionally repair.
+Run: python -m app.reconcile_stock [--org UUID] [--chunk-size 500] [--jobs 4] [--repair] [--max-fixes 1000]
+
+Read-only unless --repair. Each product chunk is checked in one statement; --jobs chunks
+run at once, each on its own connection (capped by DB_BACKGROUND_MAX_SESSIONS — raise it
+for this process to go wider). With --repair the drifted products are fixed in batches of
+--repair-batch products, each in its own locked transaction (services.stock_reconcile).
+Also lists movement references (stock_movements.reversed_by_id, *_lines.movement_id —
+no FKs since partitioning) whose movement is missing, across all orgs; those are reported,
+never repaired.
+Exit status: 0 = no drift left, 1 = drift or dangling references reported or skipped,
+2 = repair aborted.
+"""
+
+import argparse
+import asyncio
+import sys
+from uuid import UUID
+
+from app.core.config import DEFAULT_ORG_ID
+from app.services.stock_reconcile import (
+    ReconcileAbort,
+    find_dangling_movement_refs,
+    reconcile_stock,
+    repair_stock_drift,
+)
+
+
+def _print_discrepancies(found: list[dict], limit: int) -> None:
+    for d in found[:limit]:
+        where = f" loc={d['location_id']}" if d["location_id"] else ""
+        batch = f" batch={d['batch_number']}" if d["batch_number"] else ""
+        print(f"  {d['level']:<8} product={d['product_id']}{where}{batch} "
+              f"actual={d['actual']} ledger={d['expected']} diff={d['diff']:+d}")
+    if len(found) > limit:
+        print(f"  … {len(found) - limit} more")
+
+
+async def run(org_id: UUID, *, chunk_size: int, jobs: int, repair: bool,
+              max_fixes: int, repair_batch: int, show: int) -> int:
+    from app.core.database import background_session
+
+    report = await reconcile_stock(org_id=org_id, chunk_size=chunk_size, concurrency=jobs)
+    found = report["discrepancies"]
+    print(f"[Reconcile] {report['products']:,} products in {report['chunks']} chunks "
+          f"({report['workers']} workers) — {report['elapsed_s']}s")
+    print("  discrepancies: " + ", ".join(f"{lvl}={n}" for lvl, n in report["by_level"].items()))
+    _print_discrepancies(found, show)
+    async with background_session() as db:
+        dangling = await find_dangling_movement_refs(db)
+    if dangling:
+        print("  dangling movement references: " + ", ".join(f"{ref}={n}" for ref, n in dangling.items()))
+    if not found:
+        return 1 if dangling else 0
+    if not repair:
+        return 1
+
+    if len(found) > max_fixes:
+        print(f"[Repair] aborted: {len(found)} discrepancies exceed --max-fixes {max_fixes}")
+        return 2
+    product_ids = sorted({d["product_id"] for d in found})
+    fixed = skipped = 0
+    for i in range(0, len(product_ids), repair_batch):
+        try:
+            async with background_session() as db:
+                result = await repair_stock_drift(
+                    db, org_id=org_id, product_ids=product_ids[i:i + repair_batch],
+                    max_fixes=max_fixes - fixed,
+                )
+        except ReconcileAbort as e:
+            print(f"[Repair] aborted after {fixed} fixes: {e}")
+            return 2
+        fixed += len(result["fixed"])
+        skipped += len(result["skipped"])
+    print(f"[Repair] fixed {fixed}, skipped {skipped} (negative ledger balance)")
+    return 1 if skipped or dangling else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--org", type=UUID, default=DEFAULT_ORG_ID)
+    parser.add_argument("--chunk-size", type=int, default=500, help="products per reconciliation chunk")
+    parser.add_argument("--jobs", type=int, default=None, help="chunks checked concurrently")
+    parser.add_argument("--repair", action="store_true", help="set drifted balances to the ledger value")
+    parser.add_argument("--max-fixes", type=int, default=1000, help="refuse to repair more than this")
+    parser.add_argument("--repair-batch", type=int, default=200, help="products per repair transaction")
+    parser.add_argument("--show", type=int, default=50, help="discrepancies to print")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(
+        args.org, chunk_size=args.chunk_size, jobs=args.jobs, repair=args.repair,
+        max_fixes=args.max_fixes, repair_batch=args.repair_batch, show=args.show,
+    )))
+
+
+if __name__ == "__main__":
+    main()
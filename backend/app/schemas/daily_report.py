@@ -123,5 +123,16 @@ class BatchApproveRequest(BaseModel):
         return v
 
 
+class BatchApproveError(BaseModel):
+    report_id: UUID
+    detail: str
+
+
+class BatchApproveResponse(BaseModel):
+    """Approved reports + per-report errors (skipped, the rest still approved)."""
+    items: list[DailyReportResponse]
+    errors: list[BatchApproveError] = []
+
+
 class RejectRequest(BaseModel):
     reason: str = Field(min_length=1, max_length=500)
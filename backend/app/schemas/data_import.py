@@ -0,0 +1,66 @@
+"""
+SSS Corp ERP — Bulk Import Schemas (Pydantic v2)
+Phase 15: row models for master-data import files + run summary
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.schemas.hr import EmployeeCreate
+
+
+# ============================================================
+# ROW MODELS — one per file type that has no single-record schema of its own
+# ============================================================
+
+class EmployeeImportRow(EmployeeCreate):
+    """EmployeeCreate with department / cost center given by code instead of id."""
+    department_code: Optional[str] = Field(default=None, max_length=50)
+    cost_center_code: Optional[str] = Field(default=None, max_length=50)
+
+
+class OpeningStockRow(BaseModel):
+    """Counted opening balance of one product (at one location when given)."""
+    sku: str = Field(min_length=1, max_length=50)
+    quantity: int = Field(ge=0)
+    unit_cost: Optional[Decimal] = Field(default=None, ge=0, decimal_places=2)
+    warehouse_code: Optional[str] = Field(default=None, max_length=50)
+    location_code: Optional[str] = Field(default=None, max_length=50)
+
+    @field_validator("sku")
+    @classmethod
+    def normalize_sku(cls, v):
+        return v.strip().upper()
+
+
+# ============================================================
+# RUN SUMMARY
+# ============================================================
+
+class ImportRowError(BaseModel):
+    row: int
+    column: Optional[str] = None
+    value: Optional[str] = None
+    message: str
+
+
+class ImportRunResponse(BaseModel):
+    id: UUID
+    entity: str
+    file_name: str
+    dry_run: bool
+    total_rows: int
+    valid_rows: int
+    loaded_rows: int
+    skipped_rows: int
+    error_count: int
+    duration_ms: int
+    errors: list[ImportRowError] = []  # first IMPORT_ERROR_PREVIEW rows — full list via /errors
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
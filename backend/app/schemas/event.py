@@ -0,0 +1,30 @@
+"""
+SSS Corp ERP — Domain Event Schemas (Pydantic v2)
+Phase 15: offset replay of the domain event outbox
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class DomainEventResponse(BaseModel):
+    offset: int
+    event_id: UUID
+    event_type: str
+    aggregate_type: str
+    aggregate_id: UUID
+    payload: dict[str, Any]
+    actor_id: Optional[UUID] = None
+    occurred_at: datetime
+    stream_id: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class DomainEventListResponse(BaseModel):
+    items: list[DomainEventResponse]
+    next_offset: int  # pass as ?after= to continue; unchanged when there is nothing new
@@ -30,6 +30,13 @@ class LeaveStatus(str, Enum):
     REJECTED = "REJECTED"
 
 
+class LeaveEntryType(str, Enum):
+    ACCRUAL = "ACCRUAL"
+    CARRY_FORWARD = "CARRY_FORWARD"
+    USAGE = "USAGE"
+    ADJUSTMENT = "ADJUSTMENT"
+
+
 class PayrollStatus(str, Enum):
     DRAFT = "DRAFT"
     EXECUTED = "EXECUTED"
@@ -309,6 +316,9 @@ class LeaveBalanceResponse(BaseModel):
     year: int
     quota: int
     used: int
+    carried_forward: int = 0               # Phase 15: running balance
+    pending: int = 0
+    remaining: int = 0
     created_at: datetime
     updated_at: datetime
 
@@ -325,6 +335,34 @@ class LeaveBalanceUpdate(BaseModel):
     quota: Optional[int] = Field(default=None, ge=0)
 
 
+class LeaveBalanceEntryResponse(BaseModel):
+    id: UUID
+    balance_id: UUID
+    entry_type: LeaveEntryType
+    days: int
+    balance_after: int
+    leave_id: Optional[UUID] = None
+    note: Optional[str] = None
+    created_by: Optional[UUID] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class LeaveBalanceRolloverRequest(BaseModel):
+    from_year: int = Field(ge=2000, le=2100)
+
+
+class LeaveBalanceRolloverResponse(BaseModel):
+    from_year: int
+    to_year: int
+    created: int
+    updated: int
+    carried_days: int
+    entries: int
+
+
 # ============================================================
 # PAYROLL SCHEMAS
 # ============================================================
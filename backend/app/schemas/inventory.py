@@ -3,7 +3,7 @@ SSS Corp ERP — Inventory Schemas (Pydantic v2)
 Product CRUD + StockMovement
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 from typing import Literal, Optional
@@ -336,3 +336,34 @@ class BatchNumberListResponse(BaseModel):
 
 class GenerateBatchNumberResponse(BaseModel):
     batch_number: str
+
+
+# ============================================================
+# STOCK SNAPSHOT SCHEMAS (Phase 15)
+# ============================================================
+
+class StockSnapshotCreate(BaseModel):
+    """Any date in the month to snapshot — stored as that month's last day."""
+    month: date
+
+
+class StockSnapshotResponse(BaseModel):
+    id: UUID
+    period_end: date
+    cutoff_at: datetime
+    line_count: int
+    total_quantity: int
+    total_value: Decimal
+    created_by: Optional[UUID] = None
+    org_id: UUID
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class StockSnapshotListResponse(BaseModel):
+    items: list[StockSnapshotResponse]
+    total: int
+    limit: int
+    offset: int
@@ -177,6 +177,7 @@ class LeaveTypeCreate(BaseModel):
     name: str = Field(min_length=1, max_length=255)
     is_paid: bool = True
     default_quota: Optional[int] = Field(default=None, ge=0)
+    carry_forward_max: int = Field(default=0, ge=0)
 
     @field_validator("code")
     @classmethod
@@ -188,6 +189,7 @@ class LeaveTypeUpdate(BaseModel):
     name: Optional[str] = Field(default=None, min_length=1, max_length=255)
     is_paid: Optional[bool] = None
     default_quota: Optional[int] = Field(default=None, ge=0)
+    carry_forward_max: Optional[int] = Field(default=None, ge=0)
     is_active: Optional[bool] = None
 
 
@@ -197,6 +199,7 @@ class LeaveTypeResponse(BaseModel):
     name: str
     is_paid: bool
     default_quota: Optional[int] = None
+    carry_forward_max: int = 0
     is_active: bool
     created_at: datetime
     updated_at: datetime
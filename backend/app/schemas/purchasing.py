@@ -356,3 +356,51 @@ class GoodsReceiptRequest(BaseModel):
         default=None, max_length=100, description="เลขใบวางของจากซัพพลายเออร์"
     )
     lines: list[GoodsReceiptLine] = Field(min_length=1)
+
+
+# ============================================================
+# NET REQUIREMENTS / REORDER SUGGESTIONS (Phase 15)
+# ============================================================
+
+class MRPBucket(BaseModel):
+    bucket_start: date
+    available: int
+
+
+class MRPSuggestion(BaseModel):
+    product_id: UUID
+    sku: str
+    name: str
+    unit: str
+    unit_cost: Decimal
+    on_hand: int
+    min_stock: int
+    reserved: int
+    open_po: int
+    open_pr: int
+    planned_usage: int
+    projected: list[MRPBucket]
+    min_projected: int
+    need_date: Optional[date] = None
+    suggested_qty: int
+
+
+class MRPSuggestionListResponse(BaseModel):
+    items: list[MRPSuggestion]
+    total: int
+    limit: int
+    offset: int
+
+
+class MRPDraftRequest(BaseModel):
+    cost_center_id: UUID
+    cost_element_id: UUID
+    horizon_days: int = Field(default=28, ge=1, le=365)
+    bucket_days: int = Field(default=7, ge=1, le=90)
+    product_ids: Optional[list[UUID]] = None
+
+
+class MRPDraftResponse(BaseModel):
+    pr_ids: list[UUID]
+    pr_numbers: list[str]
+    line_count: int
@@ -0,0 +1,27 @@
+"""
+SSS Corp ERP — Global Search Schemas
+Phase 15: Document number search
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    doc_type: str
+    doc_type_label: str
+    doc_id: UUID
+    doc_number: str
+    status: Optional[str] = None
+    title: Optional[str] = None
+    link: str
+    updated_at: datetime
+
+
+class SearchResponse(BaseModel):
+    query: str
+    items: list[SearchHit]
+    total: int
@@ -53,6 +53,7 @@ class OrgSecurityConfigResponse(BaseModel):
     require_2fa_roles: list[str]
     api_rate_limit_per_minute: int = 120
     api_rate_limit_login: int = 5
+    api_rate_limit_roles: dict[str, int] = {}
     created_at: datetime
     updated_at: datetime
 
@@ -72,6 +73,7 @@ class OrgSecurityConfigUpdate(BaseModel):
     require_2fa_roles: Optional[list[str]] = None
     api_rate_limit_per_minute: Optional[int] = Field(default=None, ge=10, le=600)
     api_rate_limit_login: Optional[int] = Field(default=None, ge=1, le=60)
+    api_rate_limit_roles: Optional[dict[str, int]] = None
 
     @field_validator("require_2fa_roles")
     @classmethod
@@ -83,6 +85,18 @@ class OrgSecurityConfigUpdate(BaseModel):
                     raise ValueError(f"Invalid role: {role}")
         return v
 
+    @field_validator("api_rate_limit_roles")
+    @classmethod
+    def validate_role_rate_limits(cls, v):
+        if v is not None:
+            valid = {"owner", "manager", "supervisor", "staff", "viewer"}
+            for role, limit in v.items():
+                if role not in valid:
+                    raise ValueError(f"Invalid role: {role}")
+                if not 10 <= limit <= 600:
+                    raise ValueError(f"Rate limit for {role} must be between 10 and 600")
+        return v
+
 
 # ============================================================
 # PASSWORD
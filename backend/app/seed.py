@@ -39,6 +39,7 @@ from app.models.inventory import Product, ProductType
 from app.models.tools import Tool, ToolStatus
 from app.models.recharge import FixedRechargeBudget, RechargeStatus
 from app.models.asset import AssetCategory, FixedAsset, DepreciationMethod, AssetStatus
+from app.services.hr import open_leave_balance
 
 
 # ============================================================
@@ -613,15 +614,14 @@ async def seed():
                     year=current_year,
                 )
                 if not existing:
-                    lb = LeaveBalance(
+                    await open_leave_balance(
+                        db,
                         employee_id=emp_id,
                         leave_type_id=lt_data["id"],
                         year=current_year,
                         quota=lt_data["default_quota"],
-                        used=0,
                         org_id=DEFAULT_ORG_ID,
                     )
-                    db.add(lb)
                     lb_count += 1
         if lb_count > 0:
             print(f"  [LB]   {lb_count} leave balances created ({current_year})")
@@ -0,0 +1,799 @@
+"""
+Synthetic data generator — scale profiles for performance work (never run against production).
+Run: python -m app.seed_synthetic --scale M [--seed 42] [--years N] [--jobs 4] [--reset]
+
+Requires the base seed first (python -m app.seed): reuses its org, users, OT types and the
+WH-MAIN locations. Everything generated is tagged SYN- (codes, document numbers, movement
+references) so it never collides with the services' document numbering and --reset can
+remove it again.
+
+Deterministic: the same --scale / --seed / --years produce identical rows, UUIDs included.
+Each table draws from its own RNG stream and row ids are derived from (seed, table, index),
+so child rows (PO lines, invoices, payments) are re-derived instead of held in memory.
+Rows are streamed with COPY (asyncpg copy_records_to_table) in CHUNK-row batches; the
+high-volume ledgers are split into fixed shards loaded by --jobs worker processes.
+
+Profile   products  employees  stock_movements  PO / SO        audit_logs  years  timesheets≈
+S            1,000        100          100,000  2k / 2k             50,000      1         29k
+M           10,000      1,000        1,000,000  20k / 20k          500,000      2        580k
+L          100,000      5,000       10,000,000  200k / 200k      5,000,000      3        4.3M
+XL       1,000,000     20,000      100,000,000  1M / 1M         20,000,000      5         29M
+
+Distributions:
+  - SKU / supplier / customer popularity is Zipf (s=1): ~20% of SKUs carry ~80% of movements
+    and order lines at S, more concentrated as the catalogue grows
+  - Daily activity grows ~25%/year, ×3 in the last 3 days of each month, ×0.4 on Saturdays,
+    ×0.05 on Sundays; timestamps cluster in working hours (Asia/Bangkok)
+  - Movement types follow the product type (PRODUCE only for FINISHED_GOODS, CONSUME/RETURN
+    only for MATERIAL/CONSUMABLE); stock_by_location / products.on_hand are rebuilt from
+    the ledger after loading
+  - Invoices older than ~2 months are mostly paid; recent ones open or partially paid
+  - Timesheets: ~92% attendance Mon–Sat, OT more likely near month end
+"""
+
+import argparse
+import asyncio
+import bisect
+import hashlib
+import itertools
+import os
+import random
+import time
+import uuid
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.core.config import DEFAULT_ORG_ID, get_settings
+from app.core.database import AsyncSessionLocal
+from app.seed import (
+    LOC_RECEIVING_ID,
+    LOC_SHIPPING_ID,
+    LOC_STORAGE_ID,
+    OT_WEEKDAY_ID,
+    OT_WEEKEND_ID,
+)
+from app.services.partition import add_months, ensure_monthly_partitions, month_start
+
+CHUNK = 50_000
+SYN = "SYN"
+AUDIT_USER_AGENT = "seed-synthetic"
+
+SCALE_PROFILES: dict[str, dict[str, int]] = {
+    "S": {
+        "years": 1, "departments": 5, "suppliers": 100, "customers": 200,
+        "products": 1_000, "employees": 100, "work_orders": 500,
+        "purchase_orders": 2_000, "sales_orders": 2_000,
+        "stock_movements": 100_000, "audit_logs": 50_000,
+    },
+    "M": {
+        "years": 2, "departments": 20, "suppliers": 500, "customers": 2_000,
+        "products": 10_000, "employees": 1_000, "work_orders": 5_000,
+        "purchase_orders": 20_000, "sales_orders": 20_000,
+        "stock_movements": 1_000_000, "audit_logs": 500_000,
+    },
+    "L": {
+        "years": 3, "departments": 50, "suppliers": 2_000, "customers": 10_000,
+        "products": 100_000, "employees": 5_000, "work_orders": 50_000,
+        "purchase_orders": 200_000, "sales_orders": 200_000,
+        "stock_movements": 10_000_000, "audit_logs": 5_000_000,
+    },
+    "XL": {
+        "years": 5, "departments": 200, "suppliers": 5_000, "customers": 50_000,
+        "products": 1_000_000, "employees": 20_000, "work_orders": 200_000,
+        "purchase_orders": 1_000_000, "sales_orders": 1_000_000,
+        "stock_movements": 100_000_000, "audit_logs": 20_000_000,
+    },
+}
+
+_TZ = timezone(timedelta(hours=7))  # Asia/Bangkok — business hours are local
+_CENT = Decimal("0.01")
+_VAT = Decimal("7.00")
+
+_FIRST_NAMES = ("สมชาย", "สมหญิง", "วิชัย", "สุดา", "ประเสริฐ", "กนกวรรณ", "อนุชา", "พรทิพย์",
+                "ธนากร", "ศิริพร", "ณัฐพล", "จันทร์เพ็ญ", "อำนาจ", "ปิยะดา", "สุรชัย", "วราภรณ์")
+_LAST_NAMES = ("ใจดี", "ศรีสุข", "ทองดี", "แก้วมณี", "บุญมา", "สุวรรณ", "รัตนชัย", "วงศ์ใหญ่",
+               "พัฒนกุล", "มั่นคง", "เจริญผล", "สมบูรณ์")
+_PRODUCT_WORDS = ("เหล็กแผ่น", "ท่อ PVC", "น็อตสแตนเลส", "สายไฟ", "ถุงมือ", "สีกันสนิม",
+                  "ตลับลูกปืน", "ใบตัด", "ลวดเชื่อม", "ปะเก็น", "วาล์ว", "สายพาน")
+_UNITS = ("PCS", "PCS", "PCS", "KG", "M", "BOX", "SET", "L")
+_POSITIONS = ("ช่างเทคนิค", "ช่างเชื่อม", "พนักงานคลัง", "หัวหน้างาน", "วิศวกร", "ธุรการ")
+
+# (product_type, weight) and the movement mix allowed for each product type
+_PRODUCT_TYPES = (("MATERIAL", 70), ("CONSUMABLE", 15), ("SPAREPART", 10), ("FINISHED_GOODS", 5))
+_MOVEMENT_MIX: dict[str, tuple[tuple[str, int], ...]] = {
+    "MATERIAL": (("RECEIVE", 40), ("CONSUME", 26), ("ISSUE", 18), ("RETURN", 4), ("TRANSFER", 9), ("ADJUST", 3)),
+    "CONSUMABLE": (("RECEIVE", 42), ("CONSUME", 20), ("ISSUE", 26), ("RETURN", 3), ("TRANSFER", 6), ("ADJUST", 3)),
+    "SPAREPART": (("RECEIVE", 45), ("ISSUE", 45), ("TRANSFER", 7), ("ADJUST", 3)),
+    "FINISHED_GOODS": (("PRODUCE", 47), ("ISSUE", 44), ("TRANSFER", 6), ("ADJUST", 3)),
+}
+_AUDIT_MIX = (("UPDATE", 45), ("CREATE", 35), ("STATUS_CHANGE", 15), ("DELETE", 5))
+_AUDIT_RESOURCES = ("purchase_order", "sales_order", "stock_movement", "work_order", "timesheet",
+                    "supplier_invoice", "customer_invoice", "product", "employee", "leave")
+
+
+# ============================================================
+# DETERMINISTIC HELPERS
+# ============================================================
+
+def _rng(seed: int, stream: str) -> random.Random:
+    return random.Random(f"{seed}:{stream}")
+
+
+def _id(seed: int, table: str, i: int) -> uuid.UUID:
+    """Stable row id for (table, index) — lets child tables reference parents without lookups."""
+    digest = hashlib.blake2b(f"{seed}:{table}:{i}".encode(), digest_size=16).digest()
+    return uuid.UUID(bytes=digest, version=4)
+
+
+def _cum(weights) -> list[float]:
+    return list(itertools.accumulate(weights))
+
+
+def _pick(rng: random.Random, cum: list[float]) -> int:
+    """Index drawn from cumulative weights (O(log n))."""
+    return bisect.bisect_right(cum, rng.random() * cum[-1])
+
+
+class _Zipf:
+    """
+    Index picker with Zipf(s) popularity. Ranks are shuffled onto indexes once per table,
+    so hot rows are spread over the key space and the same SKUs are hot in every ledger.
+    """
+
+    def __init__(self, rng: random.Random, n: int, s: float = 1.0):
+        self.cum = _cum(1 / (r + 1) ** s for r in range(n))
+        self.by_rank = list(range(n))
+        rng.shuffle(self.by_rank)
+
+    def __call__(self, rng: random.Random) -> int:
+        return self.by_rank[_pick(rng, self.cum)]
+
+
+def _weighted(pairs) -> tuple[tuple[str, ...], list[float]]:
+    names, weights = zip(*pairs)
+    return names, _cum(weights)
+
+
+def _money(value: float) -> Decimal:
+    return Decimal(str(value)).quantize(_CENT)
+
+
+class _Calendar:
+    """Business days from `start` to `end` with growth, weekday and month-end weights."""
+
+    def __init__(self, start: date, end: date):
+        self.days: list[date] = []
+        weights = []
+        d = start
+        while d <= end:
+            w = 1.25 ** ((d - start).days / 365) * (0.05, 1, 1, 1, 1, 1, 0.4)[d.isoweekday() % 7]
+            if (d + timedelta(days=3)).month != d.month:
+                w *= 3  # month-end closing peak
+            self.days.append(d)
+            weights.append(w)
+            d += timedelta(days=1)
+        self.cum = _cum(weights)
+
+    def day(self, rng: random.Random) -> date:
+        return self.days[_pick(rng, self.cum)]
+
+    def at(self, rng: random.Random, d: date) -> datetime:
+        hour = min(int(rng.gauss(12.5, 2.6)), 20)
+        return datetime(d.year, d.month, d.day, max(hour, 7), rng.randrange(60), rng.randrange(60), tzinfo=_TZ)
+
+    def moment(self, rng: random.Random) -> datetime:
+        return self.at(rng, self.day(rng))
+
+
+class _Context:
+    def __init__(self, *, seed: int, profile: dict[str, int], org_id: uuid.UUID, user_ids: list, today: date):
+        self.seed = seed
+        self.p = profile
+        self.org_id = org_id
+        self.user_ids = user_ids
+        self.today = today
+        self.start = add_months(month_start(today), -12 * profile["years"])
+        self.calendar = _Calendar(self.start, today)
+        # Filled by _products(); used by every table that references a product
+        self.product_cost = array("d")
+        self.product_type: list[str] = []
+        self._ids: dict[str, list[uuid.UUID]] = {}
+        self._popularity: dict[str, _Zipf] = {}
+
+    def id(self, table: str, i: int) -> uuid.UUID:
+        return _id(self.seed, table, i)
+
+    def ids(self, table: str, n: int) -> list[uuid.UUID]:
+        """All ids of a parent table, cached — the high-volume ledgers index into these."""
+        if table not in self._ids:
+            self._ids[table] = [self.id(table, i) for i in range(n)]
+        return self._ids[table]
+
+    def popularity(self, table: str, s: float = 1.0) -> _Zipf:
+        if table not in self._popularity:
+            self._popularity[table] = _Zipf(self.rng(f"{table}:popularity"), self.p[table], s)
+        return self._popularity[table]
+
+    def rng(self, stream: str) -> random.Random:
+        return _rng(self.seed, stream)
+
+    def user(self, rng: random.Random) -> uuid.UUID:
+        return self.user_ids[rng.randrange(len(self.user_ids))]
+
+
+# ============================================================
+# MASTER DATA
+# ============================================================
+
+def _cost_centers(ctx: _Context):
+    rng = ctx.rng("cost_centers")
+    for i in range(ctx.p["departments"]):
+        yield (ctx.id("cost_centers", i), f"{SYN}-CC{i:04d}", f"Synthetic cost center {i}",
+               _money(rng.choice((0, 5, 10, 15))), True, ctx.org_id)
+
+
+def _departments(ctx: _Context):
+    for i in range(ctx.p["departments"]):
+        yield (ctx.id("departments", i), f"{SYN}-D{i:04d}", f"Synthetic department {i}",
+               ctx.id("cost_centers", i), True, ctx.org_id)
+
+
+def _partners(ctx: _Context, table: str, prefix: str, label: str):
+    rng = ctx.rng(table)
+    for i in range(ctx.p[table]):
+        yield (ctx.id(table, i), f"{SYN}-{prefix}{i:06d}", f"{label} {i:06d} Co., Ltd.",
+               "".join(str(rng.randrange(10)) for _ in range(13)), True, ctx.org_id)
+
+
+def _products(ctx: _Context):
+    rng = ctx.rng("products")
+    types, type_cum = _weighted(_PRODUCT_TYPES)
+    for i in range(ctx.p["products"]):
+        ptype = types[_pick(rng, type_cum)]
+        cost = max(rng.lognormvariate(4.5, 1.2), 1.0)  # median ≈ 90 THB, long tail
+        ctx.product_type.append(ptype)
+        ctx.product_cost.append(round(cost, 2))
+        yield (ctx.id("products", i), f"{SYN}-{i:07d}",
+               f"{rng.choice(_PRODUCT_WORDS)} #{i}", ptype, rng.choice(_UNITS),
+               _money(cost), 0, rng.choice((0, 0, 5, 10, 20, 50)), True, ctx.org_id)
+
+
+def _employees(ctx: _Context):
+    rng = ctx.rng("employees")
+    dept = ctx.popularity("departments", s=0.6)
+    for i in range(ctx.p["employees"]):
+        d = dept(rng)
+        monthly = rng.random() < 0.3
+        daily_rate = _money(rng.uniform(380, 900))
+        salary = _money(rng.uniform(15_000, 80_000)) if monthly else None
+        hourly = (salary / Decimal(26 * 8) if monthly else daily_rate / Decimal(8)).quantize(_CENT)
+        hire = ctx.start - timedelta(days=rng.randrange(3650)) if rng.random() < 0.8 \
+            else ctx.calendar.day(rng)
+        yield (ctx.id("employees", i), f"{SYN}-E{i:06d}",
+               f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}", rng.choice(_POSITIONS),
+               hourly, Decimal("8.00"), ctx.id("cost_centers", d), ctx.id("departments", d),
+               "MONTHLY" if monthly else "DAILY", None if monthly else daily_rate, salary,
+               True, hire, ctx.org_id)
+
+
+def _work_orders(ctx: _Context):
+    rng = ctx.rng("work_orders")
+    customer = ctx.popularity("customers")
+    for i in range(ctx.p["work_orders"]):
+        opened = ctx.calendar.moment(rng)
+        closed = opened + timedelta(days=rng.randrange(3, 90))
+        status = "CLOSED" if closed.date() < ctx.today else "OPEN"
+        yield (ctx.id("work_orders", i), f"{SYN}-WO-{i:07d}", status,
+               f"Customer {customer(rng):06d} Co., Ltd.", f"Synthetic job {i}",
+               f"{SYN}-CC{rng.randrange(ctx.p['departments']):04d}", opened,
+               closed if status == "CLOSED" else None, ctx.user(rng), True, ctx.org_id)
+
+
+# ============================================================
+# DOCUMENTS (header + lines + invoice + payments from one RNG draw)
+# ============================================================
+
+def _lines(ctx: _Context, rng: random.Random, product, *, markup: float):
+    lines = []
+    for _ in range(min(int(rng.expovariate(1 / 2.5)) + 1, 12)):
+        p = product(rng)
+        qty = max(int(rng.paretovariate(1.6) * 5), 1)
+        lines.append((p, qty, _money(ctx.product_cost[p] * markup * rng.uniform(0.9, 1.1))))
+    return lines
+
+
+def _settlement(ctx: _Context, rng: random.Random, issued: date, due: date, net: Decimal):
+    """Payments [(date, amount)] for an invoice — old ones mostly settled, recent ones open."""
+    age = (ctx.today - issued).days
+    p_paid = 0.95 if age > 60 else 0.55 if age > 30 else 0.15
+    if rng.random() >= p_paid:
+        if age > 20 and rng.random() < 0.3:  # partially paid
+            return [(min(issued + timedelta(days=rng.randrange(5, 40)), ctx.today),
+                     (net * Decimal(rng.uniform(0.2, 0.8))).quantize(_CENT))]
+        return []
+    paid_on = min(due + timedelta(days=int(rng.gauss(0, 10))), ctx.today)
+    paid_on = max(paid_on, issued)
+    if rng.random() < 0.15:
+        first = (net * Decimal("0.5")).quantize(_CENT)
+        return [(max(paid_on - timedelta(days=15), issued), first), (paid_on, net - first)]
+    return [(paid_on, net)]
+
+
+def _purchase_documents(ctx: _Context):
+    rng = ctx.rng("purchase_orders")
+    supplier = ctx.popularity("suppliers")
+    product = ctx.popularity("products")
+    for i in range(ctx.p["purchase_orders"]):
+        ordered = ctx.calendar.day(rng)
+        lines = _lines(ctx, rng, product, markup=1.0)
+        subtotal = sum((q * c for _, q, c in lines), Decimal("0.00"))
+        vat = (subtotal * _VAT / 100).quantize(_CENT)
+        wht_rate = Decimal(rng.choice((0, 0, 1, 3)))
+        wht = (subtotal * wht_rate / 100).quantize(_CENT)
+        age = (ctx.today - ordered).days
+        status = ("RECEIVED" if age > 10 else rng.choice(("DRAFT", "SUBMITTED", "APPROVED"))) \
+            if rng.random() > 0.03 else "CANCELLED"
+        s = supplier(rng)
+        doc = {
+            "i": i, "ordered": ordered, "lines": lines, "status": status, "supplier": s,
+            "subtotal": subtotal, "vat": vat, "wht_rate": wht_rate, "wht": wht,
+            "total": subtotal + vat, "net": subtotal + vat - wht,
+            "created_by": ctx.user(rng), "invoice": None,
+        }
+        if status == "RECEIVED":
+            issued = min(ordered + timedelta(days=rng.randrange(3, 21)), ctx.today)
+            due = issued + timedelta(days=rng.choice((30, 30, 45, 60)))
+            doc["invoice"] = (issued, due, _settlement(ctx, rng, issued, due, doc["net"]))
+        yield doc
+
+
+def _sales_documents(ctx: _Context):
+    rng = ctx.rng("sales_orders")
+    customer = ctx.popularity("customers")
+    product = ctx.popularity("products")
+    for i in range(ctx.p["sales_orders"]):
+        ordered = ctx.calendar.day(rng)
+        lines = _lines(ctx, rng, product, markup=1.35)
+        subtotal = sum((q * c for _, q, c in lines), Decimal("0.00"))
+        vat = (subtotal * _VAT / 100).quantize(_CENT)
+        age = (ctx.today - ordered).days
+        status = ("INVOICED" if age > 7 else rng.choice(("DRAFT", "SUBMITTED", "APPROVED"))) \
+            if rng.random() > 0.03 else "CANCELLED"
+        doc = {
+            "i": i, "ordered": ordered, "lines": lines, "status": status,
+            "customer": customer(rng), "subtotal": subtotal, "vat": vat,
+            "total": subtotal + vat, "created_by": ctx.user(rng), "invoice": None,
+        }
+        if status == "INVOICED":
+            issued = min(ordered + timedelta(days=rng.randrange(1, 8)), ctx.today)
+            due = issued + timedelta(days=rng.choice((30, 30, 60)))
+            doc["invoice"] = (issued, due, _settlement(ctx, rng, issued, due, doc["total"]))
+        yield doc
+
+
+def _invoice_status(payments, net: Decimal, open_status: str, paid_status: str = "PAID") -> tuple[str, Decimal]:
+    paid = sum((a for _, a in payments), Decimal("0.00"))
+    return (paid_status if paid >= net else open_status), paid
+
+
+def _purchase_orders(ctx: _Context):
+    for d in _purchase_documents(ctx):
+        yield (ctx.id("purchase_orders", d["i"]), f"{SYN}-PO-{d['i']:07d}",
+               f"Supplier {d['supplier']:06d} Co., Ltd.", ctx.id("suppliers", d["supplier"]),
+               d["status"], d["ordered"], d["ordered"] + timedelta(days=7), d["subtotal"], _VAT,
+               d["vat"], d["total"], d["wht_rate"], d["wht"], d["net"], d["created_by"], True,
+               ctx.org_id, datetime(d["ordered"].year, d["ordered"].month, d["ordered"].day, 9, tzinfo=_TZ))
+
+
+def _purchase_order_lines(ctx: _Context):
+    for d in _purchase_documents(ctx):
+        po_id = ctx.id("purchase_orders", d["i"])
+        received = d["status"] == "RECEIVED"
+        for n, (p, qty, cost) in enumerate(d["lines"]):
+            yield (ctx.id("purchase_order_lines", d["i"] * 16 + n), po_id, ctx.id("products", p),
+                   "GOODS", qty, "PCS", cost, "STOCK_GR", qty if received else 0)
+
+
+def _supplier_invoices(ctx: _Context):
+    for d in _purchase_documents(ctx):
+        if d["invoice"] is None:
+            continue
+        issued, due, payments = d["invoice"]
+        status, paid = _invoice_status(payments, d["net"], "APPROVED" if payments else "PENDING")
+        yield (ctx.id("supplier_invoices", d["i"]), f"{SYN}-INV-{d['i']:07d}",
+               ctx.id("purchase_orders", d["i"]), ctx.id("suppliers", d["supplier"]), issued, due,
+               d["subtotal"], _VAT, d["vat"], d["total"], d["wht_rate"], d["wht"], d["net"], paid,
+               status, d["created_by"], True, ctx.org_id)
+
+
+def _invoice_payments(ctx: _Context):
+    for d in _purchase_documents(ctx):
+        if d["invoice"] is None:
+            continue
+        ratio = d["wht"] / d["net"] if d["net"] else Decimal(0)
+        for n, (paid_on, amount) in enumerate(d["invoice"][2]):
+            yield (ctx.id("invoice_payments", d["i"] * 4 + n), ctx.id("supplier_invoices", d["i"]),
+                   paid_on, amount, (amount * ratio).quantize(_CENT), "TRANSFER",
+                   f"{SYN}-TRF-{d['i']:07d}-{n}", d["created_by"], ctx.org_id)
+
+
+def _sales_orders(ctx: _Context):
+    for d in _sales_documents(ctx):
+        yield (ctx.id("sales_orders", d["i"]), f"{SYN}-SO-{d['i']:07d}", ctx.id("customers", d["customer"]),
+               d["status"], d["ordered"], d["subtotal"], _VAT, d["vat"], d["total"], d["created_by"],
+               True, ctx.org_id, datetime(d["ordered"].year, d["ordered"].month, d["ordered"].day, 10, tzinfo=_TZ))
+
+
+def _sales_order_lines(ctx: _Context):
+    for d in _sales_documents(ctx):
+        so_id = ctx.id("sales_orders", d["i"])
+        for n, (p, qty, price) in enumerate(d["lines"]):
+            yield (ctx.id("sales_order_lines", d["i"] * 16 + n), so_id, ctx.id("products", p), qty, price)
+
+
+def _customer_invoices(ctx: _Context):
+    for d in _sales_documents(ctx):
+        if d["invoice"] is None:
+            continue
+        issued, due, payments = d["invoice"]
+        status, received = _invoice_status(payments, d["total"], "APPROVED")
+        yield (ctx.id("customer_invoices", d["i"]), f"{SYN}-AR-{d['i']:07d}",
+               ctx.id("sales_orders", d["i"]), ctx.id("customers", d["customer"]), issued, due,
+               d["subtotal"], _VAT, d["vat"], d["total"], received, status, d["created_by"],
+               True, ctx.org_id)
+
+
+def _customer_invoice_payments(ctx: _Context):
+    for d in _sales_documents(ctx):
+        if d["invoice"] is None:
+            continue
+        for n, (paid_on, amount) in enumerate(d["invoice"][2]):
+            yield (ctx.id("customer_invoice_payments", d["i"] * 4 + n),
+                   ctx.id("customer_invoices", d["i"]), paid_on, amount, "TRANSFER",
+                   f"{SYN}-RCV-{d['i']:07d}-{n}", d["created_by"], ctx.org_id)
+
+
+# ============================================================
+# HIGH-VOLUME LEDGERS
+# ============================================================
+
+def _timesheets(ctx: _Context, lo: int, hi: int):
+    """Employees [lo, hi) × every day of the history."""
+    wo_ids = ctx.ids("work_orders", ctx.p["work_orders"])
+    for e in range(lo, hi):
+        rng = ctx.rng(f"timesheets:{e}")
+        emp_id = ctx.id("employees", e)
+        home_wo = rng.randrange(len(wo_ids))
+        d = ctx.start
+        while d <= ctx.today:
+            dow = d.isoweekday()
+            if dow != 7 and rng.random() < 0.92:
+                month_end = (d + timedelta(days=3)).month != d.month
+                ot = 0.0
+                if rng.random() < (0.45 if month_end else 0.15):
+                    ot = rng.choice((1.0, 1.5, 2.0, 3.0))
+                age = (ctx.today - d).days
+                status = "FINAL" if age > 45 else "APPROVED" if age > 10 else \
+                    rng.choice(("DRAFT", "SUBMITTED", "SUBMITTED", "APPROVED"))
+                wo = home_wo if rng.random() < 0.7 else rng.randrange(len(wo_ids))
+                yield (uuid.UUID(int=rng.getrandbits(128), version=4), emp_id,
+                       wo_ids[wo], d, Decimal("8.00") if dow != 6 else Decimal("4.00"),
+                       _money(ot), (OT_WEEKEND_ID if dow == 6 else OT_WEEKDAY_ID) if ot else None,
+                       status, ctx.user(rng), status == "FINAL", ctx.org_id)
+            d += timedelta(days=1)
+
+
+def _stock_movements(ctx: _Context, lo: int, hi: int):
+    rng = ctx.rng(f"stock_movements:{lo}")
+    product = ctx.popularity("products")
+    product_ids = ctx.ids("products", ctx.p["products"])
+    wo_ids = ctx.ids("work_orders", ctx.p["work_orders"])
+    cc_ids = ctx.ids("cost_centers", ctx.p["departments"])
+    mixes = {t: _weighted(mix) for t, mix in _MOVEMENT_MIX.items()}
+    for i in range(lo, hi):
+        p = product(rng)
+        names, cum = mixes[ctx.product_type[p]]
+        mt = names[_pick(rng, cum)]
+        qty = max(int(rng.paretovariate(1.8) * (12 if mt in ("RECEIVE", "PRODUCE") else 6)), 1)
+        if mt == "ADJUST":
+            qty = rng.choice((-1, 1)) * max(qty // 3, 1)
+        location, to_location = LOC_STORAGE_ID, None
+        if mt == "RECEIVE":
+            location = LOC_RECEIVING_ID if rng.random() < 0.2 else LOC_STORAGE_ID
+        elif mt == "TRANSFER":
+            location, to_location = LOC_STORAGE_ID, LOC_SHIPPING_ID
+        wo = wo_ids[rng.randrange(len(wo_ids))] if mt in ("CONSUME", "RETURN", "PRODUCE") else None
+        cc = cc_ids[rng.randrange(len(cc_ids))] if mt == "ISSUE" else None
+        yield (uuid.UUID(int=rng.getrandbits(128), version=4), ctx.calendar.moment(rng),
+               product_ids[p], mt, qty, _money(ctx.product_cost[p] * rng.uniform(0.92, 1.08)),
+               f"{SYN}-{mt[:3]}-{i:09d}", wo, ctx.user(rng), False, location, cc, to_location,
+               ctx.org_id)
+
+
+def _audit_logs(ctx: _Context, lo: int, hi: int):
+    rng = ctx.rng(f"audit_logs:{lo}")
+    actions, action_cum = _weighted(_AUDIT_MIX)
+    for _ in range(lo, hi):
+        action = actions[_pick(rng, action_cum)]
+        resource = _AUDIT_RESOURCES[min(int(rng.expovariate(0.45)), len(_AUDIT_RESOURCES) - 1)]
+        yield (uuid.UUID(int=rng.getrandbits(128), version=4), ctx.calendar.moment(rng),
+               ctx.user(rng), ctx.org_id, action, resource,
+               str(uuid.UUID(int=rng.getrandbits(128), version=4)), f"{action} {resource}",
+               f"10.0.{rng.randrange(256)}.{rng.randrange(256)}", AUDIT_USER_AGENT)
+
+
+# ============================================================
+# LOAD PLAN — (table, columns, generator) in FK order
+# ============================================================
+
+_PLAN = (
+    ("cost_centers", ("id", "code", "name", "overhead_rate", "is_active", "org_id"), _cost_centers),
+    ("departments", ("id", "code", "name", "cost_center_id", "is_active", "org_id"), _departments),
+    ("suppliers", ("id", "code", "name", "tax_id", "is_active", "org_id"),
+     lambda ctx: _partners(ctx, "suppliers", "S", "Supplier")),
+    ("customers", ("id", "code", "name", "tax_id", "is_active", "org_id"),
+     lambda ctx: _partners(ctx, "customers", "C", "Customer")),
+    ("products", ("id", "sku", "name", "product_type", "unit", "cost", "on_hand", "min_stock",
+                  "is_active", "org_id"), _products),
+    ("employees", ("id", "employee_code", "full_name", "position", "hourly_rate", "daily_working_hours",
+                   "cost_center_id", "department_id", "pay_type", "daily_rate", "monthly_salary",
+                   "is_active", "hire_date", "org_id"), _employees),
+    ("work_orders", ("id", "wo_number", "status", "customer_name", "description", "cost_center_code",
+                     "opened_at", "closed_at", "created_by", "is_active", "org_id"), _work_orders),
+    ("purchase_orders", ("id", "po_number", "supplier_name", "supplier_id", "status", "order_date",
+                         "expected_date", "subtotal_amount", "vat_rate", "vat_amount", "total_amount",
+                         "wht_rate", "wht_amount", "net_payment", "created_by", "is_active", "org_id",
+                         "created_at"), _purchase_orders),
+    ("purchase_order_lines", ("id", "po_id", "product_id", "item_type", "quantity", "unit", "unit_cost",
+                              "gr_mode", "received_qty"), _purchase_order_lines),
+    ("supplier_invoices", ("id", "invoice_number", "po_id", "supplier_id", "invoice_date", "due_date",
+                           "subtotal_amount", "vat_rate", "vat_amount", "total_amount", "wht_rate",
+                           "wht_amount", "net_payment", "paid_amount", "status", "created_by",
+                           "is_active", "org_id"), _supplier_invoices),
+    ("invoice_payments", ("id", "invoice_id", "payment_date", "amount", "wht_deducted", "payment_method",
+                          "reference", "paid_by", "org_id"), _invoice_payments),
+    ("sales_orders", ("id", "so_number", "customer_id", "status", "order_date", "subtotal_amount",
+                      "vat_rate", "vat_amount", "total_amount", "created_by", "is_active", "org_id",
+                      "created_at"), _sales_orders),
+    ("sales_order_lines", ("id", "so_id", "product_id", "quantity", "unit_price"), _sales_order_lines),
+    ("customer_invoices", ("id", "invoice_number", "so_id", "customer_id", "invoice_date", "due_date",
+                           "subtotal_amount", "vat_rate", "vat_amount", "total_amount", "received_amount",
+                           "status", "created_by", "is_active", "org_id"), _customer_invoices),
+    ("customer_invoice_payments", ("id", "invoice_id", "payment_date", "amount", "payment_method",
+                                   "reference", "received_by", "org_id"), _customer_invoice_payments),
+)
+
+# High-volume ledgers: (table, columns, generate(ctx, lo, hi), unit profile key, units per shard).
+# Shards are fixed-size and seeded by their start index, so the rows do not depend on --jobs;
+# each shard is COPYed on its own connection (worker process when --jobs > 1).
+_SHARDED_PLAN = (
+    ("timesheets", ("id", "employee_id", "work_order_id", "work_date", "regular_hours", "ot_hours",
+                    "ot_type_id", "status", "created_by", "is_locked", "org_id"), _timesheets,
+     "employees", 2_000),
+    ("stock_movements", ("id", "created_at", "product_id", "movement_type", "quantity", "unit_cost",
+                         "reference", "work_order_id", "created_by", "is_reversed", "location_id",
+                         "cost_center_id", "to_location_id", "org_id"), _stock_movements,
+     "stock_movements", 1_000_000),
+    ("audit_logs", ("id", "created_at", "user_id", "org_id", "action", "resource_type", "resource_id",
+                    "description", "ip_address", "user_agent"), _audit_logs,
+     "audit_logs", 1_000_000),
+)
+
+# Rebuild per-location + product on_hand from the synthetic ledger (signed as in the service)
+_REBUILD_STOCK_SQL = (
+    """
+    INSERT INTO stock_by_location (id, product_id, location_id, on_hand, org_id)
+    SELECT gen_random_uuid(), product_id, location_id, GREATEST(SUM(delta), 0), $1
+    FROM (
+        SELECT product_id, location_id,
+               CASE WHEN movement_type IN ('RECEIVE', 'RETURN', 'PRODUCE', 'ADJUST') THEN quantity
+                    ELSE -quantity END AS delta
+        FROM stock_movements WHERE org_id = $1 AND reference LIKE 'SYN-%'
+        UNION ALL
+        SELECT product_id, to_location_id, quantity
+        FROM stock_movements
+        WHERE org_id = $1 AND reference LIKE 'SYN-%' AND movement_type = 'TRANSFER'
+    ) d
+    GROUP BY product_id, location_id
+    """,
+    """
+    UPDATE products p SET on_hand = s.total
+    FROM (SELECT product_id, SUM(on_hand) AS total FROM stock_by_location
+          WHERE org_id = $1 GROUP BY product_id) s
+    WHERE p.id = s.product_id AND p.org_id = $1 AND p.sku LIKE 'SYN-%'
+    """,
+)
+
+# --reset: children first
+_RESET_SQL = (
+    "DELETE FROM invoice_payments WHERE org_id = $1 AND reference LIKE 'SYN-%'",
+    "DELETE FROM supplier_invoices WHERE org_id = $1 AND invoice_number LIKE 'SYN-%'",
+    "DELETE FROM purchase_order_lines l USING purchase_orders po "
+    "WHERE l.po_id = po.id AND po.org_id = $1 AND po.po_number LIKE 'SYN-%'",
+    "DELETE FROM purchase_orders WHERE org_id = $1 AND po_number LIKE 'SYN-%'",
+    "DELETE FROM customer_invoice_payments WHERE org_id = $1 AND reference LIKE 'SYN-%'",
+    "DELETE FROM customer_invoices WHERE org_id = $1 AND invoice_number LIKE 'SYN-%'",
+    "DELETE FROM sales_order_lines l USING sales_orders so "
+    "WHERE l.so_id = so.id AND so.org_id = $1 AND so.so_number LIKE 'SYN-%'",
+    "DELETE FROM sales_orders WHERE org_id = $1 AND so_number LIKE 'SYN-%'",
+    "DELETE FROM timesheets t USING employees e "
+    "WHERE t.employee_id = e.id AND e.org_id = $1 AND e.employee_code LIKE 'SYN-%'",
+    "DELETE FROM stock_movements WHERE org_id = $1 AND reference LIKE 'SYN-%'",
+    "DELETE FROM stock_by_location s USING products p "
+    "WHERE s.product_id = p.id AND p.org_id = $1 AND p.sku LIKE 'SYN-%'",
+    f"DELETE FROM audit_logs WHERE org_id = $1 AND user_agent = '{AUDIT_USER_AGENT}'",
+    "DELETE FROM work_orders WHERE org_id = $1 AND wo_number LIKE 'SYN-%'",
+    "DELETE FROM products WHERE org_id = $1 AND sku LIKE 'SYN-%'",
+    "DELETE FROM employees WHERE org_id = $1 AND employee_code LIKE 'SYN-%'",
+    "DELETE FROM suppliers WHERE org_id = $1 AND code LIKE 'SYN-%'",
+    "DELETE FROM customers WHERE org_id = $1 AND code LIKE 'SYN-%'",
+    "DELETE FROM departments WHERE org_id = $1 AND code LIKE 'SYN-%'",
+    "DELETE FROM cost_centers WHERE org_id = $1 AND code LIKE 'SYN-%'",
+)
+
+
+# ============================================================
+# RUNNER
+# ============================================================
+
+async def _connect() -> asyncpg.Connection:
+    url = make_url(get_settings().DATABASE_URL).set(drivername="postgresql")
+    return await asyncpg.connect(url.render_as_string(hide_password=False))
+
+
+async def _copy(conn: asyncpg.Connection, table: str, columns: tuple[str, ...], rows) -> int:
+    """COPY `rows` in CHUNK-row batches inside one transaction; returns the row count."""
+    total = 0
+    superuser = await conn.fetchval("SELECT rolsuper FROM pg_roles WHERE rolname = current_user")
+    async with conn.transaction():
+        if superuser:
+            # Rows are referentially consistent by construction: skip the per-row FK trigger
+            # checks for this transaction only (as pg_restore --disable-triggers does) — ~3× faster
+            await conn.execute("SET LOCAL session_replication_role = replica")
+        while True:
+            chunk = list(itertools.islice(rows, CHUNK))
+            if not chunk:
+                return total
+            await conn.copy_records_to_table(table, records=chunk, columns=columns)
+            total += len(chunk)
+
+
+def _report(table: str, rows: int, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    print(f"  [{table}] {rows:,} rows in {elapsed:.1f}s ({rows / max(elapsed, 1e-9):,.0f} rows/s)", flush=True)
+
+
+_worker_ctx: _Context | None = None
+
+
+def _init_worker(ctx: _Context) -> None:
+    global _worker_ctx
+    _worker_ctx = ctx
+
+
+def _copy_shard(index: int, lo: int, hi: int) -> int:
+    """Worker-process entry point: one shard of _SHARDED_PLAN[index] over its own connection."""
+    table, columns, generate, _, _ = _SHARDED_PLAN[index]
+
+    async def _run() -> int:
+        conn = await _connect()
+        try:
+            return await _copy(conn, table, columns, generate(_worker_ctx, lo, hi))
+        finally:
+            await conn.close()
+
+    return asyncio.run(_run())
+
+
+async def _load_sharded(conn: asyncpg.Connection, ctx: _Context, jobs: int) -> int:
+    loaded = 0
+    # Warm the shared caches before workers fork/spawn so they inherit instead of rebuilding
+    ctx.popularity("products")
+    for table, n in (("products", ctx.p["products"]), ("work_orders", ctx.p["work_orders"]),
+                     ("cost_centers", ctx.p["departments"])):
+        ctx.ids(table, n)
+
+    pool = ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(ctx,)) if jobs > 1 else None
+    try:
+        for index, (table, columns, generate, unit_key, per_shard) in enumerate(_SHARDED_PLAN):
+            units = ctx.p[unit_key]
+            shards = [(lo, min(lo + per_shard, units)) for lo in range(0, units, per_shard)]
+            started = time.perf_counter()
+            if pool is None:
+                counts = [await _copy(conn, table, columns, generate(ctx, lo, hi)) for lo, hi in shards]
+            else:
+                loop = asyncio.get_running_loop()
+                counts = await asyncio.gather(*(
+                    loop.run_in_executor(pool, _copy_shard, index, lo, hi) for lo, hi in shards
+                ))
+            _report(table, sum(counts), started)
+            loaded += sum(counts)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return loaded
+
+
+async def _ensure_partitions(ctx: _Context) -> None:
+    months = ctx.p["years"] * 12
+    async with AsyncSessionLocal() as db:
+        for table in ("stock_movements", "audit_logs"):
+            created = await ensure_monthly_partitions(db, table, months_ahead=months, start=ctx.start)
+            if created:
+                print(f"  [Partitions] {table}: {len(created)} created")
+        await db.commit()
+
+
+async def run(scale: str, *, seed: int, years: int | None, jobs: int, reset: bool, reset_only: bool) -> None:
+    profile = dict(SCALE_PROFILES[scale])
+    if years:
+        profile["years"] = years
+    conn = await _connect()
+    try:
+        print(f"\n=== SSS Corp ERP — Synthetic data ({scale}, seed={seed}, years={profile['years']}) ===\n")
+        if reset or reset_only:
+            async with conn.transaction():
+                for sql in _RESET_SQL:
+                    await conn.execute(sql, DEFAULT_ORG_ID)
+            print("  [Reset] previous synthetic rows removed")
+            if reset_only:
+                return
+        elif await conn.fetchval(
+            "SELECT 1 FROM products WHERE org_id = $1 AND sku LIKE 'SYN-%' LIMIT 1", DEFAULT_ORG_ID
+        ):
+            raise SystemExit("Synthetic data already loaded — rerun with --reset to replace it.")
+
+        user_ids = [r["id"] for r in await conn.fetch(
+            "SELECT id FROM users WHERE org_id = $1 AND is_active ORDER BY email", DEFAULT_ORG_ID
+        )]
+        if not user_ids or not await conn.fetchval(
+            "SELECT 1 FROM locations WHERE id = $1", LOC_STORAGE_ID
+        ):
+            raise SystemExit("Base seed not found — run `python -m app.seed` first.")
+
+        ctx = _Context(seed=seed, profile=profile, org_id=DEFAULT_ORG_ID, user_ids=user_ids,
+                       today=datetime.now(_TZ).date())
+        await _ensure_partitions(ctx)
+
+        started = time.perf_counter()
+        loaded = 0
+        for table, columns, generate in _PLAN:
+            table_started = time.perf_counter()
+            rows = await _copy(conn, table, columns, generate(ctx))
+            _report(table, rows, table_started)
+            loaded += rows
+        loaded += await _load_sharded(conn, ctx, jobs)
+
+        async with conn.transaction():
+            for sql in _REBUILD_STOCK_SQL:
+                await conn.execute(sql, DEFAULT_ORG_ID)
+        print("  [Stock] stock_by_location + products.on_hand rebuilt from the ledger")
+
+        for table in [t[0] for t in _PLAN + _SHARDED_PLAN] + ["stock_by_location"]:
+            await conn.execute(f"ANALYZE {table}")
+        _report("total", loaded, started)
+    finally:
+        await conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", choices=list(SCALE_PROFILES), default="S")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--years", type=int, default=None, help="override the profile's history length")
+    parser.add_argument("--jobs", type=int, default=min(4, os.cpu_count() or 1),
+                        help="worker processes for the high-volume ledgers")
+    parser.add_argument("--reset", action="store_true", help="remove previous synthetic rows first")
+    parser.add_argument("--reset-only", action="store_true", help="remove synthetic rows and exit")
+    args = parser.parse_args()
+    asyncio.run(run(args.scale, seed=args.seed, years=args.years, jobs=args.jobs,
+                    reset=args.reset, reset_only=args.reset_only))
+
+
+if __name__ == "__main__":
+    main()
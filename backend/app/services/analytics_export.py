@@ -0,0 +1,279 @@
+"""
+SSS Corp ERP — Incremental Parquet Analytics Export
+Phase 15: stock_movements, timesheets, AP / AR invoices and payments, performance_logs
+→ compressed Parquet files, one directory per table per month, for BI tools
+
+Layout (Hive-style, readable as one dataset by DuckDB / Spark / Power BI / pandas):
+
+    {ANALYTICS_EXPORT_DIR}/{table}/month=YYYY-MM/part-{run}.parquet
+
+  month      from the table's business date (movement created_at, work_date,
+             invoice_date, payment_date, recorded_at — UTC months, as the
+             stock_movements partitions)
+  watermark  each run exports rows with exported_until < updated_at <= now() -
+             ANALYTICS_EXPORT_LAG_SECONDS and then advances the table's watermark
+             (analytics_export_watermarks). The lag leaves rows of still-open
+             transactions (updated_at = transaction start) to the next run.
+  changes    a changed row (invoice paid, timesheet approved) is written again in
+             a later part file: readers keep the row with the latest updated_at
+             per id. performance_logs is append-only and uses recorded_at.
+  memory     rows are streamed from a server-side cursor ANALYTICS_EXPORT_BATCH_ROWS
+             at a time, in month order, and each batch is written as a row group —
+             one file open at a time, nothing held beyond the current batch.
+
+A failed run removes the files it wrote and leaves the watermark where it was.
+Runs: python -m app.export_analytics, scheduled daily as its own job (cron / a
+one-off container) — not in the API workers, where each replica would repeat it
+on the request pools.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.ar import CustomerInvoice, CustomerInvoicePayment
+from app.models.hr import Timesheet
+from app.models.inventory import StockMovement
+from app.models.invoice import InvoicePayment, SupplierInvoice
+from app.models.performance import PerformanceLog
+
+logger = logging.getLogger(__name__)
+
+EXPORT_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+# ============================================================
+# REGISTRY — one entry per exported table
+# ============================================================
+# model: every mapped column is exported, in table order
+# month: column the month directory is taken from (date or timestamptz)
+# watermark: column compared with the table's watermark — updated_at unless append-only
+
+EXPORT_TABLES: dict[str, dict] = {
+    "stock_movements": {"model": StockMovement, "month": "created_at", "watermark": "updated_at"},
+    "timesheets": {"model": Timesheet, "month": "work_date", "watermark": "updated_at"},
+    "supplier_invoices": {"model": SupplierInvoice, "month": "invoice_date", "watermark": "updated_at"},
+    "invoice_payments": {"model": InvoicePayment, "month": "payment_date", "watermark": "updated_at"},
+    "customer_invoices": {"model": CustomerInvoice, "month": "invoice_date", "watermark": "updated_at"},
+    "customer_invoice_payments": {
+        "model": CustomerInvoicePayment, "month": "payment_date", "watermark": "updated_at",
+    },
+    "performance_logs": {"model": PerformanceLog, "month": "recorded_at", "watermark": "recorded_at"},
+}
+
+
+def _arrow_type(col_type: sa.types.TypeEngine):
+    """Parquet column type for a model column; anything without a native type is text."""
+    import pyarrow as pa
+
+    if isinstance(col_type, sa.Boolean):
+        return pa.bool_()
+    if isinstance(col_type, sa.BigInteger):
+        return pa.int64()
+    if isinstance(col_type, sa.SmallInteger):
+        return pa.int16()
+    if isinstance(col_type, sa.Integer):
+        return pa.int32()
+    if isinstance(col_type, sa.Float):
+        return pa.float64()
+    if isinstance(col_type, sa.Numeric):
+        return pa.decimal128(col_type.precision or 38, col_type.scale or 0)
+    if isinstance(col_type, sa.DateTime):
+        return pa.timestamp("us", tz="UTC" if col_type.timezone else None)
+    if isinstance(col_type, sa.Date):
+        return pa.date32()
+    return pa.string()  # varchar / text / enum label / uuid / json
+
+
+def arrow_schema(table_name: str):
+    import pyarrow as pa
+
+    table = EXPORT_TABLES[table_name]["model"].__table__
+    return pa.schema([pa.field(c.name, _arrow_type(c.type), nullable=c.nullable) for c in table.columns])
+
+
+def _select_sql(table_name: str) -> str:
+    """Changed rows in month order; non-native columns come back as text."""
+    import pyarrow as pa
+
+    spec = EXPORT_TABLES[table_name]
+    table = spec["model"].__table__
+    month_col = table.columns[spec["month"]]
+    month = (
+        f"to_char({month_col.name} AT TIME ZONE 'UTC', 'YYYY-MM')"
+        if isinstance(month_col.type, sa.DateTime) else f"to_char({month_col.name}, 'YYYY-MM')"
+    )
+    cols = ", ".join(
+        f"{c.name}::text AS {c.name}" if _arrow_type(c.type) == pa.string() else c.name
+        for c in table.columns
+    )
+    return f"""
+        SELECT {month} AS _month, {cols}
+        FROM {table_name}
+        WHERE {spec["watermark"]} > :after AND {spec["watermark"]} <= :until
+        ORDER BY {month_col.name}
+    """
+
+
+def part_path(out_dir: str, table_name: str, month: str, run_tag: str) -> str:
+    return os.path.join(out_dir, table_name, f"month={month}", f"part-{run_tag}.parquet")
+
+
+# ============================================================
+# WRITE (worker thread — pyarrow conversion + file I/O)
+# ============================================================
+
+class _MonthWriter:
+    """One Parquet file at a time, written under a hidden temp name and renamed on close."""
+
+    def __init__(self, schema, compression: str):
+        self.schema = schema
+        self.compression = compression
+        self.writer = None
+        self.path = None
+        self.written: list[str] = []
+
+    def open(self, path: str) -> None:
+        import pyarrow.parquet as pq
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.writer = pq.ParquetWriter(self._tmp(path), self.schema, compression=self.compression)
+
+    def write(self, rows: list) -> None:
+        import pyarrow as pa
+
+        columns = list(zip(*rows))[1:]  # drop _month
+        arrays = [pa.array(values, type=field.type) for values, field in zip(columns, self.schema)]
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self) -> None:
+        if self.writer is None:
+            return
+        self.writer.close()
+        os.replace(self._tmp(self.path), self.path)
+        self.written.append(self.path)
+        self.writer = None
+
+    def discard(self) -> None:
+        """Failed run: drop the open temp file and every file this run renamed into place."""
+        if self.writer is not None:
+            self.writer.close()
+            os.remove(self._tmp(self.path))
+            self.writer = None
+        for path in self.written:
+            os.remove(path)
+        self.written.clear()
+
+    @staticmethod
+    def _tmp(path: str) -> str:
+        head, tail = os.path.split(path)
+        return os.path.join(head, f".{tail}.tmp")
+
+
+# ============================================================
+# RUN
+# ============================================================
+
+_CLAIM_WATERMARK_SQL = text("""
+    SELECT exported_until, now() - make_interval(secs => :lag) AS until
+    FROM analytics_export_watermarks
+    WHERE table_name = :table_name
+    FOR UPDATE SKIP LOCKED
+""")
+
+
+async def export_table(
+    control: AsyncSession,
+    table_name: str,
+    *,
+    out_dir: str,
+    full: bool = False,
+    batch_rows: int | None = None,
+) -> dict[str, Any] | None:
+    """
+    Export one table's rows changed since its watermark.
+    `control` holds the watermark row lock for the whole run (a concurrent run of the
+    same table skips it — returns None); rows are streamed on a second session.
+    full=True exports from the beginning and needs an empty {out_dir}/{table}.
+    """
+    from app.core.database import background_session
+
+    settings = get_settings()
+    batch_rows = batch_rows or settings.ANALYTICS_EXPORT_BATCH_ROWS
+    started = time.monotonic()
+
+    table_dir = os.path.join(out_dir, table_name)
+    if full and os.path.isdir(table_dir) and os.listdir(table_dir):
+        raise ValueError(f"full export of {table_name} needs an empty {table_dir}")
+
+    await control.execute(
+        text("""
+            INSERT INTO analytics_export_watermarks (table_name, exported_until)
+            VALUES (:table_name, :epoch)
+            ON CONFLICT (table_name) DO NOTHING
+        """),
+        {"table_name": table_name, "epoch": EXPORT_EPOCH},
+    )
+    await control.commit()
+    claim = (await control.execute(
+        _CLAIM_WATERMARK_SQL, {"table_name": table_name, "lag": settings.ANALYTICS_EXPORT_LAG_SECONDS}
+    )).one_or_none()
+    if claim is None:
+        await control.rollback()
+        logger.info("Analytics export of %s already running — skipped", table_name)
+        return None
+    after = EXPORT_EPOCH if full else claim.exported_until
+    until = claim.until
+    run_tag = until.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    out = _MonthWriter(arrow_schema(table_name), settings.ANALYTICS_EXPORT_COMPRESSION)
+    month = None
+    rows_exported = 0
+    try:
+        async with background_session() as db:
+            result = await db.stream(text(_select_sql(table_name)), {"after": after, "until": until})
+            async for batch in result.partitions(batch_rows):
+                for batch_month, group in itertools.groupby(batch, key=lambda row: row[0]):
+                    rows = list(group)
+                    if batch_month != month:
+                        await asyncio.to_thread(out.close)
+                        month = batch_month
+                        await asyncio.to_thread(out.open, part_path(out_dir, table_name, month, run_tag))
+                    await asyncio.to_thread(out.write, rows)
+                    rows_exported += len(rows)
+        await asyncio.to_thread(out.close)
+    except BaseException:
+        await asyncio.to_thread(out.discard)
+        await control.rollback()
+        raise
+
+    duration_ms = int((time.monotonic() - started) * 1000)
+    await control.execute(
+        text("""
+            UPDATE analytics_export_watermarks
+            SET exported_until = :until, last_run_at = now(), last_run_rows = :rows,
+                last_run_files = :files, last_run_ms = :ms
+            WHERE table_name = :table_name
+        """),
+        {"until": until, "rows": rows_exported, "files": len(out.written),
+         "ms": duration_ms, "table_name": table_name},
+    )
+    await control.commit()
+    return {
+        "table": table_name,
+        "rows": rows_exported,
+        "files": out.written,
+        "after": after,
+        "until": until,
+        "duration_ms": duration_ms,
+    }
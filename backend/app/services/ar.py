@@ -25,6 +25,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.ar import CustomerInvoice, CustomerInvoicePayment, CustomerInvoiceStatus
 from app.models.sales import DeliveryOrder, DOStatus, SalesOrder, SOStatus
 from app.models.user import User
+from app.services.events import record_event, record_status_change
 
 
 # ============================================================
@@ -277,8 +278,10 @@ async def submit_ar_invoice(
         )
 
     inv.status = CustomerInvoiceStatus.PENDING
-    await db.commit()
-    await db.refresh(inv)
+    await record_status_change(
+        db, org_id=org_id, aggregate_type="AR", aggregate_id=inv.id, number=inv.invoice_number,
+        from_status=CustomerInvoiceStatus.DRAFT, to_status=inv.status, actor_id=inv.created_by,
+    )
 
     # Phase 9: Notification — APPROVAL_REQUEST for AR approvers
     try:
@@ -294,6 +297,11 @@ async def submit_ar_invoice(
         import logging
         logging.getLogger(__name__).warning("Notification failed for AR submit %s", inv.invoice_number, exc_info=True)
 
+    await db.commit()
+    await db.refresh(inv)
+    from app.services.notification import publish_pending_notifications
+    await publish_pending_notifications(db)
+
     return inv
 
 
@@ -327,6 +335,11 @@ async def approve_ar_invoice(
     else:
         raise HTTPException(status_code=400, detail="Invalid action")
 
+    await record_status_change(
+        db, org_id=org_id, aggregate_type="AR", aggregate_id=inv.id, number=inv.invoice_number,
+        from_status=CustomerInvoiceStatus.PENDING, to_status=inv.status, actor_id=user_id,
+        **({"reason": reason} if action == "reject" else {}),
+    )
     await db.commit()
     await db.refresh(inv)
 
@@ -372,7 +385,12 @@ async def cancel_ar_invoice(
             detail=f"Cannot cancel invoice in {inv.status.value} status",
         )
 
+    from_status = inv.status
     inv.status = CustomerInvoiceStatus.CANCELLED
+    await record_status_change(
+        db, org_id=org_id, aggregate_type="AR", aggregate_id=inv.id, number=inv.invoice_number,
+        from_status=from_status, to_status=inv.status,
+    )
     await db.commit()
     await db.refresh(inv)
     return inv
@@ -428,6 +446,21 @@ async def receive_payment(
     if Decimal(str(inv.received_amount)) >= Decimal(str(inv.total_amount)):
         inv.status = CustomerInvoiceStatus.PAID
 
+    await db.flush()  # payment.id
+    await record_event(
+        db, org_id=org_id, event_type="payment_received", aggregate_type="AR", aggregate_id=inv.id,
+        payload={
+            "invoice_number": inv.invoice_number,
+            "customer_id": inv.customer_id,
+            "payment_id": payment.id,
+            "payment_date": payment.payment_date,
+            "amount": amount,
+            "received_amount": inv.received_amount,
+            "total_amount": inv.total_amount,
+            "status": inv.status,
+        },
+        actor_id=user_id,
+    )
     await db.commit()
     await db.refresh(inv)
     return inv
@@ -438,58 +471,34 @@ async def receive_payment(
 # ============================================================
 
 async def get_ar_summary(db: AsyncSession, org_id: UUID) -> dict:
-    """Aggregate AR stats for dashboard."""
-    base = select(CustomerInvoice).where(
-        CustomerInvoice.org_id == org_id,
-        CustomerInvoice.is_active == True,
-        CustomerInvoice.status != CustomerInvoiceStatus.CANCELLED,
-    )
-
-    # Total invoices
-    total_q = select(func.count()).select_from(base.subquery())
-    total_invoices = (await db.execute(total_q)).scalar() or 0
-
-    # Total receivable (total_amount of non-PAID, non-CANCELLED)
-    receivable_q = select(func.coalesce(func.sum(CustomerInvoice.total_amount), 0)).where(
-        CustomerInvoice.org_id == org_id,
-        CustomerInvoice.is_active == True,
-        CustomerInvoice.status.in_([
+    """Aggregate AR stats for dashboard — single pass over the org's invoices."""
+    inv = CustomerInvoice
+    q = select(
+        func.count().label("total_invoices"),
+        func.coalesce(func.sum(inv.total_amount).filter(inv.status.in_([
             CustomerInvoiceStatus.DRAFT, CustomerInvoiceStatus.PENDING, CustomerInvoiceStatus.APPROVED,
-        ]),
-    )
-    total_receivable = (await db.execute(receivable_q)).scalar() or 0
-
-    # Total received
-    received_q = select(func.coalesce(func.sum(CustomerInvoice.received_amount), 0)).where(
-        CustomerInvoice.org_id == org_id,
-        CustomerInvoice.is_active == True,
-        CustomerInvoice.status != CustomerInvoiceStatus.CANCELLED,
-    )
-    total_received = (await db.execute(received_q)).scalar() or 0
-
-    # Overdue count (BR#127)
-    overdue_q = select(func.count()).where(
-        CustomerInvoice.org_id == org_id,
-        CustomerInvoice.is_active == True,
-        CustomerInvoice.status == CustomerInvoiceStatus.APPROVED,
-        CustomerInvoice.due_date < date.today(),
-    )
-    total_overdue = (await db.execute(overdue_q)).scalar() or 0
-
-    # Pending approval
-    pending_q = select(func.count()).where(
-        CustomerInvoice.org_id == org_id,
-        CustomerInvoice.is_active == True,
-        CustomerInvoice.status == CustomerInvoiceStatus.PENDING,
+        ])), 0).label("total_receivable"),
+        func.coalesce(func.sum(inv.received_amount), 0).label("total_received"),
+        # Overdue (BR#127) — APPROVED open items past due (ix_*_open_items)
+        func.count().filter(
+            inv.status == CustomerInvoiceStatus.APPROVED,
+            inv.outstanding_amount > 0,
+            inv.due_date < date.today(),
+        ).label("total_overdue"),
+        func.count().filter(inv.status == CustomerInvoiceStatus.PENDING).label("total_pending_approval"),
+    ).where(
+        inv.org_id == org_id,
+        inv.is_active == True,
+        inv.status != CustomerInvoiceStatus.CANCELLED,
     )
-    total_pending = (await db.execute(pending_q)).scalar() or 0
+    row = (await db.execute(q)).one()
 
     return {
-        "total_invoices": total_invoices,
-        "total_receivable": total_receivable,
-        "total_received": total_received,
-        "total_overdue": total_overdue,
-        "total_pending_approval": total_pending,
+        "total_invoices": row.total_invoices,
+        "total_receivable": row.total_receivable,
+        "total_received": row.total_received,
+        "total_overdue": row.total_overdue,
+        "total_pending_approval": row.total_pending_approval,
     }
 
 
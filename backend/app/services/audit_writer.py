@@ -0,0 +1,127 @@
+"""
+SSS Corp ERP — Batched Audit Writer
+Phase 15: Optional async write path for high-volume, non-transactional audit events
+(login history, export audit log).
+
+Events are queued in memory and flushed as one multi-row INSERT per table every
+AUDIT_WRITER_FLUSH_MS or AUDIT_WRITER_BATCH_SIZE rows, on a dedicated session.
+Trade-off: rows still queued when the process is killed (not a clean shutdown) are lost —
+which is why business audit rows (create_audit_log) never use this path.
+
+Enable with AUDIT_ASYNC_WRITES=True; started/stopped by main.lifespan.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+
+from sqlalchemy import insert
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+_STOP = object()
+
+
+class BatchedAuditWriter:
+    """In-process queue → periodic multi-row INSERT. One instance per process."""
+
+    def __init__(self, *, batch_size: int, flush_interval: float, max_queue: int):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: asyncio.Task | None = None
+        self._accepting = False
+        self.written = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._accepting and self._task is not None and not self._task.done()
+
+    def submit(self, model, row: dict) -> bool:
+        """Queue one row. Returns False if the writer is stopped or the queue is full."""
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait((model, row))
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._accepting = True
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop accepting, flush everything still queued, then exit."""
+        if self._task is None:
+            return
+        self._accepting = False
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            stopping = item is _STOP
+            batch = [] if stopping else [item]
+            # Let a batch accumulate — unless one is already waiting
+            if not stopping and self._queue.qsize() < self.batch_size - 1:
+                await asyncio.sleep(self.flush_interval)
+            while not self._queue.empty() and (stopping or len(batch) < self.batch_size):
+                extra = self._queue.get_nowait()
+                if extra is _STOP:
+                    stopping = True
+                else:
+                    batch.append(extra)
+            await self._flush(batch)
+
+    async def _flush(self, items: list[tuple]) -> None:
+        if not items:
+            return
+        from app.core.database import background_session
+
+        by_model: dict = defaultdict(list)
+        for model, row in items:
+            by_model[model].append(row)
+        try:
+            async with background_session() as db:
+                for model, rows in by_model.items():
+                    await db.execute(insert(model).values(rows))
+                await db.commit()
+            self.written += len(items)
+        except Exception:
+            self.failed += len(items)
+            logger.warning("Batched audit flush failed (%d rows dropped)", len(items), exc_info=True)
+
+
+_writer: BatchedAuditWriter | None = None
+
+
+def get_audit_writer() -> BatchedAuditWriter | None:
+    """The running writer, or None when async audit writes are disabled."""
+    return _writer if _writer is not None and _writer.running else None
+
+
+def start_audit_writer() -> BatchedAuditWriter:
+    global _writer
+    settings = get_settings()
+    if _writer is None:
+        _writer = BatchedAuditWriter(
+            batch_size=settings.AUDIT_WRITER_BATCH_SIZE,
+            flush_interval=settings.AUDIT_WRITER_FLUSH_MS / 1000,
+            max_queue=settings.AUDIT_WRITER_MAX_QUEUE,
+        )
+    _writer.start()
+    return _writer
+
+
+async def stop_audit_writer() -> None:
+    if _writer is not None:
+        await _writer.stop()
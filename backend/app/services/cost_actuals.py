@@ -0,0 +1,246 @@
+"""
+SSS Corp ERP — Cost Center Actuals Rollup
+Phase 15: cost_center_actuals — monthly actual labor / material / tool / overhead per
+cost center, the "actual" half of recharge.get_cost_center_summary
+
+Components and attribution (the WO cost summary's four components, BR#14-17):
+  labor     FINAL timesheets: (regular_hours + ot_hours × OT factor, default 1.5)
+            × employee hourly_rate — month of work_date, the WO's cost center
+            (the employee's when the WO has none)
+  material  CONSUME − RETURN against a WO (the WO's cost center) plus ISSUE to a
+            cost center, quantity × unit_cost, reversed movements left out —
+            month of created_at
+  tool      charge_amount of checked-in tool checkouts — month of checkin_at,
+            the WO's cost center
+  overhead  labor × the cost center's overhead_rate %
+Months are UTC, as the stock_movements partitions. Cost with no cost center to
+land on (WO and employee both without one) is left out.
+
+Refresh:
+  rebuild_period()        one org-month: DELETE + one INSERT … SELECT over that
+                          month's source rows (partition-pruned on stock_movements)
+  refresh_cost_actuals()  background loop — rebuilds only the org-months of source
+                          rows whose updated_at passed the watermark since the last
+                          run (updated_at indexes on all three sources); the first
+                          run backfills every month
+Master data is read at rebuild time: after changing hourly rates, OT factors,
+overhead rates or a WO's cost center, rebuild the months affected —
+python -m app.rebuild_cost_actuals.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import stage_invalidation
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_NAME = "cost_center_actuals"
+ROLLUP_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# pg_advisory_xact_lock key — one writer of cost_center_actuals at a time
+_ROLLUP_LOCK_KEY = 0x434341  # "CCA"
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def next_month(period: date) -> date:
+    return date(period.year + period.month // 12, period.month % 12 + 1, 1)
+
+
+def month_range(first: date, last: date) -> list[date]:
+    """First days of every month from first to last, inclusive."""
+    periods, period = [], month_start(first)
+    while period <= last:
+        periods.append(period)
+        period = next_month(period)
+    return periods
+
+
+# ============================================================
+# REBUILD ONE ORG-MONTH
+# ============================================================
+
+_DELETE_PERIOD_SQL = text("""
+    DELETE FROM cost_center_actuals
+    WHERE org_id = :org_id AND period_year = :year AND period_month = :month
+""")
+
+_INSERT_PERIOD_SQL = text("""
+    INSERT INTO cost_center_actuals
+        (id, org_id, period_year, period_month, cost_center_id,
+         labor, material, tool, overhead, refreshed_at)
+    SELECT gen_random_uuid(), :org_id, :year, :month, a.cost_center_id,
+           a.labor, a.material, a.tool, round(a.labor * cc.overhead_rate / 100, 2), now()
+    FROM (
+        SELECT cost_center_id,
+               round(sum(labor), 2) AS labor,
+               round(sum(material), 2) AS material,
+               round(sum(tool), 2) AS tool
+        FROM (
+            SELECT coalesce(wcc.id, e.cost_center_id) AS cost_center_id,
+                   (t.regular_hours + t.ot_hours * coalesce(ot.factor, 1.5))
+                       * coalesce(e.hourly_rate, 0) AS labor,
+                   0 AS material, 0 AS tool
+            FROM timesheets t
+            JOIN employees e ON e.id = t.employee_id
+            LEFT JOIN ot_types ot ON ot.id = t.ot_type_id
+            JOIN work_orders w ON w.id = t.work_order_id
+            LEFT JOIN cost_centers wcc ON wcc.org_id = w.org_id AND wcc.code = w.cost_center_code
+            WHERE t.org_id = :org_id AND t.status = 'FINAL'
+              AND t.work_date >= :first_day AND t.work_date < :next_first_day
+
+            UNION ALL
+            SELECT CASE WHEN m.movement_type = 'ISSUE' THEN m.cost_center_id ELSE wcc.id END,
+                   0,
+                   CASE WHEN m.movement_type = 'RETURN' THEN -1 ELSE 1 END * m.quantity * m.unit_cost,
+                   0
+            FROM stock_movements m
+            LEFT JOIN work_orders w ON w.id = m.work_order_id
+            LEFT JOIN cost_centers wcc ON wcc.org_id = w.org_id AND wcc.code = w.cost_center_code
+            WHERE m.org_id = :org_id
+              AND m.created_at >= :period_start AND m.created_at < :period_end
+              AND m.movement_type IN ('CONSUME', 'RETURN', 'ISSUE')
+              AND NOT m.is_reversed
+
+            UNION ALL
+            SELECT wcc.id, 0, 0, c.charge_amount
+            FROM tool_checkouts c
+            JOIN work_orders w ON w.id = c.work_order_id
+            LEFT JOIN cost_centers wcc ON wcc.org_id = w.org_id AND wcc.code = w.cost_center_code
+            WHERE c.org_id = :org_id
+              AND c.checkin_at >= :period_start AND c.checkin_at < :period_end
+        ) src
+        WHERE cost_center_id IS NOT NULL
+        GROUP BY cost_center_id
+    ) a
+    JOIN cost_centers cc ON cc.id = a.cost_center_id
+""")
+
+
+def _period_params(org_id: UUID, period: date) -> dict:
+    end = next_month(period)
+    return {
+        "org_id": org_id,
+        "year": period.year,
+        "month": period.month,
+        "first_day": period,
+        "next_first_day": end,
+        "period_start": datetime(period.year, period.month, 1, tzinfo=timezone.utc),
+        "period_end": datetime(end.year, end.month, 1, tzinfo=timezone.utc),
+    }
+
+
+async def _rebuild(db: AsyncSession, org_id: UUID, period: date) -> int:
+    """Replace one org-month's rows (caller holds the rollup lock). Returns cost centers written."""
+    params = _period_params(org_id, period)
+    await db.execute(_DELETE_PERIOD_SQL, params)
+    result = await db.execute(_INSERT_PERIOD_SQL, params)
+    stage_invalidation(db, org_id, "costing")
+    return result.rowcount
+
+
+async def rebuild_period(db: AsyncSession, *, org_id: UUID, year: int, month: int) -> int:
+    """
+    Recompute one month of one org from the source tables and commit.
+    Waits for a running refresh. Returns the number of cost centers with actuals.
+    """
+    await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ROLLUP_LOCK_KEY})
+    written = await _rebuild(db, org_id, date(year, month, 1))
+    await db.commit()
+    return written
+
+
+# ============================================================
+# INCREMENTAL REFRESH
+# ============================================================
+
+_CLAIM_WATERMARK_SQL = text("""
+    INSERT INTO rollup_watermarks (name, processed_until)
+    VALUES (:name, :epoch)
+    ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name
+    RETURNING processed_until, now() - make_interval(secs => :lag) AS until
+""")
+
+# org-months touched by source rows changed in (after, until]
+_CHANGED_PERIODS_SQL = text("""
+    SELECT org_id, CAST(date_trunc('month', work_date) AS date) AS period
+    FROM timesheets
+    WHERE updated_at > :after AND updated_at <= :until
+    UNION
+    SELECT org_id, CAST(date_trunc('month', created_at AT TIME ZONE 'UTC') AS date)
+    FROM stock_movements
+    WHERE updated_at > :after AND updated_at <= :until
+      AND movement_type IN ('CONSUME', 'RETURN', 'ISSUE')
+    UNION
+    SELECT org_id, CAST(date_trunc('month', checkin_at AT TIME ZONE 'UTC') AS date)
+    FROM tool_checkouts
+    WHERE updated_at > :after AND updated_at <= :until AND checkin_at IS NOT NULL
+    ORDER BY 1, 2
+""")
+
+
+async def refresh_cost_actuals(db: AsyncSession) -> int:
+    """
+    Rebuild the org-months whose source rows changed since the watermark, then
+    advance it — one transaction. Returns the number of org-months rebuilt
+    (0 when nothing changed or another refresh / rebuild holds the lock).
+    """
+    settings = get_settings()
+    locked = (await db.execute(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _ROLLUP_LOCK_KEY}
+    )).scalar()
+    if not locked:
+        await db.rollback()
+        return 0
+    mark = (await db.execute(_CLAIM_WATERMARK_SQL, {
+        "name": ROLLUP_NAME, "epoch": ROLLUP_EPOCH, "lag": settings.COST_ACTUALS_LAG_SECONDS,
+    })).one()
+    periods = (await db.execute(
+        _CHANGED_PERIODS_SQL, {"after": mark.processed_until, "until": mark.until}
+    )).all()
+    for org_id, period in periods:
+        await _rebuild(db, org_id, period)
+    await db.execute(
+        text("""
+            UPDATE rollup_watermarks
+            SET processed_until = :until, last_run_at = now(), last_run_periods = :periods
+            WHERE name = :name
+        """),
+        {"until": mark.until, "periods": len(periods), "name": ROLLUP_NAME},
+    )
+    await db.commit()
+    return len(periods)
+
+
+async def run_cost_actuals_refresher(stop: asyncio.Event) -> None:
+    """
+    Background loop (started from main.lifespan when COST_ACTUALS_REFRESH_ENABLED):
+    refresh every COST_ACTUALS_REFRESH_SECONDS.
+    """
+    from app.core.database import background_session
+
+    settings = get_settings()
+    logger.info("Cost center actuals refresher started (every %ds)", settings.COST_ACTUALS_REFRESH_SECONDS)
+    try:
+        while not stop.is_set():
+            try:
+                async with background_session() as db:
+                    rebuilt = await refresh_cost_actuals(db)
+                if rebuilt:
+                    logger.info("Cost center actuals: %d org-months rebuilt", rebuilt)
+            except Exception:
+                logger.warning("Cost center actuals refresh failed", exc_info=True)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.COST_ACTUALS_REFRESH_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        logger.info("Cost center actuals refresher stopped")
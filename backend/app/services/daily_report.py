@@ -16,7 +16,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, func, select
+from sqlalchemy import bindparam, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.daily_report import (
@@ -243,8 +243,6 @@ async def submit_daily_report(
 
     report.status = ReportStatus.SUBMITTED
     report.submitted_at = datetime.now(timezone.utc)
-    await db.commit()
-    await db.refresh(report)
 
     # Phase 9: Notification — APPROVAL_REQUEST for daily report approvers
     try:
@@ -261,6 +259,11 @@ async def submit_daily_report(
         import logging
         logging.getLogger(__name__).warning("Notification failed for daily report submit", exc_info=True)
 
+    await db.commit()
+    await db.refresh(report)
+    from app.services.notification import publish_pending_notifications
+    await publish_pending_notifications(db)
+
     return report
 
 
@@ -288,7 +291,7 @@ async def approve_daily_report(
     report.approved_at = datetime.now(timezone.utc)
 
     # Auto-record (BR#52, BR#53)
-    await _auto_record_on_approve(db, report, org_id=org_id)
+    await _auto_record_many(db, [report], org_id=org_id)
 
     await db.commit()
     await db.refresh(report)
@@ -321,14 +324,73 @@ async def batch_approve_daily_reports(
     *,
     approver_id: UUID,
     org_id: UUID,
-) -> list[DailyWorkReport]:
-    results = []
-    for rid in report_ids:
-        report = await approve_daily_report(
-            db, rid, approver_id=approver_id, org_id=org_id
+) -> tuple[list[DailyWorkReport], list[dict]]:
+    """
+    Approve many SUBMITTED reports in one transaction, set-based (BR#52, BR#53):
+    one query loads + locks the reports, auto-records for all of them are written by
+    _auto_record_many. Missing / non-SUBMITTED reports are skipped and returned as
+    errors ({report_id, detail}) — the rest are still approved.
+    """
+    unique_ids = list(dict.fromkeys(report_ids))
+    result = await db.execute(
+        select(DailyWorkReport)
+        .where(DailyWorkReport.id.in_(unique_ids), DailyWorkReport.org_id == org_id)
+        .with_for_update()
+    )
+    found = {r.id: r for r in result.scalars().all()}
+
+    approved: list[DailyWorkReport] = []
+    errors: list[dict] = []
+    for rid in unique_ids:
+        report = found.get(rid)
+        if report is None:
+            errors.append({"report_id": rid, "detail": "Report not found"})
+        elif report.status != ReportStatus.SUBMITTED:
+            errors.append({
+                "report_id": rid,
+                "detail": f"อนุมัติได้เฉพาะสถานะ SUBMITTED — ปัจจุบัน: {report.status.value}",
+            })
+        else:
+            approved.append(report)
+    if not approved:
+        return [], errors
+
+    now = datetime.now(timezone.utc)
+    for report in approved:
+        report.status = ReportStatus.APPROVED
+        report.approved_by = approver_id
+        report.approved_at = now
+
+    await _auto_record_many(db, approved, org_id=org_id)
+    await db.commit()
+
+    # Phase 9: Notification — DOCUMENT_APPROVED per report employee, one commit for all
+    try:
+        from app.services.notification import notify_status_change_many, get_user_display_name
+        from app.models.notification import NotificationType
+        emp_result = await db.execute(
+            select(Employee.id, Employee.user_id).where(
+                Employee.id.in_({r.employee_id for r in approved})
+            )
         )
-        results.append(report)
-    return results
+        emp_users = dict(emp_result.all())
+        targets = [
+            (emp_users[r.employee_id], r.id, r.report_date.strftime("%d/%m/%Y") if r.report_date else "")
+            for r in approved
+            if emp_users.get(r.employee_id) and emp_users[r.employee_id] != approver_id
+        ]
+        if targets:
+            await notify_status_change_many(
+                db, org_id=org_id, targets=targets,
+                notification_type=NotificationType.DOCUMENT_APPROVED,
+                entity_type="DailyReport", doc_type_thai="รายงานประจำวัน", link="/common-act",
+                actor_id=approver_id, actor_name=await get_user_display_name(db, approver_id),
+            )
+    except Exception:
+        import logging
+        logging.getLogger(__name__).warning("Notification failed for daily report batch approve", exc_info=True)
+
+    return approved, errors
 
 
 # ============================================================
@@ -448,24 +510,7 @@ async def list_daily_reports(
         emp_name = row[1]
         emp_code = row[2]
 
-        items.append({
-            "id": report.id,
-            "employee_id": report.employee_id,
-            "employee_name": emp_name,
-            "employee_code": emp_code,
-            "report_date": report.report_date,
-            "status": report.status,
-            "total_regular_hours": report.total_regular_hours,
-            "total_ot_hours": report.total_ot_hours,
-            "note": report.note,
-            "submitted_at": report.submitted_at,
-            "approved_by": report.approved_by,
-            "approved_at": report.approved_at,
-            "reject_reason": report.reject_reason,
-            "lines": all_lines.get(report.id, []),
-            "created_at": report.created_at,
-            "updated_at": report.updated_at,
-        })
+        items.append(_report_to_dict(report, emp_name, emp_code, all_lines.get(report.id, [])))
 
     return items, total
 
@@ -495,12 +540,48 @@ async def get_daily_report(
 
     report = row[0]
     lines = await _load_report_lines(db, report.id)
+    return _report_to_dict(report, row[1], row[2], lines)
+
+
+async def get_daily_reports(
+    db: AsyncSession,
+    report_ids: list[UUID],
+    *,
+    org_id: UUID,
+) -> list[dict]:
+    """Get several reports with joins in 2 queries (request order, missing ids skipped)."""
+    if not report_ids:
+        return []
+    result = await db.execute(
+        select(
+            DailyWorkReport,
+            Employee.full_name.label("employee_name"),
+            Employee.employee_code.label("employee_code"),
+        )
+        .join(Employee, DailyWorkReport.employee_id == Employee.id)
+        .where(DailyWorkReport.id.in_(report_ids), DailyWorkReport.org_id == org_id)
+    )
+    rows = {row[0].id: row for row in result.all()}
+    all_lines = await _batch_load_report_lines(db, list(rows))
+    return [
+        _report_to_dict(rows[rid][0], rows[rid][1], rows[rid][2], all_lines.get(rid, []))
+        for rid in dict.fromkeys(report_ids)
+        if rid in rows
+    ]
 
+
+# ============================================================
+# INTERNAL HELPERS
+# ============================================================
+
+def _report_to_dict(
+    report: DailyWorkReport, employee_name: Optional[str], employee_code: Optional[str], lines: list[dict]
+) -> dict:
     return {
         "id": report.id,
         "employee_id": report.employee_id,
-        "employee_name": row[1],
-        "employee_code": row[2],
+        "employee_name": employee_name,
+        "employee_code": employee_code,
         "report_date": report.report_date,
         "status": report.status,
         "total_regular_hours": report.total_regular_hours,
@@ -516,10 +597,6 @@ async def get_daily_report(
     }
 
 
-# ============================================================
-# INTERNAL HELPERS
-# ============================================================
-
 async def _get_report_or_404(db: AsyncSession, report_id: UUID, *, org_id: Optional[UUID] = None) -> DailyWorkReport:
     q = select(DailyWorkReport).where(DailyWorkReport.id == report_id)
     if org_id:
@@ -600,34 +677,17 @@ async def _batch_load_report_lines(
     return grouped
 
 
-async def _auto_record_on_approve(
-    db: AsyncSession,
+def _auto_record_rows(
     report: DailyWorkReport,
+    lines: list[DailyWorkReportLine],
     *,
     org_id: UUID,
-) -> None:
+) -> list[dict]:
     """
-    BR#52: Auto-create Timesheet WO Time Entries from approved report lines.
-    BR#53: Auto-update StandardTimesheet with OT hours.
+    BR#52: Timesheet rows (FINAL) for one approved report — one per (WO, OT type).
+    Regular hours go to the first record of each WO only (OBS-3).
     """
-    # Load lines
-    lines_result = await db.execute(
-        select(DailyWorkReportLine).where(
-            DailyWorkReportLine.report_id == report.id
-        )
-    )
-    lines = lines_result.scalars().all()
-
-    # ── 1. Delete old Timesheet entries from this report (re-approve case) ──
-    await db.execute(
-        delete(Timesheet).where(
-            Timesheet.employee_id == report.employee_id,
-            Timesheet.work_date == report.report_date,
-            Timesheet.note.like(f"DailyReport#{report.id}%"),
-        )
-    )
-
-    # ── 2. Group lines by (work_order_id, ot_type_id) ──
+    # ── Group lines by (work_order_id, ot_type_id) ──
     #   OBS-3 fix: separate Timesheet per OT type to avoid overwrite
     wo_groups: dict[tuple, dict] = {}
     for line in lines:
@@ -648,36 +708,72 @@ async def _auto_record_on_approve(
     for (wo_id, ot_tid), data in wo_groups.items():
         merged.setdefault(wo_id, []).append(data)
 
-    # ── 3. Create Timesheet records per WO ──
     #   If multiple OT types for same WO: regular hours go to first record only
+    rows = []
     for wo_id, group_list in merged.items():
         regular_assigned = False
         for grp in group_list:
-            ts = Timesheet(
-                employee_id=report.employee_id,
-                work_order_id=wo_id,
-                work_date=report.report_date,
-                regular_hours=grp["regular"] if not regular_assigned else Decimal("0"),
-                ot_hours=grp["ot"],
-                ot_type_id=grp["ot_type_id"],
-                status=TimesheetStatus.FINAL,
-                note=f"DailyReport#{report.id}",
-                created_by=report.approved_by,
-                org_id=org_id,
-            )
+            rows.append({
+                "employee_id": report.employee_id,
+                "work_order_id": wo_id,
+                "work_date": report.report_date,
+                "regular_hours": grp["regular"] if not regular_assigned else Decimal("0"),
+                "ot_hours": grp["ot"],
+                "ot_type_id": grp["ot_type_id"],
+                "status": TimesheetStatus.FINAL,
+                "note": f"DailyReport#{report.id}",
+                "daily_report_id": report.id,
+                "created_by": report.approved_by,
+                "org_id": org_id,
+            })
             if grp["regular"] > 0:
                 regular_assigned = True
-            db.add(ts)
+    return rows
 
-    # ── 4. Update StandardTimesheet with OT hours (BR#53) ──
-    std_result = await db.execute(
-        select(StandardTimesheet).where(
-            StandardTimesheet.employee_id == report.employee_id,
-            StandardTimesheet.work_date == report.report_date,
-        )
+
+async def _auto_record_many(
+    db: AsyncSession,
+    reports: list[DailyWorkReport],
+    *,
+    org_id: UUID,
+) -> None:
+    """
+    BR#52: Auto-create Timesheet WO Time Entries from approved report lines.
+    BR#53: Auto-update StandardTimesheet with OT hours.
+
+    Set-based for any number of reports: 1 SELECT (lines), 1 DELETE (prior
+    auto-records, keyed on timesheets.daily_report_id), 1 bulk INSERT, 1
+    executemany UPDATE — caller commits.
+    """
+    report_ids = [r.id for r in reports]
+
+    lines_result = await db.execute(
+        select(DailyWorkReportLine).where(DailyWorkReportLine.report_id.in_(report_ids))
     )
-    std_ts = std_result.scalar_one_or_none()
-    if std_ts:
-        std_ts.ot_hours = report.total_ot_hours
+    lines_by_report: dict[UUID, list[DailyWorkReportLine]] = {}
+    for line in lines_result.scalars().all():
+        lines_by_report.setdefault(line.report_id, []).append(line)
+
+    # ── 1. Replace prior auto-records from these reports (re-approve case) ──
+    await db.execute(delete(Timesheet).where(Timesheet.daily_report_id.in_(report_ids)))
+
+    # ── 2. Timesheets per (WO, OT type) for every report ──
+    rows = [
+        row
+        for report in reports
+        for row in _auto_record_rows(report, lines_by_report.get(report.id, []), org_id=org_id)
+    ]
+    if rows:
+        await db.execute(insert(Timesheet), rows)
 
-    await db.flush()
+    # ── 3. StandardTimesheet OT hours (BR#53) ──
+    std = StandardTimesheet.__table__
+    await db.execute(
+        update(std)
+        .where(std.c.employee_id == bindparam("b_employee_id"), std.c.work_date == bindparam("b_work_date"))
+        .values(ot_hours=bindparam("b_ot_hours")),
+        [
+            {"b_employee_id": r.employee_id, "b_work_date": r.report_date, "b_ot_hours": r.total_ot_hours}
+            for r in reports
+        ],
+    )
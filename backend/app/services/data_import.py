@@ -0,0 +1,669 @@
+"""
+SSS Corp ERP — Bulk Master-data Import
+Phase 15: streaming CSV / XLSX import of products, employees, customers, suppliers
+and opening stock
+
+The file is read row by row (csv.reader / openpyxl read-only) off the event loop,
+IMPORT_CHUNK_ROWS rows at a time. Each chunk is:
+
+  validated  with the same Create schema as the single-record endpoint; codes are
+             resolved against lookups loaded once per run (units, cost centers,
+             departments, locations) and duplicate keys within the file rejected
+  loaded     with one INSERT … SELECT FROM unnest(...) ON CONFLICT DO NOTHING and
+             committed — keys that already exist are skipped, so re-running a file
+             after fixing its rejected rows loads only what is missing
+  posted     (opening stock) under product row locks taken in id order, as
+             create_movement does: one RECEIVE (empty balance) or ADJUST (re-count)
+             movement per row to reach the counted quantity, balances and the
+             low-stock watchlist updated set-based in the same transaction
+
+Rejected rows (row number, column, value, message) are kept on the ImportRun and
+served as a CSV error report. dry_run validates and counts without loading.
+"""
+
+import asyncio
+import csv
+import enum
+import io
+import itertools
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterator, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import stage_invalidation
+from app.models.data_import import ImportRun
+from app.models.inventory import MovementType, Product, ProductType
+from app.schemas.customer import CustomerCreate
+from app.schemas.data_import import EmployeeImportRow, OpeningStockRow
+from app.schemas.inventory import ProductCreate
+from app.schemas.master import SupplierCreate
+from app.services.low_stock import sync_low_stock
+from app.services.stock_reconcile import _FIX_LOCATIONS_SQL
+
+IMPORT_CHUNK_ROWS = 5000
+IMPORT_MAX_ERRORS = 10_000  # rejected rows kept for the report; error_count keeps counting
+IMPORT_ERROR_PREVIEW = 100  # rejected rows returned inline with the run summary
+IMPORT_FILE_TYPES = (".csv", ".xlsx")
+
+
+# ============================================================
+# REGISTRY — one entry per importable file type
+# ============================================================
+# schema: row model (the API's Create schema where one exists)
+# columns: file columns read (header names, case/space-insensitive); others are ignored
+# key: natural key — unique within the file, existing rows are skipped
+# insert: target column → Postgres type of the unnest() array it is loaded from
+# fixed: target column → SQL value for columns the file does not carry
+# tag: cache tag bumped after each loaded chunk
+
+IMPORT_ENTITIES: dict[str, dict] = {
+    "products": {
+        "schema": ProductCreate,
+        "columns": ("sku", "name", "model", "description", "product_type", "unit", "cost", "min_stock"),
+        "key": "sku",
+        "table": "products",
+        "insert": {
+            "sku": "varchar", "name": "varchar", "model": "varchar", "description": "text",
+            "product_type": "product_type_enum", "unit": "varchar", "cost": "numeric",
+            "min_stock": "int",
+        },
+        "fixed": {"on_hand": "0"},
+        "tag": "inventory",
+        "permission": "inventory.product.create",
+        "label": "สินค้า",
+    },
+    "employees": {
+        "schema": EmployeeImportRow,
+        "columns": (
+            "employee_code", "full_name", "position", "pay_type", "hourly_rate", "daily_rate",
+            "monthly_salary", "daily_working_hours", "hire_date", "department_code", "cost_center_code",
+        ),
+        "key": "employee_code",
+        "table": "employees",
+        "insert": {
+            "employee_code": "varchar", "full_name": "varchar", "position": "varchar",
+            "pay_type": "pay_type_enum", "hourly_rate": "numeric", "daily_rate": "numeric",
+            "monthly_salary": "numeric", "daily_working_hours": "numeric", "hire_date": "date",
+            "department_id": "uuid", "cost_center_id": "uuid",
+        },
+        "fixed": {},
+        "tag": "costing",
+        "permission": "hr.employee.create",
+        "label": "พนักงาน",
+    },
+    "customers": {
+        "schema": CustomerCreate,
+        "columns": ("code", "name", "contact_name", "email", "phone", "address", "tax_id"),
+        "key": "code",
+        "table": "customers",
+        "insert": {
+            "code": "varchar", "name": "varchar", "contact_name": "varchar", "email": "varchar",
+            "phone": "varchar", "address": "text", "tax_id": "varchar",
+        },
+        "fixed": {},
+        "tag": "finance",
+        "permission": "customer.customer.create",
+        "label": "ลูกค้า",
+    },
+    "suppliers": {
+        "schema": SupplierCreate,
+        "columns": ("code", "name", "contact_name", "email", "phone", "address", "tax_id"),
+        "key": "code",
+        "table": "suppliers",
+        "insert": {
+            "code": "varchar", "name": "varchar", "contact_name": "varchar", "email": "varchar",
+            "phone": "varchar", "address": "text", "tax_id": "varchar",
+        },
+        "fixed": {},
+        "tag": "finance",
+        "permission": "master.supplier.create",
+        "label": "ผู้ขาย",
+    },
+    "opening_stock": {
+        "schema": OpeningStockRow,
+        "columns": ("sku", "quantity", "unit_cost", "warehouse_code", "location_code"),
+        "key": None,
+        "table": "stock_movements",
+        "insert": {},
+        "fixed": {},
+        "tag": "inventory",
+        "permission": "inventory.movement.create",
+        "label": "ยอดยกมาสินค้า",
+    },
+}
+
+
+def required_columns(entity: str) -> list[str]:
+    spec = IMPORT_ENTITIES[entity]
+    fields = spec["schema"].model_fields
+    return [c for c in spec["columns"] if fields[c].is_required()]
+
+
+def _insert_sql(spec: dict) -> str:
+    """INSERT … SELECT FROM unnest(one array per column) — one statement per chunk."""
+    cols = ", ".join(spec["insert"])
+    arrays = ", ".join(f"CAST(:{c} AS {t}[])" for c, t in spec["insert"].items())
+    fixed_cols = "".join(f", {c}" for c in spec["fixed"])
+    fixed_vals = "".join(f", {v}" for v in spec["fixed"].values())
+    return f"""
+        INSERT INTO {spec["table"]} (id, org_id, is_active, created_at, updated_at, {cols}{fixed_cols})
+        SELECT gen_random_uuid(), :org_id, true, now(), now(), {cols}{fixed_vals}
+        FROM unnest({arrays}) AS v({cols})
+        ON CONFLICT DO NOTHING
+        RETURNING id, {spec["key"]}
+    """
+
+
+# ============================================================
+# FILE READING
+# ============================================================
+
+def _header(value) -> str:
+    return str(value or "").strip().lower().replace(" ", "_")
+
+
+def _cell(value) -> Optional[str]:
+    """Cell → stripped text, None when blank. XLSX cells arrive typed (numbers, dates)."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    value = str(value).strip()
+    return value or None
+
+
+def read_rows(file, file_name: str) -> tuple[list[str], Iterator[tuple[int, dict]]]:
+    """
+    (header, iterator of (row number in the file, {column: text})) — streams, the
+    file is never loaded whole. Row 1 is the header; blank rows are skipped.
+    """
+    name = file_name.lower()
+    if name.endswith(".csv"):
+        reader = csv.reader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+        close = None
+    elif name.endswith(".xlsx"):
+        from openpyxl import load_workbook
+
+        try:
+            workbook = load_workbook(file, read_only=True, data_only=True)
+        except Exception:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Cannot read the .xlsx file",
+            )
+        reader = workbook.worksheets[0].iter_rows(values_only=True)
+        close = workbook.close
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unsupported file type — use {' or '.join(IMPORT_FILE_TYPES)}",
+        )
+
+    try:
+        header = [_header(h) for h in next(reader, None) or ()]
+    except UnicodeDecodeError:
+        raise _not_utf8()
+    if not any(header):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="File is empty — the first row must hold the column names",
+        )
+
+    def rows():
+        try:
+            for number, values in enumerate(reader, start=2):
+                row = {c: _cell(v) for c, v in zip(header, values) if c}
+                if any(v is not None for v in row.values()):
+                    yield number, row
+        finally:
+            if close:
+                close()
+
+    return header, rows()
+
+
+def _next_chunk(rows: Iterator) -> list[tuple[int, dict]]:
+    try:
+        return list(itertools.islice(rows, IMPORT_CHUNK_ROWS))
+    except UnicodeDecodeError:
+        raise _not_utf8()
+
+
+def _not_utf8() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="CSV must be UTF-8 encoded (Excel: save as 'CSV UTF-8')",
+    )
+
+
+# ============================================================
+# LOOKUPS + ROW VALIDATION
+# ============================================================
+
+class ImportLookups:
+    """Code → id maps for one run, loaded once instead of per row. Codes match case-insensitively."""
+
+    def __init__(self):
+        self.units: dict[str, str] = {}  # lower → spelling already in use
+        self.cost_centers: dict[str, UUID] = {}
+        self.departments: dict[str, tuple[UUID, UUID]] = {}  # code → (id, cost_center_id)
+        self.locations: dict[tuple[str, str], UUID] = {}  # (warehouse code, location code) → id
+        self.location_codes: dict[str, list[UUID]] = defaultdict(list)
+
+    @classmethod
+    async def load(cls, db: AsyncSession, org_id: UUID, entity: str) -> "ImportLookups":
+        from app.models.master import CostCenter
+        from app.models.organization import Department
+        from app.models.warehouse import Location, Warehouse
+
+        lk = cls()
+        if entity == "products":
+            result = await db.execute(select(Product.unit).where(Product.org_id == org_id).distinct())
+            lk.units = {u.lower(): u for u in result.scalars()}
+        elif entity == "employees":
+            result = await db.execute(
+                select(CostCenter.code, CostCenter.id)
+                .where(CostCenter.org_id == org_id, CostCenter.is_active == True)
+            )
+            lk.cost_centers = {code.upper(): cc_id for code, cc_id in result.all()}
+            result = await db.execute(
+                select(Department.code, Department.id, Department.cost_center_id)
+                .where(Department.org_id == org_id, Department.is_active == True)
+            )
+            lk.departments = {code.upper(): (d_id, cc_id) for code, d_id, cc_id in result.all()}
+        elif entity == "opening_stock":
+            result = await db.execute(
+                select(Warehouse.code, Location.code, Location.id)
+                .join(Warehouse, Warehouse.id == Location.warehouse_id)
+                .where(Location.org_id == org_id, Location.is_active == True, Warehouse.is_active == True)
+            )
+            for wh_code, loc_code, loc_id in result.all():
+                lk.locations[(wh_code.upper(), loc_code.upper())] = loc_id
+                lk.location_codes[loc_code.upper()].append(loc_id)
+        return lk
+
+    def unit(self, value: str) -> str:
+        return self.units.setdefault(value.lower(), value)
+
+
+def _check_product(record: dict, lk: ImportLookups) -> list[tuple[str, str]]:
+    record["unit"] = lk.unit(record["unit"])
+    # BR#1: MATERIAL cost >= 1.00
+    if record["product_type"] == ProductType.MATERIAL.value and record["cost"] < Decimal("1.00"):
+        return [("cost", "MATERIAL product cost must be >= 1.00 THB")]
+    return []
+
+
+def _check_employee(record: dict, lk: ImportLookups) -> list[tuple[str, str]]:
+    errors = []
+    dept_code = record.pop("department_code")
+    cc_code = record.pop("cost_center_code")
+    record["department_id"] = record["cost_center_id"] = None
+    if dept_code:
+        dept = lk.departments.get(dept_code.upper())
+        if dept is None:
+            errors.append(("department_code", f"Department '{dept_code}' not found"))
+        else:
+            # Department ↔ cost center is 1:1 — default the cost center from it
+            record["department_id"], record["cost_center_id"] = dept
+    if cc_code:
+        cc_id = lk.cost_centers.get(cc_code.upper())
+        if cc_id is None:
+            errors.append(("cost_center_code", f"Cost center '{cc_code}' not found"))
+        else:
+            record["cost_center_id"] = cc_id
+    return errors
+
+
+def _check_opening_stock(record: dict, lk: ImportLookups) -> list[tuple[str, str]]:
+    wh_code = record.pop("warehouse_code")
+    loc_code = record.pop("location_code")
+    record["location_id"] = None
+    if not loc_code:
+        if wh_code:
+            return [("location_code", "location_code is required with warehouse_code")]
+        return []
+    if wh_code:
+        loc_id = lk.locations.get((wh_code.upper(), loc_code.upper()))
+        if loc_id is None:
+            return [("location_code", f"Location '{loc_code}' not found in warehouse '{wh_code}'")]
+    else:
+        matches = lk.location_codes.get(loc_code.upper(), [])
+        if len(matches) != 1:
+            return [("location_code", f"Location '{loc_code}' not found" if not matches else
+                     f"Location '{loc_code}' exists in several warehouses — add warehouse_code")]
+        loc_id = matches[0]
+    record["location_id"] = loc_id
+    return []
+
+
+_ROW_CHECKS = {
+    "products": _check_product,
+    "employees": _check_employee,
+    "opening_stock": _check_opening_stock,
+}
+
+
+def _error(number: int, column: Optional[str], value, message: str) -> dict:
+    return {"row": number, "column": column, "value": value, "message": message}
+
+
+def validate_row(
+    entity: str, number: int, row: dict, lk: ImportLookups, seen: dict,
+) -> tuple[Optional[dict], list[dict]]:
+    """(record ready to load, []) or (None, errors). seen tracks keys across the whole file."""
+    spec = IMPORT_ENTITIES[entity]
+    data = {c: row[c] for c in spec["columns"] if row.get(c) is not None}
+    try:
+        model = spec["schema"].model_validate(data)
+    except ValidationError as exc:
+        errors = []
+        for e in exc.errors():
+            column = str(e["loc"][0]) if e["loc"] else None
+            errors.append(_error(number, column, data.get(column), e["msg"]))
+        return None, errors
+
+    record = {k: v.value if isinstance(v, enum.Enum) else v for k, v in model.model_dump().items()}
+    check = _ROW_CHECKS.get(entity)
+    problems = check(record, lk) if check else []
+    if problems:
+        return None, [_error(number, c, data.get(c), m) for c, m in problems]
+
+    if entity == "opening_stock":
+        key, column = (record["sku"], record["location_id"]), "sku"
+        # A product is counted either per location or as a whole, not both
+        mode = ("mode", record["sku"])
+        if seen.setdefault(mode, record["location_id"] is not None) != (record["location_id"] is not None):
+            return None, [_error(number, "location_code", data.get("location_code"),
+                                 "Mix of rows with and without location for this SKU")]
+    else:
+        column = spec["key"]
+        key = record[column]
+    first = seen.setdefault(key, number)
+    if first != number:
+        return None, [_error(number, column, data.get(column), f"Duplicate in file (first at row {first})")]
+    return record, []
+
+
+# ============================================================
+# LOADING
+# ============================================================
+
+async def _load_master(
+    db: AsyncSession, entity: str, records: list[dict], *, org_id: UUID, dry_run: bool,
+) -> tuple[int, int]:
+    """(loaded, skipped as already existing) for one chunk of valid records."""
+    spec = IMPORT_ENTITIES[entity]
+    key = spec["key"]
+    if not records:
+        return 0, 0
+    if dry_run:
+        # SKU is unique across orgs (DB constraint), the other codes per org
+        scope = "" if entity == "products" else "org_id = :org_id AND "
+        existing = (await db.execute(
+            text(f"SELECT count(*) FROM {spec['table']} WHERE {scope}{key} = ANY(:keys)"),
+            {"org_id": org_id, "keys": [r[key] for r in records]},
+        )).scalar_one()
+        return 0, existing
+
+    params = {"org_id": org_id, **{c: [r[c] for r in records] for c in spec["insert"]}}
+    inserted = (await db.execute(text(_insert_sql(spec)), params)).all()
+    loaded = len(inserted)
+    if entity == "products":
+        # new products start at on_hand=0 — low already when min_stock > 0
+        await sync_low_stock(db, [row.id for row in inserted])
+    stage_invalidation(db, org_id, spec["tag"])
+    await db.commit()
+    return loaded, len(records) - loaded
+
+
+_OPENING_PRODUCTS_SQL = """
+    SELECT id, sku, product_type, cost, on_hand FROM products
+    WHERE org_id = :org_id AND sku = ANY(:skus) AND is_active
+    ORDER BY id
+"""
+
+_OPENING_LOCATIONS_SQL = text("""
+    SELECT product_id, location_id, on_hand FROM stock_by_location
+    WHERE org_id = :org_id AND product_id = ANY(:product_ids)
+""")
+
+_INSERT_MOVEMENTS_SQL = text("""
+    INSERT INTO stock_movements (
+        id, created_at, updated_at, org_id, product_id, movement_type, quantity,
+        unit_cost, reference, note, created_by, location_id, is_reversed
+    )
+    SELECT v.id, now(), now(), :org_id, v.product_id, v.movement_type, v.quantity,
+           v.unit_cost, :reference, :note, :created_by, v.location_id, false
+    FROM unnest(
+        CAST(:ids AS uuid[]), CAST(:product_ids AS uuid[]), CAST(:movement_types AS movement_type_enum[]),
+        CAST(:quantities AS int[]), CAST(:unit_costs AS numeric[]), CAST(:location_ids AS uuid[])
+    ) AS v(id, product_id, movement_type, quantity, unit_cost, location_id)
+""")
+
+# Same `stock_moved` outbox events as inventory.create_movement, one statement per chunk
+_RECORD_MOVED_SQL = text("""
+    INSERT INTO domain_events (org_id, event_id, event_type, aggregate_type, aggregate_id, payload, actor_id)
+    SELECT :org_id, gen_random_uuid(), 'stock_moved', 'Product', v.product_id,
+           jsonb_build_object(
+               'movement_id', v.id, 'movement_type', v.movement_type, 'quantity', v.quantity,
+               'unit_cost', v.unit_cost::text, 'reference', CAST(:reference AS text),
+               'location_id', v.location_id, 'to_location_id', NULL, 'work_order_id', NULL,
+               'cost_center_id', NULL, 'batch_number', NULL, 'sku', v.sku, 'on_hand', v.on_hand
+           ),
+           :created_by
+    FROM unnest(
+        CAST(:ids AS uuid[]), CAST(:product_ids AS uuid[]), CAST(:movement_types AS text[]),
+        CAST(:quantities AS int[]), CAST(:unit_costs AS numeric[]), CAST(:location_ids AS uuid[]),
+        CAST(:skus AS text[]), CAST(:on_hands AS int[])
+    ) WITH ORDINALITY AS v(id, product_id, movement_type, quantity, unit_cost, location_id, sku, on_hand, n)
+    ORDER BY v.n
+""")
+
+_ADD_ON_HAND_SQL = text("""
+    UPDATE products p SET on_hand = p.on_hand + v.delta, updated_at = now()
+    FROM unnest(CAST(:product_ids AS uuid[]), CAST(:deltas AS int[])) AS v(product_id, delta)
+    WHERE p.id = v.product_id AND p.org_id = :org_id
+""")
+
+
+async def _post_opening_stock(
+    db: AsyncSession,
+    records: list[tuple[int, dict]],
+    *,
+    org_id: UUID,
+    created_by: UUID,
+    role: Optional[str],
+    reference: str,
+    note: str,
+    dry_run: bool,
+) -> tuple[int, int, list[dict]]:
+    """
+    Post one chunk of counted balances in one transaction. Returns (posted, skipped as
+    already at the counted quantity, rejected rows).
+    """
+    if not records:
+        return 0, 0, []
+    lock = "" if dry_run else " FOR UPDATE"
+    products = {
+        r.sku: r for r in (await db.execute(
+            text(_OPENING_PRODUCTS_SQL + lock),
+            {"org_id": org_id, "skus": list({rec["sku"] for _, rec in records})},
+        )).all()
+    }
+    at_location = {
+        (r.product_id, r.location_id): r.on_hand for r in (await db.execute(
+            _OPENING_LOCATIONS_SQL,
+            {"org_id": org_id, "product_ids": [p.id for p in products.values()]},
+        )).all()
+    }
+
+    errors, moves, skipped = [], [], 0
+    on_hand = {p.id: p.on_hand for p in products.values()}
+    for number, rec in records:
+        p = products.get(rec["sku"])
+        if p is None:
+            errors.append(_error(number, "sku", rec["sku"], "Product not found"))
+            continue
+        # BR#65: SERVICE products cannot have stock movements
+        if p.product_type == ProductType.SERVICE.value:
+            errors.append(_error(number, "sku", rec["sku"], "Cannot create stock movement for SERVICE products"))
+            continue
+        loc = rec["location_id"]
+        current = at_location.get((p.id, loc), 0) if loc else on_hand[p.id]
+        delta = rec["quantity"] - current
+        if delta == 0:
+            skipped += 1
+            continue
+        movement_type = MovementType.RECEIVE if current == 0 else MovementType.ADJUST
+        # BR#7: ADJUST — Owner only
+        if movement_type == MovementType.ADJUST and role != "owner":
+            errors.append(_error(number, "quantity", str(rec["quantity"]),
+                                 f"Balance is already {current} — re-counting (ADJUST) requires owner role"))
+            continue
+        # BR#5: on_hand >= 0
+        if on_hand[p.id] + delta < 0:
+            errors.append(_error(number, "quantity", str(rec["quantity"]),
+                                 f"Insufficient stock: on_hand={on_hand[p.id]}, adjustment={delta}"))
+            continue
+        on_hand[p.id] += delta
+        moves.append((p, loc, rec, movement_type, delta, on_hand[p.id]))
+
+    if dry_run or not moves:
+        if not dry_run:
+            await db.commit()  # release the product locks
+        return (0 if dry_run else len(moves)), skipped, errors
+
+    movements = {
+        "ids": [uuid.uuid4() for _ in moves],
+        "product_ids": [p.id for p, *_ in moves],
+        "movement_types": [mt.value for _, _, _, mt, _, _ in moves],
+        "quantities": [delta for *_, delta, _ in moves],
+        "unit_costs": [rec["unit_cost"] if rec["unit_cost"] is not None else p.cost for p, _, rec, *_ in moves],
+        "location_ids": [loc for _, loc, *_ in moves],
+    }
+    params = {"org_id": org_id, "created_by": created_by, "reference": reference}
+    await db.execute(_INSERT_MOVEMENTS_SQL, {**params, **movements, "note": note})
+    await db.execute(_RECORD_MOVED_SQL, {
+        **params, **movements,
+        "skus": [p.sku for p, *_ in moves],
+        "on_hands": [after for *_, after in moves],
+    })
+    deltas: dict[UUID, int] = defaultdict(int)
+    for p, _, _, _, delta, _ in moves:
+        deltas[p.id] += delta
+    await db.execute(_ADD_ON_HAND_SQL, {
+        "org_id": org_id, "product_ids": list(deltas), "deltas": list(deltas.values()),
+    })
+    located = [(p.id, loc, rec["quantity"]) for p, loc, rec, *_ in moves if loc]
+    if located:
+        await db.execute(_FIX_LOCATIONS_SQL, {
+            "org_id": org_id,
+            "product_ids": [pid for pid, _, _ in located],
+            "location_ids": [loc for _, loc, _ in located],
+            "expected": [qty for _, _, qty in located],
+        })
+    await sync_low_stock(db, list(deltas))
+    stage_invalidation(db, org_id, "inventory")
+    await db.commit()
+    return len(moves), skipped, errors
+
+
+# ============================================================
+# RUN
+# ============================================================
+
+async def run_import(
+    db: AsyncSession,
+    *,
+    entity: str,
+    file,
+    file_name: str,
+    org_id: UUID,
+    created_by: UUID,
+    role: Optional[str] = None,
+    dry_run: bool = False,
+) -> ImportRun:
+    """
+    Import one file chunk by chunk (each loaded chunk is committed) and record the run.
+    Bad file (type, encoding, missing columns) → 422 before anything is loaded.
+    """
+    spec = IMPORT_ENTITIES[entity]
+    started = time.perf_counter()
+    header, rows = await asyncio.to_thread(read_rows, file, file_name)
+    missing = [c for c in required_columns(entity) if c not in header]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Missing column(s): {', '.join(missing)}",
+        )
+
+    lookups = await ImportLookups.load(db, org_id, entity)
+    run = ImportRun(
+        id=uuid.uuid4(), org_id=org_id, entity=entity, file_name=file_name[:255],
+        dry_run=dry_run, created_by=created_by,
+        total_rows=0, valid_rows=0, loaded_rows=0, skipped_rows=0, error_count=0,
+    )
+    errors: list[dict] = []
+    seen: dict = {}
+    while chunk := await asyncio.to_thread(_next_chunk, rows):
+        valid, rejected = [], []
+        for number, row in chunk:
+            record, row_errors = validate_row(entity, number, row, lookups, seen)
+            if record is None:
+                rejected.extend(row_errors)
+            else:
+                valid.append((number, record))
+
+        if entity == "opening_stock":
+            loaded, skipped, post_errors = await _post_opening_stock(
+                db, valid, org_id=org_id, created_by=created_by, role=role,
+                reference=f"IMPORT-{run.id}", note=f"ยอดยกมา — นำเข้าจาก {file_name}"[:500],
+                dry_run=dry_run,
+            )
+            rejected.extend(post_errors)
+        else:
+            loaded, skipped = await _load_master(
+                db, entity, [rec for _, rec in valid], org_id=org_id, dry_run=dry_run,
+            )
+            post_errors = []
+
+        run.total_rows += len(chunk)
+        run.valid_rows += len(valid) - len(post_errors)
+        run.loaded_rows += loaded
+        run.skipped_rows += skipped
+        run.error_count += len({e["row"] for e in rejected})
+        errors.extend(rejected[:IMPORT_MAX_ERRORS - len(errors)])
+
+    run.errors = sorted(errors, key=lambda e: e["row"])
+    run.duration_ms = round((time.perf_counter() - started) * 1000)
+    db.add(run)
+    await db.commit()
+    await db.refresh(run)
+    return run
+
+
+def error_report_csv(run: ImportRun) -> str:
+    """Rejected rows as CSV (row, column, value, message) — the downloadable report."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["row", "column", "value", "message"])
+    for e in run.errors:
+        writer.writerow([e["row"], e["column"] or "", e["value"] or "", e["message"]])
+    listed = len({e["row"] for e in run.errors})
+    if run.error_count > listed:
+        writer.writerow(["", "", "", f"{run.error_count - listed} more rejected rows not listed"])
+    return out.getvalue()
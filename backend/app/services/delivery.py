@@ -32,6 +32,7 @@ from app.models.sales import (
 )
 from app.models.user import User
 from app.models.warehouse import Location, Warehouse
+from app.services.events import record_event, record_status_change
 from app.services.inventory import create_movement
 
 
@@ -372,6 +373,10 @@ async def cancel_delivery_order(
             detail=f"Can only cancel DRAFT DOs (current: {do.status.value})",
         )
     do.status = DOStatus.CANCELLED
+    await record_status_change(
+        db, org_id=org_id, aggregate_type="DO", aggregate_id=do.id, number=do.do_number,
+        from_status=DOStatus.DRAFT, to_status=do.status,
+    )
     await db.commit()
     return await get_delivery_order(db, do_id, org_id=org_id)
 
@@ -454,6 +459,25 @@ async def ship_delivery_order(
         do.status = DOStatus.SHIPPED
         do.shipped_by = shipped_by
         do.shipped_at = datetime.now(timezone.utc)
+        await record_event(
+            db, org_id=org_id, event_type="shipped", aggregate_type="DO", aggregate_id=do.id,
+            payload={
+                "do_number": do.do_number,
+                "so_id": do.so_id,
+                "customer_id": do.customer_id,
+                "shipped_at": do.shipped_at,
+                "lines": [
+                    {
+                        "line_id": line.id,
+                        "product_id": line.product_id,
+                        "shipped_qty": line.shipped_qty,
+                        "movement_id": line.movement_id,
+                    }
+                    for line in do.lines
+                ],
+            },
+            actor_id=shipped_by,
+        )
         await db.commit()
     except HTTPException:
         await db.rollback()
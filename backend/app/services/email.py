@@ -1,18 +1,32 @@
 """
 SSS Corp ERP — Email Notification Service
 Phase 4.6: Send approval request emails when documents are submitted.
+Phase 15: Transactional outbox — request path only INSERTs into email_outbox;
+          a background worker drains it over one persistent SMTP connection.
 
 Disabled by default (EMAIL_ENABLED=False in config).
-Configure SMTP settings via environment variables to enable.
+Configure SMTP settings via environment variables to enable — both are required.
+
+Outbox lifecycle:
+  PENDING → SENDING (claimed, FOR UPDATE SKIP LOCKED) → SENT
+                                                    └→ PENDING (retry, exponential backoff)
+                                                    └→ DEAD   (5xx reply or attempts exhausted)
 """
 
 import asyncio
 import logging
+import random
 import smtplib
+from datetime import datetime, timedelta, timezone
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from uuid import UUID
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.models.email import EmailOutbox, EmailStatus
 
 logger = logging.getLogger(__name__)
 
@@ -50,30 +64,68 @@ APPROVAL_EMAIL_TEMPLATE = """\
 """
 
 
-async def send_approval_request(
+# ============================================================
+# ENQUEUE (request path — no network I/O)
+# ============================================================
+
+def email_enabled() -> bool:
+    """
+    Email is on when EMAIL_ENABLED and an SMTP host is configured — the same test
+    gates enqueueing and the outbox worker, so nothing is queued that no worker
+    would deliver. EMAIL_WORKER_ENABLED only picks which processes run the worker.
+    """
+    settings = get_settings()
+    return settings.EMAIL_ENABLED and bool(settings.SMTP_HOST)
+
+
+def enqueue_email(
+    db: AsyncSession,
     *,
+    org_id: UUID,
     to_email: str,
-    approver_name: str,
-    document_type: str,
-    document_number: str,
-    requester_name: str,
-    detail_url: str,
-) -> bool:
+    subject: str,
+    html_body: str,
+    entity_type: str | None = None,
+    entity_id: UUID | None = None,
+) -> EmailOutbox | None:
     """
-    Send an approval request email.
-    Returns True if sent successfully, False otherwise.
-    Silently returns False if email is disabled.
+    Add an email to the outbox. Rides on the caller's transaction (no commit) —
+    the email exists if and only if the business change commits.
+    Returns None if email is disabled or there is no recipient.
     """
-    settings = get_settings()
+    if not email_enabled():
+        logger.debug("Email disabled — skipping '%s'", subject)
+        return None
+    if not to_email:
+        return None
 
-    if not settings.EMAIL_ENABLED:
-        logger.debug("Email disabled — skipping approval request for %s", document_number)
-        return False
+    row = EmailOutbox(
+        org_id=org_id,
+        to_email=to_email,
+        subject=subject,
+        html_body=html_body,
+        status=EmailStatus.PENDING,
+        entity_type=entity_type,
+        entity_id=entity_id,
+    )
+    db.add(row)
+    return row
 
-    if not settings.SMTP_HOST or not to_email:
-        logger.warning("SMTP not configured or no recipient — skipping email")
-        return False
 
+def enqueue_approval_request(
+    db: AsyncSession,
+    *,
+    org_id: UUID,
+    to_email: str,
+    approver_name: str,
+    document_type: str,
+    document_number: str,
+    requester_name: str,
+    detail_url: str,
+    entity_type: str | None = None,
+    entity_id: UUID | None = None,
+) -> EmailOutbox | None:
+    """Queue an approval request email (see APPROVAL_EMAIL_TEMPLATE)."""
     subject = f"[SSS Corp ERP] {document_type} รออนุมัติ: {document_number}"
     html_body = APPROVAL_EMAIL_TEMPLATE.format(
         approver_name=approver_name,
@@ -82,31 +134,240 @@ async def send_approval_request(
         requester_name=requester_name,
         detail_url=detail_url,
     )
+    return enqueue_email(
+        db,
+        org_id=org_id,
+        to_email=to_email,
+        subject=subject,
+        html_body=html_body,
+        entity_type=entity_type,
+        entity_id=entity_id,
+    )
+
+
+# ============================================================
+# SMTP SENDER (persistent connection)
+# ============================================================
+
+class PermanentEmailError(Exception):
+    """SMTP rejected the message with a 5xx reply — retrying will not help."""
+
+
+class SMTPSender:
+    """
+    One SMTP session reused across messages (EHLO/STARTTLS/AUTH once per connection).
+    Blocking — call from a worker thread (asyncio.to_thread).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        username: str = "",
+        password: str = "",
+        starttls: bool | None = None,
+        timeout: float = 10,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = (port == 587) if starttls is None else starttls
+        self.timeout = timeout
+        self._server: smtplib.SMTP | None = None
+        self.connections_opened = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        server.ehlo()
+        if self.starttls:
+            server.starttls()
+            server.ehlo()
+        if self.username and self.password:
+            server.login(self.username, self.password)
+        self.connections_opened += 1
+        return server
+
+    def _ensure_connected(self) -> smtplib.SMTP:
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except smtplib.SMTPException:
+                pass
+            self.close()
+        self._server = self._connect()
+        return self._server
+
+    def send(self, from_addr: str, to_addr: str, message: str) -> None:
+        """Send one message; reconnects once if the server dropped the session."""
+        try:
+            try:
+                self._ensure_connected().sendmail(from_addr, [to_addr], message)
+            except smtplib.SMTPServerDisconnected:
+                self.close()
+                self._ensure_connected().sendmail(from_addr, [to_addr], message)
+        except smtplib.SMTPRecipientsRefused as e:
+            raise PermanentEmailError(str(e.recipients)) from e
+        except smtplib.SMTPResponseException as e:
+            if e.smtp_code >= 500:
+                raise PermanentEmailError(f"{e.smtp_code} {e.smtp_error!r}") from e
+            raise
+
+    def close(self) -> None:
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+
+def build_smtp_sender() -> SMTPSender:
+    settings = get_settings()
+    return SMTPSender(
+        settings.SMTP_HOST,
+        settings.SMTP_PORT,
+        username=settings.SMTP_USER,
+        password=settings.SMTP_PASSWORD,
+    )
+
 
+def _build_mime(from_addr: str, to_addr: str, subject: str, html_body: str) -> str:
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
-    msg["From"] = settings.EMAIL_FROM
-    msg["To"] = to_email
+    msg["From"] = from_addr
+    msg["To"] = to_addr
     msg.attach(MIMEText(html_body, "html", "utf-8"))
+    return msg.as_string()
 
-    def _send_sync():
-        """Blocking SMTP send — executed in thread pool to avoid blocking event loop."""
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=10) as server:
-            server.ehlo()
-            if settings.SMTP_PORT == 587:
-                server.starttls()
-                server.ehlo()
-            if settings.SMTP_USER and settings.SMTP_PASSWORD:
-                server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            server.sendmail(settings.EMAIL_FROM, [to_email], msg.as_string())
 
+# ============================================================
+# OUTBOX WORKER
+# ============================================================
+
+def _backoff(attempts: int) -> timedelta:
+    """Exponential backoff with jitter: ~30s, 1m, 2m, 4m ... capped at 1h."""
+    settings = get_settings()
+    base = settings.EMAIL_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    seconds = min(base, 3600) * random.uniform(0.8, 1.2)
+    return timedelta(seconds=seconds)
+
+
+async def process_email_outbox(
+    db: AsyncSession,
+    sender: SMTPSender,
+    *,
+    batch_size: int | None = None,
+) -> int:
+    """
+    Claim one batch of due emails, send them over `sender`, record the outcome.
+    Returns the number of rows processed (0 = outbox idle).
+    """
+    settings = get_settings()
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    now = datetime.now(timezone.utc)
+    stale_before = now - timedelta(seconds=settings.EMAIL_SENDING_TIMEOUT_SECONDS)
+
+    # 1. Claim — SENDING rows older than the timeout belong to a crashed worker
+    result = await db.execute(
+        select(EmailOutbox)
+        .where(
+            or_(
+                (EmailOutbox.status == EmailStatus.PENDING)
+                & (EmailOutbox.next_attempt_at <= now),
+                (EmailOutbox.status == EmailStatus.SENDING)
+                & (EmailOutbox.locked_at < stale_before),
+            )
+        )
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    rows = list(result.scalars().all())
+    if not rows:
+        return 0
+    for row in rows:
+        row.status = EmailStatus.SENDING
+        row.locked_at = now
+        row.attempts += 1
+    await db.commit()
+
+    # 2. Send the whole batch in one thread hop over one SMTP session
+    jobs = [
+        (row.id, row.to_email, _build_mime(settings.EMAIL_FROM, row.to_email, row.subject, row.html_body))
+        for row in rows
+    ]
+
+    def _send_batch() -> dict:
+        outcome = {}
+        for row_id, to_addr, message in jobs:
+            try:
+                sender.send(settings.EMAIL_FROM, to_addr, message)
+                outcome[row_id] = None
+            except Exception as e:  # noqa: BLE001 — recorded per row
+                outcome[row_id] = e
+        return outcome
+
+    outcome = await asyncio.to_thread(_send_batch)
+
+    # 3. Record results
+    done_at = datetime.now(timezone.utc)
+    for row in rows:
+        error = outcome.get(row.id)
+        row.locked_at = None
+        if error is None:
+            row.status = EmailStatus.SENT
+            row.sent_at = done_at
+            row.last_error = None
+        elif isinstance(error, PermanentEmailError) or row.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+            row.status = EmailStatus.DEAD
+            row.last_error = str(error)[:2000]
+            logger.error("Email to %s dead-lettered after %d attempt(s): %s", row.to_email, row.attempts, error)
+        else:
+            row.status = EmailStatus.PENDING
+            row.next_attempt_at = done_at + _backoff(row.attempts)
+            row.last_error = str(error)[:2000]
+            logger.warning("Email to %s failed (attempt %d), will retry: %s", row.to_email, row.attempts, error)
+    await db.commit()
+    return len(rows)
+
+
+async def run_email_outbox_worker(stop: asyncio.Event) -> None:
+    """
+    Background loop (started from main.lifespan when email_enabled() and EMAIL_WORKER_ENABLED).
+    Drains back-to-back while there is work, sleeps EMAIL_OUTBOX_POLL_SECONDS when idle.
+    """
+    from app.core.database import background_session
+
+    settings = get_settings()
+    sender = build_smtp_sender()
+    logger.info("Email outbox worker started (%s:%s)", settings.SMTP_HOST, settings.SMTP_PORT)
+    loop = asyncio.get_running_loop()
+    last_sent = loop.time()
     try:
-        await asyncio.to_thread(_send_sync)
-        logger.info("Approval email sent to %s for %s %s", to_email, document_type, document_number)
-        return True
-    except Exception:
-        logger.exception("Failed to send approval email to %s", to_email)
-        return False
+        while not stop.is_set():
+            processed = 0
+            try:
+                async with background_session() as db:
+                    processed = await process_email_outbox(db, sender)
+            except Exception:
+                logger.warning("Email outbox batch failed", exc_info=True)
+                await asyncio.to_thread(sender.close)
+            if processed:
+                last_sent = loop.time()
+                continue
+            # Long idle: drop the SMTP session rather than let the server time it out
+            if loop.time() - last_sent > settings.EMAIL_SMTP_IDLE_SECONDS:
+                await asyncio.to_thread(sender.close)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.EMAIL_OUTBOX_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        await asyncio.to_thread(sender.close)
+        logger.info("Email outbox worker stopped")
 
 
 def build_detail_url(document_type: str, document_id: str) -> str:
@@ -0,0 +1,266 @@
+"""
+SSS Corp ERP — Domain Event Outbox + Redis Stream Relay
+Phase 15: domain_events
+
+Write path: the key service functions (stock movement, goods receipt, shipment,
+AR/AP payment, payroll execution, document status changes) await record_event()
+before their commit — the event exists if and only if the business change commits.
+
+Relay: run_event_relay() drains unpublished events in id order onto one Redis
+stream per org (events:{org_id}) and stamps them with a publish-order `offset`.
+  - ordering per aggregate: writers of one aggregate hold its row lock until
+    commit, so their events' ids are in commit order; a single relay at a time
+    (advisory lock) publishes in id order
+  - at-least-once: a relay that fails between XADD and its commit leaves the
+    batch unpublished and sends it again — consumers dedupe on event_id
+  - replay: XREAD / XRANGE from a stream id, or GET /api/admin/events?after=<offset>
+    (published events, kept EVENT_RETENTION_DAYS) once the stream has been trimmed
+
+Stream entry fields (all strings): offset, event_id, event_type, aggregate_type,
+aggregate_id, actor_id, occurred_at, payload (JSON).
+"""
+
+import asyncio
+import logging
+from typing import Any
+from uuid import UUID
+
+import orjson
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.responses import dumps
+from app.models.event import DomainEvent
+
+logger = logging.getLogger(__name__)
+
+EVENT_STREAM_PREFIX = "events:"
+# pg_try_advisory_xact_lock key — one publishing relay across all replicas
+_RELAY_LOCK_KEY = 0x455654  # "EVT"
+
+
+def stream_key(org_id: UUID | str) -> str:
+    return f"{EVENT_STREAM_PREFIX}{org_id}"
+
+
+# ============================================================
+# RECORD (request path — caller's transaction, no I/O)
+# ============================================================
+
+async def record_event(
+    db: AsyncSession,
+    *,
+    org_id: UUID,
+    event_type: str,
+    aggregate_type: str,
+    aggregate_id: UUID,
+    payload: dict[str, Any] | None = None,
+    actor_id: UUID | None = None,
+) -> DomainEvent:
+    """
+    Add a domain event to the outbox. Rides on the caller's transaction (no commit).
+    Flushes the caller's pending changes first, so the aggregate's row lock is held
+    before the event takes its id. Payload values may be Decimal / UUID / date / enum.
+    """
+    await db.flush()
+    event = DomainEvent(
+        org_id=org_id,
+        event_type=event_type,
+        aggregate_type=aggregate_type,
+        aggregate_id=aggregate_id,
+        payload=orjson.loads(dumps(payload or {})),
+        actor_id=actor_id,
+    )
+    db.add(event)
+    return event
+
+
+async def record_status_change(
+    db: AsyncSession,
+    *,
+    org_id: UUID,
+    aggregate_type: str,
+    aggregate_id: UUID,
+    number: str,
+    from_status: Any,
+    to_status: Any,
+    actor_id: UUID | None = None,
+    **extra: Any,
+) -> DomainEvent:
+    """`status_changed` event for a document (PR, PO, SO, DO, WO, AR, Invoice)."""
+    return await record_event(
+        db,
+        org_id=org_id,
+        event_type="status_changed",
+        aggregate_type=aggregate_type,
+        aggregate_id=aggregate_id,
+        payload={
+            "number": number,
+            "from": getattr(from_status, "value", from_status),
+            "to": getattr(to_status, "value", to_status),
+            **extra,
+        },
+        actor_id=actor_id,
+    )
+
+
+# ============================================================
+# RELAY
+# ============================================================
+
+_CLAIM_SQL = text("""
+    SELECT id, org_id, event_id, event_type, aggregate_type, aggregate_id,
+           payload::text AS payload, actor_id, occurred_at
+    FROM domain_events
+    WHERE published_at IS NULL
+    ORDER BY id
+    LIMIT :batch_size
+    FOR UPDATE
+""")
+
+_NEXT_OFFSETS_SQL = text("""
+    SELECT nextval('domain_event_offset_seq') AS "offset"
+    FROM generate_series(1, :n)
+    ORDER BY 1
+""")
+
+_MARK_PUBLISHED_SQL = text("""
+    UPDATE domain_events d
+    SET "offset" = p."offset", stream_id = p.stream_id, published_at = now()
+    FROM unnest(CAST(:ids AS bigint[]), CAST(:offsets AS bigint[]), CAST(:stream_ids AS text[]))
+         AS p(id, "offset", stream_id)
+    WHERE d.id = p.id
+""")
+
+
+def _stream_fields(row, offset: int) -> dict[str, str]:
+    return {
+        "offset": str(offset),
+        "event_id": str(row.event_id),
+        "event_type": row.event_type,
+        "aggregate_type": row.aggregate_type,
+        "aggregate_id": str(row.aggregate_id),
+        "actor_id": str(row.actor_id) if row.actor_id else "",
+        "occurred_at": row.occurred_at.isoformat(),
+        "payload": row.payload,
+    }
+
+
+async def publish_domain_events(db: AsyncSession, *, batch_size: int | None = None) -> int:
+    """
+    Publish one batch of unpublished events (XADD, one pipeline round trip) and
+    stamp them with offsets in the same transaction.
+    Returns the number published — 0 when idle or another relay holds the lock.
+    Raises (and publishes nothing as far as the outbox is concerned) when Redis fails.
+    """
+    from app.core.redis import get_redis_manager
+
+    settings = get_settings()
+    batch_size = batch_size or settings.EVENT_RELAY_BATCH_SIZE
+
+    locked = (await db.execute(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _RELAY_LOCK_KEY}
+    )).scalar()
+    if not locked:
+        await db.rollback()
+        return 0
+    rows = (await db.execute(_CLAIM_SQL, {"batch_size": batch_size})).all()
+    if not rows:
+        await db.rollback()
+        return 0
+    offsets = list((await db.execute(_NEXT_OFFSETS_SQL, {"n": len(rows)})).scalars())
+
+    try:
+        async with get_redis_manager().pipeline() as pipe:
+            for row, offset in zip(rows, offsets):
+                pipe.xadd(
+                    stream_key(row.org_id),
+                    _stream_fields(row, offset),
+                    maxlen=settings.EVENT_STREAM_MAXLEN,
+                    approximate=True,
+                )
+    except Exception:
+        await db.rollback()
+        raise
+
+    stream_ids = [sid.decode() if isinstance(sid, bytes) else str(sid) for sid in pipe.results]
+    await db.execute(_MARK_PUBLISHED_SQL, {
+        "ids": [row.id for row in rows],
+        "offsets": offsets,
+        "stream_ids": stream_ids,
+    })
+    await db.commit()
+    return len(rows)
+
+
+async def run_event_relay(stop: asyncio.Event) -> None:
+    """
+    Background loop (started from main.lifespan when EVENT_RELAY_ENABLED).
+    Drains back-to-back while batches come back full, sleeps EVENT_RELAY_POLL_SECONDS otherwise;
+    while Redis is down events simply accumulate in the outbox.
+    """
+    from app.core.database import background_session
+
+    settings = get_settings()
+    logger.info("Domain event relay started (batch=%d)", settings.EVENT_RELAY_BATCH_SIZE)
+    try:
+        while not stop.is_set():
+            published = 0
+            try:
+                async with background_session() as db:
+                    published = await publish_domain_events(db)
+            except Exception:
+                logger.warning("Domain event relay batch failed", exc_info=True)
+            if published >= settings.EVENT_RELAY_BATCH_SIZE:
+                continue
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.EVENT_RELAY_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        logger.info("Domain event relay stopped")
+
+
+# ============================================================
+# REPLAY + RETENTION
+# ============================================================
+
+async def list_events(
+    db: AsyncSession,
+    *,
+    org_id: UUID,
+    after: int = 0,
+    limit: int = 500,
+    aggregate_type: str | None = None,
+    event_type: str | None = None,
+) -> list[DomainEvent]:
+    """Published events with offset > after, in offset order (ix_domain_events_org_offset)."""
+    query = (
+        select(DomainEvent)
+        .where(DomainEvent.org_id == org_id, DomainEvent.offset > after)
+        .order_by(DomainEvent.offset)
+        .limit(limit)
+    )
+    if aggregate_type:
+        query = query.where(DomainEvent.aggregate_type == aggregate_type)
+    if event_type:
+        query = query.where(DomainEvent.event_type == event_type)
+    return list((await db.execute(query)).scalars().all())
+
+
+async def prune_domain_events(db: AsyncSession) -> int:
+    """Delete published events older than EVENT_RETENTION_DAYS (0 = keep forever)."""
+    days = get_settings().EVENT_RETENTION_DAYS
+    if days <= 0:
+        return 0
+    result = await db.execute(
+        text("""
+            DELETE FROM domain_events
+            WHERE published_at IS NOT NULL
+              AND published_at < now() - make_interval(days => :days)
+        """),
+        {"days": days},
+    )
+    await db.commit()
+    return result.rowcount
@@ -15,10 +15,10 @@ Provides:
 
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import NamedTuple, Optional
 from uuid import UUID
 
-from sqlalchemy import case, func, select, text
+from sqlalchemy import Date, case, func, literal, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.ar import CustomerInvoice, CustomerInvoicePayment, CustomerInvoiceStatus
@@ -76,6 +76,7 @@ async def get_finance_dashboard(
     *,
     org_id: UUID,
     months: int = 6,
+    as_of: Optional[date] = None,
 ) -> dict:
     """
     Aggregate financial data for the Finance Dashboard.
@@ -86,8 +87,15 @@ async def get_finance_dashboard(
       monthly_cashflow,
       top_customers, top_suppliers,
       cost_centers
+
+    as_of (default today) is the reference date for aging, overdue and top-N.
     """
     today = date.today()
+    as_of = as_of or today
+
+    # Open items — aging, overdue and per-party totals in one query per side
+    ar_open = await compute_open_items(db, side="ar", org_id=org_id, as_of=as_of)
+    ap_open = await compute_open_items(db, side="ap", org_id=org_id, as_of=as_of)
 
     # ── 1. Revenue Summary (Customer Invoices / AR) ─────────
     ar_active_statuses = [
@@ -111,31 +119,12 @@ async def get_finance_dashboard(
     ar_invoiced = Decimal(str(ar_row.total_invoiced))
     ar_collected = Decimal(str(ar_row.total_collected))
 
-    # AR overdue
-    ar_overdue_q = (
-        select(
-            func.count().label("cnt"),
-            func.coalesce(
-                func.sum(CustomerInvoice.total_amount - CustomerInvoice.received_amount), 0
-            ).label("amount"),
-        )
-        .where(
-            CustomerInvoice.org_id == org_id,
-            CustomerInvoice.is_active == True,  # noqa: E712
-            CustomerInvoice.status == CustomerInvoiceStatus.APPROVED,
-            CustomerInvoice.due_date < today,
-            CustomerInvoice.received_amount < CustomerInvoice.total_amount,
-        )
-    )
-    ar_overdue_result = await db.execute(ar_overdue_q)
-    ar_overdue = ar_overdue_result.one()
-
     revenue = {
         "total_invoiced": _float_or_zero(ar_invoiced),
         "total_collected": _float_or_zero(ar_collected),
         "outstanding": _float_or_zero(ar_invoiced - ar_collected),
-        "overdue_count": ar_overdue.cnt or 0,
-        "overdue_amount": _float_or_zero(ar_overdue.amount),
+        "overdue_count": ar_open["overdue_count"],
+        "overdue_amount": ar_open["overdue_amount"],
     }
 
     # ── 2. Expenses Summary (Supplier Invoices / AP) ────────
@@ -160,67 +149,26 @@ async def get_finance_dashboard(
     ap_invoiced = Decimal(str(ap_row.total_invoiced))
     ap_paid = Decimal(str(ap_row.total_paid))
 
-    # AP overdue
-    ap_overdue_q = (
-        select(
-            func.count().label("cnt"),
-            func.coalesce(
-                func.sum(SupplierInvoice.net_payment - SupplierInvoice.paid_amount), 0
-            ).label("amount"),
-        )
-        .where(
-            SupplierInvoice.org_id == org_id,
-            SupplierInvoice.is_active == True,  # noqa: E712
-            SupplierInvoice.status == InvoiceStatus.APPROVED,
-            SupplierInvoice.due_date < today,
-            SupplierInvoice.paid_amount < SupplierInvoice.net_payment,
-        )
-    )
-    ap_overdue_result = await db.execute(ap_overdue_q)
-    ap_overdue = ap_overdue_result.one()
-
     expenses = {
         "total_invoiced": _float_or_zero(ap_invoiced),
         "total_paid": _float_or_zero(ap_paid),
         "outstanding": _float_or_zero(ap_invoiced - ap_paid),
-        "overdue_count": ap_overdue.cnt or 0,
-        "overdue_amount": _float_or_zero(ap_overdue.amount),
+        "overdue_count": ap_open["overdue_count"],
+        "overdue_amount": ap_open["overdue_amount"],
     }
 
     net_position = _float_or_zero(ar_collected - ap_paid)
 
-    # ── 3. AP Aging (APPROVED invoices with outstanding balance) ──
-    ap_aging = await _compute_aging(
-        db,
-        model=SupplierInvoice,
-        amount_col=SupplierInvoice.net_payment,
-        paid_col=SupplierInvoice.paid_amount,
-        status_col=SupplierInvoice.status,
-        status_value=InvoiceStatus.APPROVED,
-        org_id=org_id,
-        today=today,
-    )
-
-    # ── 4. AR Aging (APPROVED invoices with outstanding balance) ──
-    ar_aging = await _compute_aging(
-        db,
-        model=CustomerInvoice,
-        amount_col=CustomerInvoice.total_amount,
-        paid_col=CustomerInvoice.received_amount,
-        status_col=CustomerInvoice.status,
-        status_value=CustomerInvoiceStatus.APPROVED,
-        org_id=org_id,
-        today=today,
-    )
+    # ── 3/4. AP + AR Aging (open items) ──────────────────────
+    ap_aging = ap_open["aging"]
+    ar_aging = ar_open["aging"]
 
     # ── 5. Monthly Cash Flow (last N months) ─────────────────
     monthly_cashflow = await _compute_monthly_cashflow(db, org_id=org_id, months=months, today=today)
 
-    # ── 6. Top 5 Outstanding Customers ───────────────────────
-    top_customers = await _top_outstanding_customers(db, org_id=org_id)
-
-    # ── 7. Top 5 Outstanding Suppliers ───────────────────────
-    top_suppliers = await _top_outstanding_suppliers(db, org_id=org_id)
+    # ── 6/7. Top 5 Outstanding Customers / Suppliers ─────────
+    top_customers = await _top_outstanding(db, side="ar", open_items=ar_open, org_id=org_id)
+    top_suppliers = await _top_outstanding(db, side="ap", open_items=ap_open, org_id=org_id)
 
     # ── 8. Cost Center Summary ───────────────────────────────
     try:
@@ -251,63 +199,163 @@ async def get_finance_dashboard(
     }
 
 
-# ── Aging Calculation Helper ─────────────────────────────────
+# ── Open-item Aging Engine (Phase 15) ────────────────────────
+
+AGING_BRACKETS = ["current", "1-30", "31-60", "61-90", "90+"]
+
 
-async def _compute_aging(
+class _OpenItemSide(NamedTuple):
+    model: type
+    party_col: object
+    party_model: type
+    amount_col: object
+    payment_model: type
+    open_status: object
+    settled_status: object
+
+
+def _open_item_side(side: str) -> _OpenItemSide:
+    if side == "ar":
+        return _OpenItemSide(
+            CustomerInvoice, CustomerInvoice.customer_id, Customer, CustomerInvoice.total_amount,
+            CustomerInvoicePayment, CustomerInvoiceStatus.APPROVED, CustomerInvoiceStatus.PAID,
+        )
+    if side == "ap":
+        return _OpenItemSide(
+            SupplierInvoice, SupplierInvoice.supplier_id, Supplier, SupplierInvoice.net_payment,
+            InvoicePayment, InvoiceStatus.APPROVED, InvoiceStatus.PAID,
+        )
+    raise ValueError(f"Unknown open-item side: {side}")
+
+
+def _open_items_select(spec: _OpenItemSide, *, org_id: UUID, as_of: date, today: date):
+    """
+    Open items as (party_id, due_date, amount) rows.
+
+    Up to today this reads the ix_*_open_items partial index directly. For a past
+    as_of date, payments dated after as_of are added back and invoices issued
+    after it are left out, so settled invoices reappear with their old balance.
+    """
+    m = spec.model
+    if as_of >= today:
+        return select(
+            spec.party_col.label("party_id"),
+            m.due_date.label("due_date"),
+            m.outstanding_amount.label("amount"),
+        ).where(
+            m.org_id == org_id,
+            m.status == spec.open_status,
+            m.is_active == True,  # noqa: E712
+            m.outstanding_amount > 0,
+        )
+
+    pay = spec.payment_model
+    settled = pay.amount + pay.wht_deducted if hasattr(pay, "wht_deducted") else pay.amount
+    later = (
+        select(pay.invoice_id.label("invoice_id"), func.sum(settled).label("paid"))
+        .where(pay.org_id == org_id, pay.payment_date > as_of)
+        .group_by(pay.invoice_id)
+        .subquery()
+    )
+    amount = m.outstanding_amount + func.coalesce(later.c.paid, 0)
+    return (
+        select(
+            spec.party_col.label("party_id"),
+            m.due_date.label("due_date"),
+            amount.label("amount"),
+        )
+        .outerjoin(later, later.c.invoice_id == m.id)
+        .where(
+            m.org_id == org_id,
+            m.status.in_([spec.open_status, spec.settled_status]),
+            m.is_active == True,  # noqa: E712
+            m.invoice_date <= as_of,
+            amount > 0,
+        )
+    )
+
+
+async def compute_open_items(
     db: AsyncSession,
     *,
-    model,
-    amount_col,
-    paid_col,
-    status_col,
-    status_value,
+    side: str,
     org_id: UUID,
-    today: date,
-) -> list[dict]:
+    as_of: Optional[date] = None,
+) -> dict:
     """
-    Compute aging brackets for outstanding invoices.
-    Brackets: current (not due), 1-30, 31-60, 61-90, 90+ overdue days.
+    Bucketed aging + per-party totals for AR ("ar") or AP ("ap") open items.
+
+    One GROUPING SETS query returns both the bracket rows and the party rows;
+    brackets are current (not due), 1-30, 31-60, 61-90, 90+ days overdue at as_of.
     """
-    days_overdue = func.greatest(func.date(text("CURRENT_DATE")) - func.date(model.due_date), 0)
+    today = date.today()
+    as_of = as_of or today
+    spec = _open_item_side(side)
 
+    items = _open_items_select(spec, org_id=org_id, as_of=as_of, today=today).subquery()
+    ref = literal(as_of, Date)
+    days_overdue = ref - items.c.due_date
     bracket_expr = case(
-        (model.due_date >= today, "current"),
+        (items.c.due_date >= ref, "current"),
         (days_overdue <= 30, "1-30"),
         (days_overdue <= 60, "31-60"),
         (days_overdue <= 90, "61-90"),
         else_="90+",
     )
-
-    outstanding_expr = amount_col - paid_col
+    x = select(
+        bracket_expr.label("bracket"), items.c.party_id, items.c.amount,
+    ).subquery()
 
     q = (
         select(
-            bracket_expr.label("bracket"),
+            x.c.bracket,
+            x.c.party_id,
             func.count().label("count"),
-            func.coalesce(func.sum(outstanding_expr), 0).label("amount"),
-        )
-        .where(
-            model.org_id == org_id,
-            model.is_active == True,  # noqa: E712
-            status_col == status_value,
-            paid_col < amount_col,  # has outstanding balance
+            func.coalesce(func.sum(x.c.amount), 0).label("amount"),
+            func.grouping(x.c.party_id).label("by_bracket"),
         )
-        .group_by(bracket_expr)
+        .group_by(func.grouping_sets(tuple_(x.c.bracket), tuple_(x.c.party_id)))
     )
-
     result = await db.execute(q)
-    rows = {r.bracket: {"count": r.count, "amount": _float_or_zero(r.amount)} for r in result}
+
+    brackets: dict[str, dict] = {}
+    parties: list[dict] = []
+    for r in result:
+        if r.by_bracket:
+            brackets[r.bracket] = {"count": r.count, "amount": Decimal(str(r.amount))}
+        else:
+            parties.append({
+                "id": r.party_id, "count": r.count, "outstanding": _float_or_zero(r.amount),
+            })
+    parties.sort(key=lambda p: p["outstanding"], reverse=True)
+
+    if parties:
+        party = spec.party_model
+        names = dict((await db.execute(
+            select(party.id, party.name).where(party.id.in_([p["id"] for p in parties]))
+        )).all())
+        for p in parties:
+            p["name"] = names.get(p["id"])
 
     # Return all brackets in order (even if zero)
-    brackets = ["current", "1-30", "31-60", "61-90", "90+"]
-    return [
-        {
-            "bracket": b,
-            "count": rows.get(b, {}).get("count", 0),
-            "amount": rows.get(b, {}).get("amount", 0.0),
-        }
-        for b in brackets
-    ]
+    empty = {"count": 0, "amount": _zero_dec()}
+    overdue = [brackets.get(b, empty) for b in AGING_BRACKETS if b != "current"]
+    return {
+        "side": side,
+        "as_of": as_of,
+        "aging": [
+            {
+                "bracket": b,
+                "count": brackets.get(b, empty)["count"],
+                "amount": _float_or_zero(brackets.get(b, empty)["amount"]),
+            }
+            for b in AGING_BRACKETS
+        ],
+        "outstanding": _float_or_zero(sum((v["amount"] for v in brackets.values()), _zero_dec())),
+        "overdue_count": sum(v["count"] for v in overdue),
+        "overdue_amount": _float_or_zero(sum((v["amount"] for v in overdue), _zero_dec())),
+        "parties": parties,
+    }
 
 
 # ── Monthly Cash Flow Helper ─────────────────────────────────
@@ -370,89 +418,42 @@ async def _compute_monthly_cashflow(
     return result
 
 
-# ── Top Outstanding Customers ────────────────────────────────
+# ── Top Outstanding Customers / Suppliers ───────────────────
 
-async def _top_outstanding_customers(
+async def _top_outstanding(
     db: AsyncSession,
     *,
+    side: str,
+    open_items: dict,
     org_id: UUID,
     limit: int = 5,
 ) -> list[dict]:
-    """Top N customers with highest outstanding AR balance."""
-    outstanding = (CustomerInvoice.total_amount - CustomerInvoice.received_amount)
-
-    q = (
-        select(
-            Customer.name.label("name"),
-            func.coalesce(func.sum(CustomerInvoice.total_amount), 0).label("total_invoiced"),
-            func.coalesce(func.sum(outstanding), 0).label("outstanding"),
-        )
-        .join(Customer, CustomerInvoice.customer_id == Customer.id)
+    """Top N parties with highest outstanding balance (from compute_open_items)."""
+    top = open_items["parties"][:limit]
+    if not top:
+        return []
+
+    # total_invoiced covers settled invoices too — PK lookups for the N parties only
+    spec = _open_item_side(side)
+    m = spec.model
+    invoiced_q = (
+        select(spec.party_col, func.coalesce(func.sum(spec.amount_col), 0))
         .where(
-            CustomerInvoice.org_id == org_id,
-            CustomerInvoice.is_active == True,  # noqa: E712
-            CustomerInvoice.status.in_([
-                CustomerInvoiceStatus.APPROVED,
-                CustomerInvoiceStatus.PAID,
-            ]),
+            m.org_id == org_id,
+            m.is_active == True,  # noqa: E712
+            m.status.in_([spec.open_status, spec.settled_status]),
+            spec.party_col.in_([p["id"] for p in top]),
         )
-        .group_by(Customer.id, Customer.name)
-        .having(func.sum(outstanding) > 0)
-        .order_by(func.sum(outstanding).desc())
-        .limit(limit)
+        .group_by(spec.party_col)
     )
-
-    result = await db.execute(q)
-    return [
-        {
-            "name": r.name,
-            "total_invoiced": _float_or_zero(r.total_invoiced),
-            "outstanding": _float_or_zero(r.outstanding),
-        }
-        for r in result
-    ]
-
-
-# ── Top Outstanding Suppliers ────────────────────────────────
-
-async def _top_outstanding_suppliers(
-    db: AsyncSession,
-    *,
-    org_id: UUID,
-    limit: int = 5,
-) -> list[dict]:
-    """Top N suppliers with highest outstanding AP balance."""
-    outstanding = (SupplierInvoice.net_payment - SupplierInvoice.paid_amount)
-
-    q = (
-        select(
-            Supplier.name.label("name"),
-            func.coalesce(func.sum(SupplierInvoice.net_payment), 0).label("total_invoiced"),
-            func.coalesce(func.sum(outstanding), 0).label("outstanding"),
-        )
-        .join(Supplier, SupplierInvoice.supplier_id == Supplier.id)
-        .where(
-            SupplierInvoice.org_id == org_id,
-            SupplierInvoice.is_active == True,  # noqa: E712
-            SupplierInvoice.status.in_([
-                InvoiceStatus.APPROVED,
-                InvoiceStatus.PAID,
-            ]),
-        )
-        .group_by(Supplier.id, Supplier.name)
-        .having(func.sum(outstanding) > 0)
-        .order_by(func.sum(outstanding).desc())
-        .limit(limit)
-    )
-
-    result = await db.execute(q)
+    invoiced = dict((await db.execute(invoiced_q)).all())
     return [
         {
-            "name": r.name,
-            "total_invoiced": _float_or_zero(r.total_invoiced),
-            "outstanding": _float_or_zero(r.outstanding),
+            "name": p["name"],
+            "total_invoiced": _float_or_zero(invoiced.get(p["id"])),
+            "outstanding": p["outstanding"],
         }
-        for r in result
+        for p in top
     ]
 
 
@@ -10,6 +10,7 @@ Business Rules enforced:
   BR#22 — HR unlock before editing past lock period
   BR#23 — OT Flow: staff → supervisor approve → HR final
   BR#26 — HR is final authority before payroll
+  BR#36 — Leave within quota (Phase 15: running balance + ledger)
 """
 
 from datetime import date, datetime, timedelta, timezone
@@ -18,12 +19,15 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.hr import (
     Employee,
     Leave,
+    LeaveBalance,
+    LeaveBalanceEntry,
+    LeaveEntryType,
     LeaveStatus,
     PayrollRun,
     PayrollSlip,
@@ -519,7 +523,6 @@ async def create_leave(
 
     # Phase 4.3: Quota check (BR#36) if leave_type_id provided
     if leave_type_id:
-        from app.models.hr import LeaveBalance
         from app.models.master import LeaveType as LeaveTypeModel
         lt_result = await db.execute(
             select(LeaveTypeModel).where(LeaveTypeModel.id == leave_type_id)
@@ -529,33 +532,23 @@ async def create_leave(
             raise HTTPException(status_code=404, detail="Leave type not found")
 
         if lt.default_quota is not None:
-            current_year = start_date.year
-            bal_result = await db.execute(
-                select(LeaveBalance).where(
-                    LeaveBalance.employee_id == employee_id,
-                    LeaveBalance.leave_type_id == leave_type_id,
-                    LeaveBalance.year == current_year,
-                )
+            balance = await _lock_leave_balance(
+                db, employee_id=employee_id, leave_type_id=leave_type_id, year=start_date.year,
             )
-            balance = bal_result.scalar_one_or_none()
             if not balance:
                 # Auto-create balance with default quota
-                balance = LeaveBalance(
-                    employee_id=employee_id,
-                    leave_type_id=leave_type_id,
-                    year=current_year,
-                    quota=lt.default_quota,
-                    used=0,
-                    org_id=org_id,
+                balance = await open_leave_balance(
+                    db, employee_id=employee_id, leave_type_id=leave_type_id,
+                    year=start_date.year, quota=lt.default_quota, org_id=org_id,
+                    created_by=created_by,
                 )
-                db.add(balance)
-                await db.flush()
 
-            remaining = balance.quota - balance.used
-            if days_count > remaining:
+            # Days already reserved by pending requests count against the quota
+            available = balance.remaining - balance.pending
+            if days_count > available:
                 raise HTTPException(
                     status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    detail=f"ลาเกินโควต้า: เหลือ {remaining} วัน แต่ขอลา {days_count} วัน (BR#36)",
+                    detail=f"ลาเกินโควต้า: เหลือ {available} วัน แต่ขอลา {days_count} วัน (BR#36)",
                 )
 
     leave = Leave(
@@ -573,23 +566,13 @@ async def create_leave(
     db.add(leave)
     await db.flush()
 
-    # Phase 4.3: Increment used in leave balance
+    # Phase 15: Reserve the days — booked as usage only on approval
     if leave_type_id:
-        from app.models.hr import LeaveBalance
-        current_year = start_date.year
-        bal_result = await db.execute(
-            select(LeaveBalance).where(
-                LeaveBalance.employee_id == employee_id,
-                LeaveBalance.leave_type_id == leave_type_id,
-                LeaveBalance.year == current_year,
-            )
+        balance = await _lock_leave_balance(
+            db, employee_id=employee_id, leave_type_id=leave_type_id, year=start_date.year,
         )
-        balance = bal_result.scalar_one_or_none()
         if balance:
-            balance.used += days_count
-
-    await db.commit()
-    await db.refresh(leave)
+            balance.pending += days_count
 
     # Phase 9: Notification — APPROVAL_REQUEST for leave approvers
     try:
@@ -608,6 +591,11 @@ async def create_leave(
         import logging
         logging.getLogger(__name__).warning("Notification failed for leave create", exc_info=True)
 
+    await db.commit()
+    await db.refresh(leave)
+    from app.services.notification import publish_pending_notifications
+    await publish_pending_notifications(db)
+
     return leave
 
 
@@ -703,7 +691,10 @@ async def approve_leave(
     approve: bool = True,
 ) -> Leave:
     result = await db.execute(
-        select(Leave).where(Leave.id == leave_id)
+        select(Leave)
+        .where(Leave.id == leave_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
     )
     leave = result.scalar_one_or_none()
     if not leave:
@@ -717,6 +708,21 @@ async def approve_leave(
 
     leave.status = LeaveStatus.APPROVED if approve else LeaveStatus.REJECTED
     leave.approved_by = approved_by
+
+    # Phase 15: Release the reservation; approval books USAGE in the same transaction
+    if leave.leave_type_id:
+        balance = await _lock_leave_balance(
+            db, employee_id=leave.employee_id, leave_type_id=leave.leave_type_id,
+            year=leave.start_date.year,
+        )
+        if balance:
+            balance.pending = max(balance.pending - leave.days_count, 0)
+            if approve:
+                book_leave_entry(
+                    db, balance, LeaveEntryType.USAGE, -leave.days_count,
+                    leave_id=leave.id, created_by=approved_by,
+                )
+
     await db.commit()
     await db.refresh(leave)
 
@@ -1063,8 +1069,96 @@ async def create_timesheet_batch(
 
 # ============================================================
 # LEAVE BALANCE  (Phase 4.3 — BR#36)
+# Phase 15: running balance + LeaveBalanceEntry ledger
 # ============================================================
 
+def book_leave_entry(
+    db: AsyncSession,
+    balance: LeaveBalance,
+    entry_type: LeaveEntryType,
+    days: int,
+    *,
+    leave_id: Optional[UUID] = None,
+    note: Optional[str] = None,
+    created_by: Optional[UUID] = None,
+) -> LeaveBalanceEntry:
+    """
+    Apply a signed movement to the running balance and append its ledger entry.
+    Caller holds the balance row lock and commits.
+    """
+    if entry_type in (LeaveEntryType.ACCRUAL, LeaveEntryType.ADJUSTMENT):
+        balance.quota += days
+    elif entry_type == LeaveEntryType.CARRY_FORWARD:
+        balance.carried_forward += days
+    elif entry_type == LeaveEntryType.USAGE:
+        balance.used -= days
+    balance.remaining += days
+
+    entry = LeaveBalanceEntry(
+        balance_id=balance.id,
+        entry_type=entry_type,
+        days=days,
+        balance_after=balance.remaining,
+        leave_id=leave_id,
+        note=note,
+        created_by=created_by,
+        org_id=balance.org_id,
+    )
+    db.add(entry)
+    return entry
+
+
+async def open_leave_balance(
+    db: AsyncSession,
+    *,
+    employee_id: UUID,
+    leave_type_id: UUID,
+    year: int,
+    quota: int,
+    org_id: UUID,
+    created_by: Optional[UUID] = None,
+) -> LeaveBalance:
+    """Create an empty balance and book its yearly quota as the opening ACCRUAL."""
+    balance = LeaveBalance(
+        employee_id=employee_id,
+        leave_type_id=leave_type_id,
+        year=year,
+        quota=0,
+        used=0,
+        carried_forward=0,
+        pending=0,
+        remaining=0,
+        org_id=org_id,
+    )
+    db.add(balance)
+    await db.flush()
+    book_leave_entry(
+        db, balance, LeaveEntryType.ACCRUAL, quota,
+        note=f"Opening balance {year}", created_by=created_by,
+    )
+    return balance
+
+
+async def _lock_leave_balance(
+    db: AsyncSession,
+    *,
+    employee_id: UUID,
+    leave_type_id: UUID,
+    year: int,
+) -> Optional[LeaveBalance]:
+    result = await db.execute(
+        select(LeaveBalance)
+        .where(
+            LeaveBalance.employee_id == employee_id,
+            LeaveBalance.leave_type_id == leave_type_id,
+            LeaveBalance.year == year,
+        )
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
 async def list_leave_balances(
     db: AsyncSession,
     *,
@@ -1073,8 +1167,7 @@ async def list_leave_balances(
     year: Optional[int] = None,
     org_id: Optional[UUID] = None,
 ) -> list[dict]:
-    """List leave balances with joined employee_name + leave_type info."""
-    from app.models.hr import LeaveBalance
+    """List leave balances (maintained running totals) with employee_name + leave_type info."""
     from app.models.master import LeaveType as LeaveTypeModel
 
     query = (
@@ -1088,7 +1181,7 @@ async def list_leave_balances(
         .outerjoin(LeaveTypeModel, LeaveBalance.leave_type_id == LeaveTypeModel.id)
     )
     if org_id:
-        query = query.where(Employee.org_id == org_id)
+        query = query.where(LeaveBalance.org_id == org_id)
     if employee_id:
         query = query.where(LeaveBalance.employee_id == employee_id)
     elif employee_ids is not None:
@@ -1115,6 +1208,9 @@ async def list_leave_balances(
             "year": bal.year,
             "quota": bal.quota,
             "used": bal.used,
+            "carried_forward": bal.carried_forward,
+            "pending": bal.pending,
+            "remaining": bal.remaining,
             "created_at": bal.created_at,
             "updated_at": bal.updated_at,
         })
@@ -1126,26 +1222,131 @@ async def update_leave_balance(
     balance_id: UUID,
     *,
     update_data: dict,
+    adjusted_by: Optional[UUID] = None,
     org_id: Optional[UUID] = None,
-) -> "LeaveBalance":
-    from app.models.hr import LeaveBalance
+) -> LeaveBalance:
+    """HR quota edit — booked as an ADJUSTMENT entry for the delta."""
     query = select(LeaveBalance).where(LeaveBalance.id == balance_id)
     if org_id:
-        query = query.join(Employee, LeaveBalance.employee_id == Employee.id).where(Employee.org_id == org_id)
-    result = await db.execute(query)
+        query = query.where(LeaveBalance.org_id == org_id)
+    result = await db.execute(query.with_for_update().execution_options(populate_existing=True))
     balance = result.scalar_one_or_none()
     if not balance:
         raise HTTPException(status_code=404, detail="Leave balance not found")
 
-    for field, value in update_data.items():
-        if value is not None:
-            setattr(balance, field, value)
+    quota = update_data.get("quota")
+    if quota is not None and quota != balance.quota:
+        book_leave_entry(
+            db, balance, LeaveEntryType.ADJUSTMENT, quota - balance.quota,
+            note=f"Quota {balance.quota} → {quota}", created_by=adjusted_by,
+        )
 
     await db.commit()
     await db.refresh(balance)
     return balance
 
 
+async def list_leave_balance_entries(
+    db: AsyncSession,
+    balance_id: UUID,
+    *,
+    org_id: Optional[UUID] = None,
+) -> list[LeaveBalanceEntry]:
+    query = select(LeaveBalanceEntry).where(LeaveBalanceEntry.balance_id == balance_id)
+    if org_id:
+        query = query.where(LeaveBalanceEntry.org_id == org_id)
+    result = await db.execute(
+        query.order_by(LeaveBalanceEntry.created_at.asc(), LeaveBalanceEntry.entry_type.asc())
+    )
+    return list(result.scalars().all())
+
+
+_ROLLOVER_SQL = text("""
+    WITH src AS (
+        SELECT e.id AS employee_id, lt.id AS leave_type_id, lt.default_quota AS quota,
+               LEAST(GREATEST(COALESCE(b.remaining - b.pending, 0), 0), lt.carry_forward_max) AS carry
+        FROM employees e
+        CROSS JOIN leave_types lt
+        LEFT JOIN leave_balances b
+          ON b.employee_id = e.id AND b.leave_type_id = lt.id AND b.year = :from_year
+        WHERE e.org_id = :org_id AND e.is_active
+          AND lt.org_id = :org_id AND lt.is_active AND lt.default_quota IS NOT NULL
+    ),
+    prev AS (
+        SELECT id, carried_forward FROM leave_balances
+        WHERE org_id = :org_id AND year = :to_year
+    ),
+    up AS (
+        INSERT INTO leave_balances
+            (id, employee_id, leave_type_id, year, quota, used, carried_forward, pending, remaining,
+             org_id, created_at, updated_at)
+        SELECT gen_random_uuid(), employee_id, leave_type_id, :to_year, quota, 0, carry, 0, quota + carry,
+               :org_id, now(), now()
+        FROM src
+        ON CONFLICT ON CONSTRAINT uq_leave_balance_emp_type_year DO UPDATE
+        SET carried_forward = EXCLUDED.carried_forward,
+            remaining = leave_balances.remaining - leave_balances.carried_forward + EXCLUDED.carried_forward,
+            updated_at = now()
+        RETURNING id, quota, carried_forward, remaining
+    ),
+    moved AS (
+        SELECT up.*, prev.id IS NULL AS is_new,
+               up.carried_forward - COALESCE(prev.carried_forward, 0) AS carry_delta
+        FROM up LEFT JOIN prev ON prev.id = up.id
+    ),
+    entries AS (
+        INSERT INTO leave_balance_entries
+            (id, balance_id, entry_type, days, balance_after, note, created_by, org_id, created_at, updated_at)
+        SELECT gen_random_uuid(), id, CAST('ACCRUAL' AS leave_entry_type_enum), quota, quota,
+               'Opening balance ' || :to_year, CAST(:created_by AS uuid), :org_id, now(), now()
+        FROM moved WHERE is_new
+        UNION ALL
+        SELECT gen_random_uuid(), id, CAST('CARRY_FORWARD' AS leave_entry_type_enum), carry_delta, remaining,
+               'Carried forward from ' || :from_year, CAST(:created_by AS uuid), :org_id, now(), now()
+        FROM moved WHERE carry_delta <> 0
+        RETURNING 1
+    )
+    SELECT count(*) FILTER (WHERE is_new) AS created,
+           count(*) FILTER (WHERE NOT is_new) AS updated,
+           COALESCE(sum(carried_forward), 0) AS carried_days,
+           (SELECT count(*) FROM entries) AS entries
+    FROM moved
+""")
+
+
+async def rollover_leave_balances(
+    db: AsyncSession,
+    *,
+    from_year: int,
+    org_id: UUID,
+    created_by: Optional[UUID] = None,
+) -> dict:
+    """
+    Open next year's balances for every active employee × quota leave type in one
+    set-based statement, carrying unused days up to LeaveType.carry_forward_max.
+    Days reserved by from_year requests still pending are not carried — approval
+    books them as usage in from_year; re-run once such a request is rejected to
+    carry the days it frees. Re-running is safe: existing balances only get their
+    carry re-aligned.
+    """
+    params = {
+        "from_year": from_year,
+        "to_year": from_year + 1,
+        "org_id": org_id,
+        "created_by": created_by,
+    }
+    row = (await db.execute(_ROLLOVER_SQL, params)).one()
+    await db.commit()
+    return {
+        "from_year": from_year,
+        "to_year": from_year + 1,
+        "created": row.created,
+        "updated": row.updated,
+        "carried_days": int(row.carried_days),
+        "entries": row.entries,
+    }
+
+
 # ============================================================
 # PAYROLL
 # ============================================================
@@ -1301,6 +1502,18 @@ async def execute_payroll(
     pr.executed_by = executed_by
     pr.executed_at = datetime.now(timezone.utc)
 
+    from app.services.events import record_event
+    await record_event(
+        db, org_id=pr.org_id, event_type="payroll_executed", aggregate_type="PayrollRun", aggregate_id=pr.id,
+        payload={
+            "period_start": pr.period_start,
+            "period_end": pr.period_end,
+            "employee_count": slip_count,
+            "total_amount": total_amount,
+            "executed_at": pr.executed_at,
+        },
+        actor_id=executed_by,
+    )
     await db.commit()
     await db.refresh(pr)
     return pr
@@ -19,6 +19,7 @@ Business Rules enforced:
   #71 Atomic update Product.on_hand + StockByLocation.on_hand
 """
 
+from datetime import date
 from decimal import Decimal
 from typing import Optional
 from uuid import UUID
@@ -28,6 +29,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.inventory import (
+    LowStockWatch,
     MovementType,
     Product,
     ProductType,
@@ -36,6 +38,9 @@ from app.models.inventory import (
     StockMovement,
 )
 from app.models.warehouse import Bin, Location, StockByBin, Warehouse
+from app.services.events import record_event
+from app.services.low_stock import is_low_stock, track_low_stock
+from app.services.partition import date_range_clauses
 
 
 # ============================================================
@@ -87,6 +92,9 @@ async def create_product(
         org_id=org_id,
     )
     db.add(product)
+    await db.flush()
+    # Starts at on_hand=0 — already low when min_stock > 0
+    await track_low_stock(db, product, was_low=False)
     await db.commit()
     await db.refresh(product)
     return product
@@ -173,6 +181,7 @@ async def update_product(
                 )
 
     # Apply updates
+    was_low = is_low_stock(product)
     for field, value in update_data.items():
         if value is not None:
             setattr(product, field, value)
@@ -184,6 +193,7 @@ async def update_product(
             detail="MATERIAL product cost must be >= 1.00 THB",
         )
 
+    await track_low_stock(db, product, was_low=was_low)
     await db.commit()
     await db.refresh(product)
     return product
@@ -211,7 +221,9 @@ async def delete_product(db: AsyncSession, product_id: UUID, *, org_id: Optional
             detail="Cannot delete product — on_hand balance > 0",
         )
 
+    was_low = is_low_stock(product)
     product.is_active = False
+    await track_low_stock(db, product, was_low=was_low)
     await db.commit()
 
 
@@ -436,6 +448,7 @@ async def _create_movement_inner(
         )
         db.add(movement)
         # product.on_hand unchanged for TRANSFER
+        await _record_stock_moved(db, movement, product)
         await db.commit()
         await db.refresh(movement)
         return movement
@@ -511,33 +524,44 @@ async def _create_movement_inner(
     )
     db.add(movement)
 
-    # Update on_hand
+    # Update on_hand (+ low-stock watchlist on a min_stock crossing)
+    was_low = is_low_stock(product)
     product.on_hand = new_on_hand
+    await track_low_stock(db, product, was_low=was_low)
+    await _record_stock_moved(db, movement, product)
     await db.commit()
     await db.refresh(movement)
 
-    # Phase 9: Notification — LOW_STOCK_ALERT if stock fell below min_stock
-    if (
-        product.min_stock
-        and product.min_stock > 0
-        and new_on_hand <= product.min_stock
-        and qty_delta < 0  # Only on stock decrease (ISSUE, CONSUME, etc.)
-    ):
-        try:
-            from app.services.notification import notify_low_stock
-            await notify_low_stock(
-                db, org_id=org_id,
-                product_id=product.id, product_sku=product.sku,
-                product_name=product.name, on_hand=new_on_hand,
-                min_stock=product.min_stock,
-            )
-        except Exception:
-            import logging
-            logging.getLogger(__name__).warning("Notification failed for low stock %s", product.sku, exc_info=True)
-
     return movement
 
 
+async def _record_stock_moved(db: AsyncSession, movement: StockMovement, product: Product) -> None:
+    """Outbox `stock_moved` event — aggregate is the product (locked FOR UPDATE above)."""
+    await db.flush()  # movement.id
+    await record_event(
+        db,
+        org_id=movement.org_id,
+        event_type="stock_moved",
+        aggregate_type="Product",
+        aggregate_id=product.id,
+        payload={
+            "movement_id": movement.id,
+            "movement_type": movement.movement_type,
+            "quantity": movement.quantity,
+            "unit_cost": movement.unit_cost,
+            "reference": movement.reference,
+            "location_id": movement.location_id,
+            "to_location_id": movement.to_location_id,
+            "work_order_id": movement.work_order_id,
+            "cost_center_id": movement.cost_center_id,
+            "batch_number": movement.batch_number,
+            "sku": product.sku,
+            "on_hand": product.on_hand,
+        },
+        actor_id=movement.created_by,
+    )
+
+
 async def reverse_movement(
     db: AsyncSession,
     movement_id: UUID,
@@ -665,6 +689,7 @@ async def _reverse_movement_inner(
         original.is_reversed = True
         original.reversed_by_id = reversal.id
 
+        await _record_stock_moved(db, reversal, product)
         await db.commit()
         await db.refresh(reversal)
         return reversal
@@ -733,8 +758,11 @@ async def _reverse_movement_inner(
     original.is_reversed = True
     original.reversed_by_id = reversal.id
 
-    # Update on_hand
+    # Update on_hand (+ low-stock watchlist on a min_stock crossing)
+    was_low = is_low_stock(product)
     product.on_hand = new_on_hand
+    await track_low_stock(db, product, was_low=was_low)
+    await _record_stock_moved(db, reversal, product)
 
     await db.commit()
     await db.refresh(reversal)
@@ -752,12 +780,20 @@ async def list_movements(
     work_order_id: Optional[UUID] = None,
     org_id: Optional[UUID] = None,
     batch_number: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
 ) -> tuple[list[StockMovement], int]:
-    """List stock movements with pagination and filters."""
+    """
+    List stock movements with pagination and filters.
+    date_from/date_to become a plain created_at range so only the matching
+    monthly partitions of stock_movements are scanned.
+    """
     query = select(StockMovement)
     if org_id:
         query = query.where(StockMovement.org_id == org_id)
 
+    query = query.where(*date_range_clauses(StockMovement.created_at, date_from, date_to))
+
     if product_id:
         query = query.where(StockMovement.product_id == product_id)
 
@@ -1207,16 +1243,9 @@ async def list_stock_by_location(
 
 
 async def get_low_stock_count(db: AsyncSession, *, org_id: UUID) -> int:
-    """Count products where on_hand <= min_stock AND min_stock > 0."""
+    """Count products at or below min_stock — read from the low-stock watchlist."""
     result = await db.execute(
-        select(func.count()).select_from(
-            select(Product).where(
-                Product.org_id == org_id,
-                Product.is_active == True,
-                Product.min_stock > 0,
-                Product.on_hand <= Product.min_stock,
-            ).subquery()
-        )
+        select(func.count()).where(LowStockWatch.org_id == org_id, LowStockWatch.is_low)
     )
     return result.scalar() or 0
 
@@ -26,6 +26,7 @@ from app.models.invoice import SupplierInvoice, InvoicePayment, InvoiceStatus
 from app.models.purchasing import PurchaseOrder, POStatus
 from app.models.master import CostCenter
 from app.models.user import User
+from app.services.events import record_event, record_status_change
 
 
 # ============================================================
@@ -248,8 +249,10 @@ async def submit_invoice(
         )
 
     inv.status = InvoiceStatus.PENDING
-    await db.commit()
-    await db.refresh(inv)
+    await record_status_change(
+        db, org_id=org_id, aggregate_type="Invoice", aggregate_id=inv.id, number=inv.invoice_number,
+        from_status=InvoiceStatus.DRAFT, to_status=inv.status, actor_id=inv.created_by,
+    )
 
     # Phase 9: Notification — APPROVAL_REQUEST for invoice approvers
     try:
@@ -265,6 +268,11 @@ async def submit_invoice(
         import logging
         logging.getLogger(__name__).warning("Notification failed for invoice submit %s", inv.invoice_number, exc_info=True)
 
+    await db.commit()
+    await db.refresh(inv)
+    from app.services.notification import publish_pending_notifications
+    await publish_pending_notifications(db)
+
     return inv
 
 
@@ -298,6 +306,11 @@ async def approve_invoice(
     else:
         raise HTTPException(status_code=400, detail="Invalid action")
 
+    await record_status_change(
+        db, org_id=org_id, aggregate_type="Invoice", aggregate_id=inv.id, number=inv.invoice_number,
+        from_status=InvoiceStatus.PENDING, to_status=inv.status, actor_id=user_id,
+        **({"reason": reason} if action == "reject" else {}),
+    )
     await db.commit()
     await db.refresh(inv)
 
@@ -343,7 +356,12 @@ async def cancel_invoice(
             detail=f"Cannot cancel invoice in {inv.status.value} status",
         )
 
+    from_status = inv.status
     inv.status = InvoiceStatus.CANCELLED
+    await record_status_change(
+        db, org_id=org_id, aggregate_type="Invoice", aggregate_id=inv.id, number=inv.invoice_number,
+        from_status=from_status, to_status=inv.status,
+    )
     await db.commit()
     await db.refresh(inv)
     return inv
@@ -401,6 +419,22 @@ async def record_payment(
     if Decimal(str(inv.paid_amount)) >= Decimal(str(inv.net_payment)):
         inv.status = InvoiceStatus.PAID
 
+    await db.flush()  # payment.id
+    await record_event(
+        db, org_id=org_id, event_type="payment_recorded", aggregate_type="Invoice", aggregate_id=inv.id,
+        payload={
+            "invoice_number": inv.invoice_number,
+            "supplier_id": inv.supplier_id,
+            "payment_id": payment.id,
+            "payment_date": payment.payment_date,
+            "amount": amount,
+            "wht_deducted": wht_deducted,
+            "paid_amount": inv.paid_amount,
+            "net_payment": inv.net_payment,
+            "status": inv.status,
+        },
+        actor_id=user_id,
+    )
     await db.commit()
     await db.refresh(inv)
     return inv
@@ -411,58 +445,34 @@ async def record_payment(
 # ============================================================
 
 async def get_ap_summary(db: AsyncSession, org_id: UUID) -> dict:
-    """Aggregate AP stats for dashboard."""
-    base = select(SupplierInvoice).where(
-        SupplierInvoice.org_id == org_id,
-        SupplierInvoice.is_active == True,
-        SupplierInvoice.status != InvoiceStatus.CANCELLED,
-    )
-
-    # Total invoices
-    total_q = select(func.count()).select_from(base.subquery())
-    total_invoices = (await db.execute(total_q)).scalar() or 0
-
-    # Total payable (net_payment of non-PAID, non-CANCELLED)
-    payable_q = select(func.coalesce(func.sum(SupplierInvoice.net_payment), 0)).where(
-        SupplierInvoice.org_id == org_id,
-        SupplierInvoice.is_active == True,
-        SupplierInvoice.status.in_([
+    """Aggregate AP stats for dashboard — single pass over the org's invoices."""
+    inv = SupplierInvoice
+    q = select(
+        func.count().label("total_invoices"),
+        func.coalesce(func.sum(inv.net_payment).filter(inv.status.in_([
             InvoiceStatus.DRAFT, InvoiceStatus.PENDING, InvoiceStatus.APPROVED,
-        ]),
-    )
-    total_payable = (await db.execute(payable_q)).scalar() or 0
-
-    # Total paid
-    paid_q = select(func.coalesce(func.sum(SupplierInvoice.paid_amount), 0)).where(
-        SupplierInvoice.org_id == org_id,
-        SupplierInvoice.is_active == True,
-        SupplierInvoice.status != InvoiceStatus.CANCELLED,
-    )
-    total_paid = (await db.execute(paid_q)).scalar() or 0
-
-    # Overdue count (BR#120)
-    overdue_q = select(func.count()).where(
-        SupplierInvoice.org_id == org_id,
-        SupplierInvoice.is_active == True,
-        SupplierInvoice.status == InvoiceStatus.APPROVED,
-        SupplierInvoice.due_date < date.today(),
-    )
-    total_overdue = (await db.execute(overdue_q)).scalar() or 0
-
-    # Pending approval
-    pending_q = select(func.count()).where(
-        SupplierInvoice.org_id == org_id,
-        SupplierInvoice.is_active == True,
-        SupplierInvoice.status == InvoiceStatus.PENDING,
+        ])), 0).label("total_payable"),
+        func.coalesce(func.sum(inv.paid_amount), 0).label("total_paid"),
+        # Overdue (BR#120) — APPROVED open items past due (ix_*_open_items)
+        func.count().filter(
+            inv.status == InvoiceStatus.APPROVED,
+            inv.outstanding_amount > 0,
+            inv.due_date < date.today(),
+        ).label("total_overdue"),
+        func.count().filter(inv.status == InvoiceStatus.PENDING).label("total_pending_approval"),
+    ).where(
+        inv.org_id == org_id,
+        inv.is_active == True,
+        inv.status != InvoiceStatus.CANCELLED,
     )
-    total_pending = (await db.execute(pending_q)).scalar() or 0
+    row = (await db.execute(q)).one()
 
     return {
-        "total_invoices": total_invoices,
-        "total_payable": total_payable,
-        "total_paid": total_paid,
-        "total_overdue": total_overdue,
-        "total_pending_approval": total_pending,
+        "total_invoices": row.total_invoices,
+        "total_payable": row.total_payable,
+        "total_paid": row.total_paid,
+        "total_overdue": row.total_overdue,
+        "total_pending_approval": row.total_pending_approval,
     }
 
 
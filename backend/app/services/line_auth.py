@@ -7,7 +7,6 @@ import secrets
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode
 
-import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -47,6 +46,8 @@ def generate_authorize_url(state: str) -> str:
 
 async def exchange_code_for_token(code: str) -> dict:
     """Exchange authorization code for LINE access token."""
+    import httpx  # deferred: only LINE login needs an HTTP client
+
     async with httpx.AsyncClient(timeout=10) as client:
         payload = {
             "grant_type": "authorization_code",
@@ -69,6 +70,8 @@ async def exchange_code_for_token(code: str) -> dict:
 
 async def get_line_profile(access_token: str) -> dict:
     """Get LINE user profile (userId, displayName, pictureUrl)."""
+    import httpx
+
     async with httpx.AsyncClient(timeout=10) as client:
         resp = await client.get(
             _LINE_PROFILE_URL,
@@ -0,0 +1,191 @@
+"""
+SSS Corp ERP — Low-stock Watchlist + Batched Alerts
+Phase 15: low_stock_watchlist
+
+The movement / reversal / product update that moves a product across its
+min_stock threshold flips its watchlist row in the same transaction (one
+upsert, only on a crossing). Entering the list queues an alert (alert_due);
+the worker below delivers queued alerts in batches — one notification per
+product per LOW_STOCK_ALERT_WINDOW_HOURS, showing the balance at delivery
+time — so stock movements never look up recipients or write notifications.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from uuid import UUID
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.permissions import ROLE_PERMISSIONS
+from app.models.inventory import LowStockWatch, Product
+from app.models.notification import NotificationType
+
+logger = logging.getLogger(__name__)
+
+# Alerts go to supervisor+ holders of inventory.product.read (not staff/viewer)
+ALERT_ROLES = ("owner", "manager", "supervisor")
+
+
+def is_low_stock(product: Product) -> bool:
+    return bool(product.is_active) and product.min_stock > 0 and product.on_hand <= product.min_stock
+
+
+async def track_low_stock(db: AsyncSession, product: Product, *, was_low: bool) -> None:
+    """
+    Flip the watchlist row if product crossed min_stock since was_low was taken.
+    Call before the commit that persists the new on_hand / min_stock; no-op otherwise.
+    """
+    now_low = is_low_stock(product)
+    if now_low == was_low:
+        return
+    stmt = pg_insert(LowStockWatch).values(
+        product_id=product.id,
+        org_id=product.org_id,
+        is_low=now_low,
+        low_since=func.now() if now_low else None,
+        alert_due=now_low,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LowStockWatch.product_id],
+        set_={
+            "is_low": stmt.excluded.is_low,
+            "low_since": stmt.excluded.low_since,
+            "alert_due": stmt.excluded.alert_due,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+# Set-based track_low_stock for batched postings: flip every listed product whose
+# current state differs from its watchlist row (no row = not low).
+_SYNC_WATCHLIST_SQL = text("""
+    INSERT INTO low_stock_watchlist (product_id, org_id, is_low, low_since, alert_due)
+    SELECT p.id, p.org_id, s.now_low, CASE WHEN s.now_low THEN now() END, s.now_low
+    FROM products p
+    CROSS JOIN LATERAL (
+        SELECT p.is_active AND p.min_stock > 0 AND p.on_hand <= p.min_stock AS now_low
+    ) s
+    LEFT JOIN low_stock_watchlist w ON w.product_id = p.id
+    WHERE p.id = ANY(:product_ids) AND COALESCE(w.is_low, false) <> s.now_low
+    ON CONFLICT (product_id) DO UPDATE SET
+        is_low = EXCLUDED.is_low,
+        low_since = EXCLUDED.low_since,
+        alert_due = EXCLUDED.alert_due,
+        updated_at = now()
+""")
+
+
+async def sync_low_stock(db: AsyncSession, product_ids: list[UUID]) -> None:
+    """track_low_stock for many products at once — call after their on_hand was updated in SQL."""
+    if product_ids:
+        await db.execute(_SYNC_WATCHLIST_SQL, {"product_ids": list(product_ids)})
+
+
+# ============================================================
+# ALERT DELIVERY
+# ============================================================
+
+# Claim due rows outside their product's alert window; SKIP LOCKED lets several
+# workers (one per replica) share the queue.
+_CLAIM_DUE_SQL = text("""
+    WITH due AS (
+        SELECT product_id FROM low_stock_watchlist
+        WHERE alert_due
+          AND (last_alerted_at IS NULL
+               OR last_alerted_at <= now() - make_interval(hours => :window_hours))
+        ORDER BY low_since
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE low_stock_watchlist w
+    SET alert_due = false, last_alerted_at = now(), updated_at = now()
+    FROM due, products p
+    WHERE w.product_id = due.product_id AND p.id = w.product_id
+    RETURNING w.org_id, p.id, p.sku, p.name, p.on_hand, p.min_stock
+""")
+
+
+async def _alert_recipients(db: AsyncSession, org_id: UUID) -> list[UUID]:
+    from app.models.user import User
+
+    roles = [
+        role for role in ALERT_ROLES
+        if "inventory.product.read" in ROLE_PERMISSIONS.get(role, ())
+    ]
+    result = await db.execute(
+        select(User.id).where(
+            User.org_id == org_id,
+            User.role.in_(roles),
+            User.is_active == True,  # noqa: E712
+        )
+    )
+    return list(result.scalars().all())
+
+
+async def deliver_low_stock_alerts(db: AsyncSession) -> int:
+    """
+    Send one LOW_STOCK_ALERT per due product (recipients looked up once per org),
+    commit, then publish. Returns the number of products claimed.
+    """
+    from app.services.notification import create_notifications_bulk, publish_pending_notifications
+
+    settings = get_settings()
+    rows = (await db.execute(_CLAIM_DUE_SQL, {
+        "window_hours": settings.LOW_STOCK_ALERT_WINDOW_HOURS,
+        "batch_size": settings.LOW_STOCK_ALERT_BATCH_SIZE,
+    })).all()
+    if not rows:
+        return 0
+
+    by_org: dict[UUID, list] = defaultdict(list)
+    for row in rows:
+        by_org[row.org_id].append(row)
+    for org_id, products in by_org.items():
+        user_ids = await _alert_recipients(db, org_id)
+        for p in products:
+            await create_notifications_bulk(
+                db,
+                user_ids=user_ids,
+                org_id=org_id,
+                notification_type=NotificationType.LOW_STOCK_ALERT,
+                title="สินค้าใกล้หมด",
+                message=f"{p.sku} ({p.name}) คงเหลือ {p.on_hand} (ต่ำกว่ากำหนด {p.min_stock})",
+                link="/supply-chain",
+                entity_type="Product",
+                entity_id=p.id,
+            )
+    await db.commit()
+    await publish_pending_notifications(db)
+    return len(rows)
+
+
+async def run_low_stock_alert_worker(stop: asyncio.Event) -> None:
+    """
+    Background loop (started from main.lifespan when LOW_STOCK_ALERT_WORKER_ENABLED).
+    Drains back-to-back while batches come back full, sleeps LOW_STOCK_ALERT_POLL_SECONDS otherwise.
+    """
+    from app.core.database import background_session
+
+    settings = get_settings()
+    logger.info("Low-stock alert worker started (window=%dh)", settings.LOW_STOCK_ALERT_WINDOW_HOURS)
+    try:
+        while not stop.is_set():
+            delivered = 0
+            try:
+                async with background_session() as db:
+                    delivered = await deliver_low_stock_alerts(db)
+            except Exception:
+                logger.warning("Low-stock alert batch failed", exc_info=True)
+            if delivered >= settings.LOW_STOCK_ALERT_BATCH_SIZE:
+                continue
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.LOW_STOCK_ALERT_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        logger.info("Low-stock alert worker stopped")
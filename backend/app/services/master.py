@@ -360,6 +360,7 @@ async def create_leave_type(
     name: str,
     is_paid: bool,
     default_quota: Optional[int],
+    carry_forward_max: int = 0,
     org_id: UUID,
 ) -> LeaveType:
     existing = await db.execute(
@@ -379,6 +380,7 @@ async def create_leave_type(
         name=name,
         is_paid=is_paid,
         default_quota=default_quota,
+        carry_forward_max=carry_forward_max,
         org_id=org_id,
     )
     db.add(lt)
@@ -0,0 +1,229 @@
+"""
+SSS Corp ERP — Net Requirements (MRP) + Reorder Suggestions
+Phase 15: batch projection over on_hand, reservations, open PO/PR and daily plans
+
+One statement projects every stocked product over date buckets of
+bucket_days from today:
+
+  supply   open PO lines (ordered − received, STOCK_GR goods) on expected_date
+           open PRs (DRAFT / SUBMITTED / APPROVED goods lines) on delivery/required date
+  demand   RESERVED material reservations — due now
+           DailyPlanMaterial from today on, unless the WO already reserved that product
+
+Grouped aggregates per (product, bucket) feed a running SUM window, so
+projected availability for all SKUs comes out of one pass in Postgres.
+Anything dated before today lands in bucket 0. A product is short when
+its projection dips below min_stock (below zero if no min_stock); the
+suggestion brings the lowest point back up to min_stock.
+"""
+
+import math
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+MRP_MAX_PR_LINES = 200  # auto-drafted PRs are split beyond this many lines
+
+_NET_REQUIREMENTS_SQL = """
+    WITH ev AS (
+        SELECT l.product_id, COALESCE(po.expected_date, po.order_date) AS due,
+               l.quantity - l.received_qty AS open_po, 0 AS open_pr, 0 AS reserved, 0 AS planned
+        FROM purchase_order_lines l
+        JOIN purchase_orders po ON po.id = l.po_id
+        WHERE po.org_id = :org_id
+          AND po.status IN ('DRAFT', 'SUBMITTED', 'APPROVED')
+          AND l.item_type = 'GOODS' AND l.gr_mode = 'STOCK_GR'
+          AND l.product_id IS NOT NULL AND l.quantity > l.received_qty
+        UNION ALL
+        SELECT l.product_id, COALESCE(pr.delivery_date, pr.required_date), 0, l.quantity, 0, 0
+        FROM purchase_requisition_lines l
+        JOIN purchase_requisitions pr ON pr.id = l.pr_id
+        WHERE pr.org_id = :org_id AND pr.is_active
+          AND pr.status IN ('DRAFT', 'SUBMITTED', 'APPROVED')
+          AND l.item_type = 'GOODS' AND l.product_id IS NOT NULL
+        UNION ALL
+        SELECT r.product_id, CAST(:today AS date), 0, 0, r.quantity, 0
+        FROM material_reservations r
+        WHERE r.org_id = :org_id AND r.status = 'RESERVED'
+        UNION ALL
+        SELECT m.product_id, dp.plan_date, 0, 0, 0, m.planned_qty
+        FROM daily_plan_materials m
+        JOIN daily_plans dp ON dp.id = m.daily_plan_id
+        WHERE dp.org_id = :org_id
+          AND dp.plan_date >= :today AND dp.plan_date < :horizon_end
+          AND NOT EXISTS (
+              SELECT 1 FROM material_reservations r
+              WHERE r.work_order_id = dp.work_order_id
+                AND r.product_id = m.product_id AND r.status = 'RESERVED'
+          )
+    ),
+    agg AS (
+        SELECT product_id,
+               GREATEST(0, (due - CAST(:today AS date)) / :bucket_days) AS bucket,
+               sum(open_po) AS open_po, sum(open_pr) AS open_pr,
+               sum(reserved) AS reserved, sum(planned) AS planned
+        FROM ev
+        WHERE due < :horizon_end
+        GROUP BY 1, 2
+    ),
+    proj AS (
+        SELECT p.id AS product_id, b.bucket, a.open_po, a.open_pr, a.reserved, a.planned,
+               p.on_hand + sum(
+                   COALESCE(a.open_po, 0) + COALESCE(a.open_pr, 0)
+                   - COALESCE(a.reserved, 0) - COALESCE(a.planned, 0)
+               ) OVER (PARTITION BY p.id ORDER BY b.bucket) AS projected
+        FROM products p
+        CROSS JOIN generate_series(0, :buckets - 1) AS b(bucket)
+        LEFT JOIN agg a ON a.product_id = p.id AND a.bucket = b.bucket
+        WHERE p.org_id = :org_id AND p.is_active AND p.product_type <> 'SERVICE'
+          {product_filter}
+    ),
+    net AS (
+        SELECT product_id,
+               COALESCE(sum(open_po), 0) AS open_po, COALESCE(sum(open_pr), 0) AS open_pr,
+               COALESCE(sum(reserved), 0) AS reserved, COALESCE(sum(planned), 0) AS planned,
+               array_agg(projected ORDER BY bucket) AS projected,
+               min(projected) AS min_projected
+        FROM proj
+        GROUP BY product_id
+    )
+    SELECT p.id AS product_id, p.sku, p.name, p.unit, p.cost, p.on_hand, p.min_stock,
+           n.open_po, n.open_pr, n.reserved, n.planned, n.projected, n.min_projected,
+           (SELECT min(i - 1) FROM unnest(n.projected) WITH ORDINALITY AS u(v, i)
+            WHERE u.v < p.min_stock) AS shortage_bucket,
+           count(*) OVER () AS total
+    FROM net n
+    JOIN products p ON p.id = n.product_id
+    WHERE NOT :shortages_only OR n.min_projected < p.min_stock
+    ORDER BY shortage_bucket NULLS LAST, p.sku
+    LIMIT :limit OFFSET :offset
+"""
+
+
+def bucket_count(horizon_days: int, bucket_days: int) -> int:
+    return max(1, math.ceil(horizon_days / bucket_days))
+
+
+async def compute_net_requirements(
+    db: AsyncSession,
+    *,
+    org_id: UUID,
+    today: Optional[date] = None,
+    horizon_days: int = 28,
+    bucket_days: int = 7,
+    shortages_only: bool = True,
+    product_ids: Optional[list[UUID]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> tuple[list[dict], int]:
+    """
+    Projected availability per bucket + suggested reorder quantity, shortest-dated first.
+    Returns (items, total). limit=None returns every row (scheduled job).
+    """
+    if bucket_days < 1 or horizon_days < 1:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="horizon_days and bucket_days must be >= 1",
+        )
+    today = today or date.today()
+    buckets = bucket_count(horizon_days, bucket_days)
+    product_filter = "AND p.id = ANY(:product_ids)" if product_ids else ""
+    params = {
+        "org_id": org_id,
+        "today": today,
+        "horizon_end": today + timedelta(days=buckets * bucket_days),
+        "bucket_days": bucket_days,
+        "buckets": buckets,
+        "shortages_only": shortages_only,
+        "limit": limit,
+        "offset": offset,
+    }
+    if product_ids:
+        params["product_ids"] = list(product_ids)
+    rows = (await db.execute(
+        text(_NET_REQUIREMENTS_SQL.format(product_filter=product_filter)), params
+    )).all()
+
+    items = []
+    for r in rows:
+        short = r.shortage_bucket
+        items.append({
+            "product_id": r.product_id,
+            "sku": r.sku,
+            "name": r.name,
+            "unit": r.unit,
+            "unit_cost": r.cost,
+            "on_hand": r.on_hand,
+            "min_stock": r.min_stock,
+            "reserved": int(r.reserved),
+            "open_po": int(r.open_po),
+            "open_pr": int(r.open_pr),
+            "planned_usage": int(r.planned),
+            "projected": [
+                {"bucket_start": today + timedelta(days=i * bucket_days), "available": int(v)}
+                for i, v in enumerate(r.projected)
+            ],
+            "min_projected": int(r.min_projected),
+            "need_date": today + timedelta(days=short * bucket_days) if short is not None else None,
+            "suggested_qty": max(0, r.min_stock - int(r.min_projected)),
+        })
+    total = rows[0].total if rows else 0
+    return items, total
+
+
+async def draft_reorder_requisitions(
+    db: AsyncSession,
+    *,
+    org_id: UUID,
+    suggestions: list[dict],
+    cost_center_id: UUID,
+    cost_element_id: UUID,
+    created_by: UUID,
+    requester_id: Optional[UUID] = None,
+) -> list:
+    """
+    Turn suggestions into DRAFT PRs — one per need date, split at MRP_MAX_PR_LINES.
+    Drafted lines count as open-PR supply, so the next run does not suggest them again.
+    """
+    from app.services.purchasing import create_purchase_requisition
+
+    by_date: dict[date, list[dict]] = defaultdict(list)
+    for s in suggestions:
+        if s["suggested_qty"] > 0 and s["need_date"] is not None:
+            by_date[s["need_date"]].append(s)
+
+    today = date.today()
+    prs = []
+    for need_date in sorted(by_date):
+        lines = by_date[need_date]
+        for i in range(0, len(lines), MRP_MAX_PR_LINES):
+            chunk = lines[i:i + MRP_MAX_PR_LINES]
+            body = {
+                "cost_center_id": cost_center_id,
+                "required_date": max(need_date, today),
+                "priority": "URGENT" if need_date <= today else "NORMAL",
+                "note": f"MRP reorder suggestion — need by {need_date.isoformat()}",
+                "lines": [
+                    {
+                        "item_type": "GOODS",
+                        "product_id": s["product_id"],
+                        "quantity": s["suggested_qty"],
+                        "unit": s["unit"],
+                        "estimated_unit_cost": s["unit_cost"] or Decimal("0.00"),
+                        "cost_element_id": cost_element_id,
+                        "note": (f"on_hand={s['on_hand']} min={s['min_stock']} "
+                                 f"projected_low={s['min_projected']}"),
+                    }
+                    for s in chunk
+                ],
+            }
+            prs.append(await create_purchase_requisition(
+                db, body=body, created_by=created_by, org_id=org_id, requester_id=requester_id,
+            ))
+    return prs
@@ -3,20 +3,126 @@ SSS Corp ERP — Notification Service
 Phase 9: Notification Center — CRUD + event helpers
 
 Pattern: all notification creation is fire-and-forget (wrapped in try/except, never blocks business logic).
+
+Real-time push: create/mark/delete stage Redis work on db.info; after the caller
+commits it calls publish_pending_notifications(db), which in one pipeline
+  - PUBLISHes each new notification on notif:user:{user_id} (consumed by the SSE stream)
+  - invalidates the cached unread counter notif:unread:{org_id}:{user_id}: bumps its
+    version key and DELetes it; the next read re-counts from the DB and fills the
+    cache only if no write bumped the version meanwhile (a count read before a
+    commit can never overwrite the invalidation that follows it)
+Redis is optional — any failure is logged and the DB remains the source of truth.
 """
 
+import json
 import logging
 import uuid as uuid_mod
+from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import delete, event, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.core.redis import get_redis
 from app.models.notification import Notification, NotificationType
 from app.core.permissions import ROLE_PERMISSIONS
 
 logger = logging.getLogger(__name__)
 
+UNREAD_COUNT_TTL_SECONDS = 24 * 3600
+_PENDING_KEY = "notification_push_pending"
+
+# SET the counter only if its version is still the one read before the DB count.
+# KEYS: counter, version — ARGV: version seen ('' = none), count, ttl
+_FILL_IF_UNCHANGED_LUA = """
+local v = redis.call('GET', KEYS[2]) or ''
+if v == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+_fill_script = None
+
+
+# ============================================================
+# REDIS PUSH + UNREAD COUNTER
+# ============================================================
+
+def notification_channel(user_id: UUID) -> str:
+    return f"notif:user:{user_id}"
+
+
+def _unread_key(user_id: UUID, org_id: UUID) -> str:
+    return f"notif:unread:{org_id}:{user_id}"
+
+
+def _unread_version_key(user_id: UUID, org_id: UUID) -> str:
+    return f"notif:unread:v:{org_id}:{user_id}"
+
+
+def _stage(db: AsyncSession, op: tuple) -> None:
+    db.info.setdefault(_PENDING_KEY, []).append(op)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_on_rollback(session: Session, previous_transaction) -> None:
+    if previous_transaction.nested:
+        return  # a SAVEPOINT — its writers drop their own staged ops
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _push_payload(
+    *,
+    notification_id: UUID,
+    user_id: UUID,
+    notification_type: NotificationType,
+    title: str,
+    message: str,
+    link: str | None,
+    entity_type: str | None,
+    entity_id: UUID | None,
+    actor_name: str | None,
+    created_at: datetime | None = None,
+) -> str:
+    return json.dumps({
+        "id": str(notification_id),
+        "user_id": str(user_id),
+        "notification_type": notification_type.value,
+        "title": title,
+        "message": message,
+        "link": link,
+        "entity_type": entity_type,
+        "entity_id": str(entity_id) if entity_id else None,
+        "actor_name": actor_name,
+        "is_read": False,
+        "created_at": (created_at or datetime.now(timezone.utc)).isoformat(),
+    }, ensure_ascii=False)
+
+
+async def publish_pending_notifications(db: AsyncSession) -> None:
+    """
+    Flush staged push/counter ops to Redis. Call right after db.commit().
+    Never raises — realtime delivery is best-effort, polling still works.
+    """
+    ops = db.info.pop(_PENDING_KEY, None)
+    if not ops:
+        return
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            for user_id, org_id in dict.fromkeys((user_id, org_id) for _, user_id, org_id, _ in ops):
+                version_key = _unread_version_key(user_id, org_id)
+                pipe.incr(version_key)
+                pipe.expire(version_key, UNREAD_COUNT_TTL_SECONDS)
+                pipe.delete(_unread_key(user_id, org_id))
+            for kind, user_id, _, payload in ops:
+                if kind == "push":
+                    pipe.publish(notification_channel(user_id), payload)
+            await pipe.execute()
+    except Exception:
+        logger.warning("Failed to publish %d notification op(s) to Redis", len(ops), exc_info=True)
+
 
 # ============================================================
 # CRUD
@@ -52,6 +158,17 @@ async def create_notification(
         is_read=False,
     )
     db.add(notif)
+    _stage(db, ("push", user_id, org_id, _push_payload(
+        notification_id=notif.id,
+        user_id=user_id,
+        notification_type=notification_type,
+        title=title,
+        message=message,
+        link=link,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        actor_name=actor_name,
+    )))
     return notif
 
 
@@ -68,27 +185,52 @@ async def create_notifications_bulk(
     entity_id: UUID | None = None,
     actor_id: UUID | None = None,
     actor_name: str | None = None,
-) -> list[Notification]:
-    """Create notifications for multiple users at once."""
-    notifications = []
-    for uid in user_ids:
-        notif = Notification(
-            id=uuid_mod.uuid4(),
-            user_id=uid,
-            org_id=org_id,
+) -> list[UUID]:
+    """
+    Create notifications for multiple users at once — one multi-row INSERT.
+    Returns the new notification IDs (same order as user_ids).
+    """
+    if not user_ids:
+        return []
+
+    rows = [
+        {
+            "id": uuid_mod.uuid4(),
+            "user_id": uid,
+            "org_id": org_id,
+            "notification_type": notification_type,
+            "title": title,
+            "message": message,
+            "link": link,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "actor_id": actor_id,
+            "actor_name": actor_name,
+            "is_read": False,
+        }
+        for uid in user_ids
+    ]
+    result = await db.execute(
+        insert(Notification)
+        .values(rows)
+        .returning(Notification.id, Notification.created_at)
+    )
+    created_at = {row.id: row.created_at for row in result}
+
+    for row in rows:
+        _stage(db, ("push", row["user_id"], org_id, _push_payload(
+            notification_id=row["id"],
+            user_id=row["user_id"],
             notification_type=notification_type,
             title=title,
             message=message,
             link=link,
             entity_type=entity_type,
             entity_id=entity_id,
-            actor_id=actor_id,
             actor_name=actor_name,
-            is_read=False,
-        )
-        db.add(notif)
-        notifications.append(notif)
-    return notifications
+            created_at=created_at.get(row["id"]),
+        )))
+    return [row["id"] for row in rows]
 
 
 async def list_notifications(
@@ -113,13 +255,8 @@ async def list_notifications(
     count_q = select(func.count()).select_from(base.subquery())
     total = (await db.execute(count_q)).scalar() or 0
 
-    # Count unread
-    unread_q = select(func.count()).where(
-        Notification.user_id == user_id,
-        Notification.org_id == org_id,
-        Notification.is_read == False,  # noqa: E712
-    )
-    unread_count = (await db.execute(unread_q)).scalar() or 0
+    # Count unread (Redis-cached)
+    unread_count = await get_unread_count(db, user_id, org_id)
 
     # Filter by is_read
     query = base
@@ -139,13 +276,37 @@ async def get_unread_count(
     user_id: UUID,
     org_id: UUID,
 ) -> int:
-    """Lightweight count for polling badge."""
+    """Lightweight count for polling badge. Served from Redis, DB on cache miss."""
+    global _fill_script
+    key = _unread_key(user_id, org_id)
+    version_key = _unread_version_key(user_id, org_id)
+    version = None  # stays None when Redis is unreachable — no fill then
+    try:
+        cached, seen = await get_redis().mget(key, version_key)
+        if cached is not None:
+            return max(int(cached), 0)
+        version = seen or ""
+    except Exception:
+        logger.warning("Unread count cache read failed for user %s", user_id, exc_info=True)
+
     q = select(func.count()).where(
         Notification.user_id == user_id,
         Notification.org_id == org_id,
         Notification.is_read == False,  # noqa: E712
     )
-    return (await db.execute(q)).scalar() or 0
+    count = (await db.execute(q)).scalar() or 0
+
+    if version is None:
+        return count
+    try:
+        r = get_redis()
+        if _fill_script is None:
+            _fill_script = r.register_script(_FILL_IF_UNCHANGED_LUA)
+        # a write committed since the MGET bumped the version — leave the key empty
+        await _fill_script(keys=[key, version_key], args=[version, count, UNREAD_COUNT_TTL_SECONDS])
+    except Exception:
+        logger.warning("Unread count cache fill failed for user %s", user_id, exc_info=True)
+    return count
 
 
 async def mark_as_read(
@@ -163,6 +324,8 @@ async def mark_as_read(
     result = await db.execute(q)
     notif = result.scalar_one_or_none()
     if notif:
+        if not notif.is_read:
+            _stage(db, ("invalidate", user_id, org_id, None))
         notif.is_read = True
         await db.flush()
     return notif
@@ -185,6 +348,7 @@ async def mark_all_as_read(
     )
     result = await db.execute(stmt)
     await db.flush()
+    _stage(db, ("invalidate", user_id, org_id, None))
     return result.rowcount
 
 
@@ -202,10 +366,16 @@ async def delete_notification(
             Notification.user_id == user_id,
             Notification.org_id == org_id,
         )
+        .returning(Notification.is_read)
     )
     result = await db.execute(stmt)
+    was_read = result.scalar_one_or_none()
     await db.flush()
-    return result.rowcount > 0
+    if was_read is None:
+        return False
+    if not was_read:
+        _stage(db, ("invalidate", user_id, org_id, None))
+    return True
 
 
 # ============================================================
@@ -228,7 +398,7 @@ async def get_employee_user_id(db: AsyncSession, employee_id: UUID) -> UUID | No
 
 
 # ============================================================
-# Event Helpers — called after db.commit() in service files
+# Event Helpers — called from service files (approval requests before db.commit(), others after)
 # ============================================================
 
 async def get_approver_user_ids(
@@ -279,53 +449,70 @@ async def notify_approval_request(
 ) -> None:
     """
     Create APPROVAL_REQUEST notifications for all users with a specific approve permission.
-    Also triggers email notification if EMAIL_ENABLED.
+    Also queues email notifications (email_outbox) if email is enabled.
+
+    Call BEFORE the submit's db.commit(): notifications and emails ride on the caller's
+    transaction, so they exist if and only if the submit commits. They are written in a
+    SAVEPOINT — a failure here is logged and never aborts the business change. After
+    committing, the caller calls publish_pending_notifications(db).
     """
+    await db.flush()  # the business change's own errors surface to the caller, not here
+    pending = db.info.get(_PENDING_KEY)
+    staged = len(pending) if pending else 0
     try:
-        user_ids = await get_approver_user_ids(db, org_id, permission, exclude_user_id)
-        if not user_ids:
-            return
-
-        title = f"{doc_type_thai} รออนุมัติ"
-        message = f"{doc_type_thai} {doc_number} ส่งโดย {actor_name}"
-
-        await create_notifications_bulk(
-            db,
-            user_ids=user_ids,
-            org_id=org_id,
-            notification_type=NotificationType.APPROVAL_REQUEST,
-            title=title,
-            message=message,
-            link=link,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            actor_id=actor_id,
-            actor_name=actor_name,
-        )
-        await db.commit()
-
-        # Dual channel: also send email if enabled
-        try:
-            from app.services.email import send_approval_request, build_detail_url
-            from app.models.user import User
-
-            for uid in user_ids:
-                user_q = select(User).where(User.id == uid)
-                user_result = await db.execute(user_q)
-                user = user_result.scalar_one_or_none()
-                if user and user.email:
-                    await send_approval_request(
-                        to_email=user.email,
-                        approver_name=user.full_name or user.email,
-                        document_type=doc_type_thai,
-                        document_number=doc_number,
-                        requester_name=actor_name,
-                        detail_url=build_detail_url(doc_type_thai, str(entity_id)),
-                    )
-        except Exception:
-            logger.warning("Email notification failed for %s %s", entity_type, doc_number, exc_info=True)
+        async with db.begin_nested():
+            user_ids = await get_approver_user_ids(db, org_id, permission, exclude_user_id)
+            if not user_ids:
+                return
+
+            title = f"{doc_type_thai} รออนุมัติ"
+            message = f"{doc_type_thai} {doc_number} ส่งโดย {actor_name}"
+
+            await create_notifications_bulk(
+                db,
+                user_ids=user_ids,
+                org_id=org_id,
+                notification_type=NotificationType.APPROVAL_REQUEST,
+                title=title,
+                message=message,
+                link=link,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                actor_id=actor_id,
+                actor_name=actor_name,
+            )
+
+            # Dual channel: queue email in the same transaction (delivered by outbox worker)
+            try:
+                async with db.begin_nested():
+                    from app.services.email import enqueue_approval_request, build_detail_url
+                    from app.models.user import User
+
+                    users = (await db.execute(
+                        select(User.email, User.full_name).where(User.id.in_(user_ids))
+                    )).all()
+                    detail_url = build_detail_url(doc_type_thai, str(entity_id))
+                    for u in users:
+                        if u.email:
+                            enqueue_approval_request(
+                                db,
+                                org_id=org_id,
+                                to_email=u.email,
+                                approver_name=u.full_name or u.email,
+                                document_type=doc_type_thai,
+                                document_number=doc_number,
+                                requester_name=actor_name,
+                                detail_url=detail_url,
+                                entity_type=entity_type,
+                                entity_id=entity_id,
+                            )
+            except Exception:
+                logger.warning("Email enqueue failed for %s %s", entity_type, doc_number, exc_info=True)
 
     except Exception:
+        ops = db.info.get(_PENDING_KEY)
+        if ops:
+            del ops[staged:]  # pushes for the rolled-back notifications
         logger.warning("Failed to create approval notifications for %s %s", entity_type, doc_number, exc_info=True)
 
 
@@ -348,16 +535,7 @@ async def notify_status_change(
     Create a DOCUMENT_APPROVED/REJECTED notification for a specific user (document creator).
     """
     try:
-        type_labels = {
-            NotificationType.DOCUMENT_APPROVED: "อนุมัติแล้ว",
-            NotificationType.DOCUMENT_REJECTED: "ถูกปฏิเสธ",
-        }
-        action_label = type_labels.get(notification_type, "อัปเดต")
-
-        title = f"{doc_type_thai} {action_label}"
-        message = f"{doc_type_thai} {doc_number} {action_label}โดย {actor_name}"
-        if reason:
-            message += f": {reason}"
+        title, message = _status_change_text(notification_type, doc_type_thai, doc_number, actor_name, reason)
 
         await create_notification(
             db,
@@ -373,69 +551,69 @@ async def notify_status_change(
             actor_name=actor_name,
         )
         await db.commit()
+        await publish_pending_notifications(db)
     except Exception:
         logger.warning("Failed to create status change notification for %s %s", entity_type, doc_number, exc_info=True)
 
 
-async def notify_low_stock(
+async def notify_status_change_many(
     db: AsyncSession,
     *,
     org_id: UUID,
-    product_id: UUID,
-    product_sku: str,
-    product_name: str,
-    on_hand: int | float,
-    min_stock: int | float,
+    targets: list[tuple[UUID, UUID, str]],
+    notification_type: NotificationType,
+    entity_type: str,
+    doc_type_thai: str,
+    link: str,
+    actor_id: UUID,
+    actor_name: str,
 ) -> None:
     """
-    Create LOW_STOCK_ALERT for supervisor+ users.
-    Dedup: skip if unread alert exists for same product.
+    Batch notify_status_change — targets are (user_id, entity_id, doc_number).
+    One commit + one Redis publish for the whole batch (e.g. batch approvals).
     """
+    if not targets:
+        return
     try:
-        # Check for existing unread alert for this product
-        existing_q = select(func.count()).where(
-            Notification.org_id == org_id,
-            Notification.notification_type == NotificationType.LOW_STOCK_ALERT,
-            Notification.entity_type == "Product",
-            Notification.entity_id == product_id,
-            Notification.is_read == False,  # noqa: E712
-        )
-        existing = (await db.execute(existing_q)).scalar() or 0
-        if existing > 0:
-            return  # Already have unread low-stock alert for this product
+        for user_id, entity_id, doc_number in targets:
+            title, message = _status_change_text(notification_type, doc_type_thai, doc_number, actor_name)
+            await create_notification(
+                db,
+                user_id=user_id,
+                org_id=org_id,
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                link=link,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                actor_id=actor_id,
+                actor_name=actor_name,
+            )
+        await db.commit()
+        await publish_pending_notifications(db)
+    except Exception:
+        logger.warning("Failed to create %d status change notifications for %s", len(targets), entity_type, exc_info=True)
 
-        # Get supervisor+ users
-        user_ids = await get_approver_user_ids(
-            db, org_id, "inventory.product.read"
-        )
-        # Filter to supervisor+ (not staff/viewer) to avoid spamming
-        from app.models.user import User
-        q = select(User.id).where(
-            User.id.in_(user_ids),
-            User.role.in_(["owner", "manager", "supervisor"]),
-        )
-        result = await db.execute(q)
-        target_ids = list(result.scalars().all())
-        if not target_ids:
-            return
 
-        title = "สินค้าใกล้หมด"
-        message = f"{product_sku} ({product_name}) คงเหลือ {on_hand} (ต่ำกว่ากำหนด {min_stock})"
+def _status_change_text(
+    notification_type: NotificationType,
+    doc_type_thai: str,
+    doc_number: str,
+    actor_name: str,
+    reason: str | None = None,
+) -> tuple[str, str]:
+    type_labels = {
+        NotificationType.DOCUMENT_APPROVED: "อนุมัติแล้ว",
+        NotificationType.DOCUMENT_REJECTED: "ถูกปฏิเสธ",
+    }
+    action_label = type_labels.get(notification_type, "อัปเดต")
 
-        await create_notifications_bulk(
-            db,
-            user_ids=target_ids,
-            org_id=org_id,
-            notification_type=NotificationType.LOW_STOCK_ALERT,
-            title=title,
-            message=message,
-            link="/supply-chain",
-            entity_type="Product",
-            entity_id=product_id,
-        )
-        await db.commit()
-    except Exception:
-        logger.warning("Failed to create low stock notification for %s", product_sku, exc_info=True)
+    title = f"{doc_type_thai} {action_label}"
+    message = f"{doc_type_thai} {doc_number} {action_label}โดย {actor_name}"
+    if reason:
+        message += f": {reason}"
+    return title, message
 
 
 async def notify_leave_decision(
@@ -475,6 +653,7 @@ async def notify_leave_decision(
             actor_name=actor_name,
         )
         await db.commit()
+        await publish_pending_notifications(db)
     except Exception:
         logger.warning("Failed to create leave notification for user %s", user_id, exc_info=True)
 
@@ -514,6 +693,7 @@ async def notify_timesheet_decision(
             actor_name=actor_name,
         )
         await db.commit()
+        await publish_pending_notifications(db)
     except Exception:
         logger.warning("Failed to create timesheet notification for user %s", user_id, exc_info=True)
 
@@ -545,5 +725,6 @@ async def notify_po_received(
             actor_name=actor_name,
         )
         await db.commit()
+        await publish_pending_notifications(db)
     except Exception:
         logger.warning("Failed to create PO received notification for %s", po_number, exc_info=True)
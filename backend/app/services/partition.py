@@ -0,0 +1,169 @@
+"""
+SSS Corp ERP — Monthly Partition Maintenance
+Phase 15: Range-partitioned append-only tables (partition key: created_at)
+
+Naming: {table}_y{YYYY}m{MM} for monthly partitions, {table}_default as a safety net
+(rows outside every monthly range land there instead of failing the insert).
+
+Runs at startup and once a day from main.lifespan:
+  - creates partitions for the current month + PARTITION_MONTHS_AHEAD
+  - detaches + drops partitions older than the table's retention (0 = keep forever)
+"""
+
+import logging
+import re
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# table → Settings attribute holding retention in months (None = ledger, never dropped)
+PARTITIONED_TABLES: dict[str, str | None] = {
+    "audit_logs": "AUDIT_LOG_RETENTION_MONTHS",
+    "login_history": "LOGIN_HISTORY_RETENTION_MONTHS",
+    "export_audit_logs": "EXPORT_AUDIT_RETENTION_MONTHS",
+    "stock_movements": None,
+}
+
+_PARTITION_RE = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+def month_start(d: date | datetime) -> date:
+    return date(d.year, d.month, 1)
+
+
+def add_months(d: date, months: int) -> date:
+    idx = d.year * 12 + (d.month - 1) + months
+    return date(idx // 12, idx % 12 + 1, 1)
+
+
+def date_range_clauses(column, start: date | None, end: date | None) -> list:
+    """
+    Sargable, partition-prunable filter for a timestamptz column over whole days:
+    start <= column < end + 1 day. Use instead of func.date(column) BETWEEN ...
+    """
+    clauses = []
+    if start:
+        clauses.append(column >= start)
+    if end:
+        clauses.append(column < end + timedelta(days=1))
+    return clauses
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year}m{month.month:02d}"
+
+
+def _bound(d: date) -> str:
+    return f"{d.isoformat()} 00:00:00+00"
+
+
+async def _is_partitioned(db: AsyncSession, table: str) -> bool:
+    result = await db.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :t"
+        ),
+        {"t": table},
+    )
+    return result.scalar() is not None
+
+
+async def list_partitions(db: AsyncSession, table: str) -> list[str]:
+    result = await db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :t ORDER BY child.relname"
+        ),
+        {"t": table},
+    )
+    return list(result.scalars().all())
+
+
+async def ensure_monthly_partitions(
+    db: AsyncSession,
+    table: str,
+    *,
+    months_ahead: int,
+    start: date | None = None,
+) -> list[str]:
+    """CREATE the monthly partitions from `start` (default: this month) through +months_ahead."""
+    first = month_start(start or datetime.now(timezone.utc))
+    existing = set(await list_partitions(db, table))
+    created = []
+    for i in range(months_ahead + 1):
+        lo = add_months(first, i)
+        name = partition_name(table, lo)
+        if name in existing:
+            continue
+        try:
+            # Savepoint: fails if the default partition already holds rows for this range
+            async with db.begin_nested():
+                await db.execute(text(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+                    f"FOR VALUES FROM ('{_bound(lo)}') TO ('{_bound(add_months(lo, 1))}')"
+                ))
+            created.append(name)
+        except Exception:
+            logger.warning("Could not create partition %s", name, exc_info=True)
+    return created
+
+
+async def drop_partitions_before(
+    db: AsyncSession,
+    table: str,
+    cutoff: date,
+) -> list[str]:
+    """DETACH + DROP every monthly partition whose whole range is before `cutoff`."""
+    dropped = []
+    for name in await list_partitions(db, table):
+        m = _PARTITION_RE.search(name)
+        if not m:
+            continue  # default partition etc.
+        upper = add_months(date(int(m.group(1)), int(m.group(2)), 1), 1)
+        if upper > cutoff:
+            continue
+        await db.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+        await db.execute(text(f'DROP TABLE "{name}"'))
+        dropped.append(name)
+    return dropped
+
+
+async def maintain_partitions(db: AsyncSession) -> dict[str, dict]:
+    """
+    Create upcoming + drop expired partitions for every table in PARTITIONED_TABLES.
+    Serialized across processes with a transaction-scoped advisory lock.
+    """
+    settings = get_settings()
+    got_lock = (await db.execute(
+        text("SELECT pg_try_advisory_xact_lock(hashtext('partition_maintenance'))")
+    )).scalar()
+    if not got_lock:
+        return {}
+
+    summary: dict[str, dict] = {}
+    this_month = month_start(datetime.now(timezone.utc))
+    for table, retention_attr in PARTITIONED_TABLES.items():
+        if not await _is_partitioned(db, table):
+            continue
+        created = await ensure_monthly_partitions(
+            db, table, months_ahead=settings.PARTITION_MONTHS_AHEAD
+        )
+        dropped = []
+        retention = getattr(settings, retention_attr, 0) if retention_attr else 0
+        if retention > 0:
+            dropped = await drop_partitions_before(
+                db, table, add_months(this_month, -retention)
+            )
+        summary[table] = {"created": created, "dropped": dropped}
+        if created or dropped:
+            logger.info("Partitions %s: created=%s dropped=%s", table, created, dropped)
+    await db.commit()
+    return summary
@@ -27,11 +27,16 @@ async def flush_redis_buffer(redis_client, db: AsyncSession, batch_size: int = 2
     if not redis_client:
         return 0
 
+    # Take up to batch_size entries in one round trip (MULTI: LRANGE + LTRIM)
+    from app.core.redis import get_redis_manager
+
+    async with get_redis_manager().pipeline(redis_client, transaction=True) as pipe:
+        pipe.lrange("perf:buffer", 0, batch_size - 1)
+        pipe.ltrim("perf:buffer", batch_size, -1)
+    raws = pipe.results[0] or []
+
     count = 0
-    while count < batch_size:
-        raw = await redis_client.lpop("perf:buffer")
-        if not raw:
-            break
+    for raw in raws:
         try:
             entry = json.loads(raw)
             log = PerformanceLog(
@@ -25,6 +25,7 @@ from app.models.purchasing import (
     PurchaseRequisition,
     PurchaseRequisitionLine,
 )
+from app.services.events import record_event, record_status_change
 from app.services.inventory import create_movement
 from app.services.organization import get_or_create_tax_config
 
@@ -263,7 +264,10 @@ async def submit_purchase_requisition(
             detail=f"Can only submit DRAFT PR (current: {pr.status.value})",
         )
     pr.status = PRStatus.SUBMITTED
-    await db.commit()
+    await record_status_change(
+        db, org_id=org_id, aggregate_type="PR", aggregate_id=pr.id, number=pr.pr_number,
+        from_status=PRStatus.DRAFT, to_status=pr.status, actor_id=pr.created_by,
+    )
 
     # Phase 9: Notification — APPROVAL_REQUEST for PR approvers
     try:
@@ -279,6 +283,10 @@ async def submit_purchase_requisition(
         import logging
         logging.getLogger(__name__).warning("Notification failed for PR submit %s", pr.pr_number, exc_info=True)
 
+    await db.commit()
+    from app.services.notification import publish_pending_notifications
+    await publish_pending_notifications(db)
+
     return await get_purchase_requisition(db, pr_id, org_id=org_id)
 
 
@@ -309,6 +317,11 @@ async def approve_purchase_requisition(
         pr.approved_at = datetime.now(timezone.utc)
         pr.rejected_reason = reason
 
+    await record_status_change(
+        db, org_id=org_id, aggregate_type="PR", aggregate_id=pr.id, number=pr.pr_number,
+        from_status=PRStatus.SUBMITTED, to_status=pr.status, actor_id=approved_by,
+        **({"reason": reason} if action == "reject" else {}),
+    )
     await db.commit()
 
     # Phase 9: Notification — APPROVED/REJECTED for PR creator
@@ -348,7 +361,12 @@ async def cancel_purchase_requisition(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=f"Can only cancel DRAFT/SUBMITTED PR (current: {pr.status.value})",
         )
+    from_status = pr.status
     pr.status = PRStatus.CANCELLED
+    await record_status_change(
+        db, org_id=org_id, aggregate_type="PR", aggregate_id=pr.id, number=pr.pr_number,
+        from_status=from_status, to_status=pr.status,
+    )
     await db.commit()
     return await get_purchase_requisition(db, pr_id, org_id=org_id)
 
@@ -526,6 +544,11 @@ async def convert_pr_to_po(
 
         # Update PR status
         pr.status = PRStatus.PO_CREATED
+        await record_status_change(
+            db, org_id=org_id, aggregate_type="PR", aggregate_id=pr.id, number=pr.pr_number,
+            from_status=PRStatus.APPROVED, to_status=pr.status, actor_id=created_by,
+            po_id=po.id, po_number=po.po_number,
+        )
 
         await db.commit()
     except HTTPException:
@@ -719,8 +742,13 @@ async def approve_purchase_order(
             detail=f"Cannot approve PO in {po.status.value} status",
         )
 
+    from_status = po.status
     po.status = POStatus.APPROVED
     po.approved_by = approved_by
+    await record_status_change(
+        db, org_id=po.org_id, aggregate_type="PO", aggregate_id=po.id, number=po.po_number,
+        from_status=from_status, to_status=po.status, actor_id=approved_by,
+    )
     await db.commit()
     return await get_purchase_order(db, po_id, org_id=org_id)
 
@@ -809,6 +837,25 @@ async def receive_goods(
         if all_received:
             po.status = POStatus.RECEIVED
 
+        await record_event(
+            db, org_id=org_id, event_type="goods_received", aggregate_type="PO", aggregate_id=po.id,
+            payload={
+                "po_number": po.po_number,
+                "delivery_note_number": po.delivery_note_number,
+                "status": po.status,
+                "lines": [
+                    {
+                        "line_id": rl["line_id"],
+                        "product_id": lines_by_id[rl["line_id"]].product_id,
+                        "received_qty": rl["received_qty"],
+                        "location_id": rl.get("location_id"),
+                        "batch_number": rl.get("batch_number"),
+                    }
+                    for rl in receipt_lines
+                ],
+            },
+            actor_id=received_by,
+        )
         await db.commit()
     except HTTPException:
         await db.rollback()
@@ -22,6 +22,7 @@ from fastapi import HTTPException, status
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.cost_actuals import CostCenterActual
 from app.models.recharge import (
     FixedRechargeBudget,
     FixedRechargeEntry,
@@ -405,7 +406,8 @@ async def get_cost_center_summary(
 ) -> list[dict]:
     """
     Aggregate cost per cost center:
-    - Actual: labor, material, tool, overhead from existing finance report
+    - Actual: labor, material, tool, overhead from the monthly cost_center_actuals
+      rollup (app.services.cost_actuals)
     - Fixed Recharge: SUM(entries.amount) per target CC
     Returns combined rows.
     """
@@ -437,21 +439,43 @@ async def get_cost_center_summary(
     recharge_result = await db.execute(recharge_query)
     recharge_by_cc = {row[0]: row[1] or Decimal("0.00") for row in recharge_result.all()}
 
+    # Aggregate actuals per CC — keyed on (org_id, period_year, period_month)
+    actual_query = select(
+        CostCenterActual.cost_center_id,
+        func.sum(CostCenterActual.labor),
+        func.sum(CostCenterActual.material),
+        func.sum(CostCenterActual.tool),
+        func.sum(CostCenterActual.overhead),
+    ).where(
+        CostCenterActual.org_id == org_id,
+    )
+    if year:
+        actual_query = actual_query.where(CostCenterActual.period_year == year)
+    if month:
+        actual_query = actual_query.where(CostCenterActual.period_month == month)
+
+    actual_query = actual_query.group_by(CostCenterActual.cost_center_id)
+    actual_result = await db.execute(actual_query)
+    zero = (Decimal("0.00"),) * 4
+    actual_by_cc = {row[0]: tuple(row[1:]) for row in actual_result.all()}
+
     # Build summary rows
     rows = []
     for cc in cost_centers:
         fixed = recharge_by_cc.get(cc.id, Decimal("0.00"))
+        labor, material, tool, overhead = actual_by_cc.get(cc.id, zero)
+        actual_total = labor + material + tool + overhead
         rows.append({
             "cost_center_id": cc.id,
             "cost_center_code": cc.code,
             "cost_center_name": cc.name,
-            "actual_labor": Decimal("0.00"),
-            "actual_material": Decimal("0.00"),
-            "actual_tool": Decimal("0.00"),
-            "actual_overhead": Decimal("0.00"),
-            "actual_total": Decimal("0.00"),
+            "actual_labor": labor,
+            "actual_material": material,
+            "actual_tool": tool,
+            "actual_overhead": overhead,
+            "actual_total": actual_total,
             "fixed_recharge": fixed,
-            "grand_total": fixed,
+            "grand_total": actual_total + fixed,
         })
 
     return rows
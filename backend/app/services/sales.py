@@ -15,6 +15,7 @@ from sqlalchemy.orm import selectinload
 
 from app.models.sales import SOStatus, SalesOrder, SalesOrderLine
 from app.models.user import User
+from app.services.events import record_status_change
 from app.services.organization import get_or_create_tax_config
 
 
@@ -252,7 +253,10 @@ async def submit_sales_order(
     so.status = SOStatus.SUBMITTED
     # Clear rejected_reason when re-submitting
     so.rejected_reason = None
-    await db.commit()
+    await record_status_change(
+        db, org_id=so.org_id, aggregate_type="SO", aggregate_id=so.id, number=so.so_number,
+        from_status=SOStatus.DRAFT, to_status=so.status, actor_id=so.created_by,
+    )
 
     # Phase 9: Notification — APPROVAL_REQUEST for SO approvers
     try:
@@ -268,6 +272,10 @@ async def submit_sales_order(
         import logging
         logging.getLogger(__name__).warning("Notification failed for SO submit %s", so.so_number, exc_info=True)
 
+    await db.commit()
+    from app.services.notification import publish_pending_notifications
+    await publish_pending_notifications(db)
+
     return await get_sales_order(db, so_id)
 
 
@@ -291,6 +299,7 @@ async def approve_sales_order(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=f"Cannot approve/reject SO in {so.status.value} status",
         )
+    from_status = so.status
 
     if action == "approve":
         so.status = SOStatus.APPROVED
@@ -313,6 +322,11 @@ async def approve_sales_order(
             detail="action must be 'approve' or 'reject'",
         )
 
+    await record_status_change(
+        db, org_id=so.org_id, aggregate_type="SO", aggregate_id=so.id, number=so.so_number,
+        from_status=from_status, to_status=so.status, actor_id=approved_by,
+        **({"reason": reason} if action == "reject" else {}),
+    )
     await db.commit()
 
     # Phase 9: Notification — APPROVED/REJECTED for SO creator
@@ -361,7 +375,12 @@ async def cancel_sales_order(
             detail=f"Cannot cancel SO in {so.status.value} status",
         )
 
+    from_status = so.status
     so.status = SOStatus.CANCELLED
+    await record_status_change(
+        db, org_id=so.org_id, aggregate_type="SO", aggregate_id=so.id, number=so.so_number,
+        from_status=from_status, to_status=so.status,
+    )
     await db.commit()
     return await get_sales_order(db, so_id)
 
@@ -0,0 +1,331 @@
+"""
+SSS Corp ERP — Global Document Search Service
+Phase 15: Cross-entity search by document number (WO, PR, PO, SO, DO, SW, TF, ST, TCS, AP/AR invoices)
+
+Sync pattern: an ORM after_flush hook upserts document_search_index rows whenever a
+searchable document is created, renumbered, changes status or is soft-deleted.
+The upsert rides on the caller's transaction (same as create_audit_log) —
+if the business operation rolls back, the index row rolls back with it.
+
+Query pattern: prefix match on (org_id, search_key) first (btree, varchar_pattern_ops,
+highest numbers first in the index's own order), then trigram substring match
+(GIN pg_trgm) only when the prefix pass is short of `limit`.
+"""
+
+import logging
+from uuid import UUID
+
+from sqlalchemy import event, func, inspect, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.permissions import ROLE_PERMISSIONS
+from app.models.search import DocumentSearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# REGISTRY — one entry per searchable document type
+# ============================================================
+# model: "module:ClassName" (resolved lazily to avoid import cycles)
+# number: document-number attribute
+# title: optional attribute shown under the number in the result list
+# permission: read permission required to see hits of this type
+# link: frontend deep link (relative URL, same convention as Notification.link)
+
+SEARCHABLE_DOCUMENTS: dict[str, dict] = {
+    "WO": {
+        "model": "app.models.workorder:WorkOrder",
+        "number": "wo_number",
+        "title": "customer_name",
+        "permission": "workorder.order.read",
+        "link": "/work-orders/{id}",
+        "label": "ใบสั่งงาน",
+    },
+    "PR": {
+        "model": "app.models.purchasing:PurchaseRequisition",
+        "number": "pr_number",
+        "title": None,
+        "permission": "purchasing.pr.read",
+        "link": "/purchasing/pr/{id}",
+        "label": "ใบขอซื้อ",
+    },
+    "PO": {
+        "model": "app.models.purchasing:PurchaseOrder",
+        "number": "po_number",
+        "title": "supplier_name",
+        "permission": "purchasing.po.read",
+        "link": "/purchasing/po/{id}",
+        "label": "ใบสั่งซื้อ",
+    },
+    "SO": {
+        "model": "app.models.sales:SalesOrder",
+        "number": "so_number",
+        "title": None,
+        "permission": "sales.order.read",
+        "link": "/sales/{id}",
+        "label": "ใบสั่งขาย",
+    },
+    "DO": {
+        "model": "app.models.sales:DeliveryOrder",
+        "number": "do_number",
+        "title": None,
+        "permission": "sales.delivery.read",
+        "link": "/sales/delivery/{id}",
+        "label": "ใบส่งของ",
+    },
+    "SW": {
+        "model": "app.models.inventory:StockWithdrawalSlip",
+        "number": "slip_number",
+        "title": "reference",
+        "permission": "inventory.withdrawal.read",
+        "link": "/withdrawal-slips/{id}",
+        "label": "ใบเบิกของ",
+    },
+    "TF": {
+        "model": "app.models.inventory:TransferRequest",
+        "number": "transfer_number",
+        "title": "reference",
+        "permission": "inventory.movement.read",
+        "link": "/transfer-requests/{id}",
+        "label": "ใบโอนย้าย",
+    },
+    "ST": {
+        "model": "app.models.stocktake:StockTake",
+        "number": "stocktake_number",
+        "title": "reference",
+        "permission": "inventory.stocktake.read",
+        "link": "/stock-take/{id}",
+        "label": "ใบตรวจนับสต็อก",
+    },
+    "TCS": {
+        "model": "app.models.tools:ToolCheckoutSlip",
+        "number": "slip_number",
+        "title": "reference",
+        "permission": "tools.tool.read",
+        "link": "/tool-checkout-slips/{id}",
+        "label": "ใบเบิกเครื่องมือ",
+    },
+    "AP": {
+        "model": "app.models.invoice:SupplierInvoice",
+        "number": "invoice_number",
+        "title": None,
+        "permission": "finance.invoice.read",
+        "link": "/finance/invoices/{id}",
+        "label": "ใบแจ้งหนี้ผู้ขาย",
+    },
+    "AR": {
+        "model": "app.models.ar:CustomerInvoice",
+        "number": "invoice_number",
+        "title": None,
+        "permission": "finance.ar.read",
+        "link": "/finance/ar/{id}",
+        "label": "ใบแจ้งหนี้ลูกค้า",
+    },
+}
+
+# Attributes whose change triggers a re-index (besides number + title)
+_TRACKED_ATTRS = ("status", "is_active")
+
+_model_map: dict[type, str] | None = None
+
+
+def _get_model_map() -> dict[type, str]:
+    """Resolve registry model paths → {ModelClass: doc_type} (cached)."""
+    global _model_map
+    if _model_map is None:
+        import importlib
+
+        resolved = {}
+        for doc_type, spec in SEARCHABLE_DOCUMENTS.items():
+            module_path, class_name = spec["model"].split(":")
+            model = getattr(importlib.import_module(module_path), class_name)
+            resolved[model] = doc_type
+        _model_map = resolved
+    return _model_map
+
+
+def allowed_doc_types(role: str | None) -> list[str]:
+    """Document types whose read permission is granted to `role`."""
+    perms = ROLE_PERMISSIONS.get(role or "", set())
+    return [t for t, spec in SEARCHABLE_DOCUMENTS.items() if spec["permission"] in perms]
+
+
+def build_link(doc_type: str, doc_id: UUID) -> str:
+    return SEARCHABLE_DOCUMENTS[doc_type]["link"].format(id=doc_id)
+
+
+# ============================================================
+# INDEX SYNC (after_flush hook)
+# ============================================================
+
+def _status_value(obj) -> str | None:
+    status = getattr(obj, "status", None)
+    if status is None:
+        return None
+    return status.value if hasattr(status, "value") else str(status)
+
+
+def _index_row(obj, doc_type: str) -> dict | None:
+    spec = SEARCHABLE_DOCUMENTS[doc_type]
+    number = getattr(obj, spec["number"], None)
+    if not number or obj.id is None or obj.org_id is None:
+        return None
+    title = getattr(obj, spec["title"], None) if spec["title"] else None
+    return {
+        "org_id": obj.org_id,
+        "doc_type": doc_type,
+        "doc_id": obj.id,
+        "doc_number": number,
+        "search_key": number.upper(),
+        "status": _status_value(obj),
+        "title": title[:255] if title else None,
+        "is_active": bool(getattr(obj, "is_active", True)),
+    }
+
+
+def _needs_reindex(obj, doc_type: str) -> bool:
+    spec = SEARCHABLE_DOCUMENTS[doc_type]
+    attrs = [spec["number"], *_TRACKED_ATTRS]
+    if spec["title"]:
+        attrs.append(spec["title"])
+    state = inspect(obj)
+    for attr in attrs:
+        if attr in state.attrs and state.attrs[attr].history.has_changes():
+            return True
+    return False
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_search_index(session: Session, flush_context) -> None:
+    """Upsert/delete index rows for documents touched by this flush."""
+    model_map = _get_model_map()
+
+    rows = []
+    for obj in session.new:
+        doc_type = model_map.get(type(obj))
+        if doc_type:
+            row = _index_row(obj, doc_type)
+            if row:
+                rows.append(row)
+    for obj in session.dirty:
+        doc_type = model_map.get(type(obj))
+        if doc_type and _needs_reindex(obj, doc_type):
+            row = _index_row(obj, doc_type)
+            if row:
+                rows.append(row)
+
+    deleted = [
+        (model_map[type(obj)], obj.id)
+        for obj in session.deleted
+        if type(obj) in model_map
+    ]
+
+    if not rows and not deleted:
+        return
+
+    conn = session.connection()
+    if rows:
+        stmt = pg_insert(DocumentSearchIndex.__table__).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_doc_search_type_id",
+            set_={
+                "doc_number": stmt.excluded.doc_number,
+                "search_key": stmt.excluded.search_key,
+                "status": stmt.excluded.status,
+                "title": stmt.excluded.title,
+                "is_active": stmt.excluded.is_active,
+                "doc_updated_at": func.now(),
+                "updated_at": func.now(),
+            },
+        )
+        conn.execute(stmt)
+    for doc_type, doc_id in deleted:
+        conn.execute(
+            DocumentSearchIndex.__table__.delete().where(
+                DocumentSearchIndex.doc_type == doc_type,
+                DocumentSearchIndex.doc_id == doc_id,
+            )
+        )
+
+
+# ============================================================
+# QUERY
+# ============================================================
+
+# Descending by the varchar_pattern_ops ">" (byte order): a backward scan of
+# ix_doc_search_org_key_prefix stops after `limit` rows. "search_key DESC" is
+# collation order, which that index can't return — every prefix hit gets sorted.
+_PREFIX_ORDER = text(f"{DocumentSearchIndex.__tablename__}.search_key USING ~>~")
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def search_documents(
+    db: AsyncSession,
+    *,
+    org_id: UUID,
+    query: str,
+    doc_types: list[str],
+    limit: int = 20,
+) -> list[dict]:
+    """
+    Search documents by number. Prefix hits come first, then substring hits.
+    `doc_types` must already be RBAC-filtered by the caller (see allowed_doc_types).
+    """
+    key = query.strip().upper()
+    if not key or not doc_types:
+        return []
+
+    escaped = _escape_like(key)
+    base = select(
+        DocumentSearchIndex.doc_type,
+        DocumentSearchIndex.doc_id,
+        DocumentSearchIndex.doc_number,
+        DocumentSearchIndex.status,
+        DocumentSearchIndex.title,
+        DocumentSearchIndex.doc_updated_at,
+    ).where(
+        DocumentSearchIndex.org_id == org_id,
+        DocumentSearchIndex.is_active == True,  # noqa: E712
+        DocumentSearchIndex.doc_type.in_(doc_types),
+    )
+
+    # 1. Prefix pass — btree range scan on (org_id, search_key), read backwards
+    prefix_q = (
+        base.where(DocumentSearchIndex.search_key.like(f"{escaped}%", escape="\\"))
+        .order_by(_PREFIX_ORDER)
+        .limit(limit)
+    )
+    rows = list((await db.execute(prefix_q)).all())
+
+    # 2. Substring pass — trigram index needs >= 3 chars to be selective
+    if len(rows) < limit and len(key) >= 3:
+        seen = [r.doc_id for r in rows]
+        contains_q = base.where(
+            DocumentSearchIndex.search_key.like(f"%{escaped}%", escape="\\"),
+        )
+        if seen:
+            contains_q = contains_q.where(DocumentSearchIndex.doc_id.notin_(seen))
+        contains_q = contains_q.order_by(
+            DocumentSearchIndex.doc_updated_at.desc()
+        ).limit(limit - len(rows))
+        rows.extend((await db.execute(contains_q)).all())
+
+    return [
+        {
+            "doc_type": r.doc_type,
+            "doc_type_label": SEARCHABLE_DOCUMENTS[r.doc_type]["label"],
+            "doc_id": r.doc_id,
+            "doc_number": r.doc_number,
+            "status": r.status,
+            "title": r.title,
+            "link": build_link(r.doc_type, r.doc_id),
+            "updated_at": r.doc_updated_at,
+        }
+        for r in rows
+    ]
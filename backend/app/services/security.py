@@ -7,9 +7,8 @@ import re
 import secrets
 import uuid
 from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
 
-import pyotp
-from cryptography.fernet import Fernet, InvalidToken
 from sqlalchemy import select, func, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,14 +16,21 @@ from app.core.config import get_settings
 from app.core.security import hash_password, verify_password
 from app.models.security import LoginHistory, LoginStatus, OrgSecurityConfig
 from app.models.user import User, RefreshToken
+from app.services.audit_writer import get_audit_writer
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
 
 
 # ============================================================
 # TOTP ENCRYPTION
+# pyotp / cryptography are imported on first 2FA use — keeps them out of API cold start
 # ============================================================
 
-def _get_fernet() -> Fernet:
+def _get_fernet() -> "Fernet":
     """Get Fernet cipher using TOTP_ENCRYPTION_KEY."""
+    from cryptography.fernet import Fernet
+
     settings = get_settings()
     key = settings.TOTP_ENCRYPTION_KEY
     # Pad/derive a valid Fernet key from the config string
@@ -44,6 +50,8 @@ def encrypt_totp_secret(secret: str) -> str:
 
 def decrypt_totp_secret(encrypted: str) -> str:
     """Decrypt stored TOTP secret."""
+    from cryptography.fernet import InvalidToken
+
     f = _get_fernet()
     try:
         return f.decrypt(encrypted.encode()).decode()
@@ -166,17 +174,27 @@ async def record_login_attempt(
     user_agent: str | None,
     status: LoginStatus,
     failure_reason: str | None = None,
-) -> LoginHistory:
-    """Record a login attempt."""
-    entry = LoginHistory(
-        email=email,
-        user_id=user_id,
-        org_id=org_id,
-        ip_address=ip_address,
-        user_agent=user_agent[:500] if user_agent and len(user_agent) > 500 else user_agent,
-        status=status,
-        failure_reason=failure_reason,
-    )
+) -> LoginHistory | None:
+    """
+    Record a login attempt.
+    With AUDIT_ASYNC_WRITES the row is queued on the batched writer instead
+    (returns None); falls back to the caller's session if the queue is unavailable.
+    """
+    row = {
+        "id": uuid.uuid4(),
+        "email": email,
+        "user_id": user_id,
+        "org_id": org_id,
+        "ip_address": ip_address,
+        "user_agent": user_agent[:500] if user_agent and len(user_agent) > 500 else user_agent,
+        "status": status,
+        "failure_reason": failure_reason,
+    }
+    writer = get_audit_writer()
+    if writer is not None and writer.submit(LoginHistory, row):
+        return None
+
+    entry = LoginHistory(**row)
     db.add(entry)
     await db.flush()
     return entry
@@ -287,6 +305,8 @@ async def setup_2fa(db: AsyncSession, user: User) -> dict:
     Initialize 2FA setup. Returns secret + QR URI + backup codes.
     Does NOT enable 2FA yet — user must verify first.
     """
+    import pyotp
+
     # Generate TOTP secret
     secret = pyotp.random_base32()
 
@@ -320,6 +340,8 @@ async def verify_and_enable_2fa(
     db: AsyncSession, user: User, code: str
 ) -> bool:
     """Verify TOTP code and enable 2FA if correct."""
+    import pyotp
+
     if not user.totp_secret:
         return False
 
@@ -341,6 +363,8 @@ async def verify_2fa_code(
     Verify 2FA code. Tries TOTP first, then backup codes.
     Backup codes are consumed on use.
     """
+    import pyotp
+
     if not user.totp_secret:
         return False
 
@@ -541,6 +565,18 @@ async def revoke_other_sessions(
 # EXPORT AUDIT LOG (Phase 13.7)
 # ============================================================
 
+async def _load_user_names(
+    db: AsyncSession, user_ids: set[uuid.UUID]
+) -> dict[uuid.UUID, tuple[str | None, str | None]]:
+    """{user_id: (email, full_name)} for audit list enrichment."""
+    if not user_ids:
+        return {}
+    result = await db.execute(
+        select(User.id, User.email, User.full_name).where(User.id.in_(user_ids))
+    )
+    return {row.id: (row.email, row.full_name) for row in result}
+
+
 async def log_export(
     db: AsyncSession,
     user_id: uuid.UUID,
@@ -556,18 +592,22 @@ async def log_export(
     """Fire-and-forget export audit log. Errors silenced to not break exports."""
     try:
         from app.models.security import ExportAuditLog
-        entry = ExportAuditLog(
-            user_id=user_id,
-            org_id=org_id,
-            endpoint=endpoint,
-            resource_type=resource_type,
-            record_count=record_count,
-            file_format=file_format,
-            ip_address=ip_address,
-            user_agent=user_agent[:500] if user_agent and len(user_agent) > 500 else user_agent,
-            filters_used=filters_used,
-        )
-        db.add(entry)
+        row = {
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "org_id": org_id,
+            "endpoint": endpoint,
+            "resource_type": resource_type,
+            "record_count": record_count,
+            "file_format": file_format,
+            "ip_address": ip_address,
+            "user_agent": user_agent[:500] if user_agent and len(user_agent) > 500 else user_agent,
+            "filters_used": filters_used,
+        }
+        writer = get_audit_writer()
+        if writer is not None and writer.submit(ExportAuditLog, row):
+            return
+        db.add(ExportAuditLog(**row))
         await db.commit()
     except Exception:
         import logging as _log
@@ -605,18 +645,11 @@ async def get_export_audit_log(
     result = await db.execute(items_q)
     items = list(result.scalars().all())
 
-    # Enrich with user email/name
+    # Enrich with user email/name (one query for the page)
     enriched = []
-    user_cache = {}
+    user_cache = await _load_user_names(db, {item.user_id for item in items})
     for item in items:
-        if item.user_id not in user_cache:
-            u_result = await db.execute(
-                select(User.email, User.full_name).where(User.id == item.user_id)
-            )
-            u_row = u_result.one_or_none()
-            user_cache[item.user_id] = (u_row[0] if u_row else None, u_row[1] if u_row else None)
-
-        email, name = user_cache[item.user_id]
+        email, name = user_cache.get(item.user_id, (None, None))
         enriched.append({
             "id": item.id,
             "user_id": item.user_id,
@@ -726,20 +759,10 @@ async def get_audit_logs(
     result = await db.execute(items_q)
     items = list(result.scalars().all())
 
-    # Enrich with user email/name (batch cache)
+    # Enrich with user email/name (one query for the page)
     enriched = []
-    user_cache: dict = {}
+    user_cache = await _load_user_names(db, {item.user_id for item in items if item.user_id})
     for item in items:
-        if item.user_id and item.user_id not in user_cache:
-            u_result = await db.execute(
-                select(User.email, User.full_name).where(User.id == item.user_id)
-            )
-            u_row = u_result.one_or_none()
-            user_cache[item.user_id] = (
-                u_row[0] if u_row else None,
-                u_row[1] if u_row else None,
-            )
-
         email, name = user_cache.get(item.user_id, (None, None)) if item.user_id else (None, None)
         enriched.append({
             "id": item.id,
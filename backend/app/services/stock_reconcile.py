@@ -0,0 +1,364 @@
+"""
+SSS Corp ERP — Stock Ledger Reconciliation + Drift Repair
+Phase 15: recompute on-hand from stock_movements and compare with the balances
+
+Product.on_hand, StockByLocation.on_hand and StockBatch.on_hand are maintained by
+_create_movement_inner / _reverse_movement_inner only. A failed deploy or a manual
+SQL fix can leave them out of step with the ledger, so this replays the ledger —
+with the same signed legs as the snapshots (stock_snapshot._movement_delta_sql) —
+and reports every key whose balance differs, at all three levels:
+
+  product   products.on_hand             vs Σ all legs of the product
+  location  stock_by_location.on_hand    vs Σ legs at (product, location)
+  batch     stock_batches.on_hand        vs Σ legs at (product, location, batch)
+
+Work is split into product-ID ranges (chunk_size products each) and the ranges are
+checked concurrently, one background session per worker, each range in one
+statement (index range scan on (org_id, product_id, created_at) in every partition).
+
+Repair runs per product set in one guarded transaction: product rows locked in id
+order (the same lock create_movement takes first), discrepancies recomputed under
+the lock, aborted when they exceed max_fixes, then balances set to the ledger value.
+Run: python -m app.reconcile_stock [--repair]
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import stage_invalidation
+from app.core.config import get_settings
+from app.services.low_stock import sync_low_stock
+from app.services.stock_snapshot import _movement_delta_sql
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+RECONCILE_LEVELS = ("product", "location", "batch")
+
+_NO_LOCATION = "'00000000-0000-0000-0000-000000000000'::uuid"
+
+
+class ReconcileAbort(Exception):
+    """Repair refused — more discrepancies than the caller allowed, nothing written."""
+
+
+def _reconcile_sql(cond: str) -> str:
+    """Discrepancy rows (level, product_id, location_id, batch_number, actual, expected)."""
+    def scoped(col: str) -> str:
+        return cond.format(p=col)
+
+    return f"""
+        WITH d AS ({_movement_delta_sql(cond, since=False)}),
+        exp_location AS (
+            SELECT product_id, location_id, SUM(qty) AS qty
+            FROM d WHERE location_id IS NOT NULL GROUP BY 1, 2
+        ),
+        exp_product AS (
+            SELECT product_id, SUM(qty) AS qty FROM d GROUP BY 1
+        ),
+        exp_batch AS (
+            SELECT product_id, location_id, batch_number, qty
+            FROM d WHERE batch_number IS NOT NULL
+        )
+        SELECT 'product' AS level, COALESCE(a.id, e.product_id) AS product_id,
+               CAST(NULL AS uuid) AS location_id, CAST(NULL AS varchar) AS batch_number,
+               COALESCE(a.on_hand, 0) AS actual, COALESCE(e.qty, 0) AS expected
+        FROM (
+            SELECT id, on_hand FROM products
+            WHERE org_id = :org_id {scoped("id")}
+        ) a
+        FULL JOIN exp_product e ON e.product_id = a.id
+        WHERE COALESCE(a.on_hand, 0) <> COALESCE(e.qty, 0)
+        UNION ALL
+        SELECT 'location', COALESCE(a.product_id, e.product_id), COALESCE(a.location_id, e.location_id),
+               NULL, COALESCE(a.on_hand, 0), COALESCE(e.qty, 0)
+        FROM (
+            SELECT product_id, location_id, on_hand FROM stock_by_location
+            WHERE org_id = :org_id {scoped("product_id")}
+        ) a
+        FULL JOIN exp_location e
+          ON e.product_id = a.product_id AND e.location_id = a.location_id
+        WHERE COALESCE(a.on_hand, 0) <> COALESCE(e.qty, 0)
+        UNION ALL
+        SELECT 'batch', COALESCE(a.product_id, e.product_id), COALESCE(a.location_id, e.location_id),
+               COALESCE(a.batch_number, e.batch_number), COALESCE(a.on_hand, 0), COALESCE(e.qty, 0)
+        FROM (
+            SELECT product_id, location_id, batch_number, on_hand FROM stock_batches
+            WHERE org_id = :org_id {scoped("product_id")}
+        ) a
+        FULL JOIN exp_batch e
+          ON e.product_id = a.product_id
+         AND e.batch_number = a.batch_number
+         AND COALESCE(e.location_id, {_NO_LOCATION}) = COALESCE(a.location_id, {_NO_LOCATION})
+        WHERE COALESCE(a.on_hand, 0) <> COALESCE(e.qty, 0)
+    """
+
+
+_RANGE_SQL = text(_reconcile_sql(" AND {p} BETWEEN :lo AND :hi"))
+_PRODUCTS_SQL = text(_reconcile_sql(" AND {p} = ANY(:product_ids)"))
+
+# First and last product id of every chunk_size block (uuid has no MIN/MAX aggregate)
+_CHUNK_BOUNDS_SQL = text("""
+    SELECT id, rn, total
+    FROM (
+        SELECT id, ROW_NUMBER() OVER (ORDER BY id) AS rn, COUNT(*) OVER () AS total
+        FROM products WHERE org_id = :org_id
+    ) p
+    WHERE (rn - 1) % :chunk_size = 0 OR rn % :chunk_size = 0 OR rn = total
+    ORDER BY rn
+""")
+
+
+async def product_chunks(db: AsyncSession, *, org_id: UUID, chunk_size: int) -> list[tuple[UUID, UUID, int]]:
+    """(lo, hi, products) id ranges covering every product of org_id, chunk_size products each."""
+    rows = (await db.execute(_CHUNK_BOUNDS_SQL, {"org_id": org_id, "chunk_size": chunk_size})).all()
+    chunks, lo = [], None
+    for row in rows:
+        if (row.rn - 1) % chunk_size == 0:
+            lo = row
+        if row.rn % chunk_size == 0 or row.rn == row.total:
+            chunks.append((lo.id, row.id, row.rn - lo.rn + 1))
+    return chunks
+
+
+def _discrepancy(row) -> dict:
+    return {
+        "level": row.level,
+        "product_id": row.product_id,
+        "location_id": row.location_id,
+        "batch_number": row.batch_number,
+        "actual": int(row.actual),
+        "expected": int(row.expected),
+        "diff": int(row.actual) - int(row.expected),
+    }
+
+
+async def reconcile_chunk(db: AsyncSession, *, org_id: UUID, lo: UUID, hi: UUID) -> list[dict]:
+    """Discrepancies for products with lo <= id <= hi — one statement, one MVCC snapshot."""
+    rows = (await db.execute(_RANGE_SQL, {"org_id": org_id, "lo": lo, "hi": hi})).all()
+    await db.rollback()  # read-only; release the snapshot before the next chunk
+    return [_discrepancy(r) for r in rows]
+
+
+async def reconcile_stock(
+    *,
+    org_id: UUID,
+    chunk_size: int = 500,
+    concurrency: Optional[int] = None,
+    session_factory=None,
+) -> dict:
+    """
+    Check every product of org_id against the ledger, chunk_size products per range,
+    `concurrency` ranges at a time (capped by DB_BACKGROUND_MAX_SESSIONS, since each
+    worker holds a background session). Read-only.
+    """
+    from app.core.database import background_session
+
+    session_factory = session_factory or background_session
+    cap = settings.DB_BACKGROUND_MAX_SESSIONS
+    workers = max(1, min(concurrency or cap, cap))
+    started = time.perf_counter()
+
+    async with session_factory() as db:
+        chunks = await product_chunks(db, org_id=org_id, chunk_size=chunk_size)
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for chunk in chunks:
+        queue.put_nowait(chunk)
+    found: list[dict] = []
+
+    async def _worker() -> None:
+        async with session_factory() as db:
+            while True:
+                try:
+                    lo, hi, _ = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                found.extend(await reconcile_chunk(db, org_id=org_id, lo=lo, hi=hi))
+
+    await asyncio.gather(*(_worker() for _ in range(min(workers, len(chunks)))))
+
+    found.sort(key=lambda d: (
+        RECONCILE_LEVELS.index(d["level"]), str(d["product_id"]),
+        str(d["location_id"] or ""), d["batch_number"] or "",
+    ))
+    return {
+        "org_id": org_id,
+        "products": sum(c[2] for c in chunks),
+        "chunks": len(chunks),
+        "workers": min(workers, len(chunks)),
+        "elapsed_s": round(time.perf_counter() - started, 2),
+        "by_level": {lvl: sum(1 for d in found if d["level"] == lvl) for lvl in RECONCILE_LEVELS},
+        "discrepancies": found,
+    }
+
+
+# ============================================================
+# REPAIR
+# ============================================================
+
+_FIX_PRODUCTS_SQL = text("""
+    UPDATE products p SET on_hand = v.expected, updated_at = now()
+    FROM unnest(CAST(:product_ids AS uuid[]), CAST(:expected AS int[])) AS v(product_id, expected)
+    WHERE p.id = v.product_id AND p.org_id = :org_id
+""")
+
+_FIX_LOCATIONS_SQL = text("""
+    INSERT INTO stock_by_location (id, product_id, location_id, on_hand, org_id, created_at, updated_at)
+    SELECT gen_random_uuid(), v.product_id, v.location_id, v.expected, :org_id, now(), now()
+    FROM unnest(CAST(:product_ids AS uuid[]), CAST(:location_ids AS uuid[]), CAST(:expected AS int[]))
+         AS v(product_id, location_id, expected)
+    ON CONFLICT ON CONSTRAINT uq_stock_by_location_product_location
+    DO UPDATE SET on_hand = EXCLUDED.on_hand, updated_at = now()
+""")
+
+_FIX_BATCHES_SQL = text(f"""
+    WITH v AS (
+        SELECT * FROM unnest(
+            CAST(:product_ids AS uuid[]), CAST(:location_ids AS uuid[]),
+            CAST(:batch_numbers AS varchar[]), CAST(:expected AS int[])
+        ) AS v(product_id, location_id, batch_number, expected)
+    ),
+    upd AS (
+        UPDATE stock_batches b SET on_hand = v.expected, updated_at = now()
+        FROM v
+        WHERE b.org_id = :org_id
+          AND b.product_id = v.product_id
+          AND b.batch_number = v.batch_number
+          AND COALESCE(b.location_id, {_NO_LOCATION}) = COALESCE(v.location_id, {_NO_LOCATION})
+        RETURNING b.product_id, b.location_id, b.batch_number
+    )
+    INSERT INTO stock_batches (id, product_id, location_id, batch_number, on_hand, unit_cost, org_id,
+                               created_at, updated_at)
+    SELECT gen_random_uuid(), v.product_id, v.location_id, v.batch_number, v.expected,
+           COALESCE(p.cost, 0), :org_id, now(), now()
+    FROM v
+    JOIN products p ON p.id = v.product_id
+    WHERE NOT EXISTS (
+        SELECT 1 FROM upd
+        WHERE upd.product_id = v.product_id
+          AND upd.batch_number = v.batch_number
+          AND COALESCE(upd.location_id, {_NO_LOCATION}) = COALESCE(v.location_id, {_NO_LOCATION})
+    )
+""")
+
+
+async def repair_stock_drift(
+    db: AsyncSession,
+    *,
+    org_id: UUID,
+    product_ids: list[UUID],
+    max_fixes: int = 1000,
+    repaired_by: Optional[UUID] = None,
+) -> dict:
+    """
+    Set the balances of product_ids to what the ledger says, in one transaction.
+
+    Guards: product rows are locked (id order) before recomputing, so no movement can
+    land between check and fix; more than max_fixes discrepancies → ReconcileAbort and
+    nothing is written; keys whose ledger value is negative cannot satisfy the
+    on_hand >= 0 checks and are left alone (reported as skipped).
+    """
+    ids = sorted(set(product_ids))
+    if not ids:
+        return {"fixed": [], "skipped": []}
+
+    await db.execute(
+        text("SELECT id FROM products WHERE org_id = :org_id AND id = ANY(:ids) ORDER BY id FOR UPDATE"),
+        {"org_id": org_id, "ids": ids},
+    )
+    rows = (await db.execute(_PRODUCTS_SQL, {"org_id": org_id, "product_ids": ids})).all()
+    found = [_discrepancy(r) for r in rows]
+    if len(found) > max_fixes:
+        await db.rollback()
+        raise ReconcileAbort(f"{len(found)} discrepancies exceed max_fixes={max_fixes}")
+
+    fixed = [d for d in found if d["expected"] >= 0]
+    skipped = [d for d in found if d["expected"] < 0]
+    by_level = {lvl: [d for d in fixed if d["level"] == lvl] for lvl in RECONCILE_LEVELS}
+
+    if by_level["product"]:
+        await db.execute(_FIX_PRODUCTS_SQL, {
+            "org_id": org_id,
+            "product_ids": [d["product_id"] for d in by_level["product"]],
+            "expected": [d["expected"] for d in by_level["product"]],
+        })
+        await sync_low_stock(db, [d["product_id"] for d in by_level["product"]])
+    if by_level["location"]:
+        await db.execute(_FIX_LOCATIONS_SQL, {
+            "org_id": org_id,
+            "product_ids": [d["product_id"] for d in by_level["location"]],
+            "location_ids": [d["location_id"] for d in by_level["location"]],
+            "expected": [d["expected"] for d in by_level["location"]],
+        })
+    if by_level["batch"]:
+        await db.execute(_FIX_BATCHES_SQL, {
+            "org_id": org_id,
+            "product_ids": [d["product_id"] for d in by_level["batch"]],
+            "location_ids": [d["location_id"] for d in by_level["batch"]],
+            "batch_numbers": [d["batch_number"] for d in by_level["batch"]],
+            "expected": [d["expected"] for d in by_level["batch"]],
+        })
+
+    if fixed:
+        from app.services.security import create_audit_log
+
+        await create_audit_log(
+            db, user_id=repaired_by, org_id=org_id,
+            action="UPDATE", resource_type="stock_reconciliation",
+            resource_id=None,
+            description=f"ซ่อมยอดคงเหลือให้ตรง stock ledger {len(fixed)} รายการ",
+            changes={
+                "fixed": [
+                    {**d, "product_id": str(d["product_id"]),
+                     "location_id": str(d["location_id"]) if d["location_id"] else None}
+                    for d in fixed
+                ],
+            },
+        )
+    stage_invalidation(db, org_id, "inventory")
+    await db.commit()
+    for d in skipped:
+        logger.warning("Stock drift not repaired (ledger value negative): %s", d)
+    return {"fixed": fixed, "skipped": skipped}
+
+
+# ============================================================
+# MOVEMENT REFERENCES (no FKs since partitioning)
+# ============================================================
+# stock_movements is partitioned (PK = id + created_at), so the columns below cannot
+# carry a FK to it (migration b1c2d3e4f5g6). They stay valid by how they are written:
+#   - each is set only from a movement flushed in the same transaction (reversal,
+#     withdrawal / transfer / stock take / delivery posting) — reference and movement
+#     commit or roll back together
+#   - movements are never deleted: corrections are reversals, and stock_movements has
+#     no partition retention (partition.PARTITIONED_TABLES)
+# find_dangling_movement_refs() checks that invariant; python -m app.reconcile_stock
+# reports any reference that breaks it.
+
+MOVEMENT_REFS: tuple[tuple[str, str], ...] = (
+    ("stock_movements", "reversed_by_id"),
+    ("stock_withdrawal_slip_lines", "movement_id"),
+    ("stock_take_lines", "movement_id"),
+    ("transfer_request_lines", "movement_id"),
+    ("delivery_order_lines", "movement_id"),
+)
+
+_DANGLING_REFS_SQL = text(" UNION ALL ".join(
+    f"SELECT '{table}.{column}' AS ref, count(*) AS n FROM {table} r "
+    f"WHERE r.{column} IS NOT NULL "
+    f"AND NOT EXISTS (SELECT 1 FROM stock_movements m WHERE m.id = r.{column})"
+    for table, column in MOVEMENT_REFS
+))
+
+
+async def find_dangling_movement_refs(db: AsyncSession) -> dict[str, int]:
+    """References (all orgs) whose movement does not exist — {"table.column": rows}, non-zero only."""
+    rows = (await db.execute(_DANGLING_REFS_SQL)).all()
+    return {ref: n for ref, n in rows if n}
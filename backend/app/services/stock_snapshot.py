@@ -0,0 +1,459 @@
+"""
+SSS Corp ERP — Month-end Stock Snapshots + Point-in-time Stock
+Phase 15: stock_snapshots / stock_snapshot_lines
+
+A snapshot freezes on-hand per (product, location, batch) at cutoff_at — the first
+instant (UTC, same bounds as the stock_movements partitions) after period_end.
+It is written in one INSERT … SELECT: live state (products / stock_by_location /
+stock_batches) minus every movement at or after the cutoff. The statement sees
+one MVCC snapshot, so the job can run any time after month end.
+
+Stock as of a date starts from the nearest base — a snapshot on either side, or
+live state — and replays only the movements between that base and the date.
+
+Live state decomposes into disjoint keys:
+  (product, location, batch)  stock_batches
+  (product, location, NULL)   stock_by_location − batches at that location
+  (product, NULL, NULL)       products.on_hand − Σ locations − unlocated batches
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.inventory import StockSnapshot
+from app.models.organization import Organization
+from app.services.partition import add_months, month_start
+
+logger = logging.getLogger(__name__)
+
+AS_OF_GROUPINGS = ("product", "location", "product_type")
+
+
+def period_end_of(d: date) -> date:
+    return add_months(month_start(d), 1) - timedelta(days=1)
+
+
+def cutoff_for(d: date) -> datetime:
+    """First instant after day d (UTC)."""
+    return datetime.combine(d + timedelta(days=1), time.min, tzinfo=timezone.utc)
+
+
+# ============================================================
+# SQL BUILDING BLOCKS
+# ============================================================
+
+def _live_sql(cond: str) -> str:
+    """(product_id, location_id, batch_number, qty, unit_cost) of live stock; cond filters on p / loc."""
+    return f"""
+        SELECT b.product_id, b.location_id, b.batch_number, b.on_hand AS qty, b.unit_cost
+        FROM stock_batches b
+        WHERE b.org_id = :org_id AND b.on_hand <> 0
+          {cond.format(p="b.product_id", loc="b.location_id")}
+        UNION ALL
+        SELECT s.product_id, s.location_id, NULL, s.on_hand - COALESCE(bl.qty, 0), NULL
+        FROM stock_by_location s
+        LEFT JOIN (
+            SELECT product_id, location_id, SUM(on_hand) AS qty
+            FROM stock_batches
+            WHERE org_id = :org_id AND location_id IS NOT NULL
+            GROUP BY 1, 2
+        ) bl ON bl.product_id = s.product_id AND bl.location_id = s.location_id
+        WHERE s.org_id = :org_id
+          {cond.format(p="s.product_id", loc="s.location_id")}
+        UNION ALL
+        SELECT p.id, NULL, NULL, p.on_hand - COALESCE(sl.qty, 0) - COALESCE(bn.qty, 0), NULL
+        FROM products p
+        LEFT JOIN (
+            SELECT product_id, SUM(on_hand) AS qty
+            FROM stock_by_location WHERE org_id = :org_id GROUP BY 1
+        ) sl ON sl.product_id = p.id
+        LEFT JOIN (
+            SELECT product_id, SUM(on_hand) AS qty
+            FROM stock_batches WHERE org_id = :org_id AND location_id IS NULL GROUP BY 1
+        ) bn ON bn.product_id = p.id
+        WHERE p.org_id = :org_id AND p.product_type <> 'SERVICE'
+          {cond.format(p="p.id", loc="CAST(NULL AS uuid)")}
+    """
+
+
+def _movement_delta_sql(cond: str, *, since: bool = True, until: bool = False) -> str:
+    """
+    Signed on-hand change per (product_id, location_id, batch_number) from movements
+    with created_at in [:since, :until) — either bound is dropped when False.
+    Mirrors services.inventory._calculate_qty_delta; a TRANSFER yields a source and a
+    destination leg, a REVERSAL is its original with the sign flipped.
+    """
+    window = ("AND m.created_at >= :since " if since else "") + ("AND m.created_at < :until" if until else "")
+    return f"""
+        SELECT m.product_id, leg.location_id, m.batch_number, SUM(leg.qty) AS qty, NULL::numeric AS unit_cost
+        FROM stock_movements m
+        CROSS JOIN LATERAL (
+            SELECT CASE WHEN m.movement_type = 'REVERSAL' THEN -1 ELSE 1 END AS sign,
+                   CASE WHEN m.movement_type = 'REVERSAL' THEN (
+                            -- only evaluated for reversal rows: one PK probe per partition
+                            SELECT o.movement_type FROM stock_movements o
+                            WHERE o.id = CASE WHEN m.reference ~ '^REVERSAL of [0-9a-f-]{{36}}$'
+                                              THEN CAST(substring(m.reference FROM 13 FOR 36) AS uuid) END
+                              AND o.created_at <= m.created_at
+                        )
+                        ELSE m.movement_type END AS kind
+        ) k
+        CROSS JOIN LATERAL (VALUES
+            (m.location_id, k.sign * CASE
+                WHEN k.kind IN ('RECEIVE', 'RETURN', 'PRODUCE', 'ADJUST') THEN m.quantity
+                WHEN k.kind IN ('ISSUE', 'CONSUME', 'TRANSFER') THEN -m.quantity
+                ELSE 0 END),
+            (m.to_location_id, CASE WHEN k.kind = 'TRANSFER' THEN k.sign * m.quantity ELSE 0 END)
+        ) AS leg(location_id, qty)
+        WHERE m.org_id = :org_id
+          {window}
+          AND leg.qty <> 0
+          {cond.format(p="m.product_id", loc="leg.location_id")}
+        GROUP BY 1, 2, 3
+    """
+
+
+def _snapshot_lines_sql(cond: str) -> str:
+    return f"""
+        SELECT l.product_id, l.location_id, l.batch_number, l.quantity AS qty, l.unit_cost
+        FROM stock_snapshot_lines l
+        WHERE l.snapshot_id = :base_id
+          {cond.format(p="l.product_id", loc="l.location_id")}
+    """
+
+
+def _filter_cond(product_id: Optional[UUID], location_id: Optional[UUID]) -> str:
+    cond = ""
+    if product_id:
+        cond += " AND {p} = :product_id"
+    if location_id:
+        cond += " AND {loc} = :location_id"
+    return cond
+
+
+def _state_cte(base_sql: str, delta_sql: str, *, delta_sign: int) -> str:
+    """state(product_id, location_id, batch_number, qty, unit_cost) = base + sign × delta."""
+    return f"""
+        state AS (
+            SELECT u.product_id, u.location_id, u.batch_number,
+                   SUM(u.qty) AS qty, MAX(u.unit_cost) AS unit_cost
+            FROM (
+                {base_sql}
+                UNION ALL
+                SELECT d.product_id, d.location_id, d.batch_number, {delta_sign} * d.qty, d.unit_cost
+                FROM ({delta_sql}) d
+            ) u
+            GROUP BY 1, 2, 3
+            HAVING SUM(u.qty) <> 0
+        ),
+        valued AS (
+            SELECT s.product_id, s.location_id, s.batch_number, s.qty,
+                   COALESCE(s.unit_cost, b.unit_cost, p.cost) AS unit_cost
+            FROM state s
+            JOIN products p ON p.id = s.product_id
+            LEFT JOIN stock_batches b
+              ON b.org_id = :org_id
+             AND b.product_id = s.product_id
+             AND b.batch_number = s.batch_number
+             AND b.location_id IS NOT DISTINCT FROM s.location_id
+        )
+    """
+
+
+_TAKE_SNAPSHOT_SQL = text(f"""
+    WITH {_state_cte(_live_sql(""), _movement_delta_sql(""), delta_sign=-1)},
+    ins AS (
+        INSERT INTO stock_snapshot_lines
+            (id, snapshot_id, product_id, location_id, batch_number, quantity, unit_cost, value)
+        SELECT gen_random_uuid(), CAST(:snapshot_id AS uuid), v.product_id, v.location_id, v.batch_number,
+               v.qty, v.unit_cost, v.qty * v.unit_cost
+        FROM valued v
+        RETURNING quantity, value
+    )
+    SELECT COUNT(*) AS line_count,
+           COALESCE(SUM(quantity), 0) AS total_quantity,
+           COALESCE(SUM(value), 0) AS total_value
+    FROM ins
+""")
+
+_GROUPINGS = {
+    "product": (
+        ("v.product_id", "p.sku", "p.name", "p.product_type", "p.unit"),
+        "p.sku",
+    ),
+    "location": (
+        ("v.product_id", "p.sku", "p.name", "p.product_type", "p.unit",
+         "v.location_id", "loc.name AS location_name", "v.batch_number"),
+        "p.sku, location_name NULLS FIRST, v.batch_number NULLS FIRST",
+    ),
+    "product_type": (("p.product_type",), "p.product_type"),
+}
+
+
+def _as_of_sql(state_cte: str, group_by: str) -> str:
+    cols, order = _GROUPINGS[group_by]
+    keys = ", ".join(c.split(" AS ")[0] for c in cols)
+    return f"""
+        WITH {state_cte}
+        SELECT {", ".join(cols)}, SUM(v.qty) AS quantity, SUM(v.qty * v.unit_cost) AS value
+        FROM valued v
+        JOIN products p ON p.id = v.product_id
+        LEFT JOIN locations loc ON loc.id = v.location_id
+        GROUP BY {keys}
+        ORDER BY {order}
+    """
+
+
+# ============================================================
+# SNAPSHOTS
+# ============================================================
+
+async def take_stock_snapshot(
+    db: AsyncSession,
+    *,
+    month: date,
+    org_id: UUID,
+    created_by: Optional[UUID] = None,
+) -> StockSnapshot:
+    """
+    Snapshot stock at the end of month's month. Re-taking a month replaces it.
+    The month must be over — its cutoff cannot lie in the future.
+    """
+    period_end = period_end_of(month)
+    cutoff = cutoff_for(period_end)
+    if cutoff > datetime.now(timezone.utc):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Month ending {period_end} has not closed yet",
+        )
+
+    await db.execute(
+        delete(StockSnapshot).where(
+            StockSnapshot.org_id == org_id,
+            StockSnapshot.period_end == period_end,
+        )
+    )
+    snapshot = StockSnapshot(
+        id=uuid4(), period_end=period_end, cutoff_at=cutoff, created_by=created_by, org_id=org_id,
+    )
+    db.add(snapshot)
+    await db.flush()
+
+    row = (await db.execute(
+        _TAKE_SNAPSHOT_SQL,
+        {"snapshot_id": snapshot.id, "org_id": org_id, "since": cutoff},
+    )).one()
+    snapshot.line_count = row.line_count
+    snapshot.total_quantity = int(row.total_quantity)
+    snapshot.total_value = Decimal(row.total_value)
+    await db.commit()
+    return snapshot
+
+
+async def list_stock_snapshots(
+    db: AsyncSession,
+    *,
+    org_id: UUID,
+    limit: int = 24,
+    offset: int = 0,
+) -> tuple[list[StockSnapshot], int]:
+    query = select(StockSnapshot).where(StockSnapshot.org_id == org_id)
+    total = (await db.execute(select(func.count()).select_from(query.subquery()))).scalar() or 0
+    result = await db.execute(
+        query.order_by(StockSnapshot.period_end.desc()).limit(limit).offset(offset)
+    )
+    return list(result.scalars().all()), total
+
+
+async def ensure_month_end_snapshots(db: AsyncSession, *, today: Optional[date] = None) -> int:
+    """
+    Daily job (main.lifespan): snapshot last month for every org that lacks one.
+    Returns how many snapshots were taken.
+    """
+    period_end = month_start(today or date.today()) - timedelta(days=1)
+    missing = await db.execute(
+        select(Organization.id).where(
+            ~select(StockSnapshot.id)
+            .where(
+                StockSnapshot.org_id == Organization.id,
+                StockSnapshot.period_end == period_end,
+            )
+            .exists()
+        )
+    )
+    taken = 0
+    for org_id in missing.scalars().all():
+        snapshot = await take_stock_snapshot(db, month=period_end, org_id=org_id)
+        logger.info(
+            "Stock snapshot %s for org %s: %d lines, value %s",
+            period_end, org_id, snapshot.line_count, snapshot.total_value,
+        )
+        taken += 1
+    return taken
+
+
+# ============================================================
+# POINT-IN-TIME STOCK
+# ============================================================
+
+async def _nearest_base(
+    db: AsyncSession, *, org_id: UUID, target: datetime
+) -> tuple[Optional[StockSnapshot], int]:
+    """
+    Cheapest starting point for target: (snapshot, +1) replays forward from a snapshot
+    at or before target, (snapshot, −1) / (None, −1) rewinds from a later snapshot / live.
+    """
+    before = (await db.execute(
+        select(StockSnapshot)
+        .where(StockSnapshot.org_id == org_id, StockSnapshot.cutoff_at <= target)
+        .order_by(StockSnapshot.cutoff_at.desc())
+        .limit(1)
+    )).scalar_one_or_none()
+    after = (await db.execute(
+        select(StockSnapshot)
+        .where(StockSnapshot.org_id == org_id, StockSnapshot.cutoff_at > target)
+        .order_by(StockSnapshot.cutoff_at.asc())
+        .limit(1)
+    )).scalar_one_or_none()
+
+    later_at = after.cutoff_at if after else datetime.now(timezone.utc)
+    if before and (target - before.cutoff_at) <= (later_at - target):
+        return before, 1
+    return after, -1
+
+
+async def get_stock_as_of(
+    db: AsyncSession,
+    *,
+    as_of: date,
+    org_id: UUID,
+    group_by: str = "product",
+    product_id: Optional[UUID] = None,
+    location_id: Optional[UUID] = None,
+) -> dict:
+    """
+    Stock on hand + value at the end of as_of, grouped by product, by
+    (product, location, batch) or by product type. Snapshot lines keep the unit cost
+    frozen at snapshot time; keys without one are valued at the batch / product cost.
+    """
+    if group_by not in AS_OF_GROUPINGS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"group_by must be one of {', '.join(AS_OF_GROUPINGS)}",
+        )
+    target = cutoff_for(as_of)
+    base, direction = await _nearest_base(db, org_id=org_id, target=target)
+
+    cond = _filter_cond(product_id, location_id)
+    params: dict = {"org_id": org_id}
+    if product_id:
+        params["product_id"] = product_id
+    if location_id:
+        params["location_id"] = location_id
+
+    if base is None:
+        # Rewind live state: subtract everything from target on
+        state = _state_cte(_live_sql(cond), _movement_delta_sql(cond), delta_sign=-1)
+        params["since"] = target
+    elif direction > 0:
+        state = _state_cte(_snapshot_lines_sql(cond), _movement_delta_sql(cond, until=True), delta_sign=1)
+        params.update(base_id=base.id, since=base.cutoff_at, until=target)
+    else:
+        state = _state_cte(_snapshot_lines_sql(cond), _movement_delta_sql(cond, until=True), delta_sign=-1)
+        params.update(base_id=base.id, since=target, until=base.cutoff_at)
+
+    rows = (await db.execute(text(_as_of_sql(state, group_by)), params)).all()
+
+    items = []
+    for row in rows:
+        item = {
+            "quantity": int(row.quantity),
+            "value": float(row.value),
+        }
+        if group_by == "product_type":
+            item["product_type"] = row.product_type
+        else:
+            item.update(
+                product_id=str(row.product_id),
+                sku=row.sku,
+                product_name=row.name,
+                product_type=row.product_type,
+                unit=row.unit,
+            )
+            if group_by == "location":
+                item.update(
+                    location_id=str(row.location_id) if row.location_id else None,
+                    location_name=row.location_name or "",
+                    batch_number=row.batch_number,
+                )
+        items.append(item)
+
+    return {
+        "as_of": as_of.isoformat(),
+        "group_by": group_by,
+        "base": {
+            "snapshot_id": str(base.id) if base else None,
+            "period_end": base.period_end.isoformat() if base else None,
+            "direction": "forward" if direction > 0 else "rewind",
+        },
+        "total_quantity": sum(i["quantity"] for i in items),
+        "total_value": float(sum(Decimal(str(r.value)) for r in rows)),
+        "items": items,
+    }
+
+
+async def get_month_end_valuation(
+    db: AsyncSession,
+    *,
+    month: date,
+    org_id: UUID,
+) -> dict:
+    """
+    Inventory value by product type at month end. Reads only the snapshot lines
+    when the month has been snapshotted — cost stays flat as the ledger grows.
+    """
+    period_end = period_end_of(month)
+    snapshot = (await db.execute(
+        select(StockSnapshot).where(
+            StockSnapshot.org_id == org_id,
+            StockSnapshot.period_end == period_end,
+        )
+    )).scalar_one_or_none()
+    if snapshot is None:
+        report = await get_stock_as_of(db, as_of=period_end, org_id=org_id, group_by="product_type")
+        return {
+            "period_end": period_end.isoformat(),
+            "snapshot_id": None,
+            "total_quantity": report["total_quantity"],
+            "total_value": report["total_value"],
+            "by_product_type": report["items"],
+        }
+
+    rows = (await db.execute(
+        text("""
+            SELECT p.product_type, SUM(l.quantity) AS quantity, SUM(l.value) AS value
+            FROM stock_snapshot_lines l
+            JOIN products p ON p.id = l.product_id
+            WHERE l.snapshot_id = :snapshot_id
+            GROUP BY p.product_type
+            ORDER BY p.product_type
+        """),
+        {"snapshot_id": snapshot.id},
+    )).all()
+    return {
+        "period_end": period_end.isoformat(),
+        "snapshot_id": str(snapshot.id),
+        "total_quantity": snapshot.total_quantity,
+        "total_value": float(snapshot.total_value),
+        "by_product_type": [
+            {"product_type": r.product_type, "quantity": int(r.quantity), "value": float(r.value)}
+            for r in rows
+        ],
+    }
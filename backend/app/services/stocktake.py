@@ -402,7 +402,6 @@ async def submit_stocktake(
             line.unit_cost = prod.cost
 
     st.status = StockTakeStatus.SUBMITTED
-    await db.commit()
 
     # Notify approvers
     try:
@@ -420,6 +419,10 @@ async def submit_stocktake(
     except Exception:
         pass
 
+    await db.commit()
+    from app.services.notification import publish_pending_notifications
+    await publish_pending_notifications(db)
+
     return await get_stocktake(db, stocktake_id, org_id)
 
 
@@ -342,7 +342,6 @@ async def submit_tool_checkout_slip(
             detail=f"Can only submit DRAFT slips (current: {slip.status.value})",
         )
     slip.status = ToolCheckoutSlipStatus.PENDING
-    await db.commit()
 
     # Phase 9: Notification — APPROVAL_REQUEST for tool checkout approvers
     try:
@@ -358,6 +357,10 @@ async def submit_tool_checkout_slip(
         import logging
         logging.getLogger(__name__).warning("Notification failed for tool slip submit %s", slip.slip_number, exc_info=True)
 
+    await db.commit()
+    from app.services.notification import publish_pending_notifications
+    await publish_pending_notifications(db)
+
     return await get_tool_checkout_slip(db, slip_id, org_id=org_id)
 
 
@@ -338,7 +338,6 @@ async def submit_transfer_request(
             detail=f"Can only submit DRAFT requests (current: {tf.status.value})",
         )
     tf.status = TransferRequestStatus.PENDING
-    await db.commit()
 
     # Notification — APPROVAL_REQUEST for transfer approvers
     try:
@@ -360,6 +359,10 @@ async def submit_transfer_request(
             tf.transfer_number, exc_info=True,
         )
 
+    await db.commit()
+    from app.services.notification import publish_pending_notifications
+    await publish_pending_notifications(db)
+
     return await get_transfer_request(db, tf_id, org_id=org_id)
 
 
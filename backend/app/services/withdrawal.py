@@ -309,7 +309,6 @@ async def submit_withdrawal_slip(db: AsyncSession, slip_id: UUID, org_id: UUID)
             detail=f"Can only submit DRAFT slips (current: {slip.status.value})",
         )
     slip.status = WithdrawalStatus.PENDING
-    await db.commit()
 
     # Phase 9: Notification — APPROVAL_REQUEST for withdrawal approvers
     try:
@@ -325,6 +324,10 @@ async def submit_withdrawal_slip(db: AsyncSession, slip_id: UUID, org_id: UUID)
         import logging
         logging.getLogger(__name__).warning("Notification failed for withdrawal submit %s", slip.slip_number, exc_info=True)
 
+    await db.commit()
+    from app.services.notification import publish_pending_notifications
+    await publish_pending_notifications(db)
+
     return await get_withdrawal_slip(db, slip_id, org_id=org_id)
 
 
@@ -23,6 +23,7 @@ from decimal import Decimal
 
 from app.models.inventory import StockMovement
 from app.models.workorder import VALID_TRANSITIONS, WOStatus, WorkOrder
+from app.services.events import record_status_change
 
 
 # ============================================================
@@ -222,8 +223,13 @@ async def open_work_order(db: AsyncSession, wo_id: UUID) -> WorkOrder:
                    f"valid transitions: {[t.value for t in VALID_TRANSITIONS.get(wo.status, [])]}",
         )
 
+    from_status = wo.status
     wo.status = WOStatus.OPEN
     wo.opened_at = datetime.now(timezone.utc)
+    await record_status_change(
+        db, org_id=wo.org_id, aggregate_type="WO", aggregate_id=wo.id, number=wo.wo_number,
+        from_status=from_status, to_status=wo.status,
+    )
     await db.commit()
     await db.refresh(wo)
     return wo
@@ -240,8 +246,13 @@ async def close_work_order(db: AsyncSession, wo_id: UUID) -> WorkOrder:
                    f"valid transitions: {[t.value for t in VALID_TRANSITIONS.get(wo.status, [])]}",
         )
 
+    from_status = wo.status
     wo.status = WOStatus.CLOSED
     wo.closed_at = datetime.now(timezone.utc)
+    await record_status_change(
+        db, org_id=wo.org_id, aggregate_type="WO", aggregate_id=wo.id, number=wo.wo_number,
+        from_status=from_status, to_status=wo.status,
+    )
     await db.commit()
     await db.refresh(wo)
     return wo
@@ -266,27 +277,21 @@ async def get_cost_summary(db: AsyncSession, wo_id: UUID) -> dict:
     wo = await get_work_order(db, wo_id)
 
     # 1. Material cost = CONSUME - RETURN (capped at 0)
-    consume_result = await db.execute(
-        select(
-            func.coalesce(func.sum(StockMovement.quantity * StockMovement.unit_cost), 0)
-        ).where(
-            StockMovement.work_order_id == wo_id,
-            StockMovement.movement_type == "CONSUME",
-            StockMovement.is_reversed == False,
-        )
-    )
-    consume_cost = Decimal(str(consume_result.scalar() or 0))
-
-    return_result = await db.execute(
+    #    One pass over the WO's movements (work_order_id index, probed once per partition)
+    line_cost = StockMovement.quantity * StockMovement.unit_cost
+    material_result = await db.execute(
         select(
-            func.coalesce(func.sum(StockMovement.quantity * StockMovement.unit_cost), 0)
+            func.coalesce(func.sum(line_cost).filter(StockMovement.movement_type == "CONSUME"), 0),
+            func.coalesce(func.sum(line_cost).filter(StockMovement.movement_type == "RETURN"), 0),
         ).where(
             StockMovement.work_order_id == wo_id,
-            StockMovement.movement_type == "RETURN",
+            StockMovement.movement_type.in_(["CONSUME", "RETURN"]),
             StockMovement.is_reversed == False,
         )
     )
-    return_cost = Decimal(str(return_result.scalar() or 0))
+    consume_total, return_total = material_result.one()
+    consume_cost = Decimal(str(consume_total or 0))
+    return_cost = Decimal(str(return_total or 0))
 
     material_cost = max(consume_cost - return_cost, Decimal("0.00"))
 
@@ -0,0 +1,24 @@
+"""
+Shared pytest fixtures for SSS Corp ERP unit tests.
+No live server, database or Redis — run: pytest tests/unit
+SQL-level tests additionally run when TEST_DATABASE_URL points at any Postgres 13+
+(asyncpg URL); they only create TEMP tables, so no migrated schema is needed.
+"""
+
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fetch_workflow_dynamic_ids():
+    """Override tests/conftest.py's live-server login — unit tests need no API."""
+    return None
+
+
+@pytest.fixture()
+def pg_url() -> str:
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL not set")
+    return url
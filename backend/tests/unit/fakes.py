@@ -0,0 +1,99 @@
+"""
+Test doubles shared by the unit tests — an AsyncSession stand-in and canned results,
+and TEMP tables standing in for the real ones when a query's figures are under test.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+
+class FakeSession:
+    """
+    Records adds / flushes / statements and transaction ends in `log`;
+    execute() answers from a queue of canned results, then with `default`
+    (a queued exception is raised instead).
+    """
+
+    def __init__(self, results=(), *, default=None):
+        self.log = []
+        self.added = []
+        self.info = {}
+        self.results = list(results)
+        self.default = default
+        self.statements = []
+        self.params = []
+
+    def add(self, obj):
+        self.log.append("add")
+        self.added.append(obj)
+
+    async def flush(self):
+        self.log.append("flush")
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        self.params.append(params)
+        if self.results:
+            answer = self.results.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+        if self.default is None:
+            raise AssertionError(f"unexpected statement: {stmt}")
+        return self.default
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        self.log.append("savepoint")
+        try:
+            yield
+        except BaseException:
+            self.log.append("rollback savepoint")
+            raise
+        self.log.append("release savepoint")
+
+    async def commit(self):
+        self.log.append("commit")
+
+    async def rollback(self):
+        self.log.append("rollback")
+
+
+class _Scalars(list):
+    def all(self):
+        return list(self)
+
+
+def result(*, scalar=None, one=None, rows=(), scalars=(), rowcount=0):
+    """A Result answering scalar() / one() / all() / scalars() with the given values."""
+    return SimpleNamespace(
+        scalar=lambda: scalar, one=lambda: one, all=lambda: list(rows),
+        scalars=lambda: _Scalars(scalars), rowcount=rowcount,
+    )
+
+
+def run_with_temp_tables(pg_url: str, tables: str, rows, check, **params) -> None:
+    """
+    Create `tables` (";"-separated CREATE TEMP TABLE statements — they shadow the
+    real tables of the same name), insert `rows` ((sql, params) pairs, `params`
+    merged in), then run `await check(db)`. Everything goes over one connection,
+    commits included, so nothing outside the TEMP tables is touched.
+    """
+    async def go():
+        engine = create_async_engine(pg_url, poolclass=NullPool)
+        try:
+            async with engine.connect() as conn, AsyncSession(bind=conn, expire_on_commit=False) as db:
+                for statement in tables.split(";"):
+                    await db.execute(text(statement))
+                for sql, row_params in rows:
+                    await db.execute(text(sql), {**params, **row_params})
+                await check(db)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(go())
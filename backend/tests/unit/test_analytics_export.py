@@ -0,0 +1,86 @@
+"""
+Parquet analytics export (Phase 15) — schema mapping, export query, file writing; no DB or API.
+"""
+
+import os
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from app.services.analytics_export import EXPORT_TABLES, _MonthWriter, _select_sql, arrow_schema, part_path
+
+
+def test_arrow_types_follow_the_model_columns():
+    schema = arrow_schema("stock_movements")
+    assert schema.field("id").type == pa.string()  # uuid
+    assert schema.field("movement_type").type == pa.string()  # enum label
+    assert schema.field("unit_cost").type == pa.decimal128(12, 2)
+    assert schema.field("quantity").type == pa.int32()
+    assert schema.field("created_at").type == pa.timestamp("us", tz="UTC")
+    assert schema.field("is_reversed").type == pa.bool_()
+    assert not schema.field("created_at").nullable and schema.field("work_order_id").nullable
+    assert arrow_schema("timesheets").field("work_date").type == pa.date32()
+    assert arrow_schema("performance_logs").field("response_time_ms").type == pa.float64()
+
+
+def test_select_casts_text_columns_and_takes_utc_months():
+    sql = _select_sql("stock_movements")
+    assert "to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM') AS _month" in sql
+    assert "id::text AS id" in sql and "movement_type::text AS movement_type" in sql
+    assert " unit_cost," in sql and "unit_cost::text" not in sql
+    assert "WHERE updated_at > :after AND updated_at <= :until" in sql
+    assert "ORDER BY created_at" in sql
+    assert "to_char(payment_date, 'YYYY-MM')" in _select_sql("invoice_payments")
+    assert "WHERE recorded_at > :after" in _select_sql("performance_logs")
+
+
+@pytest.mark.parametrize("table_name", sorted(EXPORT_TABLES))
+def test_watermark_column_is_indexed(table_name):
+    spec = EXPORT_TABLES[table_name]
+    leading = {next(iter(ix.columns)).name for ix in spec["model"].__table__.indexes}
+    assert spec["watermark"] in leading
+
+
+def _rows(month: str, n: int, start: int = 0) -> list[tuple]:
+    return [(month, f"id-{i}", Decimal("1.50"), date(2026, 3, 1), datetime(2026, 3, 1, tzinfo=timezone.utc))
+            for i in range(start, start + n)]
+
+
+_SCHEMA = pa.schema([
+    pa.field("id", pa.string(), nullable=False),
+    pa.field("amount", pa.decimal128(12, 2)),
+    pa.field("payment_date", pa.date32()),
+    pa.field("updated_at", pa.timestamp("us", tz="UTC")),
+])
+
+
+def test_month_file_appears_only_when_closed(tmp_path):
+    out = _MonthWriter(_SCHEMA, "zstd")
+    path = part_path(str(tmp_path), "invoice_payments", "2026-03", "20260401T000000Z")
+    out.open(path)
+    out.write(_rows("2026-03", 3))
+    out.write(_rows("2026-03", 2, start=3))
+    assert not os.path.exists(path)  # BI readers skip the hidden temp file meanwhile
+    out.close()
+
+    assert out.written == [path]
+    assert os.listdir(os.path.dirname(path)) == ["part-20260401T000000Z.parquet"]
+    meta = pq.ParquetFile(path).metadata
+    assert (meta.num_rows, meta.num_row_groups) == (5, 2)  # one row group per batch
+    table = pq.read_table(path)
+    assert table.schema == _SCHEMA
+    assert table.column("amount").to_pylist()[0] == Decimal("1.50")
+
+
+def test_discard_removes_everything_the_run_wrote(tmp_path):
+    out = _MonthWriter(_SCHEMA, "zstd")
+    out.open(part_path(str(tmp_path), "invoice_payments", "2026-02", "run"))
+    out.write(_rows("2026-02", 2))
+    out.close()
+    out.open(part_path(str(tmp_path), "invoice_payments", "2026-03", "run"))
+    out.write(_rows("2026-03", 2))
+    out.discard()
+    assert [files for _, _, files in os.walk(tmp_path) if files] == []
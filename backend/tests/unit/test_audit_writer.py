@@ -0,0 +1,110 @@
+"""
+Batched audit writer (Phase 15) — flush on batch size or interval, clean shutdown and
+failed flushes; no DB or API.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from app.core import database
+from app.models.security import LoginHistory
+from app.services.audit_writer import BatchedAuditWriter
+from tests.unit.fakes import FakeSession, result
+
+
+def _writer(**kwargs) -> tuple[BatchedAuditWriter, list]:
+    writer = BatchedAuditWriter(**{"batch_size": 3, "flush_interval": 30.0, "max_queue": 100, **kwargs})
+    batches = []
+
+    async def record(items):
+        if items:
+            batches.append([row["n"] for _, row in items])
+
+    writer._flush = record
+    return writer, batches
+
+
+def test_full_batch_flushes_without_waiting_for_the_interval():
+    async def scenario():
+        writer, batches = _writer()
+        writer.start()
+        for n in range(3):
+            assert writer.submit(LoginHistory, {"n": n})
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if batches:
+                break
+        running = writer.running
+        await writer.stop()
+        return batches, running
+
+    batches, running = asyncio.run(scenario())
+    assert batches == [[0, 1, 2]] and running
+
+
+def test_partial_batch_flushes_after_the_interval():
+    async def scenario():
+        writer, batches = _writer(batch_size=100, flush_interval=0.05)
+        writer.start()
+        writer.submit(LoginHistory, {"n": 1})
+        writer.submit(LoginHistory, {"n": 2})
+        await asyncio.sleep(0.01)
+        early = list(batches)
+        await asyncio.sleep(0.1)
+        await writer.stop()
+        return early, batches
+
+    early, batches = asyncio.run(scenario())
+    assert early == [] and batches == [[1, 2]]
+
+
+def test_stop_flushes_everything_queued_then_refuses_rows():
+    async def scenario():
+        writer, batches = _writer(flush_interval=0.05)
+        writer.start()
+        for n in range(7):
+            writer.submit(LoginHistory, {"n": n})
+        await writer.stop()
+        return writer, batches
+
+    writer, batches = asyncio.run(scenario())
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert not writer.running and writer.submit(LoginHistory, {"n": 8}) is False
+
+
+def test_full_queue_rejects_instead_of_blocking():
+    async def scenario():
+        writer, _ = _writer(max_queue=2, flush_interval=0.05)
+        writer.start()
+        accepted = [writer.submit(LoginHistory, {"n": n}) for n in range(3)]
+        await writer.stop()
+        return accepted
+
+    assert asyncio.run(scenario()) == [True, True, False]
+
+
+def test_flush_is_one_insert_per_table_and_counts_failures(monkeypatch):
+    sessions = []
+
+    @asynccontextmanager
+    async def background_session():
+        db = FakeSession(default=result())
+        sessions.append(db)
+        yield db
+
+    monkeypatch.setattr(database, "background_session", background_session)
+    writer = BatchedAuditWriter(batch_size=10, flush_interval=0, max_queue=10)
+    rows = [(LoginHistory, {"email": f"u{n}@test"}) for n in range(3)]
+    asyncio.run(writer._flush(rows))
+    (db,) = sessions
+    assert len(db.statements) == 1 and db.log == ["commit"]
+    assert writer.written == 3
+
+    @asynccontextmanager
+    async def broken_session():
+        raise ConnectionError("db down")
+        yield
+
+    monkeypatch.setattr(database, "background_session", broken_session)
+    asyncio.run(writer._flush(rows))  # logged, rows dropped — never raised
+    assert (writer.written, writer.failed) == (3, 3)
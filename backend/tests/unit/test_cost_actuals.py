@@ -0,0 +1,197 @@
+"""
+Cost center actuals rollup (Phase 15) — periods, incremental refresh, summary assembly.
+The rollup figures run the real SQL when TEST_DATABASE_URL is set: the source tables
+are TEMP tables (they shadow any real ones) holding a hand-costed month.
+"""
+
+import asyncio
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from sqlalchemy import text
+
+from app.services.cost_actuals import (
+    _period_params,
+    month_range,
+    next_month,
+    rebuild_period,
+    refresh_cost_actuals,
+)
+from app.services.recharge import get_cost_center_summary
+from tests.unit.fakes import FakeSession, result, run_with_temp_tables
+
+ORG = uuid.UUID(int=1)
+
+
+def test_month_arithmetic_crosses_the_year():
+    assert next_month(date(2025, 12, 1)) == date(2026, 1, 1)
+    assert month_range(date(2025, 11, 15), date(2026, 2, 1)) == [
+        date(2025, 11, 1), date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1),
+    ]
+    assert month_range(date(2026, 3, 1), date(2026, 2, 1)) == []
+
+
+def test_period_bounds_are_utc_month_edges():
+    params = _period_params(ORG, date(2025, 12, 1))
+    assert (params["year"], params["month"]) == (2025, 12)
+    assert (params["first_day"], params["next_first_day"]) == (date(2025, 12, 1), date(2026, 1, 1))
+    assert params["period_start"] == datetime(2025, 12, 1, tzinfo=timezone.utc)
+    assert params["period_end"] == datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_refresh_skips_while_another_writer_holds_the_lock():
+    db = FakeSession([result(scalar=False)])
+    assert asyncio.run(refresh_cost_actuals(db)) == 0
+    assert db.log == ["rollback"]
+
+
+def test_summary_combines_actuals_with_fixed_recharge():
+    cc_a = SimpleNamespace(id=uuid.uuid4(), code="CC-A", name="A")
+    cc_b = SimpleNamespace(id=uuid.uuid4(), code="CC-B", name="B")
+    db = FakeSession([
+        result(scalars=[cc_a, cc_b]),
+        result(rows=[(cc_a.id, Decimal("1000.00"))]),  # fixed recharge
+        result(rows=[(cc_a.id, Decimal("500.00"), Decimal("250.50"), Decimal("20.00"), Decimal("50.00"))]),
+    ])
+    rows = asyncio.run(get_cost_center_summary(db, org_id=ORG, year=2026, month=3))
+    a, b = rows
+    assert (a["actual_labor"], a["actual_material"], a["actual_tool"], a["actual_overhead"]) == (
+        Decimal("500.00"), Decimal("250.50"), Decimal("20.00"), Decimal("50.00"),
+    )
+    assert (a["actual_total"], a["fixed_recharge"], a["grand_total"]) == (
+        Decimal("820.50"), Decimal("1000.00"), Decimal("1820.50"),
+    )
+    assert (b["actual_total"], b["grand_total"]) == (Decimal("0.00"), Decimal("0.00"))
+
+
+# ============================================================
+# ROLLUP FIGURES (Postgres)
+# ============================================================
+# Only the columns the rollup reads; status / movement_type as text.
+
+_SOURCE_TABLES = """
+    CREATE TEMP TABLE cost_centers (id uuid, org_id uuid, code text, overhead_rate numeric(5,2));
+    CREATE TEMP TABLE employees (id uuid, hourly_rate numeric(12,2), cost_center_id uuid);
+    CREATE TEMP TABLE ot_types (id uuid, factor numeric(4,2));
+    CREATE TEMP TABLE work_orders (id uuid, org_id uuid, cost_center_code text);
+    CREATE TEMP TABLE timesheets (
+        org_id uuid, employee_id uuid, work_order_id uuid, ot_type_id uuid, status text,
+        work_date date, regular_hours numeric(5,2), ot_hours numeric(5,2), updated_at timestamptz);
+    CREATE TEMP TABLE stock_movements (
+        org_id uuid, movement_type text, quantity int, unit_cost numeric(12,2),
+        work_order_id uuid, cost_center_id uuid, is_reversed boolean,
+        created_at timestamptz, updated_at timestamptz);
+    CREATE TEMP TABLE tool_checkouts (
+        org_id uuid, work_order_id uuid, charge_amount numeric(12,2),
+        checkin_at timestamptz, updated_at timestamptz);
+    CREATE TEMP TABLE cost_center_actuals (
+        id uuid, org_id uuid, period_year int, period_month int, cost_center_id uuid,
+        labor numeric(14,2), material numeric(14,2), tool numeric(14,2), overhead numeric(14,2),
+        refreshed_at timestamptz);
+    CREATE TEMP TABLE rollup_watermarks (
+        name text PRIMARY KEY, processed_until timestamptz, last_run_at timestamptz,
+        last_run_periods int)
+"""
+
+OTHER_ORG = uuid.UUID(int=2)
+CC_A, CC_B, CC_OTHER = uuid.UUID(int=0xA), uuid.UUID(int=0xB), uuid.UUID(int=0xC)
+EMP_1, EMP_2 = uuid.UUID(int=0xE1), uuid.UUID(int=0xE2)
+OT_DOUBLE = uuid.UUID(int=0x0D)
+WO_A, WO_NONE = uuid.UUID(int=0xF1), uuid.UUID(int=0xF2)
+
+# March 2026 for ORG, costed by hand:
+#   CC-A  labor (8 + 2×2.0)×100 + (1×1.5)×100 = 1350  material 10×12.50 − 2×12.50 = 100
+#         tool 55.50  overhead 10% of labor = 135
+#   CC-B  labor 4×100 = 400 (WO without a cost center → employee's)  material ISSUE 3×7 = 21
+#         overhead 0%
+_SOURCE_ROWS = [
+    ("INSERT INTO cost_centers VALUES (:a, :org, 'A', 10), (:b, :org, 'B', 0), (:c, :other, 'A', 50)",
+     {"a": CC_A, "b": CC_B, "c": CC_OTHER}),
+    ("INSERT INTO employees VALUES (:e1, 100, :b), (:e2, 200, NULL)", {"e1": EMP_1, "e2": EMP_2, "b": CC_B}),
+    ("INSERT INTO ot_types VALUES (:ot, 2.0)", {"ot": OT_DOUBLE}),
+    ("INSERT INTO work_orders VALUES (:wa, :org, 'A'), (:wn, :org, NULL)", {"wa": WO_A, "wn": WO_NONE}),
+    ("""INSERT INTO timesheets VALUES
+        (:org, :e1, :wa, :ot, 'FINAL', '2026-03-02', 8, 2, :changed),
+        (:org, :e1, :wa, NULL, 'FINAL', '2026-03-31', 0, 1, :changed),
+        (:org, :e1, :wn, NULL, 'FINAL', '2026-03-10', 4, 0, :changed),
+        (:org, :e2, :wn, NULL, 'FINAL', '2026-03-10', 5, 0, :changed),   -- no cost center anywhere
+        (:org, :e1, :wa, NULL, 'DRAFT', '2026-03-11', 10, 0, :changed),  -- not FINAL
+        (:org, :e1, :wa, NULL, 'FINAL', '2026-04-01', 10, 0, :changed)   -- next month""",
+     {"e1": EMP_1, "e2": EMP_2, "wa": WO_A, "wn": WO_NONE, "ot": OT_DOUBLE}),
+    ("""INSERT INTO stock_movements VALUES
+        (:org, 'CONSUME', 10, 12.50, :wa, NULL, false, '2026-03-05 10:00+00', :changed),
+        (:org, 'RETURN', 2, 12.50, :wa, NULL, false, '2026-03-06 10:00+00', :changed),
+        (:org, 'CONSUME', 5, 10.00, :wa, NULL, true, '2026-03-07 10:00+00', :changed),   -- reversed
+        (:org, 'ISSUE', 3, 7.00, NULL, :b, false, '2026-03-08 10:00+00', :changed),
+        (:org, 'RECEIVE', 100, 1.00, :wa, NULL, false, '2026-03-09 10:00+00', :changed),
+        (:org, 'CONSUME', 4, 10.00, :wa, NULL, false, '2026-02-28 23:59+00', :changed),  -- February
+        (:org, 'CONSUME', 1, 10.00, :wa, NULL, false, '2026-04-01 00:00+00', :changed)   -- April
+    """, {"wa": WO_A, "b": CC_B}),
+    ("""INSERT INTO tool_checkouts VALUES
+        (:org, :wa, 55.50, '2026-03-20 09:00+00', :changed),
+        (:org, :wa, 99.00, '2026-04-02 09:00+00', :changed),
+        (:org, :wa, 77.00, NULL, :changed)                                   -- still out
+    """, {"wa": WO_A}),
+]
+
+MARCH = {
+    CC_A: (Decimal("1350.00"), Decimal("100.00"), Decimal("55.50"), Decimal("135.00")),
+    CC_B: (Decimal("400.00"), Decimal("21.00"), Decimal("0.00"), Decimal("0.00")),
+}
+
+
+def _with_source_rows(pg_url: str, check) -> None:
+    """Run check(db) on a session whose TEMP source tables hold the month above."""
+    changed = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(hours=2)
+    run_with_temp_tables(
+        pg_url, _SOURCE_TABLES, _SOURCE_ROWS, check, org=ORG, other=OTHER_ORG, changed=changed,
+    )
+
+
+async def _actuals(db, org_id, year, month) -> dict:
+    rows = (await db.execute(text("""
+        SELECT cost_center_id, labor, material, tool, overhead FROM cost_center_actuals
+        WHERE org_id = :org_id AND period_year = :year AND period_month = :month
+    """), {"org_id": org_id, "year": year, "month": month})).all()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+
+def test_rebuild_rolls_up_a_month_per_cost_center(pg_url):
+    async def check(db):
+        assert await rebuild_period(db, org_id=ORG, year=2026, month=3) == 2
+        assert await _actuals(db, ORG, 2026, 3) == MARCH
+        # rebuilding replaces the month instead of adding to it
+        assert await rebuild_period(db, org_id=ORG, year=2026, month=3) == 2
+        assert await _actuals(db, ORG, 2026, 3) == MARCH
+        assert await _actuals(db, OTHER_ORG, 2026, 3) == {}
+
+    _with_source_rows(pg_url, check)
+
+
+def test_refresh_rebuilds_changed_months_once(pg_url):
+    async def check(db):
+        # first run backfills: ORG's February, March and April
+        assert await refresh_cost_actuals(db) == 3
+        assert await _actuals(db, ORG, 2026, 3) == MARCH
+        assert await _actuals(db, ORG, 2026, 2) == {
+            CC_A: (Decimal("0.00"), Decimal("40.00"), Decimal("0.00"), Decimal("0.00")),
+        }
+        assert await _actuals(db, ORG, 2026, 4) == {
+            CC_A: (Decimal("1000.00"), Decimal("10.00"), Decimal("99.00"), Decimal("100.00")),
+        }
+        # nothing changed since the watermark
+        assert await refresh_cost_actuals(db) == 0
+        # a reversal after the watermark rebuilds only its month (clock moved back
+        # to fit the 60s lag: rows changed 2h ago, the reversal 1h ago, watermark between)
+        await db.execute(text("""
+            UPDATE stock_movements SET is_reversed = true, updated_at = now() - interval '1 hour'
+            WHERE movement_type = 'RETURN'
+        """))
+        await db.execute(text("UPDATE rollup_watermarks SET processed_until = now() - interval '90 minutes'"))
+        assert await refresh_cost_actuals(db) == 1
+        a = (await _actuals(db, ORG, 2026, 3))[CC_A]
+        assert a[1] == Decimal("125.00")
+
+    _with_source_rows(pg_url, check)
@@ -0,0 +1,56 @@
+"""
+Daily report auto-record grouping (BR#52, OBS-3) — pure function, no API.
+"""
+
+import uuid
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.models.daily_report import LineType
+from app.models.hr import TimesheetStatus
+from app.services.daily_report import _auto_record_rows
+
+ORG = uuid.UUID(int=1)
+WO_A, WO_B = uuid.UUID(int=10), uuid.UUID(int=11)
+OT_WEEKDAY, OT_HOLIDAY = uuid.UUID(int=20), uuid.UUID(int=21)
+
+
+def _line(line_type, hours, wo=None, ot=None):
+    return SimpleNamespace(line_type=line_type, hours=Decimal(hours), work_order_id=wo, ot_type_id=ot)
+
+
+def _report():
+    return SimpleNamespace(
+        id=uuid.uuid4(), employee_id=uuid.uuid4(), report_date=date(2026, 3, 2),
+        approved_by=uuid.uuid4(),
+    )
+
+
+def test_rows_per_wo_and_ot_type_with_regular_on_first_only():
+    report = _report()
+    rows = _auto_record_rows(report, [
+        _line(LineType.REGULAR, "4", WO_A),
+        _line(LineType.REGULAR, "4", WO_B),
+        _line(LineType.OT, "2", WO_A, OT_WEEKDAY),
+        _line(LineType.OT, "1", WO_A, OT_HOLIDAY),
+        _line(LineType.REGULAR, "1"),  # no WO → not recorded
+    ], org_id=ORG)
+
+    by_key = {(r["work_order_id"], r["ot_type_id"]): r for r in rows}
+    assert len(rows) == 4
+    assert by_key[(WO_A, None)]["regular_hours"] == Decimal("4")
+    assert by_key[(WO_A, OT_WEEKDAY)]["regular_hours"] == Decimal("0")
+    assert by_key[(WO_A, OT_WEEKDAY)]["ot_hours"] == Decimal("2")
+    assert by_key[(WO_A, OT_HOLIDAY)]["ot_hours"] == Decimal("1")
+    assert by_key[(WO_B, None)]["regular_hours"] == Decimal("4")
+    assert sum(r["regular_hours"] for r in rows) == Decimal("8")
+    for row in rows:
+        assert row["daily_report_id"] == report.id
+        assert row["note"] == f"DailyReport#{report.id}"
+        assert row["status"] == TimesheetStatus.FINAL
+        assert row["created_by"] == report.approved_by
+
+
+def test_report_without_wo_lines_records_nothing():
+    assert _auto_record_rows(_report(), [_line(LineType.REGULAR, "8")], org_id=ORG) == []
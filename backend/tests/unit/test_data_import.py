@@ -0,0 +1,131 @@
+"""
+Bulk master-data import (Phase 15) — file reading, row validation, error report; no DB or API.
+"""
+
+import io
+import uuid
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from openpyxl import Workbook
+
+from app.models.data_import import ImportRun
+from app.services.data_import import (
+    IMPORT_ENTITIES,
+    ImportLookups,
+    _insert_sql,
+    error_report_csv,
+    read_rows,
+    required_columns,
+    validate_row,
+)
+
+
+def _rows(data: bytes, name: str) -> tuple[list[str], list]:
+    header, rows = read_rows(io.BytesIO(data), name)
+    return header, list(rows)
+
+
+def test_csv_header_normalized_and_blank_rows_skipped():
+    data = "﻿SKU, Product Type ,Cost\nA-1,MATERIAL, 5.00 \n,,\nA-2,,\n".encode()
+    header, rows = _rows(data, "products.CSV")
+    assert header == ["sku", "product_type", "cost"]
+    assert rows == [
+        (2, {"sku": "A-1", "product_type": "MATERIAL", "cost": "5.00"}),
+        (4, {"sku": "A-2", "product_type": None, "cost": None}),
+    ]
+
+
+def test_xlsx_typed_cells_become_text():
+    wb = Workbook()
+    wb.active.append(["Employee Code", "Daily Rate", "Hire Date"])
+    wb.active.append([10023, 450.0, date(2024, 1, 5)])
+    wb.active.append(["E-2", 450.5, None])
+    buf = io.BytesIO()
+    wb.save(buf)
+    _, rows = _rows(buf.getvalue(), "emp.xlsx")
+    assert rows == [
+        (2, {"employee_code": "10023", "daily_rate": "450", "hire_date": "2024-01-05"}),
+        (3, {"employee_code": "E-2", "daily_rate": "450.5", "hire_date": None}),
+    ]
+
+
+@pytest.mark.parametrize("data,name", [(b"sku\n", "p.txt"), (b"", "p.csv"), (b"not a zip", "p.xlsx")])
+def test_unreadable_files_rejected(data, name):
+    with pytest.raises(HTTPException) as exc:
+        read_rows(io.BytesIO(data), name)
+    assert exc.value.status_code == 422
+
+
+def test_required_columns_come_from_the_schemas():
+    assert required_columns("products") == ["sku", "name"]
+    assert required_columns("opening_stock") == ["sku", "quantity"]
+
+
+def test_product_rules_units_and_duplicates():
+    lk, seen = ImportLookups(), {}
+    lk.units = {"pcs": "PCS"}
+    record, errors = validate_row("products", 2, {"sku": " a-1 ", "name": "A", "unit": "pcs", "cost": "5"}, lk, seen)
+    assert errors == [] and record["sku"] == "A-1" and record["unit"] == "PCS"
+    assert record["product_type"] == "MATERIAL"  # enum → plain value for the unnest array
+
+    _, errors = validate_row("products", 3, {"sku": "A-1", "name": "again", "cost": "5"}, lk, seen)
+    assert errors[0]["message"] == "Duplicate in file (first at row 2)"
+    # BR#1: MATERIAL cost >= 1.00
+    _, errors = validate_row("products", 4, {"sku": "A-2", "name": "cheap", "cost": "0.50"}, lk, seen)
+    assert errors == [{"row": 4, "column": "cost", "value": "0.50",
+                       "message": "MATERIAL product cost must be >= 1.00 THB"}]
+    _, errors = validate_row("products", 5, {"sku": "A-3", "cost": "x", "min_stock": "-1"}, lk, seen)
+    assert {e["column"] for e in errors} == {"name", "cost", "min_stock"}
+
+
+def test_employee_codes_resolved_and_cost_center_defaults_from_department():
+    dept_id, dept_cc, other_cc = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    lk = ImportLookups()
+    lk.departments = {"PROD": (dept_id, dept_cc)}
+    lk.cost_centers = {"CC-ADMIN": other_cc}
+    row = {"employee_code": "e-1", "full_name": "A", "department_code": "prod"}
+    record, _ = validate_row("employees", 2, row, lk, {})
+    assert (record["employee_code"], record["department_id"], record["cost_center_id"]) == ("E-1", dept_id, dept_cc)
+    record, _ = validate_row("employees", 3, {**row, "employee_code": "E-2", "cost_center_code": "cc-admin"}, lk, {})
+    assert record["cost_center_id"] == other_cc
+    _, errors = validate_row("employees", 4, {**row, "employee_code": "E-3", "department_code": "X"}, lk, {})
+    assert errors[0]["column"] == "department_code"
+
+
+def test_opening_stock_locations():
+    stor_a, stor_b, recv = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    lk = ImportLookups()
+    lk.locations = {("WH-A", "STOR"): stor_a, ("WH-B", "STOR"): stor_b, ("WH-A", "RECV"): recv}
+    lk.location_codes.update({"STOR": [stor_a, stor_b], "RECV": [recv]})
+    seen = {}
+
+    record, _ = validate_row("opening_stock", 2, {"sku": "p-1", "quantity": "5", "location_code": "recv"}, lk, seen)
+    assert record["location_id"] == recv and "location_code" not in record
+    record, _ = validate_row("opening_stock", 3, {"sku": "P-1", "quantity": "5", "warehouse_code": "wh-b",
+                                                  "location_code": "STOR"}, lk, seen)
+    assert record["location_id"] == stor_b
+    _, errors = validate_row("opening_stock", 4, {"sku": "P-2", "quantity": "5", "location_code": "STOR"}, lk, seen)
+    assert "several warehouses" in errors[0]["message"]
+    _, errors = validate_row("opening_stock", 5, {"sku": "P-1", "quantity": "1"}, lk, seen)
+    assert errors[0]["message"] == "Mix of rows with and without location for this SKU"
+    _, errors = validate_row("opening_stock", 6, {"sku": "P-1", "quantity": "9", "location_code": "RECV"}, lk, seen)
+    assert errors[0]["message"] == "Duplicate in file (first at row 2)"
+
+
+def test_insert_sql_is_one_unnest_statement_per_chunk():
+    sql = _insert_sql(IMPORT_ENTITIES["products"])
+    assert "CAST(:product_type AS product_type_enum[])" in sql
+    assert "ON CONFLICT DO NOTHING" in sql and "RETURNING id, sku" in sql
+    assert sql.count("INSERT") == 1
+
+
+def test_error_report_notes_rows_beyond_the_cap():
+    run = ImportRun(errors=[{"row": 3, "column": "cost", "value": "x", "message": "bad, really"}], error_count=4)
+    lines = error_report_csv(run).splitlines()
+    assert lines == [
+        "row,column,value,message",
+        '3,cost,x,"bad, really"',
+        ",,,3 more rejected rows not listed",
+    ]
@@ -0,0 +1,159 @@
+"""
+Email outbox (Phase 15) — enqueue gating, approval requests in the caller's transaction,
+and the SMTP sender against a local aiosmtpd stand-in, not the live dev server.
+"""
+
+import asyncio
+import smtplib
+import socket
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.core.config import get_settings
+from app.models.email import EmailOutbox
+from app.services import email as email_service
+from app.services import notification
+from app.services.email import PermanentEmailError, SMTPSender, _build_mime, enqueue_email
+from tests.unit.fakes import FakeSession, result
+
+ORG = uuid.UUID(int=1)
+
+
+@pytest.fixture()
+def email_settings(monkeypatch):
+    settings = get_settings().model_copy(update={"EMAIL_ENABLED": True, "SMTP_HOST": "smtp.test"})
+    monkeypatch.setattr(email_service, "get_settings", lambda: settings)
+    return settings
+
+
+def _enqueue(db):
+    return enqueue_email(db, org_id=ORG, to_email="a@test", subject="s", html_body="<p>b</p>")
+
+
+def test_enqueue_needs_email_enabled_and_smtp_host(email_settings):
+    db = FakeSession()
+    email_settings.SMTP_HOST = ""
+    assert _enqueue(db) is None  # no worker would ever deliver it
+    email_settings.SMTP_HOST, email_settings.EMAIL_ENABLED = "smtp.test", False
+    assert _enqueue(db) is None
+    email_settings.EMAIL_ENABLED = True
+    row = _enqueue(db)
+    assert db.added == [row] and db.log == ["add"]  # no commit — rides on the caller's transaction
+
+
+def _approval_request(db):
+    return notification.notify_approval_request(
+        db, org_id=ORG, permission="purchasing.pr.approve", entity_type="PR",
+        entity_id=uuid.uuid4(), doc_number="PR-0001", doc_type_thai="ใบขอซื้อ",
+        link="/purchasing/pr/x", actor_id=uuid.uuid4(), actor_name="Staff",
+    )
+
+
+def test_approval_request_is_written_in_the_callers_transaction(monkeypatch, email_settings):
+    approvers = [uuid.uuid4(), uuid.uuid4()]
+
+    async def fake_bulk(db, *, user_ids, org_id, **kwargs):
+        for uid in user_ids:
+            notification._stage(db, ("push", uid, org_id, "{}"))
+        return user_ids
+
+    monkeypatch.setattr(notification, "create_notifications_bulk", fake_bulk)
+    db = FakeSession([
+        result(scalars=approvers),
+        result(rows=[SimpleNamespace(email="m1@test", full_name="M1"),
+                     SimpleNamespace(email=None, full_name="M2")]),
+    ])
+    asyncio.run(_approval_request(db))
+
+    assert "commit" not in db.log  # the submit's commit makes notification + email durable together
+    assert db.log == ["flush", "savepoint", "savepoint", "add", "release savepoint", "release savepoint"]
+    assert [type(row) for row in db.added] == [EmailOutbox]
+    assert db.added[0].to_email == "m1@test"
+    assert len(db.info[notification._PENDING_KEY]) == 2  # published after the caller commits
+
+
+def test_failed_approval_request_never_aborts_the_submit(email_settings):
+    db = FakeSession([])  # approver lookup fails
+    notification._stage(db, ("reset", uuid.uuid4(), ORG, 0))  # staged earlier by the caller
+    asyncio.run(_approval_request(db))
+
+    assert db.log == ["flush", "savepoint", "rollback savepoint"]
+    assert len(db.info[notification._PENDING_KEY]) == 1
+
+
+class _Collector:
+    def __init__(self):
+        self.messages = []
+        self.peers = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.endswith("@reject.test"):
+            return "550 mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        self.peers.add(session.peer)
+        return "250 Message accepted"
+
+
+@pytest.fixture()
+def smtp_server():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    handler = _Collector()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    try:
+        yield handler, "127.0.0.1", port
+    finally:
+        controller.stop()
+
+
+def test_batch_reuses_one_connection(smtp_server):
+    handler, host, port = smtp_server
+    sender = SMTPSender(host, port, starttls=False)
+    try:
+        for i in range(5):
+            msg = _build_mime("noreply@test", f"user{i}@test", f"subject {i}", "<p>hi</p>")
+            sender.send("noreply@test", f"user{i}@test", msg)
+    finally:
+        sender.close()
+
+    assert len(handler.messages) == 5
+    assert sender.connections_opened == 1
+    assert len(handler.peers) == 1
+
+
+def test_reconnects_after_close(smtp_server):
+    handler, host, port = smtp_server
+    sender = SMTPSender(host, port, starttls=False)
+    sender.send("noreply@test", "a@test", _build_mime("noreply@test", "a@test", "s", "b"))
+    sender.close()
+    sender.send("noreply@test", "b@test", _build_mime("noreply@test", "b@test", "s", "b"))
+    sender.close()
+
+    assert len(handler.messages) == 2
+    assert sender.connections_opened == 2
+
+
+def test_5xx_is_permanent(smtp_server):
+    _, host, port = smtp_server
+    sender = SMTPSender(host, port, starttls=False)
+    try:
+        with pytest.raises(PermanentEmailError):
+            sender.send("noreply@test", "x@reject.test", _build_mime("noreply@test", "x@reject.test", "s", "b"))
+    finally:
+        sender.close()
+
+
+def test_connection_refused_is_retryable():
+    sender = SMTPSender("127.0.0.1", 1, starttls=False, timeout=1)
+    with pytest.raises((OSError, smtplib.SMTPException)) as exc:
+        sender.send("noreply@test", "a@test", "body")
+    assert not isinstance(exc.value, PermanentEmailError)
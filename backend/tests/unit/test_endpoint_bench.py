@@ -0,0 +1,40 @@
+"""
+Endpoint benchmark suite tests (Phase 15) — percentile + regression rules, no API.
+"""
+
+from app.bench.endpoints import FLOW_BUDGETS_MS, FLOWS, compare, percentile
+
+
+def _result(p95: float, queries: int = 5, errors: int = 0) -> dict:
+    return {"p95_ms": p95, "queries": queries, "errors": errors, "error_statuses": [503] if errors else []}
+
+
+def test_percentile_nearest_rank():
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile(samples, 99) == 99
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def test_every_flow_has_a_budget():
+    assert set(FLOWS) == set(FLOW_BUDGETS_MS)
+
+
+def test_compare_flags_budget_baseline_queries_and_errors():
+    budgets = {"me": 50}
+    assert compare({"me": _result(40)}, {"me": _result(35)}, budgets, 0.25) == []
+
+    problems = compare(
+        {"me": _result(60, queries=7, errors=2)}, {"me": _result(40)}, budgets, 0.25,
+    )
+    assert len(problems) == 4
+    assert "non-2xx" in problems[0] and "503" in problems[0]
+    assert "budget" in problems[1]
+    assert "baseline" in problems[2]
+    assert "queries" in problems[3]
+
+
+def test_compare_without_baseline_uses_budget_only():
+    assert compare({"me": _result(45)}, {}, {"me": 50}, 0.0) == []
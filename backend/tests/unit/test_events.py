@@ -0,0 +1,124 @@
+"""
+Domain event outbox + relay (Phase 15) — recording and publishing, no DB, Redis or API.
+"""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.models.inventory import MovementType
+from app.models.sales import SOStatus
+from app.services.events import publish_domain_events, record_event, record_status_change, stream_key
+from tests.unit.fakes import FakeSession, result
+
+ORG = uuid.UUID(int=1)
+
+
+def test_record_event_flushes_first_and_stores_json_payload():
+    db = FakeSession()
+    movement_id = uuid.uuid4()
+    event = asyncio.run(record_event(
+        db, org_id=ORG, event_type="stock_moved", aggregate_type="Product", aggregate_id=uuid.uuid4(),
+        payload={"movement_id": movement_id, "movement_type": MovementType.RECEIVE,
+                 "unit_cost": Decimal("12.50"), "on": date(2026, 3, 31), "batch_number": None},
+    ))
+    # aggregate's pending UPDATE (and its row lock) lands before the event takes its id
+    assert db.log == ["flush", "add"] and db.added == [event]
+    assert event.payload == {"movement_id": str(movement_id), "movement_type": "RECEIVE",
+                             "unit_cost": "12.50", "on": "2026-03-31", "batch_number": None}
+
+
+def test_status_change_payload():
+    db = FakeSession()
+    event = asyncio.run(record_status_change(
+        db, org_id=ORG, aggregate_type="SO", aggregate_id=uuid.uuid4(), number="SO-0001",
+        from_status=SOStatus.SUBMITTED, to_status=SOStatus.DRAFT, reason="price",
+    ))
+    assert event.event_type == "status_changed"
+    assert event.payload == {"number": "SO-0001", "from": "SUBMITTED", "to": "DRAFT", "reason": "price"}
+
+
+def _row(n: int, org=ORG):
+    return SimpleNamespace(
+        id=n, org_id=org, event_id=uuid.UUID(int=n), event_type="stock_moved", aggregate_type="Product",
+        aggregate_id=uuid.UUID(int=100), payload='{"quantity": 1}', actor_id=None,
+        occurred_at=datetime(2026, 3, 31, tzinfo=timezone.utc),
+    )
+
+
+class _Pipe:
+    def __init__(self, fail: bool):
+        self.fail = fail
+        self.xadds = []
+
+    def xadd(self, key, fields, **kwargs):
+        self.xadds.append((key, fields, kwargs))
+
+
+class _Manager:
+    def __init__(self, fail=False):
+        self.pipe = _Pipe(fail)
+
+    @asynccontextmanager
+    async def pipeline(self):
+        yield self.pipe
+        if self.pipe.fail:
+            raise RedisConnectionError("Connection refused")
+        self.pipe.results = [f"1700000000000-{i}" for i in range(len(self.pipe.xadds))]
+
+
+def _publish(monkeypatch, db, manager):
+    import app.core.redis
+
+    monkeypatch.setattr(app.core.redis, "get_redis_manager", lambda: manager)
+    return asyncio.run(publish_domain_events(db, batch_size=10))
+
+
+def test_publish_in_id_order_with_offsets(monkeypatch):
+    other = uuid.UUID(int=2)
+    db = FakeSession([
+        result(scalar=True),  # advisory lock
+        result(rows=[_row(7), _row(8, org=other), _row(9)]),
+        result(scalars=[41, 42, 43]),
+        result(),  # mark published
+    ])
+    manager = _Manager()
+    assert _publish(monkeypatch, db, manager) == 3
+
+    keys = [key for key, _, _ in manager.pipe.xadds]
+    assert keys == [stream_key(ORG), stream_key(other), stream_key(ORG)]
+    fields = manager.pipe.xadds[0][1]
+    assert fields["offset"] == "41" and fields["event_id"] == str(uuid.UUID(int=7))
+    assert fields["actor_id"] == "" and fields["payload"] == '{"quantity": 1}'
+    assert manager.pipe.xadds[0][2]["approximate"] is True
+    assert db.params[-1] == {"ids": [7, 8, 9], "offsets": [41, 42, 43],
+                             "stream_ids": ["1700000000000-0", "1700000000000-1", "1700000000000-2"]}
+    assert db.log == ["commit"]
+
+
+def test_publish_skips_while_another_relay_holds_the_lock(monkeypatch):
+    db = FakeSession([result(scalar=False)])
+    assert _publish(monkeypatch, db, _Manager()) == 0
+    assert db.log == ["rollback"]
+
+
+def test_redis_failure_leaves_batch_unpublished(monkeypatch):
+    db = FakeSession([result(scalar=True), result(rows=[_row(1)]), result(scalars=[5])])
+    with pytest.raises(RedisConnectionError):
+        _publish(monkeypatch, db, _Manager(fail=True))
+    # no mark-published statement; the batch goes out again next round (at-least-once)
+    assert db.log == ["rollback"] and len(db.params) == 3
+
+
+def test_relay_poll_index_is_partial():
+    from app.models.event import DomainEvent
+
+    where = {i.name: str(i.dialect_options["postgresql"]["where"]) for i in DomainEvent.__table__.indexes
+             if i.dialect_options["postgresql"]["where"] is not None}
+    assert where == {"ix_domain_events_unpublished": "published_at IS NULL"}
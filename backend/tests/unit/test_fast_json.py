@@ -0,0 +1,76 @@
+"""
+Fast JSON path + compression middleware (Phase 15) — no database or live API needed.
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.routing import serialize_response
+from fastapi.testclient import TestClient
+from fastapi.utils import create_model_field
+
+from app.bench.json_responses import _rows
+from app.core.responses import fast_json
+from app.middleware.compression import CompressionMiddleware
+from app.schemas.inventory import StockBatchListResponse
+
+
+def test_fast_json_matches_response_model_output():
+    payload = {"items": _rows(25), "total": 25, "limit": 25, "offset": 0}
+    field = create_model_field("response", StockBatchListResponse, mode="serialization")
+    validated = asyncio.run(serialize_response(field=field, response_content=payload))
+
+    expected = json.loads(JSONResponse(validated).body)
+    actual = json.loads(fast_json(StockBatchListResponse, payload).body)
+    assert actual == expected
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/big")
+    async def big():
+        return {"data": "x" * 5000}
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def gen():
+            yield "data: 1\n\n"
+            yield "data: 2\n\n" + "y" * 500
+
+        return StreamingResponse(gen(), media_type="text/event-stream")
+
+    return app
+
+
+def test_large_json_is_compressed_small_is_not():
+    client = TestClient(_app())
+    big = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert big.headers["content-encoding"] == "gzip"
+    assert big.json() == {"data": "x" * 5000}
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+def test_streaming_response_passes_through():
+    client = TestClient(_app())
+    resp = client.get("/stream", headers={"Accept-Encoding": "gzip, br"})
+    assert "content-encoding" not in resp.headers
+    assert resp.text.startswith("data: 1")
+
+
+def test_brotli_preferred_when_available():
+    pytest.importorskip("brotli")
+    client = TestClient(_app())
+    resp = client.get("/big", headers={"Accept-Encoding": "gzip, br"})
+    assert resp.headers["content-encoding"] == "br"
+    assert resp.json() == {"data": "x" * 5000}
@@ -0,0 +1,104 @@
+"""
+Leave balance ledger (BR#36, Phase 15) — running balance bookkeeping, no API.
+Year-end rollover runs its SQL over TEMP tables when TEST_DATABASE_URL is set.
+"""
+
+import uuid
+
+from sqlalchemy import text
+
+from app.models.hr import LeaveBalance, LeaveEntryType
+from app.services.hr import book_leave_entry, rollover_leave_balances
+from tests.unit.fakes import FakeSession, run_with_temp_tables
+
+ORG = uuid.UUID(int=1)
+
+
+def _balance():
+    return LeaveBalance(
+        id=uuid.uuid4(), employee_id=uuid.uuid4(), leave_type_id=uuid.uuid4(), year=2026,
+        quota=0, used=0, carried_forward=0, pending=0, remaining=0, org_id=ORG,
+    )
+
+
+def test_entries_keep_running_balance_consistent():
+    db, bal = FakeSession(), _balance()
+    book_leave_entry(db, bal, LeaveEntryType.ACCRUAL, 6)
+    book_leave_entry(db, bal, LeaveEntryType.CARRY_FORWARD, 3)
+    leave_id = uuid.uuid4()
+    usage = book_leave_entry(db, bal, LeaveEntryType.USAGE, -2, leave_id=leave_id)
+    book_leave_entry(db, bal, LeaveEntryType.ADJUSTMENT, -1)
+
+    assert (bal.quota, bal.carried_forward, bal.used, bal.remaining) == (5, 3, 2, 6)
+    assert bal.remaining == bal.quota + bal.carried_forward - bal.used
+    assert [e.balance_after for e in db.added] == [6, 9, 7, 6]
+    assert sum(e.days for e in db.added) == bal.remaining
+    assert usage.leave_id == leave_id
+    assert all(e.balance_id == bal.id and e.org_id == bal.org_id for e in db.added)
+
+
+# ============================================================
+# ROLLOVER (Postgres)
+# ============================================================
+
+_TABLES = f"""
+    CREATE TYPE pg_temp.leave_entry_type_enum AS ENUM ({", ".join(f"'{t.value}'" for t in LeaveEntryType)});
+    CREATE TEMP TABLE employees (id uuid, org_id uuid, is_active boolean);
+    CREATE TEMP TABLE leave_types (
+        id uuid, org_id uuid, is_active boolean, default_quota int, carry_forward_max int);
+    CREATE TEMP TABLE leave_balances (
+        id uuid PRIMARY KEY, employee_id uuid, leave_type_id uuid, year int, quota int, used int,
+        carried_forward int, pending int, remaining int, org_id uuid,
+        created_at timestamptz, updated_at timestamptz,
+        CONSTRAINT uq_leave_balance_emp_type_year UNIQUE (employee_id, leave_type_id, year));
+    CREATE TEMP TABLE leave_balance_entries (
+        id uuid, balance_id uuid, entry_type leave_entry_type_enum, days int, balance_after int,
+        note text, created_by uuid, org_id uuid, created_at timestamptz, updated_at timestamptz)
+"""
+
+EMP_PENDING, EMP_OVERBOOKED, EMP_CAPPED = uuid.UUID(int=0xE1), uuid.UUID(int=0xE2), uuid.UUID(int=0xE3)
+ANNUAL = uuid.UUID(int=0xA1)
+
+_ROWS = [
+    ("INSERT INTO employees VALUES (:e1, :org, true), (:e2, :org, true), (:e3, :org, true)", {}),
+    ("INSERT INTO leave_types VALUES (:lt, :org, true, 6, 10)", {}),
+    # 2025: remaining / pending — 8 left with 3 reserved, 2 left with 5 reserved, 15 left
+    ("""INSERT INTO leave_balances VALUES
+        (gen_random_uuid(), :e1, :lt, 2025, 10, 2, 0, 3, 8, :org, now(), now()),
+        (gen_random_uuid(), :e2, :lt, 2025, 10, 8, 0, 5, 2, :org, now(), now()),
+        (gen_random_uuid(), :e3, :lt, 2025, 15, 0, 0, 0, 15, :org, now(), now())""", {}),
+]
+
+
+async def _carried(db) -> dict:
+    rows = (await db.execute(text(
+        "SELECT employee_id, carried_forward, remaining FROM leave_balances WHERE year = 2026"
+    ))).all()
+    return {row[0]: (row[1], row[2]) for row in rows}
+
+
+def test_rollover_leaves_pending_days_out_of_the_carry(pg_url):
+    async def check(db):
+        report = await rollover_leave_balances(db, from_year=2025, org_id=ORG)
+        assert (report["created"], report["updated"], report["carried_days"]) == (3, 0, 15)
+        assert await _carried(db) == {
+            EMP_PENDING: (5, 11),     # 8 − 3 pending
+            EMP_OVERBOOKED: (0, 6),   # pending beyond remaining carries nothing
+            EMP_CAPPED: (10, 16),     # carry_forward_max
+        }
+
+        # the pending request is rejected — a re-run carries the freed days
+        await db.execute(text("UPDATE leave_balances SET pending = 0 WHERE employee_id = :e1 AND year = 2025"),
+                         {"e1": EMP_PENDING})
+        report = await rollover_leave_balances(db, from_year=2025, org_id=ORG)
+        assert (report["created"], report["updated"]) == (0, 3)
+        assert (await _carried(db))[EMP_PENDING] == (8, 14)
+        carries = (await db.execute(text("""
+            SELECT days, balance_after FROM leave_balance_entries
+            WHERE entry_type = 'CARRY_FORWARD'
+        """))).all()
+        assert sorted(tuple(row) for row in carries) == [(3, 14), (5, 11), (10, 16)]
+
+    run_with_temp_tables(
+        pg_url, _TABLES, _ROWS, check, org=ORG, lt=ANNUAL, e1=EMP_PENDING, e2=EMP_OVERBOOKED, e3=EMP_CAPPED,
+    )
@@ -0,0 +1,54 @@
+"""
+Low-stock watchlist (Phase 15) — threshold crossings, no DB or API.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.inventory import LowStockWatch, Product
+from app.services.low_stock import is_low_stock, track_low_stock
+from tests.unit.fakes import FakeSession, result
+
+
+def _product(on_hand, min_stock, is_active=True) -> Product:
+    return Product(id=uuid.uuid4(), org_id=uuid.UUID(int=1), sku="P-1", name="P",
+                   on_hand=on_hand, min_stock=min_stock, is_active=is_active)
+
+
+def _track(product, was_low) -> list:
+    db = FakeSession(default=result())
+    asyncio.run(track_low_stock(db, product, was_low=was_low))
+    return db.statements
+
+
+@pytest.mark.parametrize("on_hand,min_stock,is_active,expected", [
+    (5, 5, True, True),
+    (6, 5, True, False),
+    (0, 0, True, False),  # no threshold set
+    (0, 5, False, False),  # deleted product
+])
+def test_is_low_stock(on_hand, min_stock, is_active, expected):
+    assert is_low_stock(_product(on_hand, min_stock, is_active)) is expected
+
+
+def test_no_write_without_crossing():
+    assert _track(_product(3, 5), was_low=True) == []
+    assert _track(_product(9, 5), was_low=False) == []
+
+
+@pytest.mark.parametrize("on_hand,was_low,now_low", [(4, False, True), (8, True, False)])
+def test_crossing_upserts_watchlist_row(on_hand, was_low, now_low):
+    (stmt,) = _track(_product(on_hand, 5), was_low=was_low)
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT (product_id) DO UPDATE" in str(compiled)
+    assert compiled.params["is_low"] is now_low
+    assert compiled.params["alert_due"] is now_low
+
+
+def test_partial_indexes():
+    where = {i.name: str(i.dialect_options["postgresql"]["where"]) for i in LowStockWatch.__table__.indexes}
+    assert where == {"ix_low_stock_watchlist_low": "is_low",
+                     "ix_low_stock_watchlist_alert_due": "alert_due"}
@@ -0,0 +1,55 @@
+"""
+Net requirements / reorder drafting (Phase 15) — no DB or API.
+"""
+
+import asyncio
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+import app.services.purchasing as purchasing
+from app.services import mrp
+
+TODAY = date.today()
+
+
+def _suggestion(need_in_days, qty, sku="P"):
+    return {
+        "product_id": uuid.uuid4(), "sku": sku, "unit": "PCS", "unit_cost": Decimal("5.00"),
+        "on_hand": 0, "min_stock": qty, "min_projected": 0, "suggested_qty": qty,
+        "need_date": TODAY + timedelta(days=need_in_days) if need_in_days is not None else None,
+    }
+
+
+@pytest.mark.parametrize("horizon,bucket,expected", [(28, 7, 4), (30, 7, 5), (3, 7, 1), (1, 1, 1)])
+def test_bucket_count(horizon, bucket, expected):
+    assert mrp.bucket_count(horizon, bucket) == expected
+
+
+def test_draft_groups_by_need_date_and_splits_large_prs(monkeypatch):
+    bodies = []
+
+    async def _create(db, *, body, created_by, org_id, requester_id=None):
+        bodies.append(body)
+        return body
+
+    monkeypatch.setattr(purchasing, "create_purchase_requisition", _create)
+    monkeypatch.setattr(mrp, "MRP_MAX_PR_LINES", 2)
+    suggestions = [_suggestion(0, 5), _suggestion(0, 6), _suggestion(0, 7),
+                   _suggestion(7, 3), _suggestion(None, 0)]
+    asyncio.run(mrp.draft_reorder_requisitions(
+        None, org_id=uuid.UUID(int=1), suggestions=suggestions,
+        cost_center_id=uuid.uuid4(), cost_element_id=uuid.uuid4(), created_by=uuid.uuid4(),
+    ))
+
+    assert [len(b["lines"]) for b in bodies] == [2, 1, 1]
+    assert [b["priority"] for b in bodies] == ["URGENT", "URGENT", "NORMAL"]
+    assert bodies[2]["required_date"] == TODAY + timedelta(days=7)
+    assert all(line["item_type"] == "GOODS" for b in bodies for line in b["lines"])
+
+
+def test_projection_sql_only_filters_products_when_asked():
+    assert ":product_ids" not in mrp._NET_REQUIREMENTS_SQL.format(product_filter="")
+    assert "{" not in mrp._NET_REQUIREMENTS_SQL.format(product_filter="")
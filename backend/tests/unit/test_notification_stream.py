@@ -0,0 +1,51 @@
+"""
+Notification SSE stream (Phase 15) — streams subscribe on their own pub/sub pool, capped
+per worker, and never take command connections. In-memory Redis (fakeredis), no DB or API.
+"""
+
+import asyncio
+import uuid
+
+import fakeredis
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+import app.api.notification as notification_api
+import app.core.redis
+from app.core.redis import InstrumentedRedis, RedisManager, _BoundedPool
+
+TOKEN = {"sub": str(uuid.UUID(int=7)), "org_id": str(uuid.UUID(int=1))}
+
+
+def _client(cls, server, max_connections):
+    pool = _BoundedPool(
+        connection_class=fake_aioredis.FakeConnection, server=server,
+        max_connections=max_connections, decode_responses=True,
+    )
+    return cls(connection_pool=pool)
+
+
+def test_streams_over_the_cap_get_503_and_commands_keep_working(monkeypatch):
+    # own breaker — the process-wide one may be open from tests that hit a real (absent) Redis
+    monkeypatch.setattr(app.core.redis, "manager", RedisManager(failure_threshold=3, cooldown_seconds=60))
+    server = fakeredis.FakeServer()
+    commands = _client(InstrumentedRedis, server, 1)
+    pubsub = _client(fake_aioredis.FakeRedis, server, 2)
+    monkeypatch.setattr(notification_api, "get_pubsub_redis", lambda: pubsub)
+
+    async def _run():
+        open_streams = [
+            await notification_api.api_notification_stream(request=None, token=TOKEN) for _ in range(2)
+        ]
+        assert all(isinstance(r, StreamingResponse) for r in open_streams)
+        with pytest.raises(HTTPException) as refused:
+            await notification_api.api_notification_stream(request=None, token=TOKEN)
+        assert refused.value.status_code == 503
+        # the full pub/sub pool leaves the one-connection command pool untouched
+        await commands.set("k", "v")
+        assert await commands.publish(notification_api.notification_channel(uuid.UUID(TOKEN["sub"])), "x") == 2
+        return await commands.get("k")
+
+    assert asyncio.run(_run()) == "v"
@@ -0,0 +1,81 @@
+"""
+Notification unread counter (Phase 15) — Redis cache invalidated on write, version-guarded
+fill on read. In-memory Redis (fakeredis, Lua enabled), no DB or API.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from fakeredis import aioredis as fake_aioredis
+
+from app.services import notification
+from tests.unit.fakes import FakeSession, result
+
+ORG = uuid.UUID(int=1)
+USER = uuid.UUID(int=2)
+KEY = f"notif:unread:{ORG}:{USER}"
+
+
+@pytest.fixture()
+def redis(monkeypatch):
+    client = fake_aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(notification, "get_redis", lambda: client)
+    monkeypatch.setattr(notification, "_fill_script", None)
+    return client
+
+
+async def _write(op=("invalidate", USER, ORG, None)):
+    """What a committed mark-read / create does once the caller publishes."""
+    db = FakeSession()
+    notification._stage(db, op)
+    await notification.publish_pending_notifications(db)
+
+
+def test_miss_counts_from_db_then_serves_from_cache(redis):
+    async def scenario():
+        db = FakeSession([result(scalar=3)])
+        first = await notification.get_unread_count(db, USER, ORG)
+        second = await notification.get_unread_count(db, USER, ORG)  # no DB result left to pop
+        return first, second, await redis.get(KEY)
+
+    assert asyncio.run(scenario()) == (3, 3, "3")
+
+
+def test_write_invalidates_and_pushes(redis):
+    async def scenario():
+        await redis.set(KEY, 5)
+        pubsub = redis.pubsub()
+        await pubsub.subscribe(notification.notification_channel(USER))
+        await pubsub.get_message(timeout=1)  # subscribe confirmation
+        await _write(("push", USER, ORG, '{"title": "t"}'))
+        message = await pubsub.get_message(timeout=1)
+        return await redis.get(KEY), message and message["data"]
+
+    assert asyncio.run(scenario()) == (None, '{"title": "t"}')
+
+
+def test_count_read_before_a_commit_never_refills_the_cache(redis):
+    class RacingSession(FakeSession):
+        async def execute(self, stmt, params=None):
+            stale = await super().execute(stmt, params)
+            await _write()  # mark-read commits between our DB count and the fill
+            return stale
+
+    async def scenario():
+        stale = await notification.get_unread_count(RacingSession([result(scalar=3)]), USER, ORG)
+        cached_after_race = await redis.get(KEY)
+        fresh = await notification.get_unread_count(FakeSession([result(scalar=2)]), USER, ORG)
+        return stale, cached_after_race, fresh, await redis.get(KEY)
+
+    assert asyncio.run(scenario()) == (3, None, 2, "2")
+
+
+def test_redis_down_falls_back_to_db(monkeypatch):
+    def down():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(notification, "get_redis", down)
+    db = FakeSession([result(scalar=4)])
+    assert asyncio.run(notification.get_unread_count(db, USER, ORG)) == 4
+    asyncio.run(_write())  # logged, never raised
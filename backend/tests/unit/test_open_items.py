@@ -0,0 +1,163 @@
+"""
+AR/AP open-item aging queries (Phase 15) — index predicates from the compiled SQL; bracket,
+as-of and party figures of compute_open_items over known rows in TEMP tables when
+TEST_DATABASE_URL is set.
+"""
+
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.ar import CustomerInvoice, CustomerInvoiceStatus
+from app.models.invoice import InvoiceStatus, SupplierInvoice
+from app.services.finance import _open_item_side, _open_items_select, compute_open_items
+from tests.unit.fakes import run_with_temp_tables
+
+ORG = uuid.UUID(int=1)
+TODAY = date(2026, 3, 26)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _index_where(model, name) -> str:
+    index = next(i for i in model.__table__.indexes if i.name == name)
+    return str(index.dialect_options["postgresql"]["where"])
+
+
+@pytest.mark.parametrize("side", ["ar", "ap"])
+def test_current_aging_matches_open_item_index_predicate(side):
+    sql = _sql(_open_items_select(_open_item_side(side), org_id=ORG, as_of=TODAY, today=TODAY))
+    assert "outstanding_amount > 0" in sql
+    assert "'APPROVED'" in sql and "'PAID'" not in sql
+    assert "payments" not in sql
+
+
+def test_index_predicates_match_between_sides():
+    assert _index_where(CustomerInvoice, "ix_ci_open_items") == _index_where(
+        SupplierInvoice, "ix_invoice_open_items"
+    )
+
+
+def test_unknown_side_rejected():
+    with pytest.raises(ValueError):
+        _open_item_side("gl")
+
+
+# ============================================================
+# FIGURES (Postgres)
+# ============================================================
+# Only the columns the aging reads; status in TEMP copies of the enum types, which the
+# bound parameters are cast to.
+
+
+def _labels(enum_cls) -> str:
+    return ", ".join(f"'{member.value}'" for member in enum_cls)
+
+
+_TABLES = f"""
+    CREATE TYPE pg_temp.customer_invoice_status_enum AS ENUM ({_labels(CustomerInvoiceStatus)});
+    CREATE TYPE pg_temp.invoice_status_enum AS ENUM ({_labels(InvoiceStatus)});
+    CREATE TEMP TABLE customers (id uuid, name text);
+    CREATE TEMP TABLE suppliers (id uuid, name text);
+    CREATE TEMP TABLE customer_invoices (
+        id uuid, org_id uuid, customer_id uuid, status customer_invoice_status_enum, is_active boolean,
+        invoice_date date, due_date date, outstanding_amount numeric(12,2));
+    CREATE TEMP TABLE supplier_invoices (
+        id uuid, org_id uuid, supplier_id uuid, status invoice_status_enum, is_active boolean,
+        invoice_date date, due_date date, outstanding_amount numeric(12,2));
+    CREATE TEMP TABLE customer_invoice_payments (
+        invoice_id uuid, org_id uuid, payment_date date, amount numeric(12,2));
+    CREATE TEMP TABLE invoice_payments (
+        invoice_id uuid, org_id uuid, payment_date date, amount numeric(12,2),
+        wht_deducted numeric(12,2))
+"""
+
+OTHER_ORG = uuid.UUID(int=2)
+ALPHA, BETA, GAMMA = uuid.UUID(int=0xA1), uuid.UUID(int=0xB1), uuid.UUID(int=0xC1)
+
+
+def _run(pg_url, rows, check):
+    parties = [
+        ("INSERT INTO customers VALUES (:a, 'Alpha'), (:b, 'Beta'), (:c, 'Gamma')", {}),
+        ("INSERT INTO suppliers VALUES (:a, 'Alpha'), (:b, 'Beta')", {}),
+    ]
+    run_with_temp_tables(
+        pg_url, _TABLES, parties + rows, check, org=ORG, other=OTHER_ORG, a=ALPHA, b=BETA, c=GAMMA,
+    )
+
+
+def _aging(report) -> dict:
+    return {b["bracket"]: (b["count"], b["amount"]) for b in report["aging"]}
+
+
+def test_current_aging_brackets_and_party_totals(pg_url):
+    today = date.today()
+    rows = [("""
+        INSERT INTO customer_invoices VALUES
+            (gen_random_uuid(), :org, :a, 'APPROVED', true, :d0, :due_in_5, 100),
+            (gen_random_uuid(), :org, :c, 'APPROVED', true, :d0, :due_today, 50),
+            (gen_random_uuid(), :org, :a, 'APPROVED', true, :d0, :late_30, 200),
+            (gen_random_uuid(), :org, :b, 'APPROVED', true, :d0, :late_31, 300),
+            (gen_random_uuid(), :org, :b, 'APPROVED', true, :d0, :late_90, 400),
+            (gen_random_uuid(), :org, :c, 'APPROVED', true, :d0, :late_91, 500),
+            (gen_random_uuid(), :org, :a, 'PAID', true, :d0, :late_30, 0),
+            (gen_random_uuid(), :org, :a, 'APPROVED', false, :d0, :late_30, 999),   -- inactive
+            (gen_random_uuid(), :org, :b, 'DRAFT', true, :d0, :late_30, 888),
+            (gen_random_uuid(), :org, :b, 'APPROVED', true, :d0, :late_30, 0),      -- settled
+            (gen_random_uuid(), :other, :b, 'APPROVED', true, :d0, :late_30, 777)
+    """, {
+        "d0": today - timedelta(days=120), "due_in_5": today + timedelta(days=5), "due_today": today,
+        "late_30": today - timedelta(days=30), "late_31": today - timedelta(days=31),
+        "late_90": today - timedelta(days=90), "late_91": today - timedelta(days=91),
+    })]
+
+    async def check(db):
+        report = await compute_open_items(db, side="ar", org_id=ORG)
+        assert _aging(report) == {
+            "current": (2, 150.0), "1-30": (1, 200.0), "31-60": (1, 300.0),
+            "61-90": (1, 400.0), "90+": (1, 500.0),
+        }
+        assert (report["outstanding"], report["overdue_count"], report["overdue_amount"]) == (1550.0, 4, 1400.0)
+        assert [(p["name"], p["count"], p["outstanding"]) for p in report["parties"]] == [
+            ("Beta", 2, 700.0), ("Gamma", 2, 550.0), ("Alpha", 2, 300.0),
+        ]
+
+    _run(pg_url, rows, check)
+
+
+def test_past_as_of_adds_back_later_payments_and_skips_later_invoices(pg_url):
+    as_of = date(2026, 3, 31)
+    j1, j2, j3, j4, j5 = (uuid.UUID(int=0xF0 + i) for i in range(1, 6))
+    rows = [
+        ("""
+        INSERT INTO supplier_invoices VALUES
+            (:j1, :org, :a, 'PAID', true, '2026-03-01', '2026-03-15', 0),
+            (:j2, :org, :b, 'APPROVED', true, '2026-01-05', '2026-01-20', 250),
+            (:j3, :org, :b, 'APPROVED', true, '2026-04-05', '2026-05-05', 900),     -- issued later
+            (:j4, :org, :a, 'PAID', true, '2026-02-01', '2026-02-28', 0),
+            (:j5, :org, :a, 'APPROVED', true, '2026-03-20', '2026-04-30', 100)
+        """, {"j1": j1, "j2": j2, "j3": j3, "j4": j4, "j5": j5}),
+        ("""
+        INSERT INTO invoice_payments VALUES
+            (:j1, :org, '2026-03-20', 400, 0),
+            (:j1, :org, '2026-04-10', 570, 30),  -- after as_of: 600 back, WHT included
+            (:j4, :org, '2026-03-10', 300, 0),   -- settled before as_of
+            (:j5, :org, '2026-05-01', 50, 0)
+        """, {"j1": j1, "j4": j4, "j5": j5}),
+    ]
+
+    async def check(db):
+        report = await compute_open_items(db, side="ap", org_id=ORG, as_of=as_of)
+        assert _aging(report) == {
+            "current": (1, 150.0), "1-30": (1, 600.0), "31-60": (0, 0.0),
+            "61-90": (1, 250.0), "90+": (0, 0.0),
+        }
+        assert [(p["name"], p["count"], p["outstanding"]) for p in report["parties"]] == [
+            ("Alpha", 2, 750.0), ("Beta", 1, 250.0),
+        ]
+
+    _run(pg_url, rows, check)
@@ -0,0 +1,136 @@
+"""
+Monthly partition maintenance (Phase 15) — partition creation, retention drops, the
+maintenance lock and partition-prunable date filters; no DB or API.
+"""
+
+import asyncio
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import and_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import get_settings
+from app.services import partition
+from app.models.inventory import StockMovement
+from app.services.partition import (
+    add_months,
+    date_range_clauses,
+    ensure_monthly_partitions,
+    maintain_partitions,
+    month_start,
+)
+from tests.unit.fakes import FakeSession, result
+
+
+def _ddl(db) -> list[str]:
+    return [str(s) for s in db.statements if str(s).startswith(("CREATE", "ALTER", "DROP"))]
+
+
+def test_creates_missing_months_with_utc_bounds():
+    db = FakeSession(
+        [result(scalars=["audit_logs_default", "audit_logs_y2026m01"])],
+        default=result(),
+    )
+    created = asyncio.run(ensure_monthly_partitions(db, "audit_logs", months_ahead=2, start=date(2026, 1, 15)))
+
+    assert created == ["audit_logs_y2026m02", "audit_logs_y2026m03"]
+    assert _ddl(db) == [
+        'CREATE TABLE IF NOT EXISTS "audit_logs_y2026m02" PARTITION OF "audit_logs" '
+        "FOR VALUES FROM ('2026-02-01 00:00:00+00') TO ('2026-03-01 00:00:00+00')",
+        'CREATE TABLE IF NOT EXISTS "audit_logs_y2026m03" PARTITION OF "audit_logs" '
+        "FOR VALUES FROM ('2026-03-01 00:00:00+00') TO ('2026-04-01 00:00:00+00')",
+    ]
+    assert db.log == ["savepoint", "release savepoint"] * 2
+
+
+def test_year_end_rollover():
+    db = FakeSession([result(scalars=[])], default=result())
+    created = asyncio.run(ensure_monthly_partitions(db, "login_history", months_ahead=1, start=date(2025, 12, 1)))
+    assert created == ["login_history_y2025m12", "login_history_y2026m01"]
+    assert "TO ('2026-01-01 00:00:00+00')" in _ddl(db)[0]
+
+
+def test_failed_create_is_skipped_inside_its_savepoint():
+    # e.g. the default partition already holds rows for that month
+    clash = OperationalError("CREATE TABLE", {}, Exception("updated partition constraint violated"))
+    db = FakeSession([result(scalars=[]), clash], default=result())
+    created = asyncio.run(ensure_monthly_partitions(db, "audit_logs", months_ahead=1, start=date(2026, 1, 1)))
+
+    assert created == ["audit_logs_y2026m02"]
+    assert db.log == ["savepoint", "rollback savepoint", "savepoint", "release savepoint"]
+
+
+@pytest.fixture()
+def settings(monkeypatch):
+    current = get_settings().model_copy(update={"PARTITION_MONTHS_AHEAD": 1, "AUDIT_LOG_RETENTION_MONTHS": 2})
+    monkeypatch.setattr(partition, "get_settings", lambda: current)
+    return current
+
+
+def test_maintenance_skips_when_another_process_holds_the_lock(settings):
+    db = FakeSession([result(scalar=False)])
+    assert asyncio.run(maintain_partitions(db)) == {}
+    assert db.log == [] and len(db.statements) == 1
+
+
+def test_maintenance_creates_ahead_and_drops_past_retention(settings):
+    this = month_start(datetime.now(timezone.utc))
+    name = lambda months: partition.partition_name("audit_logs", add_months(this, months))  # noqa: E731
+    existing = ["audit_logs_default", name(-3), name(-2), name(-1), name(0)]
+    db = FakeSession([
+        result(scalar=True),  # advisory lock
+        result(scalar=1),  # audit_logs is partitioned
+        result(scalars=existing),
+        result(),  # CREATE next month
+        result(scalars=existing),
+        result(), result(),  # DETACH + DROP the month past retention
+        result(scalar=None), result(scalar=None), result(scalar=None),  # other tables not partitioned
+    ])
+    summary = asyncio.run(maintain_partitions(db))
+
+    assert summary == {"audit_logs": {"created": [name(1)], "dropped": [name(-3)]}}
+    assert _ddl(db)[1:] == [
+        f'ALTER TABLE "audit_logs" DETACH PARTITION "{name(-3)}"',
+        f'DROP TABLE "{name(-3)}"',
+    ]
+    assert db.log[-1] == "commit"
+
+
+# ============================================================
+# DATE RANGE FILTER
+# ============================================================
+
+def _where(start, end) -> tuple[str, dict]:
+    clauses = date_range_clauses(StockMovement.created_at, start, end)
+    if not clauses:
+        return "", {}
+    compiled = and_(*clauses).compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+def test_whole_days_as_half_open_range_on_the_raw_column():
+    sql, params = _where(date(2026, 3, 1), date(2026, 3, 31))
+    # no date(created_at) wrapper — the planner can prune partitions and use the index
+    assert sql == "stock_movements.created_at >= %(created_at_1)s AND stock_movements.created_at < %(created_at_2)s"
+    assert (params["created_at_1"], params["created_at_2"]) == (date(2026, 3, 1), date(2026, 4, 1))
+
+
+@pytest.mark.parametrize("start,end,upper", [
+    (date(2026, 1, 1), date(2026, 1, 31), date(2026, 2, 1)),  # month end → next month's partition bound
+    (date(2025, 12, 1), date(2025, 12, 31), date(2026, 1, 1)),  # year end
+    (date(2024, 2, 1), date(2024, 2, 29), date(2024, 3, 1)),  # leap day
+    (date(2026, 3, 15), date(2026, 3, 15), date(2026, 3, 16)),  # single day
+])
+def test_end_day_is_inclusive_across_month_edges(start, end, upper):
+    _, params = _where(start, end)
+    assert params == {"created_at_1": start, "created_at_2": upper}
+
+
+def test_open_bounds():
+    assert _where(None, None) == ("", {})
+    assert _where(date(2026, 3, 1), None) == ("stock_movements.created_at >= %(created_at_1)s",
+                                              {"created_at_1": date(2026, 3, 1)})
+    assert _where(None, date(2026, 3, 31)) == ("stock_movements.created_at < %(created_at_1)s",
+                                               {"created_at_1": date(2026, 4, 1)})
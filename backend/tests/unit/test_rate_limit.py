@@ -0,0 +1,129 @@
+"""
+Rate limiter — policies, GCRA fallback, middleware (Phase 15). No Redis server needed.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.config import DEFAULT_ORG_ID
+from app.core.rate_limit import LocalGCRA, OrgRatePolicy, RateLimiter, request_identity
+from app.core.security import create_access_token
+from app.middleware.rate_limit import RateLimitMiddleware
+
+ORG = str(DEFAULT_ORG_ID)
+
+
+def test_local_gcra_allows_burst_then_refills():
+    gcra = LocalGCRA(max_keys=10)
+    assert all(gcra.hit("k", 3, 60, now=0.0)[0] for _ in range(3))
+    allowed, retry_after = gcra.hit("k", 3, 60, now=0.0)
+    assert not allowed and retry_after == pytest.approx(20.0)
+    assert gcra.hit("k", 3, 60, now=20.0)[0]  # one token back after period/limit
+    assert gcra.hit("other", 3, 60, now=0.0)[0]  # buckets are per key
+
+
+def test_local_gcra_prunes_expired_keys_at_capacity():
+    gcra = LocalGCRA(max_keys=2)
+    gcra.hit("a", 60, 60, now=0.0)
+    gcra.hit("b", 60, 60, now=0.0)
+    gcra.hit("c", 60, 60, now=5.0)
+    assert set(gcra._tat) == {"c"}
+
+
+def test_role_override():
+    policy = OrgRatePolicy(api=120, login=5, roles={"viewer": 30})
+    assert policy.limit_for("api", "viewer") == ("api:viewer", 30)
+    assert policy.limit_for("api", "owner") == ("api", 120)
+    assert policy.limit_for("login", "viewer") == ("login", 5)
+
+
+def _app(limiter: RateLimiter) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
+
+    @app.get("/data")
+    async def data():
+        return {"ok": True}
+
+    @app.post("/login")
+    @limiter.limit("login")
+    async def login():
+        return {"ok": True}
+
+    @app.get("/health")
+    @limiter.exempt
+    async def health():
+        return {"ok": True}
+
+    return app
+
+
+def _limiter(policy: OrgRatePolicy) -> RateLimiter:
+    limiter = RateLimiter()
+    limiter.enabled = True
+    policy.loaded_at = time.monotonic()
+    limiter._policies[ORG] = policy
+
+    async def _redis_down(*args, **kwargs):
+        raise RedisConnectionError("Connection refused")
+
+    limiter._hit_redis = _redis_down
+    return limiter
+
+
+def test_middleware_falls_back_in_process_and_counts_per_policy():
+    limiter = _limiter(OrgRatePolicy(api=3, login=2, roles={"viewer": 2}))
+    client = TestClient(_app(limiter))
+    viewer = {"Authorization": "Bearer " + create_access_token({"sub": "u1", "org_id": ORG, "role": "viewer"})}
+
+    assert [client.get("/data", headers=viewer).status_code for _ in range(3)] == [200, 200, 429]
+    throttled = client.get("/data", headers=viewer)
+    assert int(throttled.headers["Retry-After"]) >= 1
+    assert [client.get("/data").status_code for _ in range(4)] == [200, 200, 200, 429]  # anonymous: per IP
+    assert [client.post("/login").status_code for _ in range(3)] == [200, 200, 429]
+    assert all(client.get("/health").status_code == 200 for _ in range(10))
+
+    counters = limiter.metrics()["counters"]
+    assert counters["api:viewer"] == {"allowed": 2, "throttled": 2, "local": 4}
+    assert counters["api"]["throttled"] == 1
+    assert counters["login"]["allowed"] == 2
+
+
+def test_version_change_reloads_policy():
+    limiter = RateLimiter()
+    limiter._policies[ORG] = OrgRatePolicy(api=3, loaded_at=time.monotonic(), version="1:0")
+    loads = []
+
+    async def _load(org):
+        loads.append(org)
+        return OrgRatePolicy(api=50, loaded_at=time.monotonic())
+
+    async def _redis(key, limit, org):
+        return True, 0.0, "2:0"
+
+    limiter._load_policy = _load
+    limiter._hit_redis = _redis
+
+    async def _run():
+        assert (await limiter.hit(org=ORG, policy_name="api", subject="s", role=None))[2] == 3
+        assert (await limiter.hit(org=ORG, policy_name="api", subject="s", role=None))[2] == 50
+
+    asyncio.run(_run())
+    assert loads == [ORG]
+
+
+def test_request_identity_decodes_token_once():
+    from starlette.requests import Request
+
+    token = create_access_token({"sub": "u9", "org_id": "org-x", "role": "staff"})
+    scope = {"type": "http", "headers": [(b"authorization", f"Bearer {token}".encode())],
+             "client": ("10.0.0.1", 1234)}
+    request = Request(scope)
+    assert request_identity(request) == ("org-x", "staff", "user:u9")
+    assert scope["state"]["token_payload"]["sub"] == "u9"
+    assert request_identity(request, "login") == (ORG, None, "ip:10.0.0.1")
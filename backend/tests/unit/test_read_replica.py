@@ -0,0 +1,83 @@
+"""
+Read-replica routing tests (Phase 15).
+Router decisions run without a database; the READ ONLY check needs
+READ_REPLICA_TEST_URL (any Postgres — a single instance stands in for the replica).
+"""
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.database import ReplicaRouter
+
+PRIMARY = object()
+REPLICA = object()
+
+
+class _FakeLagRouter(ReplicaRouter):
+    def __init__(self, lags, **kwargs):
+        super().__init__(REPLICA, PRIMARY, **kwargs)
+        self.lags = list(lags)
+        self.probes = 0
+
+    async def _measure_lag(self):
+        self.probes += 1
+        lag = self.lags.pop(0)
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+
+def test_replica_used_when_lag_within_limit():
+    router = _FakeLagRouter([0.5], max_lag=5, check_interval=60)
+    assert asyncio.run(router.factory()) is REPLICA
+    assert router.last_lag == 0.5
+
+
+def test_falls_back_when_replica_lags():
+    router = _FakeLagRouter([30.0], max_lag=5, check_interval=60)
+    assert asyncio.run(router.factory()) is PRIMARY
+
+
+def test_falls_back_when_probe_fails():
+    router = _FakeLagRouter([ConnectionRefusedError()], max_lag=5, check_interval=60)
+    assert asyncio.run(router.factory()) is PRIMARY
+
+
+def test_probe_cached_within_interval():
+    router = _FakeLagRouter([0.0, 99.0], max_lag=5, check_interval=60)
+
+    async def _twice():
+        return [await router.factory(), await router.factory()]
+
+    assert asyncio.run(_twice()) == [REPLICA, REPLICA]
+    assert router.probes == 1
+
+
+def test_no_replica_configured_uses_primary():
+    router = ReplicaRouter(None, PRIMARY, max_lag=5, check_interval=60)
+    assert asyncio.run(router.factory()) is PRIMARY
+
+
+@pytest.mark.skipif(not os.getenv("READ_REPLICA_TEST_URL"), reason="READ_REPLICA_TEST_URL not set")
+def test_read_session_rejects_writes():
+    async def _run():
+        eng = create_async_engine(os.environ["READ_REPLICA_TEST_URL"])
+        factory = async_sessionmaker(eng, class_=AsyncSession)
+        router = ReplicaRouter(factory, factory, max_lag=5, check_interval=60)
+        try:
+            assert await router.replica_ok()
+            assert router.last_lag == 0  # single instance: not in recovery
+            async with factory() as session:
+                session.info["read_only"] = True
+                assert (await session.execute(text("SELECT 1"))).scalar() == 1
+                with pytest.raises(DBAPIError, match="read-only"):
+                    await session.execute(text("CREATE TEMP TABLE _replica_probe (id int)"))
+        finally:
+            await eng.dispose()
+
+    asyncio.run(_run())
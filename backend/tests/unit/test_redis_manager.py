@@ -0,0 +1,111 @@
+"""
+Shared Redis manager — circuit breaker + counters, bounded pools (Phase 15).
+No Redis server needed (pools run on fakeredis connections).
+"""
+
+import asyncio
+
+import fakeredis
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+
+import app.core.redis
+from app.core.redis import (
+    InstrumentedRedis,
+    RedisManager,
+    RedisPoolExhaustedError,
+    RedisUnavailableError,
+    _BoundedPool,
+)
+
+
+async def _ok():
+    return "PONG"
+
+
+async def _down():
+    raise RedisConnectionError("Connection refused")
+
+
+async def _wrongtype():
+    raise ResponseError("WRONGTYPE")
+
+
+def test_breaker_opens_after_consecutive_failures_and_fails_fast():
+    mgr = RedisManager(failure_threshold=3, cooldown_seconds=60)
+
+    async def _run():
+        for _ in range(3):
+            with pytest.raises(RedisConnectionError):
+                await mgr.timed("GET", _down)
+        assert mgr.state == "open"
+        calls = []
+
+        async def _tracked():
+            calls.append(1)
+            return "x"
+
+        with pytest.raises(RedisUnavailableError):
+            await mgr.timed("GET", _tracked)
+        assert calls == []  # never reached the network
+
+    asyncio.run(_run())
+    assert mgr.stats["GET"].errors == 3
+
+
+def test_half_open_probe_closes_circuit_on_success():
+    mgr = RedisManager(failure_threshold=1, cooldown_seconds=0)
+
+    async def _run():
+        with pytest.raises(RedisConnectionError):
+            await mgr.timed("GET", _down)
+        assert mgr.state == "half_open"  # cooldown 0 → next call is the probe
+        assert await mgr.timed("PING", _ok) == "PONG"
+
+    asyncio.run(_run())
+    assert mgr.state == "closed"
+    assert mgr.consecutive_failures == 0
+
+
+def test_command_errors_do_not_trip_breaker():
+    mgr = RedisManager(failure_threshold=1, cooldown_seconds=60)
+
+    async def _run():
+        with pytest.raises(ResponseError):
+            await mgr.timed("INCR", _wrongtype)
+
+    asyncio.run(_run())
+    assert mgr.state == "closed"
+    metrics = mgr.metrics()["commands"]["INCR"]
+    assert metrics["calls"] == 1 and metrics["errors"] == 1
+
+
+def _bounded_pool(server, max_connections):
+    return _BoundedPool(
+        connection_class=fake_aioredis.FakeConnection, server=server,
+        max_connections=max_connections, decode_responses=True,
+    )
+
+
+def test_exhausted_pool_does_not_trip_breaker(monkeypatch):
+    mgr = RedisManager(failure_threshold=3, cooldown_seconds=60)
+    monkeypatch.setattr(app.core.redis, "manager", mgr)
+    pool = _bounded_pool(fakeredis.FakeServer(), 2)
+    client = InstrumentedRedis(connection_pool=pool)
+
+    async def _run():
+        await client.set("k", "v")
+        held = [await pool.get_connection("GET") for _ in range(2)]
+        for _ in range(5):
+            with pytest.raises(RedisPoolExhaustedError):
+                await client.get("k")
+        assert mgr.state == "closed"
+        for connection in held:
+            await pool.release(connection)
+        return await client.get("k")
+
+    assert asyncio.run(_run()) == "v"
+    assert (mgr.consecutive_failures, mgr.pool_exhausted) == (0, 5)
+    assert mgr.stats["GET"].errors == 5
@@ -0,0 +1,60 @@
+"""
+Tag-based response cache (Phase 15) — single-flight + registry + Redis-down bypass.
+No Redis server or live API needed.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.cache import TABLE_TAGS, _single_flight, cached
+
+
+def test_single_flight_runs_one_computation_for_concurrent_callers():
+    calls = []
+
+    async def _compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"value": 42}
+
+    async def _run():
+        return await asyncio.gather(*[_single_flight("k", _compute) for _ in range(50)])
+
+    results = asyncio.run(_run())
+    assert len(calls) == 1
+    assert all(r == {"value": 42} for r in results)
+
+
+def test_single_flight_propagates_errors_and_releases_key():
+    async def _boom():
+        raise ValueError("boom")
+
+    async def _ok():
+        return 1
+
+    async def _run():
+        with pytest.raises(ValueError):
+            await _single_flight("k2", _boom)
+        return await _single_flight("k2", _ok)
+
+    assert asyncio.run(_run()) == 1
+
+
+def test_movement_writes_invalidate_inventory():
+    assert "inventory" in TABLE_TAGS["stock_movements"]
+    assert "costing" in TABLE_TAGS["timesheets"]
+
+
+def test_redis_down_runs_endpoint_uncached():
+    calls = []
+
+    @cached(tags=("inventory",), ttl=60)
+    async def endpoint(months: int = 6, token: dict | None = None):
+        calls.append(months)
+        return {"months": months}
+
+    token = {"org_id": "00000000-0000-0000-0000-000000000001", "role": "owner"}
+    result = asyncio.run(endpoint(months=3, token=token))
+    assert result == {"months": 3}
+    assert calls == [3]
@@ -0,0 +1,191 @@
+"""
+Global document search (Phase 15) — after_flush index sync and the prefix-then-trigram
+query with per-role document types; no DB or API. The prefix pass's plan is checked
+on a TEMP table when TEST_DATABASE_URL is set.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.invoice import SupplierInvoice
+from app.models.purchasing import PurchaseOrder
+from app.models.workorder import WorkOrder, WOStatus
+from app.services.search import _sync_search_index, allowed_doc_types, search_documents
+from tests.unit.fakes import FakeSession, result, run_with_temp_tables
+
+ORG = uuid.UUID(int=1)
+
+
+def _loaded(model, **values):
+    """A document as loaded from the DB — committed state, no pending changes."""
+    obj = model()
+    for key, value in values.items():
+        set_committed_value(obj, key, value)
+    return obj
+
+
+def _wo(**changes):
+    return _loaded(WorkOrder, id=uuid.uuid4(), org_id=ORG, wo_number="WO-2026-0001",
+                   status=WOStatus.DRAFT, customer_name="ACME", is_active=True, **changes)
+
+
+def _flush(new=(), dirty=(), deleted=()) -> list:
+    """Run the hook on a flush of these objects; returns the statements it executed."""
+    executed = []
+    session = SimpleNamespace(new=list(new), dirty=list(dirty), deleted=list(deleted),
+                              connection=lambda: SimpleNamespace(execute=executed.append))
+    _sync_search_index(session, None)
+    return [stmt.compile(dialect=postgresql.dialect()) for stmt in executed]
+
+
+def _upserted(compiled) -> list[dict]:
+    """Index rows of a multi-row upsert, as {column: value}."""
+    rows, n = [], 0
+    while f"org_id_m{n}" in compiled.params:
+        rows.append({k[: -len(f"_m{n}")]: v for k, v in compiled.params.items() if k.endswith(f"_m{n}")})
+        n += 1
+    return rows
+
+
+def test_new_documents_are_indexed_in_one_upsert():
+    wo = WorkOrder(id=uuid.uuid4(), org_id=ORG, wo_number="wo-2026-0007", status=WOStatus.DRAFT,
+                   customer_name="ACME", is_active=True)
+    po = PurchaseOrder(id=uuid.uuid4(), org_id=ORG, po_number="PO-2026-0003", supplier_name="Steel Co")
+    unnumbered = WorkOrder(id=uuid.uuid4(), org_id=ORG, wo_number=None)
+
+    (stmt,) = _flush(new=[wo, po, unnumbered])
+    assert "ON CONFLICT ON CONSTRAINT uq_doc_search_type_id DO UPDATE" in str(stmt)
+    by_type = {row["doc_type"]: row for row in _upserted(stmt)}
+    assert set(by_type) == {"WO", "PO"}
+    assert by_type["WO"]["search_key"] == "WO-2026-0007" and by_type["WO"]["status"] == "DRAFT"
+    assert by_type["PO"]["title"] == "Steel Co"
+
+
+def test_renumber_and_status_change_reindex():
+    renumbered, status_changed = _wo(), _wo()
+    renumbered.wo_number = "WO-2026-0099"
+    status_changed.status = WOStatus.OPEN
+
+    (stmt,) = _flush(dirty=[renumbered, status_changed])
+    rows = _upserted(stmt)
+    assert [(r["doc_number"], r["status"]) for r in rows] == [("WO-2026-0099", "DRAFT"), ("WO-2026-0001", "OPEN")]
+
+
+def test_untracked_change_writes_nothing():
+    wo = _wo()
+    wo.description = "notes only"
+    assert _flush(dirty=[wo]) == []
+
+
+def test_soft_delete_flags_row_and_hard_delete_removes_it():
+    soft, hard = _wo(), _loaded(SupplierInvoice, id=uuid.uuid4(), org_id=ORG, invoice_number="INV-1")
+    soft.is_active = False
+
+    upsert, delete = _flush(dirty=[soft], deleted=[hard])
+    assert _upserted(upsert)[0]["is_active"] is False  # kept, hidden from search
+    assert "DELETE FROM document_search_index" in str(delete)
+    assert set(delete.params.values()) == {"AP", hard.id}
+
+
+# ============================================================
+# QUERY
+# ============================================================
+
+def _hit(doc_type, number):
+    return SimpleNamespace(doc_type=doc_type, doc_id=uuid.uuid4(), doc_number=number, status="OPEN",
+                           title=None, doc_updated_at=datetime(2026, 3, 1, tzinfo=timezone.utc))
+
+
+def _sql(stmt):
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+def test_prefix_hits_first_then_trigram_fill_excluding_them():
+    prefix = [_hit("PO", "PO-2026-0001")]
+    contains = [_hit("PR", "PR-PO-2026-0001")]
+    db = FakeSession([result(rows=prefix), result(rows=contains)])
+    hits = asyncio.run(search_documents(db, org_id=ORG, query=" po-2026 ", doc_types=["PO", "PR"], limit=5))
+
+    assert [h["doc_number"] for h in hits] == ["PO-2026-0001", "PR-PO-2026-0001"]
+    assert hits[0]["link"] == f"/purchasing/po/{prefix[0].doc_id}" and hits[0]["doc_type_label"] == "ใบสั่งซื้อ"
+    (prefix_sql, prefix_params), (contains_sql, contains_params) = map(_sql, db.statements)
+    assert prefix_params["search_key_1"] == "PO-2026%"
+    assert "ORDER BY document_search_index.search_key USING ~>~" in prefix_sql
+    assert contains_params["search_key_1"] == "%PO-2026%"
+    assert contains_params["doc_id_1"] == [prefix[0].doc_id]  # no duplicates across passes
+    assert contains_params["param_1"] == 4  # only the remaining slots
+
+
+def test_trigram_pass_skipped_when_prefix_fills_limit_or_query_is_short():
+    db = FakeSession([result(rows=[_hit("PO", "PO-1"), _hit("PO", "PO-2")])])
+    asyncio.run(search_documents(db, org_id=ORG, query="PO-", doc_types=["PO"], limit=2))
+    db_short = FakeSession([result(rows=[])])
+    asyncio.run(search_documents(db_short, org_id=ORG, query="PO", doc_types=["PO"], limit=5))
+    assert len(db.statements) == len(db_short.statements) == 1
+
+
+def test_like_wildcards_in_the_query_are_literal():
+    db = FakeSession([result(rows=[]), result(rows=[])])
+    asyncio.run(search_documents(db, org_id=ORG, query="50%_off", doc_types=["WO"]))
+    assert _sql(db.statements[0])[1]["search_key_1"] == "50\\%\\_OFF%"
+
+
+def test_doc_types_follow_role_read_permissions():
+    assert {"AP", "AR"} <= set(allowed_doc_types("owner"))
+    staff = allowed_doc_types("staff")
+    assert "WO" in staff and not {"AP", "AR"} & set(staff)
+    assert allowed_doc_types(None) == [] and allowed_doc_types("unknown") == []
+
+    db = FakeSession([result(rows=[]), result(rows=[])])
+    asyncio.run(search_documents(db, org_id=ORG, query="INV", doc_types=staff))
+    sql, params = _sql(db.statements[0])
+    assert params["doc_type_1"] == staff  # AP / AR hits never leave the index for staff
+    assert params["org_id_1"] == ORG and "is_active = true" in sql
+    assert asyncio.run(search_documents(FakeSession(), org_id=ORG, query="INV", doc_types=[])) == []
+
+
+# ============================================================
+# PREFIX PLAN (Postgres)
+# ============================================================
+
+_TABLES = """
+    CREATE TEMP TABLE document_search_index (
+        id uuid, org_id uuid, doc_type varchar(10), doc_id uuid, doc_number varchar(50),
+        search_key varchar(50), status varchar(30), title varchar(255), is_active boolean,
+        doc_updated_at timestamptz);
+    CREATE INDEX ON document_search_index (org_id, search_key varchar_pattern_ops)
+"""
+
+_ROWS = [
+    ("""
+        INSERT INTO document_search_index
+        SELECT gen_random_uuid(), :org, t, gen_random_uuid(), n, n, 'OPEN', NULL, true, now()
+        FROM generate_series(1, 20000) g, (VALUES ('PO'), ('PR')) v(t),
+             LATERAL (SELECT t || '-' || (2020 + g % 7) || '-' || lpad(g::text, 5, '0') AS n) k
+    """, {}),
+    ("ANALYZE document_search_index", {}),
+]
+
+
+def test_short_prefix_reads_the_pattern_index_backwards_without_sorting(pg_url):
+    recorder = FakeSession([result(rows=[])])
+    asyncio.run(search_documents(recorder, org_id=ORG, query="P", doc_types=["PO", "PR"], limit=5))
+
+    async def check(db):
+        conn = await db.connection()
+        prefix = recorder.statements[0].compile(
+            dialect=conn.dialect, compile_kwargs={"render_postcompile": True},
+        )
+        params = tuple(prefix.params[name] for name in prefix.positiontup)
+        plan = "\n".join(row[0] for row in await conn.exec_driver_sql(f"EXPLAIN {prefix}", params))
+        assert "Index Scan Backward" in plan and "Sort" not in plan
+        hits = await search_documents(db, org_id=ORG, query="po-2026", doc_types=["PO"], limit=3)
+        assert [h["doc_number"] for h in hits] == ["PO-2026-19998", "PO-2026-19991", "PO-2026-19984"]
+
+    run_with_temp_tables(pg_url, _TABLES, _ROWS, check, org=ORG)
@@ -0,0 +1,67 @@
+"""
+Synthetic data generator tests (Phase 15) — generators only, no database.
+"""
+
+import uuid
+from collections import Counter
+from datetime import date
+
+from app.seed_synthetic import (
+    SCALE_PROFILES,
+    _Context,
+    _products,
+    _purchase_order_lines,
+    _purchase_orders,
+    _stock_movements,
+    _supplier_invoices,
+    _timesheets,
+)
+
+USERS = [uuid.UUID(int=i + 1) for i in range(5)]
+ORG = uuid.UUID(int=99)
+
+
+def _ctx(seed: int = 7) -> _Context:
+    profile = {**SCALE_PROFILES["S"], "products": 500, "stock_movements": 20_000,
+               "purchase_orders": 300, "employees": 4}
+    ctx = _Context(seed=seed, profile=profile, org_id=ORG, user_ids=USERS, today=date(2026, 3, 15))
+    list(_products(ctx))
+    return ctx
+
+
+def test_same_seed_same_rows():
+    a, b = _ctx(), _ctx()
+    assert list(_stock_movements(a, 0, 2_000)) == list(_stock_movements(b, 0, 2_000))
+    assert list(_purchase_orders(a)) == list(_purchase_orders(b))
+    assert list(_stock_movements(_ctx(seed=8), 0, 50)) != list(_stock_movements(a, 0, 50))
+
+
+def test_child_rows_reference_generated_parents():
+    ctx = _ctx()
+    po_ids = {row[0] for row in _purchase_orders(ctx)}
+    product_ids = {row[0] for row in _products(_ctx())}
+    lines = list(_purchase_order_lines(ctx))
+    assert {line[1] for line in lines} <= po_ids
+    assert {line[2] for line in lines} <= product_ids
+    assert {inv[2] for inv in _supplier_invoices(ctx)} <= po_ids
+
+
+def test_movements_follow_product_type_and_hot_skus():
+    ctx = _ctx()
+    product_type = {row[0]: row[3] for row in _products(_ctx())}
+    rows = list(_stock_movements(ctx, 0, 20_000))
+    for row in rows:
+        mt, ptype = row[3], product_type[row[2]]
+        if mt == "PRODUCE":
+            assert ptype == "FINISHED_GOODS"
+        if mt in ("CONSUME", "RETURN"):
+            assert ptype in ("MATERIAL", "CONSUMABLE")
+        assert ctx.start <= row[1].date() <= ctx.today
+    counts = sorted(Counter(row[2] for row in rows).values(), reverse=True)
+    assert sum(counts[:100]) / len(rows) > 0.6  # top 20% of 500 SKUs
+
+
+def test_timesheets_skip_sundays():
+    ctx = _ctx()
+    days = [row[3] for row in _timesheets(ctx, 0, 2)]
+    assert days and all(d.isoweekday() != 7 for d in days)
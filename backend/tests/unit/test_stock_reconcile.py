@@ -0,0 +1,85 @@
+"""
+Stock ledger reconciliation (Phase 15) — chunking, SQL assembly and repair guard, no API.
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.sql.elements import TextClause
+
+from app.services.stock_reconcile import (
+    MOVEMENT_REFS,
+    ReconcileAbort,
+    _PRODUCTS_SQL,
+    _DANGLING_REFS_SQL,
+    _RANGE_SQL,
+    find_dangling_movement_refs,
+    product_chunks,
+    repair_stock_drift,
+)
+from tests.unit.fakes import FakeSession, result
+
+ORG = uuid.UUID(int=1)
+
+
+def test_chunks_cover_every_product_once():
+    ids = [uuid.UUID(int=i) for i in range(1, 6)]
+    # rows the bounds query returns for 5 products, chunk_size=2: rn 1,2,3,4,5
+    rows = [SimpleNamespace(id=ids[rn - 1], rn=rn, total=5) for rn in (1, 2, 3, 4, 5)]
+    chunks = asyncio.run(product_chunks(FakeSession(default=result(rows=rows)), org_id=ORG, chunk_size=2))
+    assert chunks == [(ids[0], ids[1], 2), (ids[2], ids[3], 2), (ids[4], ids[4], 1)]
+
+
+def test_range_and_product_set_queries_check_all_levels():
+    assert set(_RANGE_SQL._bindparams) == {"org_id", "lo", "hi"}
+    assert set(_PRODUCTS_SQL._bindparams) == {"org_id", "product_ids"}
+    sql = str(_RANGE_SQL)
+    for level in ("'product'", "'location'", "'batch'"):
+        assert level in sql
+    # the full ledger is replayed — no created_at window
+    assert ":since" not in sql and "m.product_id BETWEEN :lo AND :hi" in sql
+
+
+def test_repair_aborts_over_max_fixes_without_writing():
+    row = SimpleNamespace(level="product", product_id=uuid.uuid4(), location_id=None,
+                          batch_number=None, actual=5, expected=3)
+    db = FakeSession(default=result(rows=[row, row, row]))
+    with pytest.raises(ReconcileAbort):
+        asyncio.run(repair_stock_drift(db, org_id=ORG, product_ids=[row.product_id], max_fixes=2))
+    assert db.log == ["rollback"]
+    # lock, recompute — no UPDATE issued
+    assert len(db.statements) == 2
+    assert all(isinstance(s, TextClause) and "SET on_hand" not in str(s) for s in db.statements)
+
+
+def test_repair_syncs_watchlist_for_products_fixed_at_product_level():
+    product = SimpleNamespace(level="product", product_id=uuid.uuid4(), location_id=None,
+                              batch_number=None, actual=9, expected=2)
+    located = SimpleNamespace(level="location", product_id=uuid.uuid4(), location_id=uuid.uuid4(),
+                              batch_number=None, actual=1, expected=0)
+    db = FakeSession(default=result(rows=[product, located]))
+    asyncio.run(repair_stock_drift(db, org_id=ORG, product_ids=[product.product_id, located.product_id]))
+
+    assert db.log[-1] == "commit"
+    (sync,) = [p for s, p in zip(db.statements, db.params) if "low_stock_watchlist" in str(s)]
+    assert sync == {"product_ids": [product.product_id]}  # on_hand only changes at product level
+
+
+def test_dangling_movement_refs_cover_every_reference_column():
+    from app.models.inventory import StockMovement
+
+    sql = str(_DANGLING_REFS_SQL)
+    assert sql.count("NOT EXISTS (SELECT 1 FROM stock_movements m WHERE m.id = r.") == len(MOVEMENT_REFS)
+    # every movement_id / reversed_by_id column in the models is checked
+    columns = {
+        (table.name, column.name)
+        for table in StockMovement.metadata.sorted_tables
+        for column in table.columns
+        if column.name in ("movement_id", "reversed_by_id")
+    }
+    assert columns == set(MOVEMENT_REFS)
+
+    db = FakeSession([result(rows=[("stock_movements.reversed_by_id", 0), ("stock_take_lines.movement_id", 2)])])
+    assert asyncio.run(find_dangling_movement_refs(db)) == {"stock_take_lines.movement_id": 2}
@@ -0,0 +1,55 @@
+"""
+Month-end stock snapshots + point-in-time stock (Phase 15) — SQL assembly only, no API.
+"""
+
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+
+from app.services.stock_snapshot import (
+    _TAKE_SNAPSHOT_SQL,
+    _as_of_sql,
+    _filter_cond,
+    _live_sql,
+    _movement_delta_sql,
+    _snapshot_lines_sql,
+    _state_cte,
+    cutoff_for,
+    period_end_of,
+)
+
+
+def _binds(sql: str) -> set[str]:
+    return set(text(sql)._bindparams)
+
+
+def test_period_end_and_cutoff():
+    assert period_end_of(date(2028, 2, 10)) == date(2028, 2, 29)
+    assert period_end_of(date(2026, 12, 1)) == date(2026, 12, 31)
+    assert cutoff_for(date(2026, 3, 31)) == datetime(2026, 4, 1, tzinfo=timezone.utc)
+
+
+def test_snapshot_rewinds_live_state_in_one_statement():
+    assert set(_TAKE_SNAPSHOT_SQL._bindparams) == {"snapshot_id", "org_id", "since"}
+    sql = str(_TAKE_SNAPSHOT_SQL)
+    assert sql.count("INSERT INTO") == 1
+    assert "-1 * d.qty" in sql
+
+
+def test_forward_replay_is_bounded_and_filters_every_source():
+    cond = _filter_cond("p", "loc")
+    sql = _as_of_sql(
+        _state_cte(_snapshot_lines_sql(cond), _movement_delta_sql(cond, until=True), delta_sign=1),
+        "location",
+    )
+    assert _binds(sql) == {"org_id", "base_id", "since", "until", "product_id", "location_id"}
+    assert "l.product_id = :product_id" in sql and "m.product_id = :product_id" in sql
+    assert "leg.location_id = :location_id" in sql
+
+
+def test_live_filters_reach_unlocated_rows():
+    sql = _live_sql(_filter_cond("p", "loc"))
+    assert "p.id = :product_id" in sql
+    # product-level (unlocated) rows never match a location filter
+    assert "CAST(NULL AS uuid) = :location_id" in sql
+    assert "{p}" not in _live_sql("") and "until" not in _movement_delta_sql("")
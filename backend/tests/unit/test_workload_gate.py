@@ -0,0 +1,61 @@
+"""
+DB workload class gate tests (Phase 15) — no database or live server needed.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.workload import PoolSaturatedError, WorkloadGate
+
+
+def _gate(limit=2, wait_ms=50):
+    return WorkloadGate(
+        "reporting", limit=limit, wait_ms=wait_ms,
+        statement_timeout_ms=1000, lock_timeout_ms=500,
+    )
+
+
+def test_saturated_class_fails_fast_with_retry_after():
+    async def _run():
+        gate = _gate(limit=1, wait_ms=50)
+        async with gate.slot():
+            with pytest.raises(PoolSaturatedError) as exc:
+                async with gate.slot():
+                    pass
+        return gate, exc.value
+
+    gate, err = asyncio.run(_run())
+    assert err.workload == "reporting"
+    assert err.retry_after == 1
+    assert gate.rejected == 1
+    assert gate.in_use == 0 and gate.waiting == 0
+
+
+def test_waiter_gets_slot_released_within_budget():
+    async def _run():
+        gate = _gate(limit=1, wait_ms=1000)
+
+        async def _hold():
+            async with gate.slot():
+                await asyncio.sleep(0.05)
+
+        await asyncio.gather(_hold(), _hold())
+        return gate
+
+    gate = asyncio.run(_run())
+    snap = gate.snapshot()
+    assert snap["acquired"] == 2
+    assert snap["rejected"] == 0
+    assert snap["peak_in_use"] == 1
+    assert snap["max_wait_ms"] >= 30
+
+
+def test_classes_are_isolated():
+    async def _run():
+        reporting, transactional = _gate(limit=1), _gate(limit=1)
+        async with reporting.slot():
+            async with transactional.slot():
+                return transactional.in_use
+
+    assert asyncio.run(_run()) == 1
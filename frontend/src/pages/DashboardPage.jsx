@@ -122,7 +122,7 @@ function StaffDashboard() {
     },
     {
       title: 'วันลาเหลือ',
-      value: leaveBalance ? `${Number(leaveBalance.quota || 0) - Number(leaveBalance.used || 0)}` : '—',
+      value: leaveBalance ? `${Number(leaveBalance.remaining || 0) - Number(leaveBalance.pending || 0)}` : '—',
       suffix: leaveBalance ? 'วัน' : '',
       icon: <CalendarOff size={20} />,
       color: COLORS.accent,
@@ -470,7 +470,7 @@ function SupervisorDashboard() {
           <Col xs={12}>
             <StatCard
               title="วันลาเหลือ"
-              value={myLeaveBalance ? `${Number(myLeaveBalance.quota || 0) - Number(myLeaveBalance.used || 0)}` : '—'}
+              value={myLeaveBalance ? `${Number(myLeaveBalance.remaining || 0) - Number(myLeaveBalance.pending || 0)}` : '—'}
               subtitle={myLeaveBalance ? 'วัน' : ''}
               icon={<CalendarOff size={20} />}
               color={COLORS.accent}
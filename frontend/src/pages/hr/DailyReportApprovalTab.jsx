@@ -86,8 +86,11 @@ export default function DailyReportApprovalTab() {
     }
     setApproving(true);
     try {
-      await api.post('/api/daily-report/batch-approve', { report_ids: selectedIds });
-      message.success(`อนุมัติสำเร็จ ${selectedIds.length} รายการ`);
+      const { data } = await api.post('/api/daily-report/batch-approve', { report_ids: selectedIds });
+      if (data.items.length) message.success(`อนุมัติสำเร็จ ${data.items.length} รายการ`);
+      if (data.errors.length) {
+        message.warning(`อนุมัติไม่สำเร็จ ${data.errors.length} รายการ: ${data.errors[0].detail}`);
+      }
       loadReports();
     } catch (err) {
       message.error(err.response?.data?.detail || 'อนุมัติผิดพลาด');
@@ -113,10 +113,18 @@ export default function LeaveBalanceTab() {
       title: 'ใช้แล้ว', dataIndex: 'used', key: 'used', width: 90, align: 'center',
       render: (v) => <span style={{ color: v > 0 ? COLORS.warning : COLORS.textMuted }}>{v}</span>,
     },
+    {
+      title: 'ยกมา', dataIndex: 'carried_forward', key: 'carried_forward', width: 80, align: 'center',
+      render: (v) => <span style={{ color: v > 0 ? COLORS.accent : COLORS.textMuted }}>{v}</span>,
+    },
+    {
+      title: 'รออนุมัติ', dataIndex: 'pending', key: 'pending', width: 90, align: 'center',
+      render: (v) => <span style={{ color: v > 0 ? COLORS.warning : COLORS.textMuted }}>{v}</span>,
+    },
     {
       title: 'คงเหลือ', key: 'remaining', width: 90, align: 'center',
       render: (_, r) => {
-        const remaining = r.quota - r.used;
+        const remaining = r.remaining - r.pending;
         return (
           <span style={{ fontWeight: 600, color: remaining <= 0 ? COLORS.danger : COLORS.success }}>
             {remaining}
@@ -52,8 +52,9 @@ export default function LeaveFormModal({ open, onClose, onSuccess }) {
     if (!selectedLeaveTypeId || leaveBalances.length === 0) return null;
     const balance = leaveBalances.find((b) => b.leave_type_id === selectedLeaveTypeId);
     if (!balance) return null;
-    const remaining = balance.quota - balance.used;
-    return { quota: balance.quota, used: balance.used, remaining };
+    // remaining is maintained server-side; pending requests are already reserved
+    const remaining = balance.remaining - balance.pending;
+    return { quota: balance.quota + balance.carried_forward, used: balance.used + balance.pending, remaining };
   }, [selectedLeaveTypeId, leaveBalances]);
 
   const handleSubmit = async () => {
@@ -56,13 +56,13 @@ export default function MobileHomePage() {
         .catch(() => setReportToday(false))
     );
 
-    // 2) Leave balance (fields: quota, used)
+    // 2) Leave balance (fields: remaining, pending)
     promises.push(
       api.get('/api/hr/leave-balance')
         .then(({ data }) => {
           const balances = Array.isArray(data) ? data : data.items || [];
           const totalRemaining = balances.reduce(
-            (sum, b) => sum + ((Number(b.quota) || 0) - (Number(b.used) || 0)),
+            (sum, b) => sum + ((Number(b.remaining) || 0) - (Number(b.pending) || 0)),
             0
           );
           setLeaveBalance(totalRemaining);